@@ -0,0 +1,44 @@
+"""Deduplicate targets and add unique index on targets.name
+
+Revision ID: i6d7e8f9a0b1
+Revises: h5c6d7e8f9a0
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i6d7e8f9a0b1'
+down_revision: Union[str, None] = 'h5c6d7e8f9a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 동일 이름 타겟을 하나로 병합 (참조 테이블을 먼저 대표 id로 이동)
+    op.execute("""
+        CREATE TEMP TABLE target_dedupe ON COMMIT DROP AS
+        SELECT id, FIRST_VALUE(id) OVER (PARTITION BY name ORDER BY id) AS keep_id
+        FROM targets
+    """)
+    op.execute("""
+        UPDATE daily_ranks d SET target_id = t.keep_id
+        FROM target_dedupe t WHERE d.target_id = t.id AND t.id <> t.keep_id
+    """)
+    op.execute("""
+        UPDATE crawling_logs c SET target_id = t.keep_id
+        FROM target_dedupe t WHERE c.target_id = t.id AND t.id <> t.keep_id
+    """)
+    op.execute("""
+        DELETE FROM targets USING target_dedupe t
+        WHERE targets.id = t.id AND t.id <> t.keep_id
+    """)
+    op.create_unique_constraint('targets_name_key', 'targets', ['name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('targets_name_key', 'targets', type_='unique')
@@ -0,0 +1,65 @@
+"""Add rank_positions (last-known rank index) and rank_deltas tables
+
+Revision ID: j7e8f9a0b1c2
+Revises: i6d7e8f9a0b1
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j7e8f9a0b1c2'
+down_revision: Union[str, None] = 'i6d7e8f9a0b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PLATFORM_TYPE = sa.Enum(
+    'NAVER_VIEW', 'NAVER_PLACE', 'NAVER_AD', 'GOOGLE_ADS', 'META_ADS', 'KAKAO_AD',
+    name='platformtype', create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rank_positions',
+        sa.Column('keyword_id', sa.UUID(), sa.ForeignKey('keywords.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('platform', PLATFORM_TYPE, primary_key=True),
+        sa.Column('target_id', sa.UUID(), sa.ForeignKey('targets.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('captured_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_table(
+        'rank_deltas',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('client_id', sa.UUID(), sa.ForeignKey('clients.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('keyword_id', sa.UUID(), sa.ForeignKey('keywords.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('target_id', sa.UUID(), sa.ForeignKey('targets.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('platform', PLATFORM_TYPE, nullable=False),
+        sa.Column('previous_rank', sa.Integer(), nullable=True),
+        sa.Column('current_rank', sa.Integer(), nullable=True),
+        sa.Column('rank_change', sa.Integer(), nullable=True),
+        sa.Column('captured_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index('ix_rank_deltas_keyword_captured', 'rank_deltas', ['keyword_id', 'captured_at'])
+
+    # 기존 daily_ranks 의 가장 최근 스냅샷으로 인덱스 초기화 (타겟별 최상위 순위)
+    op.execute("""
+        INSERT INTO rank_positions (keyword_id, platform, target_id, rank, captured_at)
+        SELECT d.keyword_id, d.platform, d.target_id, MIN(d.rank), MAX(d.captured_at)
+        FROM daily_ranks d
+        JOIN (
+            SELECT keyword_id, platform, MAX(captured_at) AS latest
+            FROM daily_ranks GROUP BY keyword_id, platform
+        ) l ON l.keyword_id = d.keyword_id AND l.platform = d.platform AND l.latest = d.captured_at
+        GROUP BY d.keyword_id, d.platform, d.target_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rank_deltas_keyword_captured', 'rank_deltas')
+    op.drop_table('rank_deltas')
+    op.drop_table('rank_positions')
@@ -0,0 +1,138 @@
+"""Partition daily_ranks by month and add composite indexes for hot query shapes
+
+Revision ID: k8f9a0b1c2d3
+Revises: j7e8f9a0b1c2
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k8f9a0b1c2d3'
+down_revision: Union[str, None] = 'j7e8f9a0b1c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (이름, 컬럼, INCLUDE 컬럼) - models.DailyRank.__table_args__ 와 동일하게 유지
+INDEXES = [
+    ('ix_daily_ranks_kw_platform_captured_rank', ['keyword_id', 'platform', 'captured_at', 'rank'], ['target_id']),
+    ('ix_daily_ranks_kw_platform_target_captured', ['keyword_id', 'platform', 'target_id', 'captured_at'], ['rank']),
+    ('ix_daily_ranks_target_platform_captured', ['target_id', 'platform', 'captured_at'], ['keyword_id', 'rank']),
+    ('ix_daily_ranks_client_captured', ['client_id', 'captured_at'], []),
+]
+
+COLUMNS = "id, client_id, target_id, keyword_id, platform, rank, rank_change, captured_at"
+
+# 월 파티션 생성 함수: 스케줄러가 매월 호출해 앞으로 N개월치 파티션을 미리 만든다
+ENSURE_PARTITIONS_FN = """
+CREATE OR REPLACE FUNCTION ensure_daily_ranks_partitions(from_month date, months_ahead integer)
+RETURNS integer AS $$
+DECLARE
+    m date := date_trunc('month', from_month)::date;
+    last_month date := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+    part_name text;
+    created integer := 0;
+BEGIN
+    WHILE m <= last_month LOOP
+        part_name := 'daily_ranks_' || to_char(m, 'YYYY_MM');
+        IF to_regclass(part_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF daily_ranks FOR VALUES FROM (%L) TO (%L)',
+                part_name, m, (m + interval '1 month')::date
+            );
+            created := created + 1;
+        END IF;
+        m := (m + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _create_indexes(postgres: bool) -> None:
+    for name, columns, include in INDEXES:
+        if postgres and include:
+            op.create_index(name, 'daily_ranks', columns, postgresql_include=include)
+        else:
+            op.create_index(name, 'daily_ranks', columns)
+
+
+def upgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    if not postgres:
+        _create_indexes(postgres)
+        return
+
+    # 1. 기존 테이블을 옆으로 치우고 (PK 인덱스 이름 충돌 방지)
+    op.execute("ALTER TABLE daily_ranks RENAME TO daily_ranks_unpartitioned")
+    op.execute("ALTER TABLE daily_ranks_unpartitioned RENAME CONSTRAINT daily_ranks_pkey TO daily_ranks_unpartitioned_pkey")
+
+    # 2. captured_at 기준 RANGE 파티션 테이블 (파티션 키는 PK 에 포함되어야 한다)
+    op.execute("""
+        CREATE TABLE daily_ranks (
+            id uuid NOT NULL,
+            client_id uuid REFERENCES clients(id) ON DELETE CASCADE,
+            target_id uuid NOT NULL REFERENCES targets(id),
+            keyword_id uuid NOT NULL REFERENCES keywords(id),
+            platform platformtype NOT NULL,
+            rank integer NOT NULL,
+            rank_change integer DEFAULT 0,
+            captured_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, captured_at)
+        ) PARTITION BY RANGE (captured_at)
+    """)
+    # 범위를 벗어난 행(미래 날짜 등)을 받아줄 기본 파티션
+    op.execute("CREATE TABLE daily_ranks_default PARTITION OF daily_ranks DEFAULT")
+
+    # 3. 기존 데이터 범위 + 3개월치 월 파티션 생성
+    op.execute(ENSURE_PARTITIONS_FN)
+    op.execute("""
+        SELECT ensure_daily_ranks_partitions(
+            COALESCE((SELECT MIN(captured_at) FROM daily_ranks_unpartitioned), now())::date, 3
+        )
+    """)
+
+    # 4. 인덱스는 부모에 만들면 모든 파티션에 전파된다 (데이터 적재 전에 생성)
+    _create_indexes(postgres)
+
+    # 5. 데이터 이동
+    op.execute(f"""
+        INSERT INTO daily_ranks ({COLUMNS})
+        SELECT id, client_id, target_id, keyword_id, platform, rank, rank_change, COALESCE(captured_at, now())
+        FROM daily_ranks_unpartitioned
+    """)
+    op.execute("DROP TABLE daily_ranks_unpartitioned")
+    op.execute("ANALYZE daily_ranks")
+
+
+def downgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    if not postgres:
+        for name, _, _ in INDEXES:
+            op.drop_index(name, 'daily_ranks')
+        return
+
+    op.execute("ALTER TABLE daily_ranks RENAME TO daily_ranks_partitioned")
+    op.execute("ALTER TABLE daily_ranks_partitioned RENAME CONSTRAINT daily_ranks_pkey TO daily_ranks_partitioned_pkey")
+    for name, _, _ in INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_partitioned")
+    op.execute("""
+        CREATE TABLE daily_ranks (
+            id uuid PRIMARY KEY,
+            client_id uuid REFERENCES clients(id) ON DELETE CASCADE,
+            target_id uuid NOT NULL REFERENCES targets(id),
+            keyword_id uuid NOT NULL REFERENCES keywords(id),
+            platform platformtype NOT NULL,
+            rank integer NOT NULL,
+            rank_change integer DEFAULT 0,
+            captured_at timestamptz DEFAULT now()
+        )
+    """)
+    op.execute(f"INSERT INTO daily_ranks ({COLUMNS}) SELECT {COLUMNS} FROM daily_ranks_partitioned")
+    op.execute("DROP TABLE daily_ranks_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS ensure_daily_ranks_partitions(date, integer)")
@@ -0,0 +1,64 @@
+"""Add latest_rank_snapshot table and daily_ranks.snapshot_id
+
+Revision ID: l9a0b1c2d3e4
+Revises: k8f9a0b1c2d3
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l9a0b1c2d3e4'
+down_revision: Union[str, None] = 'k8f9a0b1c2d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PLATFORM_TYPE = sa.Enum(
+    'NAVER_VIEW', 'NAVER_PLACE', 'NAVER_AD', 'GOOGLE_ADS', 'META_ADS', 'KAKAO_AD',
+    name='platformtype', create_type=False
+)
+
+
+def upgrade() -> None:
+    op.add_column('daily_ranks', sa.Column('snapshot_id', sa.UUID(), nullable=True))
+
+    op.create_table(
+        'latest_rank_snapshot',
+        sa.Column('keyword_id', sa.UUID(), sa.ForeignKey('keywords.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('platform', PLATFORM_TYPE, primary_key=True),
+        sa.Column('position', sa.Integer(), primary_key=True),
+        sa.Column('target_id', sa.UUID(), sa.ForeignKey('targets.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('client_id', sa.UUID(), sa.ForeignKey('clients.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('rank_change', sa.Integer(), nullable=True),
+        sa.Column('snapshot_id', sa.UUID(), nullable=False),
+        sa.Column('captured_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 기존 daily_ranks 의 키워드/플랫폼별 마지막 수집분으로 스냅샷 초기화
+    op.execute("""
+        INSERT INTO latest_rank_snapshot
+            (keyword_id, platform, position, target_id, client_id, rank, rank_change, snapshot_id, captured_at)
+        SELECT d.keyword_id, d.platform,
+               ROW_NUMBER() OVER (PARTITION BY d.keyword_id, d.platform ORDER BY d.rank, d.id) - 1,
+               d.target_id, d.client_id, d.rank, d.rank_change,
+               md5(d.keyword_id::text || d.platform::text || l.latest::text)::uuid,
+               d.captured_at
+        FROM daily_ranks d
+        JOIN (
+            SELECT keyword_id, platform, MAX(captured_at) AS latest
+            FROM daily_ranks GROUP BY keyword_id, platform
+        ) l ON l.keyword_id = d.keyword_id AND l.platform = d.platform AND l.latest = d.captured_at
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('latest_rank_snapshot')
+    op.drop_column('daily_ranks', 'snapshot_id')
@@ -0,0 +1,75 @@
+"""Add client_metrics_daily / client_metrics_monthly rollup tables
+
+Revision ID: m0b1c2d3e4f5
+Revises: l9a0b1c2d3e4
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm0b1c2d3e4f5'
+down_revision: Union[str, None] = 'l9a0b1c2d3e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PLATFORM_TYPE = sa.Enum(
+    'NAVER_VIEW', 'NAVER_PLACE', 'NAVER_AD', 'GOOGLE_ADS', 'META_ADS', 'KAKAO_AD',
+    name='platformtype', create_type=False
+)
+
+
+def _rollup_columns(period_column: str):
+    return [
+        sa.Column('client_id', sa.UUID(), sa.ForeignKey('clients.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('platform', PLATFORM_TYPE, primary_key=True),
+        sa.Column('campaign_id', sa.UUID(), sa.ForeignKey('campaigns.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('source', sa.String(), primary_key=True),
+        sa.Column(period_column, sa.Date(), primary_key=True),
+        sa.Column('spend', sa.Float(), nullable=True),
+        sa.Column('impressions', sa.Integer(), nullable=True),
+        sa.Column('clicks', sa.Integer(), nullable=True),
+        sa.Column('conversions', sa.Integer(), nullable=True),
+        sa.Column('revenue', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('client_metrics_daily', *_rollup_columns('date'))
+    op.create_index('ix_client_metrics_daily_client_source_date', 'client_metrics_daily', ['client_id', 'source', 'date'])
+    op.create_table('client_metrics_monthly', *_rollup_columns('month'))
+    op.create_index('ix_client_metrics_monthly_client_source_month', 'client_metrics_monthly', ['client_id', 'source', 'month'])
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 기존 metrics_daily 로 롤업 초기화
+    op.execute("""
+        INSERT INTO client_metrics_daily
+            (client_id, platform, campaign_id, source, date, spend, impressions, clicks, conversions, revenue)
+        SELECT pc.client_id, pc.platform, m.campaign_id, m.source, m.date::date,
+               SUM(COALESCE(m.spend, 0)), SUM(COALESCE(m.impressions, 0)), SUM(COALESCE(m.clicks, 0)),
+               SUM(COALESCE(m.conversions, 0)), SUM(COALESCE(m.revenue, 0))
+        FROM metrics_daily m
+        JOIN campaigns c ON c.id = m.campaign_id
+        JOIN platform_connections pc ON pc.id = c.connection_id
+        GROUP BY pc.client_id, pc.platform, m.campaign_id, m.source, m.date::date
+    """)
+    op.execute("""
+        INSERT INTO client_metrics_monthly
+            (client_id, platform, campaign_id, source, month, spend, impressions, clicks, conversions, revenue)
+        SELECT client_id, platform, campaign_id, source, date_trunc('month', date)::date,
+               SUM(spend), SUM(impressions), SUM(clicks), SUM(conversions), SUM(revenue)
+        FROM client_metrics_daily
+        GROUP BY client_id, platform, campaign_id, source, date_trunc('month', date)::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('client_metrics_monthly')
+    op.drop_table('client_metrics_daily')
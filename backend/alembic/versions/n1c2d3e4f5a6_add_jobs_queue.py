@@ -0,0 +1,56 @@
+"""Add jobs table (durable job queue)
+
+Revision ID: n1c2d3e4f5a6
+Revises: m0b1c2d3e4f5
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'n1c2d3e4f5a6'
+down_revision: Union[str, None] = 'm0b1c2d3e4f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_STATUS = sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus')
+ACTIVE = sa.text("status IN ('QUEUED', 'RUNNING')")
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('dedupe_key', sa.String(length=255), nullable=True),
+        sa.Column('status', JOB_STATUS, nullable=False),
+        sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
+        sa.Column('run_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+    )
+    # 워커 점유 쿼리: status='QUEUED' AND run_at <= now() ORDER BY priority DESC, run_at
+    op.create_index('ix_jobs_claim', 'jobs', ['status', 'priority', 'run_at'])
+    # 진행 중(QUEUED/RUNNING) 작업은 dedupe_key 당 하나 - 인스턴스 간 중복 스크래핑 방지
+    op.create_index(
+        'uq_jobs_active_dedupe_key', 'jobs', ['dedupe_key'], unique=True,
+        postgresql_where=ACTIVE, sqlite_where=ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_jobs_active_dedupe_key', table_name='jobs')
+    op.drop_index('ix_jobs_claim', table_name='jobs')
+    op.drop_table('jobs')
+    JOB_STATUS.drop(op.get_bind(), checkfirst=True)
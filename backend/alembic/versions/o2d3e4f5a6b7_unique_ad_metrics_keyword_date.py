@@ -0,0 +1,42 @@
+"""Deduplicate ad_metrics_daily and add unique (keyword_id, date)
+
+Revision ID: o2d3e4f5a6b7
+Revises: n1c2d3e4f5a6
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'o2d3e4f5a6b7'
+down_revision: Union[str, None] = 'n1c2d3e4f5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 키워드/날짜 중복 행은 가장 최근에 생성된 행만 남김
+    op.execute("""
+        DELETE FROM ad_metrics_daily
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY keyword_id, date ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM ad_metrics_daily
+                WHERE keyword_id IS NOT NULL
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_unique_constraint(
+        'ad_metrics_daily_keyword_id_date_key', 'ad_metrics_daily', ['keyword_id', 'date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ad_metrics_daily_keyword_id_date_key', 'ad_metrics_daily', type_='unique')
@@ -0,0 +1,60 @@
+"""Unique RECONCILED metrics per campaign/date and reconciliation_warnings table
+
+Revision ID: p3e4f5a6b7c8
+Revises: o2d3e4f5a6b7
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p3e4f5a6b7c8'
+down_revision: Union[str, None] = 'o2d3e4f5a6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECONCILED = sa.text("source = 'RECONCILED'")
+
+
+def upgrade() -> None:
+    # 캠페인/일자당 RECONCILED 행이 여러 개면 하나만 남김 (다음 정합 실행이 값을 다시 채움)
+    op.execute("""
+        DELETE FROM metrics_daily
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY campaign_id, date ORDER BY id) AS rn
+                FROM metrics_daily
+                WHERE source = 'RECONCILED'
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_index(
+        'uq_metrics_daily_reconciled', 'metrics_daily', ['campaign_id', 'date'], unique=True,
+        postgresql_where=RECONCILED, sqlite_where=RECONCILED,
+    )
+
+    op.create_table(
+        'reconciliation_warnings',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('campaign_id', sa.UUID(), sa.ForeignKey('campaigns.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.Column('metric', sa.String(length=50), nullable=False),
+        sa.Column('api_value', sa.Float(), nullable=True),
+        sa.Column('scraper_value', sa.Float(), nullable=True),
+        sa.Column('variance', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_reconciliation_warnings_campaign_date', 'reconciliation_warnings', ['campaign_id', 'date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reconciliation_warnings_campaign_date', table_name='reconciliation_warnings')
+    op.drop_table('reconciliation_warnings')
+    op.drop_index('uq_metrics_daily_reconciled', table_name='metrics_daily')
@@ -0,0 +1,43 @@
+"""Deduplicate sync_tasks and add unique (connection_id, target_date)
+
+Revision ID: q4f5a6b7c8d9
+Revises: p3e4f5a6b7c8
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'q4f5a6b7c8d9'
+down_revision: Union[str, None] = 'p3e4f5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 커넥션/일자 태스크가 여러 개면 COMPLETED 우선, 그다음 최근 시작된 행만 남김
+    # (sync_validations 는 ON DELETE CASCADE)
+    op.execute("""
+        DELETE FROM sync_tasks
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY connection_id, target_date
+                    ORDER BY (status = 'COMPLETED') DESC, started_at DESC NULLS LAST, id
+                ) AS rn
+                FROM sync_tasks
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_unique_constraint(
+        'sync_tasks_connection_id_target_date_key', 'sync_tasks', ['connection_id', 'target_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('sync_tasks_connection_id_target_date_key', 'sync_tasks', type_='unique')
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from typing import List, Union, Optional
 from uuid import UUID
 from app.core.database import get_db
+from app.core.async_database import AsyncDB, get_async_db
 from app.schemas.scraping import (
     SOVAnalysisRequest, SOVAnalysisResult, RankingRequest, RankingResultItem,
     CompetitorAnalysisRequest, CompetitorAnalysisResult,
@@ -14,12 +15,10 @@ from app.schemas.analysis import EfficiencyReviewResponse
 from app.services.analysis import AnalysisService
 from app.services.ai_service import AIService
 from app.services.benchmark_service import BenchmarkService
-from app.models.models import PlatformType, User, DailyRank, Target, Keyword, TargetType, Client
+from app.models.models import PlatformType, User, Target, Keyword, TargetType, Client
 from app.api.endpoints.auth import get_current_user
 from fastapi.responses import StreamingResponse
-import io
 import json
-import csv
 from pydantic import BaseModel, Field
 from uuid import uuid4
 from typing import List, Union, Optional, Dict
@@ -99,44 +98,42 @@ def analyze_sov(
     db: Session = Depends(get_db)
 ):
     service = AnalysisService(db)
-    results = []
-    
-    for keyword in request.keywords:
-        # Check specific platform requested
-        platform = PlatformType.NAVER_VIEW if request.platform == "NAVER_VIEW" else PlatformType.NAVER_PLACE
-        
-        sov_data = service.calculate_sov(keyword, request.target_hospital, platform, request.top_n)
-        
-        results.append(SOVAnalysisResult(
-            keyword=keyword,
+    # Check specific platform requested
+    platform = PlatformType.NAVER_VIEW if request.platform == "NAVER_VIEW" else PlatformType.NAVER_PLACE
+
+    # 전체 키워드를 집계 쿼리 1회로 계산
+    sov_list = service.calculate_sov_batch(request.keywords, request.target_hospital, platform, request.top_n)
+
+    return [
+        SOVAnalysisResult(
+            keyword=sov_data["keyword"],
             total_items=sov_data["total"],
             target_hits=sov_data["hits"],
             sov_score=sov_data["sov"],
-            top_rank=sov_data.get("top_rank") # Assuming service might return this
-        ))
-        
-    return results
+            top_rank=sov_data.get("top_rank")
+        )
+        for sov_data in sov_list
+    ]
 
 @router.get("/funnel/{client_id}")
-def get_funnel_analysis(
+async def get_funnel_analysis(
     client_id: str, 
     days: int = 30, 
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    db: Session = Depends(get_db)
+    adb: AsyncDB = Depends(get_async_db)
 ):
-    service = AnalysisService(db)
-    
     # Parse dates if provided
     s_date = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
     e_date = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
     
-    return service.get_funnel_data(client_id, start_date=s_date, end_date=e_date, days=days)
+    return await adb.run_sync(
+        lambda db: AnalysisService(db).get_funnel_data(client_id, start_date=s_date, end_date=e_date, days=days)
+    )
 
 @router.get("/cohort/{client_id}")
-def get_cohort_analysis(client_id: str, db: Session = Depends(get_db)):
-    service = AnalysisService(db)
-    return service.get_cohort_data(client_id)
+async def get_cohort_analysis(client_id: str, adb: AsyncDB = Depends(get_async_db)):
+    return await adb.run_sync(lambda db: AnalysisService(db).get_cohort_data(client_id))
 
 @router.get("/attribution/{client_id}")
 def get_attribution_analysis(client_id: str, db: Session = Depends(get_db)):
@@ -164,13 +161,12 @@ def get_current_user_wrapper(db: Session = Depends(get_db), token: str = Depends
     return get_current_user(token, db)
 
 @router.get("/benchmark/{client_id}")
-def get_benchmark_comparison(
+async def get_benchmark_comparison(
     client_id: UUID,
-    db: Session = Depends(get_db),
+    adb: AsyncDB = Depends(get_async_db),
     current_user: User = Depends(get_current_user_wrapper)
 ):
-    service = BenchmarkService(db)
-    return service.compare_client_performance(client_id)
+    return await adb.run_sync(lambda db: BenchmarkService(db).compare_client_performance(client_id))
 
 @router.get("/efficiency/{client_id}", response_model=EfficiencyReviewResponse)
 def get_efficiency_review(
@@ -377,23 +373,18 @@ def download_analysis_result(
     filename = f"analysis_{history.keyword}_{history.created_at.strftime('%Y%m%d')}"
     
     if format == "csv":
-        output = io.StringIO()
-        writer = csv.writer(output)
+        from app.core.export_stream import iter_csv
         # Assuming result_data is a dict, we flatten it a bit or just dump as rows
-        writer.writerow(["Field", "Value"])
-        for k, v in history.result_data.items():
-            writer.writerow([k, str(v)])
-        
-        output.seek(0)
+        rows = ({"Field": k, "Value": str(v)} for k, v in history.result_data.items())
         return StreamingResponse(
-            io.BytesIO(output.getvalue().encode('utf-8-sig')),
+            iter_csv([("Field", "str"), ("Value", "str")], rows),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}.csv"}
         )
     
     # Default to JSON
     return StreamingResponse(
-        io.BytesIO(json.dumps(history.result_data, indent=2, ensure_ascii=False).encode('utf-8')),
+        iter([json.dumps(history.result_data, indent=2, ensure_ascii=False).encode('utf-8')]),
         media_type="application/json",
         headers={"Content-Disposition": f"attachment; filename={filename}.json"}
     )
@@ -874,11 +865,11 @@ def assistant_stream(
 
 
 @router.get("/scrape-results/{client_id}")
-def get_scrape_results(
+async def get_scrape_results(
     client_id: str,
     keyword: Optional[str] = None,
     platform: str = "NAVER_PLACE",
-    db: Session = Depends(get_db),
+    adb: AsyncDB = Depends(get_async_db),
 ):
     """
     실제 스크래핑 결과 조회 (DailyRank 테이블에서)
@@ -901,7 +892,19 @@ def get_scrape_results(
         client_uuid = UUID(client_id)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid client_id format")
+
+    results_list = await adb.run_sync(lambda db: _load_scrape_results(db, client_uuid, keyword, platform))
     
+    return {
+        "has_data": len(results_list) > 0,
+        "keyword": keyword,
+        "platform": platform,
+        "results": results_list,
+        "total_count": len(results_list),
+    }
+
+
+def _load_scrape_results(db: Session, client_uuid: UUID, keyword: Optional[str], platform: str) -> List[dict]:
     # 클라이언트 존재 확인
     client = db.query(Client).filter(Client.id == client_uuid).first()
     if not client:
@@ -926,15 +929,11 @@ def get_scrape_results(
     from datetime import timedelta
     since = datetime.utcnow() - timedelta(hours=24)
 
-    query = db.query(DailyRank).filter(DailyRank.client_id == client_uuid)
-    query = query.filter(DailyRank.platform == platform_enum)      # [FIX] platform 필터
-    query = query.filter(DailyRank.captured_at >= since)           # [FIX] 24h 타임윈도우
-
-    if keyword_obj:
-        query = query.filter(DailyRank.keyword_id == keyword_obj.id)
-
-    # 최신 데이터 먼저 정렬
-    results = query.order_by(DailyRank.captured_at.desc()).all()
+    # [FIX] platform 필터 + 24h 타임윈도우, 최신 데이터 먼저 (타겟 컬럼 JOIN 1회)
+    from app.services.rank_repository import RankReadRepository
+    results = RankReadRepository(db).history(
+        client_uuid, platform_enum, since, keyword_id=keyword_obj.id if keyword_obj else None
+    )
     
     # 응답 구성
     results_list = []
@@ -942,20 +941,13 @@ def get_scrape_results(
         result_item = {
             "rank": r.rank,
             "rank_change": r.rank_change,
-            "target_name": r.target.name if r.target else None,
-            "target_type": r.target.type.value if r.target and r.target.type else None,
-            "link": r.target.urls.get("default") if r.target and r.target.urls else None,
+            "target_name": r.target_name,
+            "target_type": r.target_type.value if r.target_type else None,
+            "link": r.url,
             "captured_at": r.captured_at.isoformat() if r.captured_at else None,
         }
         results_list.append(result_item)
-    
-    return {
-        "has_data": len(results_list) > 0,
-        "keyword": keyword,
-        "platform": platform,
-        "results": results_list,
-        "total_count": len(results_list),
-    }
+    return results_list
 
 
 @router.get("/assistant/sessions")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 from app.services.ai_service import AIService
@@ -41,8 +41,7 @@ def get_recommendations(data: RecommendationRequest):
     return result
 
 @router.post("/sync")
-async def trigger_full_sync(
-    background_tasks: BackgroundTasks,
+def trigger_full_sync(
     db: Session = Depends(get_db)
 ):
     """
@@ -58,13 +57,12 @@ async def trigger_full_sync(
         # Just return message asking user to connect manually.
         return {"status": "SKIPPED", "message": "활성화된 플랫폼 연결이 없습니다. 설정 > 데이터 연결에서 연동을 먼저 진행해주세요."}
     
-    from app.tasks.sync_data import sync_all_channels, run_sync_process
-    background_tasks.add_task(run_sync_process, db)
+    from app.services.job_queue import JobQueue
+    JobQueue(db).enqueue("sync.all", {}, dedupe_key="sync:all")
     return {"status": "SUCCESS", "message": "전체 채널 데이터 동기화가 시작되었습니다."}
 
 @router.post("/cron-sync")
-async def trigger_cron_sync(
-    background_tasks: BackgroundTasks,
+def trigger_cron_sync(
     db: Session = Depends(get_db)
 ):
     """
@@ -72,12 +70,14 @@ async def trigger_cron_sync(
     """
     from datetime import datetime
     logger.info("Cron Sync triggered via Cloud Scheduler.")
-    from app.tasks.sync_data import sync_all_channels
-    background_tasks.add_task(sync_all_channels, db)
+    from app.services.job_queue import JobQueue
+    # 여러 인스턴스/중복 호출이 와도 진행 중인 전체 동기화는 하나만 유지
+    job, created = JobQueue(db).enqueue("sync.all", {}, dedupe_key="sync:all")
     
     return {
         "status": "ACCEPTED",
-        "message": "Data synchronization routine has been dispatched to background tasks.",
+        "message": "Data synchronization routine has been queued." if created else "Data synchronization is already queued or running.",
+        "job_id": str(job.id),
         "timestamp": datetime.utcnow().isoformat()
     }
 
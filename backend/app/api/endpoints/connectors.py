@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.models.models import PlatformConnection, PlatformType
-from app.tasks.sync_data import sync_naver_data
+from app.services.job_queue import JobQueue
 
 router = APIRouter()
 
@@ -43,7 +43,6 @@ def connect_platform(
     platform_id: str, 
     client_id: str, 
     credentials: dict, 
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     if platform_id == "naver_ads":
@@ -67,7 +66,11 @@ def connect_platform(
 
     # Trigger initial sync
     if platform_id == "naver_ads":
-        background_tasks.add_task(sync_naver_data, db, str(new_conn.id))
+        JobQueue(db).enqueue(
+            "sync.connection",
+            {"connection_id": str(new_conn.id)},
+            dedupe_key=f"sync:connection:{new_conn.id}",
+        )
 
     return {
         "status": "SUCCESS",
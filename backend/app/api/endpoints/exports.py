@@ -0,0 +1,80 @@
+"""
+원본 이력 스트리밍 내보내기 (CSV / NDJSON / Parquet)
+
+GET /exports/ranks, /exports/metrics ?client_id=&start_date=&end_date=&platform=&format=
+행 수와 무관하게 서버 메모리는 배치 하나 분량만 사용한다 (DataExportService + app.core.export_stream).
+"""
+import datetime
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.auth import get_current_user
+from app.core.database import get_db
+from app.core.export_stream import EXPORT_FORMATS, ExportFormatUnavailable, check_export_format, stream_export
+from app.models.models import Client, PlatformType, User, UserRole
+from app.services.data_export import METRIC_COLUMNS, RANK_COLUMNS, DataExportService
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+FORMAT_PATTERN = "^(csv|ndjson|parquet)$"
+
+
+def _authorize_client(db: Session, client_id: UUID, current_user: User) -> Client:
+    client = db.query(Client).filter(Client.id == client_id).first()
+    if not client:
+        raise HTTPException(status_code=404, detail="Client not found")
+    if client.agency_id != current_user.agency_id and current_user.role != UserRole.SUPER_ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return client
+
+
+def _export_response(kind: str, fmt: str, columns, rows, start_date, end_date) -> StreamingResponse:
+    try:
+        check_export_format(fmt)
+    except ExportFormatUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    period = "_".join(d.strftime("%Y%m%d") for d in (start_date, end_date) if d) or "all"
+    filename = f"{kind}_{period}.{fmt}"
+    return StreamingResponse(
+        stream_export(fmt, columns, rows),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.get("/ranks")
+def export_ranks(
+    client_id: UUID,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    platform: Optional[PlatformType] = None,
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """클라이언트의 DailyRank 이력 (captured_at 순)."""
+    _authorize_client(db, client_id, current_user)
+    rows = DataExportService().rank_rows(client_id, start_date, end_date, platform)
+    return _export_response("ranks", format, RANK_COLUMNS, rows, start_date, end_date)
+
+
+@router.get("/metrics")
+def export_metrics(
+    client_id: UUID,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    platform: Optional[PlatformType] = None,
+    format: str = Query("csv", pattern=FORMAT_PATTERN),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """클라이언트의 MetricsDaily 이력 (모든 source, 일자 순)."""
+    _authorize_client(db, client_id, current_user)
+    rows = DataExportService().metric_rows(client_id, start_date, end_date, platform)
+    return _export_response("metrics", format, METRIC_COLUMNS, rows, start_date, end_date)
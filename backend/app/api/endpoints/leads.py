@@ -103,29 +103,26 @@ def get_cohort_data(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """코호트 분석 - 월별 리드 유입 및 전환율 추이"""
-    rows = db.query(
-        Lead.cohort_month,
-        func.count(Lead.id).label("total"),
-        func.sum(LeadActivity.conversions).label("conversions"),
-        func.sum(LeadActivity.revenue).label("revenue"),
-    ).outerjoin(LeadActivity, Lead.id == LeadActivity.lead_id)\
-     .filter(Lead.client_id == client_id)\
-     .group_by(Lead.cohort_month)\
-     .order_by(Lead.cohort_month).all()
-
+    """코호트 분석 - 월별 리드 유입 및 전환율 추이 (AnalysisService 코호트 매트릭스 공유)"""
+    from app.services.analysis import AnalysisService
     return [
         {
-            "cohort_month": r.cohort_month,
-            "total_leads": r.total,
-            "conversions": int(r.conversions or 0),
-            "revenue": float(r.revenue or 0),
-            "conversion_rate": round(int(r.conversions or 0) / r.total * 100, 1) if r.total > 0 else 0,
+            "cohort_month": c["month"],
+            "total_leads": c["size"],
+            "conversions": c["conversions"],
+            "revenue": c["revenue"],
+            "conversion_rate": round(c["conversions"] / c["size"] * 100, 1) if c["size"] > 0 else 0,
         }
-        for r in rows
+        for c in AnalysisService(db).get_cohort_matrix(client_id)
     ]
 
 
+def _invalidate_cohort_cache(db: Session, client_id: UUID):
+    from app.services.analysis import AnalysisService
+    from app.services.analytics_cache import invalidate_client_analytics
+    invalidate_client_analytics(db, client_id, prefix=AnalysisService.get_cohort_matrix.cache_namespace)
+
+
 # [NOTE] /{client_id}는 구체적 경로들보다 반드시 뒤에 위치해야 함
 @router.get("/{client_id}", response_model=List[LeadResponse])
 def get_leads(
@@ -166,6 +163,7 @@ def create_lead(
         cohort_month=cohort_month,
     )
     db.add(lead)
+    _invalidate_cohort_cache(db, data.client_id)
     db.commit()
     db.refresh(lead)
     return lead
@@ -182,6 +180,7 @@ def delete_lead(
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     db.delete(lead)
+    _invalidate_cohort_cache(db, lead.client_id)
     db.commit()
 
 
@@ -206,5 +205,6 @@ def add_lead_activity(
         revenue=data.revenue,
     )
     db.add(activity)
+    _invalidate_cohort_cache(db, lead.client_id)
     db.commit()
     return {"status": "SUCCESS"}
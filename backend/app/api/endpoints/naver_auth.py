@@ -1,6 +1,6 @@
 import os
 import secrets
-import httpx
+from app.core.http_client import get_http_client
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
@@ -48,11 +48,11 @@ async def naver_callback(
         "state": state
     }
     
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(token_url, params=params)
-        if resp.status_code != 200:
-            raise HTTPException(status_code=400, detail="Failed to get token from Naver")
-        token_data = resp.json()
+    client = get_http_client("nid.naver.com")
+    resp = await client.post(token_url, params=params)
+    if resp.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to get token from Naver")
+    token_data = resp.json()
         
     # 2. Update or Create Connection
     # Note: client_id needs to be tracked. In this simplified version, 
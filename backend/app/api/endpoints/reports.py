@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -12,6 +12,7 @@ from app.schemas.reports import (
 from app.api.endpoints.auth import get_current_user
 from app.services.analysis import AnalysisService
 from app.services.report_builder import ReportBuilderService
+from app.services.job_queue import JobQueue
 from app.services.pdf_generator import PDFGeneratorService
 from app.services.email_service import EmailService
 from pydantic import BaseModel, EmailStr
@@ -98,28 +99,11 @@ def delete_template(
     db.commit()
     return {"status": "SUCCESS", "message": "Template deleted"}
 
-# --- Helper for Background Tasks ---
-
-from app.core.database import SessionLocal
-
-def process_report_task(report_id: UUID):
-    db = SessionLocal()
-    try:
-        service = ReportBuilderService(db)
-        service.generate_report_data(report_id)
-    except Exception as e:
-        import logging
-        logging.error(f"CRITICAL ERROR in process_report_task: {str(e)}")
-        db.rollback()
-    finally:
-        db.close()
-
 # --- Report Endpoints ---
 
 @router.post("", response_model=ReportResponse)
 def create_report(
     report_data: ReportCreate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -138,8 +122,12 @@ def create_report(
     db.commit()
     db.refresh(new_report)
     
-    # 2. Trigger data generation in background
-    background_tasks.add_task(process_report_task, new_report.id)
+    # 2. Trigger data generation in background (job queue, 실패 시 backoff 재시도)
+    JobQueue(db).enqueue(
+        "report.generate",
+        {"report_id": str(new_report.id)},
+        dedupe_key=f"report:{new_report.id}",
+    )
     
     return new_report
 
@@ -293,11 +281,7 @@ def download_report_pdf(
     # 4. PDF 생성
     try:
         pdf_service = PDFGeneratorService()
-        pdf_bytes = pdf_service.generate_report_pdf(
-            report_data=report.data or {},
-            template_config=template.config,
-            client_name=client.name
-        )
+        pdf_bytes = pdf_service.generate_cached_report_pdf(report, template.config, client.name)
 
         # 5. Response 반환
         return Response(
@@ -353,11 +337,7 @@ def send_report_email(
     # 4. PDF 생성
     try:
         pdf_service = PDFGeneratorService()
-        pdf_bytes = pdf_service.generate_report_pdf(
-            report_data=report.data or {},
-            template_config=template.config,
-            client_name=client.name
-        )
+        pdf_bytes = pdf_service.generate_cached_report_pdf(report, template.config, client.name)
 
         # 5. 이메일 발송
         email_service = EmailService()
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.core.database import get_db, engine
 from app.models.models import Notification, User
@@ -11,24 +11,47 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Status"])
 
 @router.post("/sync")
-async def trigger_manual_sync(
-    background_tasks: BackgroundTasks,
+def trigger_manual_sync(
     client_id: str = None, 
     days: int = None, 
     db: Session = Depends(get_db)
 ):
     """
     Manually triggers the sync pipeline for a specific client or all clients.
-    Offloads to BackgroundTasks to prevent timeout.
+    Offloads to the job queue to prevent timeout (같은 대상의 진행 중 동기화는 하나만 유지).
     """
-    from app.scripts.sync_data import run_sync_process
+    from app.services.job_queue import JobQueue
     
-    # Offload to BackgroundTasks
-    background_tasks.add_task(run_sync_process, client_id=client_id, days=days)
+    JobQueue(db).enqueue(
+        "sync.all",
+        {"client_id": client_id, "days": days},
+        dedupe_key=f"sync:client:{client_id}" if client_id else "sync:all",
+        priority=5,
+    )
     
     msg = f"광고주({client_id})의 {f'{days}일치 ' if days else ''}데이터 조사가 시작되었습니다. 완료 시 알림이 발송됩니다." if client_id else "전체 데이터 동기화가 백그라운드에서 시작되었습니다."
     return {"status": "SUCCESS", "message": msg}
 
+@router.get("/scrape-pipeline")
+def get_scrape_pipeline_stats():
+    """마지막 순위 수집 파이프라인 실행의 단계별 처리량 카운터."""
+    from app.scrapers.pipeline import get_last_pipeline_stats
+    stats = get_last_pipeline_stats()
+    if not stats:
+        return {"status": "NO_RUN", "message": "아직 실행된 수집 파이프라인이 없습니다."}
+    return {"status": "SUCCESS", **stats}
+
+@router.get("/analytics-cache")
+def get_analytics_cache_stats():
+    """분석 캐시(LRU / analytics_cache 테이블)와 지표 소스 결정 캐시의 히트/미스 카운터 (인스턴스 기준)."""
+    from app.services.analytics_cache import get_analytics_cache
+    from app.services.source_resolution import get_source_cache
+    return {
+        "status": "SUCCESS",
+        "analytics": get_analytics_cache().stats(),
+        "source_resolution": get_source_cache().snapshot(),
+    }
+
 @router.get("/naver-health")
 def check_naver_api_health(db: Session = Depends(get_db)):
     """Tests if the Naver Ads API keys are valid (Checks the first active connection)."""
@@ -149,6 +172,7 @@ def reset_all_data(db: Session = Depends(get_db)):
     try:
         from app.models.models import (
             Client, PlatformConnection, Campaign, Leads, MetricsDaily,
+            ClientMetricsDaily, ClientMetricsMonthly,
             AnalysisHistory, Notification, SystemConfig
         )
         
@@ -157,6 +181,10 @@ def reset_all_data(db: Session = Depends(get_db)):
         # Delete in correct order to avoid foreign key constraints
         db.query(MetricsDaily).delete()
         logger.info("✅ MetricsDaily deleted")
+
+        db.query(ClientMetricsDaily).delete()
+        db.query(ClientMetricsMonthly).delete()
+        logger.info("✅ Metrics rollups deleted")
         
         db.query(Campaign).delete()
         logger.info("✅ Campaign deleted")
@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.services.trend_analysis import TrendAnalysisService
-from app.models.models import User
+from app.models.models import User, PlatformType
 from app.api.endpoints.auth import get_current_user
 from typing import Optional
 from uuid import UUID
+import datetime
 
 router = APIRouter(tags=["Trend Analysis"])
 
@@ -124,6 +125,40 @@ def predict_search_trends(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/rank-deltas/{client_id}")
+def get_rank_deltas(
+    client_id: UUID,
+    hours: int = Query(24, ge=1, le=24 * 31),
+    platform: Optional[PlatformType] = None,
+    keyword_id: Optional[UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    순위 변동 스트림 조회
+
+    최근 {hours}시간 동안 바뀐 위치(신규 진입 / 순위 변동 / 이탈)만 반환.
+    rank_change = 이전 순위 - 현재 순위 (양수 = 상승)
+    """
+    service = TrendAnalysisService(db)
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=hours)
+
+    try:
+        deltas = service.get_rank_deltas(
+            client_id=client_id,
+            since=since,
+            platform=platform,
+            keyword_id=keyword_id
+        )
+
+        return {
+            "status": "SUCCESS",
+            "count": len(deltas),
+            "deltas": deltas
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/alerts/ranking-drop/{client_id}")
 def create_ranking_drop_alert(
     client_id: UUID,
@@ -134,7 +169,7 @@ def create_ranking_drop_alert(
     """
     순위 급락 알림 생성
 
-    전일 대비 순위가 {rank_drop_threshold}위 이상 하락한 키워드 감지
+    최근 24시간 동안 자사 순위가 {rank_drop_threshold}위 이상 하락한 키워드 감지 (순위 변동 스트림 기반)
 
     **Response**:
     ```json
@@ -145,6 +180,7 @@ def create_ranking_drop_alert(
             {
                 "keyword_id": "uuid",
                 "keyword": "임플란트",
+                "platform": "NAVER_PLACE",
                 "previous_rank": 2,
                 "current_rank": 8,
                 "drop": 6
@@ -0,0 +1,109 @@
+"""
+지표 이상치 탐지 (rolling z-score / IQR) - numpy 벡터 연산, DB 의존성 없음
+
+입력은 [캠페인 × 일자] 행렬 (결측은 NaN, 일자는 빈 날 없이 연속). 각 칸을 같은 캠페인의
+직전 window 일 이력과 비교하므로 여러 커넥션·여러 날짜를 한 번에 판정할 수 있다.
+- z-score: |x - 이력 평균| / 이력 표준편차 > z_threshold
+- IQR: x < Q1 - k·IQR 또는 x > Q3 + k·IQR
+이력이 min_history 일 미만이거나 표준편차/IQR 가 0 이면 판정하지 않는다 (이상치 아님).
+"""
+import datetime
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+HISTORY_WINDOW = 28
+MIN_HISTORY = 7
+Z_THRESHOLD = 3.0
+IQR_K = 1.5
+
+
+def safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """분모가 0/결측이면 NaN (CTR = clicks/impressions, CVR = conversions/clicks)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def build_matrices(rows: Iterable[Tuple], fields: Tuple[str, ...]):
+    """
+    Args:
+        rows: (campaign_id, date, *values) - values 순서는 fields 와 동일
+
+    Returns:
+        (campaign_ids, days, {field: [캠페인 × 일자] float 행렬})
+        days 는 최소~최대 일자의 연속 구간
+    """
+    rows = list(rows)
+    if not rows:
+        return [], [], {field: np.empty((0, 0)) for field in fields}
+    campaign_ids = list(dict.fromkeys(r[0] for r in rows))
+    first = min(r[1] for r in rows)
+    span = (max(r[1] for r in rows) - first).days + 1
+    days = [first + datetime.timedelta(days=i) for i in range(span)]
+
+    row_index = {cid: i for i, cid in enumerate(campaign_ids)}
+    ri = np.fromiter((row_index[r[0]] for r in rows), dtype=np.intp, count=len(rows))
+    ci = np.fromiter(((r[1] - first).days for r in rows), dtype=np.intp, count=len(rows))
+    matrices = {}
+    for k, field in enumerate(fields):
+        matrix = np.full((len(campaign_ids), span), np.nan)
+        matrix[ri, ci] = [float(r[2 + k] or 0) for r in rows]
+        matrices[field] = matrix
+    return campaign_ids, days, matrices
+
+
+def trailing_windows(matrix: np.ndarray, window: int) -> np.ndarray:
+    """[n, d] → [n, d, window]: 각 칸의 직전 window 일 값 (당일 제외, 시작 전 구간은 NaN)."""
+    n, d = matrix.shape
+    padded = np.concatenate([np.full((n, window), np.nan), matrix], axis=1)
+    return sliding_window_view(padded, window, axis=1)[:, :d, :]
+
+
+def rolling_outliers(matrix: np.ndarray, window: int = HISTORY_WINDOW, min_history: int = MIN_HISTORY,
+                     z_threshold: float = Z_THRESHOLD, iqr_k: float = IQR_K) -> Dict[str, np.ndarray]:
+    """
+    Returns:
+        {"z": z-score (판정 불가 칸은 NaN), "zscore": z-score 이상치 여부, "iqr": IQR 이상치 여부} - 모두 [n, d]
+    """
+    if matrix.size == 0:
+        empty = np.zeros(matrix.shape, dtype=bool)
+        return {"z": np.full(matrix.shape, np.nan), "zscore": empty, "iqr": empty.copy()}
+    history = trailing_windows(matrix, window)
+    count = np.sum(~np.isnan(history), axis=2)
+    with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+        # 이력이 전부 NaN 인 칸 (All-NaN slice) 은 아래 enough 마스크로 제외
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(history, axis=2)
+        std = np.nanstd(history, axis=2)
+        q1, q3 = np.nanpercentile(history, [25, 75], axis=2)
+        enough = (count >= min_history) & ~np.isnan(matrix)
+        z = np.where(enough & (std > 0), (matrix - mean) / std, np.nan)
+        iqr = q3 - q1
+        iqr_flag = enough & (iqr > 0) & ((matrix < q1 - iqr_k * iqr) | (matrix > q3 + iqr_k * iqr))
+    return {"z": z, "zscore": np.abs(np.nan_to_num(z)) > z_threshold, "iqr": iqr_flag}
+
+
+def detect_metric_anomalies(spend: np.ndarray, impressions: np.ndarray, clicks: np.ndarray,
+                            conversions: np.ndarray, **kwargs: Any) -> Dict[str, Dict[str, np.ndarray]]:
+    """spend / CTR / CVR 각각의 rolling_outliers 결과. 키: 'spend', 'ctr', 'cvr'."""
+    series = {
+        "spend": spend,
+        "ctr": safe_ratio(clicks, impressions),
+        "cvr": safe_ratio(conversions, clicks),
+    }
+    return {name: {"value": values, **rolling_outliers(values, **kwargs)} for name, values in series.items()}
+
+
+def flagged_checks(anomalies: Dict[str, Dict[str, np.ndarray]], rows: np.ndarray, col: Optional[int]) -> Dict[str, List[int]]:
+    """특정 일자(col)·캠페인 행들(rows)에서 걸린 검사 → {'spend_zscore': [행 인덱스...], ...} (모든 검사 키 포함)."""
+    result = {}
+    for metric, result_set in anomalies.items():
+        for check in ("zscore", "iqr"):
+            if col is None or not len(rows):
+                result[f"{metric}_{check}"] = []
+                continue
+            mask = result_set[check][rows, col]
+            result[f"{metric}_{check}"] = [int(r) for r in rows[mask]]
+    return result
@@ -0,0 +1,62 @@
+"""
+코호트 리텐션 매트릭스 (DB 의존성 없는 순수 로직)
+
+cohort_month / activity_month 는 'YYYY-MM' 문자열이며, 월 오프셋은
+(연 * 12 + 월) 차이로 계산한다 (SQL 쪽도 같은 식을 사용).
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAX_RETENTION_OFFSET = 5  # 유입 월 + 이후 5개월
+
+
+def month_index(month: str) -> int:
+    year, mon = map(int, month.split("-"))
+    return year * 12 + mon
+
+
+def month_offset(cohort_month: str, activity_month: str) -> int:
+    return month_index(activity_month) - month_index(cohort_month)
+
+
+def build_cohort_matrix(
+    rows: Iterable[Tuple[str, int, Optional[int], Optional[int], Optional[int], Optional[float]]],
+    max_offset: int = MAX_RETENTION_OFFSET,
+) -> List[Dict[str, Any]]:
+    """
+    Args:
+        rows: (cohort_month, size, offset, active_leads, conversions, revenue) - 활동이 없는 코호트는 offset=None
+
+    Returns:
+        cohort_month 오름차순 [{"month", "size", "active": [...], "retention": [...], "conversions", "revenue"}]
+        - active[k]: k 개월 후 활동한 리드 수 (0..max_offset, 빈 달은 0)
+        - retention: [100.0, k=1.. 비율(%)] - 관측된 마지막 오프셋까지
+    """
+    cohorts: Dict[str, Dict[str, Any]] = {}
+    for cohort_month, size, offset, active, conversions, revenue in rows:
+        cohort = cohorts.setdefault(cohort_month, {
+            "month": cohort_month,
+            "size": int(size or 0),
+            "active": [0] * (max_offset + 1),
+            "last_offset": 0,
+            "conversions": 0,
+            "revenue": 0.0,
+        })
+        if offset is None:
+            continue
+        cohort["conversions"] += int(conversions or 0)
+        cohort["revenue"] += float(revenue or 0)
+        if 0 <= offset <= max_offset:
+            cohort["active"][offset] = int(active or 0)
+            cohort["last_offset"] = max(cohort["last_offset"], offset)
+
+    results = []
+    for month in sorted(cohorts):
+        cohort = cohorts[month]
+        size = cohort["size"]
+        retention = [100.0] + [
+            round(cohort["active"][k] / size * 100, 1) if size > 0 else 0.0
+            for k in range(1, cohort.pop("last_offset") + 1)
+        ]
+        cohort["retention"] = retention
+        results.append(cohort)
+    return results
@@ -0,0 +1,30 @@
+"""
+작업 큐 재시도 판단 (DB 의존성 없는 순수 로직)
+
+재시도 간격은 지수 backoff (base * 2^(attempt-1), cap 상한) 이며, jitter 는 여러 인스턴스가
+같은 순간에 몰리지 않도록 최대 jitter 비율만큼 늘리는 방향으로만 적용한다.
+"""
+DEFAULT_BACKOFF_BASE_SECONDS = 30.0
+DEFAULT_BACKOFF_CAP_SECONDS = 1800.0
+
+
+def backoff_seconds(
+    attempt: int,
+    base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+    cap: float = DEFAULT_BACKOFF_CAP_SECONDS,
+    jitter: float = 0.0,
+    rand: float = 0.0,
+) -> float:
+    """
+    Args:
+        attempt: 방금 실패한 시도 번호 (1부터)
+        jitter: 0..1, 지연을 최대 jitter 비율만큼 늘림
+        rand: 0..1 난수 (호출자가 random.random() 전달)
+    """
+    delay = min(cap, base * (2 ** max(attempt - 1, 0)))
+    return delay * (1 + jitter * rand)
+
+
+def should_retry(attempts: int, max_attempts: int) -> bool:
+    return attempts < max_attempts
+
@@ -0,0 +1,62 @@
+"""
+metrics_daily → 클라이언트 롤업 집계 (DB 의존성 없는 순수 로직)
+
+롤업 키: (client_id, platform, campaign_id, source, 기간 시작일)
+- 일별: 기간 시작일 = 해당 일자
+- 월별: 기간 시작일 = 해당 월 1일
+"""
+import datetime
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+METRIC_FIELDS = ("spend", "impressions", "clicks", "conversions", "revenue")
+
+RollupKey = Tuple[Any, Any, Any, str, datetime.date]
+
+
+def as_date(value) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def month_start(value) -> datetime.date:
+    return as_date(value).replace(day=1)
+
+
+def _roll_up(rows: Iterable[Tuple], bucket: Callable[[Any], datetime.date]) -> Dict[RollupKey, Dict[str, float]]:
+    totals: Dict[RollupKey, Dict[str, float]] = {}
+    for client_id, platform, campaign_id, source, day, *values in rows:
+        key = (client_id, platform, campaign_id, source, bucket(day))
+        agg = totals.setdefault(key, dict.fromkeys(METRIC_FIELDS, 0))
+        for field, value in zip(METRIC_FIELDS, values):
+            agg[field] += value or 0
+    return totals
+
+
+def roll_up_daily(rows: Iterable[Tuple]) -> Dict[RollupKey, Dict[str, float]]:
+    """
+    Args:
+        rows: (client_id, platform, campaign_id, source, date|datetime, spend, impressions, clicks, conversions, revenue)
+
+    Returns:
+        {(client_id, platform, campaign_id, source, date): {metric: 합계}}
+    """
+    return _roll_up(rows, as_date)
+
+
+def roll_up_monthly(rows: Iterable[Tuple]) -> Dict[RollupKey, Dict[str, float]]:
+    """roll_up_daily 와 같은 입력을 월 단위(월 1일 키)로 집계."""
+    return _roll_up(rows, month_start)
+
+
+def to_records(totals: Dict[RollupKey, Dict[str, float]], period_field: str) -> List[Dict[str, Any]]:
+    """집계 결과를 bulk insert 용 dict 목록으로 변환."""
+    return [
+        {
+            "client_id": client_id,
+            "platform": platform,
+            "campaign_id": campaign_id,
+            "source": source,
+            period_field: period,
+            **metrics,
+        }
+        for (client_id, platform, campaign_id, source, period), metrics in totals.items()
+    ]
@@ -0,0 +1,97 @@
+"""
+순위 변동(delta) 계산 (DB 의존성 없는 순수 로직)
+
+위치 키 = (keyword_id, platform, target_id)
+rank_change = previous_rank - current_rank  (양수 = 상승, 음수 = 하락)
+"""
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+PositionKey = Tuple[Hashable, Hashable, Hashable]
+
+
+def rank_change(previous_rank: Optional[int], current_rank: Optional[int]) -> Optional[int]:
+    """이전/현재 순위가 모두 있을 때만 변동폭 반환 (신규 진입/이탈은 None)."""
+    if previous_rank is None or current_rank is None:
+        return None
+    return previous_rank - current_rank
+
+
+def best_positions(observations: List[Tuple[PositionKey, int]]) -> Dict[PositionKey, int]:
+    """같은 타겟이 한 결과에 여러 번 노출되면 가장 높은 순위(최소값)만 남긴다."""
+    best: Dict[PositionKey, int] = {}
+    for key, rank in observations:
+        if key not in best or rank < best[key]:
+            best[key] = rank
+    return best
+
+
+def diff_rank_positions(
+    previous: Dict[PositionKey, int],
+    current: Dict[PositionKey, int],
+) -> List[Dict[str, Any]]:
+    """
+    마지막으로 알려진 순위(previous)와 이번 수집 결과(current)를 비교해 바뀐 위치만 반환.
+
+    이탈 판정은 이번 배치에서 결과가 있었던 (keyword_id, platform) 범위에 한정한다.
+    (스크래핑 실패로 빈 결과가 온 키워드의 기존 순위를 모두 이탈로 처리하지 않기 위함)
+
+    Args:
+        previous: {(keyword_id, platform, target_id): rank} 해당 범위의 마지막 순위
+        current: {(keyword_id, platform, target_id): rank} 이번 배치의 순위
+
+    Returns:
+        [{"key": PositionKey, "previous_rank": int|None, "current_rank": int|None, "rank_change": int|None}, ...]
+        previous_rank None = 신규 진입, current_rank None = 순위권 이탈
+    """
+    observed_scopes = {(kw, platform) for kw, platform, _ in current}
+    deltas = []
+
+    for key, rank in current.items():
+        prev = previous.get(key)
+        if prev == rank:
+            continue
+        deltas.append({
+            "key": key,
+            "previous_rank": prev,
+            "current_rank": rank,
+            "rank_change": rank_change(prev, rank),
+        })
+
+    for key, prev in previous.items():
+        if key in current or (key[0], key[1]) not in observed_scopes:
+            continue
+        deltas.append({
+            "key": key,
+            "previous_rank": prev,
+            "current_rank": None,
+            "rank_change": None,
+        })
+
+    return deltas
+
+
+def summarize_rank_drops(deltas: List[Dict[str, Any]], threshold: int) -> List[Dict[str, Any]]:
+    """
+    기간 내 delta 를 위치별로 접어 순 변동을 구하고 threshold 이상 하락한 위치만 반환.
+
+    Args:
+        deltas: 시간순 [{"key": ..., "previous_rank": ..., "current_rank": ...}, ...]
+        threshold: 하락 임계값 (위)
+
+    Returns:
+        [{"key": ..., "previous_rank": int, "current_rank": int, "drop": int}, ...] 하락폭 내림차순
+    """
+    folded: Dict[PositionKey, List[Optional[int]]] = {}
+    for d in deltas:
+        if d["key"] not in folded:
+            folded[d["key"]] = [d["previous_rank"], d["current_rank"]]
+        else:
+            folded[d["key"]][1] = d["current_rank"]
+
+    drops = []
+    for key, (prev, curr) in folded.items():
+        change = rank_change(prev, curr)
+        if change is not None and -change >= threshold:
+            drops.append({"key": key, "previous_rank": prev, "current_rank": curr, "drop": -change})
+    drops.sort(key=lambda d: d["drop"], reverse=True)
+    return drops
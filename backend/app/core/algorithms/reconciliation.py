@@ -0,0 +1,63 @@
+"""
+다중 소스 지표 정합(Reconciliation) 결정 로직 (DB 의존성 없는 순수 로직)
+
+DataReconciliationService.reconcile_metrics 의 단건 정책을 (캠페인, 일자) 묶음 단위로 적용한다.
+- 우선순위: API > SCRAPER (둘 다 없으면 해당 키는 정합 대상 아님)
+- 둘 다 있고 API spend > 0 인데 spend 편차가 VARIANCE_THRESHOLD 를 넘으면 경고
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+METRIC_FIELDS = ("spend", "impressions", "clicks", "conversions", "revenue")
+SOURCE_PRIORITY = ("API", "SCRAPER")
+VARIANCE_THRESHOLD = 0.1
+
+ReconcileKey = Tuple[Any, Any]
+
+
+def spend_variance(api_spend: float, scraper_spend: float):
+    """API 대비 스크래퍼 spend 편차 비율 (API spend 가 0 이하면 None)."""
+    api_spend = api_spend or 0
+    if api_spend <= 0:
+        return None
+    return abs(api_spend - (scraper_spend or 0)) / api_spend
+
+
+def reconcile_rows(rows: Iterable[Tuple], threshold: float = VARIANCE_THRESHOLD):
+    """
+    Args:
+        rows: (campaign_id, date, source, spend, impressions, clicks, conversions, revenue)
+              - (campaign_id, date, source) 별로 묶인 조회 결과 (RECONCILED 는 제외된 상태)
+
+    Returns:
+        (reconciled, warnings)
+        reconciled: {(campaign_id, date): {"metrics": {...}, "primary_source": str, "sources_used": [str]}}
+        warnings: [{"campaign_id", "date", "metric", "api_value", "scraper_value", "variance"}]
+    """
+    by_key: Dict[ReconcileKey, Dict[str, Dict[str, Any]]] = {}
+    for campaign_id, day, source, *values in rows:
+        by_key.setdefault((campaign_id, day), {})[source] = dict(zip(METRIC_FIELDS, values))
+
+    reconciled: Dict[ReconcileKey, Dict[str, Any]] = {}
+    warnings: List[Dict[str, Any]] = []
+    for key, sources in by_key.items():
+        primary = next((s for s in SOURCE_PRIORITY if s in sources), None)
+        if primary is None:
+            continue
+        reconciled[key] = {
+            "metrics": {field: sources[primary][field] or 0 for field in METRIC_FIELDS},
+            "primary_source": primary,
+            "sources_used": sorted(sources),
+        }
+        if "API" in sources and "SCRAPER" in sources:
+            api_spend, scraper_spend = sources["API"]["spend"], sources["SCRAPER"]["spend"]
+            variance = spend_variance(api_spend, scraper_spend)
+            if variance is not None and variance > threshold:
+                warnings.append({
+                    "campaign_id": key[0],
+                    "date": key[1],
+                    "metric": "spend",
+                    "api_value": float(api_spend),
+                    "scraper_value": float(scraper_spend or 0),
+                    "variance": variance,
+                })
+    return reconciled, warnings
@@ -0,0 +1,72 @@
+"""
+캠페인 ROAS/CPA/CTR/CVR 계산 (DB 의존성 없는 순수 로직)
+
+캠페인×일자 집계 행을 한 번 읽어 캠페인별 일자 시계열(컬럼 배열)과 합계를 만들고,
+지표는 배열 단위로 한 번에 계산한다. 합계 행과 일별 행 모두 같은 함수를 쓴다.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SERIES_FIELDS = ("spend", "clicks", "conversions", "impressions")
+
+
+def group_campaign_days(rows: Iterable[Tuple]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Args:
+        rows: (campaign_id, name, platform, date, spend, clicks, conversions, impressions) - 캠페인/일자 순
+
+    Returns:
+        {campaign_id: {"name", "platform", "dates": [...], "spend": [...], ..., "totals": {field: 합계}}}
+    """
+    campaigns: Dict[Any, Dict[str, Any]] = {}
+    for campaign_id, name, platform, date, *values in rows:
+        series = campaigns.get(campaign_id)
+        if series is None:
+            series = campaigns[campaign_id] = {"name": name, "platform": platform, "dates": []}
+            for field in SERIES_FIELDS:
+                series[field] = []
+        series["dates"].append(date)
+        for field, value in zip(SERIES_FIELDS, values):
+            series[field].append(value or 0)
+    for series in campaigns.values():
+        series["totals"] = {field: sum(series[field]) for field in SERIES_FIELDS}
+    return campaigns
+
+
+def efficiency_columns(
+    spend: Sequence[float],
+    conversions: Sequence[int],
+    clicks: Sequence[int],
+    impressions: Sequence[int],
+    conversion_value: float,
+) -> Dict[str, List[Optional[float]]]:
+    """
+    배열 단위 ROAS(%)/CPA/CTR(%)/CVR(%).
+    분모가 0 이면 ROAS/CTR/CVR 은 0, CPA 는 None (전환 없음 처리는 호출자가 결정).
+    """
+    return {
+        "roas": [(c * conversion_value / s * 100) if s > 0 else 0 for s, c in zip(spend, conversions)],
+        "cpa": [(s / c) if c > 0 else None for s, c in zip(spend, conversions)],
+        "ctr": [(k / i * 100) if i > 0 else 0 for k, i in zip(clicks, impressions)],
+        "cvr": [(c / k * 100) if k > 0 else 0 for c, k in zip(conversions, clicks)],
+    }
+
+
+def campaign_totals_columns(campaigns: Dict[Any, Dict[str, Any]]) -> Dict[str, list]:
+    """캠페인 합계를 컬럼 배열로 ({"campaign_id": [...], "spend": [...], ...})."""
+    ids = list(campaigns)
+    columns: Dict[str, list] = {"campaign_id": ids}
+    for field in SERIES_FIELDS:
+        columns[field] = [campaigns[cid]["totals"][field] for cid in ids]
+    return columns
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """선형 보간 분위수 (0 <= q <= 1). 값이 없으면 inf."""
+    ordered = sorted(values)
+    if not ordered:
+        return math.inf
+    pos = (len(ordered) - 1) * q
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
@@ -0,0 +1,91 @@
+"""
+키워드별 SOV(Share of Voice) 계산 (DB 의존성 없는 순수 로직)
+
+SQL 집계 결과와 메모리 스냅샷 모두 같은 결과 형태로 변환한다.
+SOV = (상위 top_n 안에 타겟이 노출된 횟수) / top_n * 100
+"""
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def empty_sov(keyword: str) -> Dict[str, Any]:
+    """키워드 레코드가 없을 때의 결과."""
+    return {"sov": 0.0, "total": 0, "hits": 0, "keyword": keyword}
+
+
+def build_sov_result(
+    keyword: str,
+    hits: int,
+    top_n: int,
+    top_rank: Optional[int] = None,
+    latest_capture: Optional[datetime.datetime] = None,
+) -> Dict[str, Any]:
+    """키워드 하나의 집계값을 calculate_sov 응답 형태로 변환."""
+    if top_n <= 0:
+        return empty_sov(keyword)
+    period_str = latest_capture.strftime("%Y-%m-%d %H:%M") if latest_capture else None
+    return {
+        "sov": (hits / top_n) * 100,
+        "total": top_n,
+        "hits": hits,
+        "keyword": keyword,
+        "top_rank": top_rank,
+        "period_start": period_str,
+        "period_end": period_str,
+    }
+
+
+def build_sov_results(
+    keywords: List[str],
+    aggregates: Dict[str, Tuple[int, Optional[int], Optional[datetime.datetime]]],
+    top_n: int,
+) -> List[Dict[str, Any]]:
+    """
+    Args:
+        keywords: 요청 키워드 (응답 순서)
+        aggregates: {keyword: (hits, top_rank, latest_capture)} - 키워드 레코드가 있는 것만
+        top_n: 상위 N 슬롯
+
+    Returns:
+        keywords 순서의 SOV 결과 목록
+    """
+    results = []
+    for keyword in keywords:
+        if keyword not in aggregates:
+            results.append(empty_sov(keyword))
+            continue
+        hits, top_rank, latest_capture = aggregates[keyword]
+        results.append(build_sov_result(keyword, hits or 0, top_n, top_rank, latest_capture))
+    return results
+
+
+def compute_sov_in_memory(
+    rows: Iterable[Tuple[str, str, int, Optional[datetime.datetime]]],
+    keywords: List[str],
+    target_name: str,
+    top_n: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    캐시된 스냅샷 행으로 SOV 계산 (SQL 경로와 동일한 결과).
+
+    Args:
+        rows: (keyword, target_name, rank, captured_at) 튜플
+        keywords: 요청 키워드
+        target_name: 대상 병원명
+        top_n: 상위 N 슬롯
+
+    Returns:
+        keywords 순서의 SOV 결과 목록 (rows 에 한 번도 나오지 않은 키워드는 레코드 없음으로 처리)
+    """
+    wanted = set(keywords)
+    aggregates: Dict[str, List] = {}
+    for keyword, name, rank, captured_at in rows:
+        if keyword not in wanted:
+            continue
+        agg = aggregates.setdefault(keyword, [0, None, None])
+        if name == target_name and rank <= top_n:
+            agg[0] += 1
+            agg[1] = rank if agg[1] is None else min(agg[1], rank)
+        if captured_at is not None and (agg[2] is None or captured_at > agg[2]):
+            agg[2] = captured_at
+    return build_sov_results(keywords, {k: tuple(v) for k, v in aggregates.items()}, top_n)
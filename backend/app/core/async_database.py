@@ -0,0 +1,153 @@
+"""
+비동기 DB 레이어 (async 엔드포인트용)
+
+- ASYNC_DB_ENABLED + PostgreSQL + psycopg(3) 설치 시: create_async_engine(postgresql+psycopg) + AsyncSession
+- 그 외(SQLite 로컬/테스트, 드라이버 미설치): 기존 SessionLocal 을 스레드풀에서 실행
+
+서비스 계층은 sync Session 기반이므로 엔드포인트는 AsyncDB.run_sync(fn) 으로 호출한다.
+AsyncSession.run_sync 는 greenlet 안에서 sync 코드를 돌리고 I/O 는 이벤트 루프에서 await 하므로,
+쿼리 대기 동안 스레드풀 워커(기본 40개)를 붙잡지 않는다.
+"""
+import importlib.util
+import logging
+import threading
+from typing import Callable, Dict, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_async_engine = None
+_async_session_factory = None
+_init_done = False
+_init_lock = threading.Lock()
+
+
+def to_async_url(url: str) -> Optional[str]:
+    """sync DATABASE_URL → psycopg3 async URL (PostgreSQL 이 아니면 None)."""
+    for prefix in ("postgres://", "postgresql://", "postgresql+psycopg2://", "postgresql+psycopg://"):
+        if url.startswith(prefix):
+            return "postgresql+psycopg://" + url[len(prefix):]
+    return None
+
+
+def split_pool_budget(total: int, async_share: int, async_enabled: bool) -> Dict[str, Dict[str, int]]:
+    """
+    인스턴스당 연결 예산(total)을 sync / async 엔진에 나눈다 (두 풀의 최대 연결 수 합계 = total).
+    각 엔진은 몫의 약 30% 를 상시 연결(pool_size), 나머지를 burst(max_overflow)로 쓴다 (기존 3 + 7 비율).
+    """
+    total = max(1, total)
+    async_total = min(max(1, async_share), total - 1) if async_enabled and total > 1 else 0
+
+    def pool(connections: int) -> Dict[str, int]:
+        size = max(1, round(connections * 0.3))
+        return {"pool_size": size, "max_overflow": connections - size}
+
+    return {
+        "sync": pool(total - async_total),
+        "async": pool(async_total) if async_total else {"pool_size": 0, "max_overflow": 0},
+    }
+
+
+def async_engine_expected(database_url: str) -> bool:
+    """async 엔진이 실제로 만들어질 조건 (설정 ON + PostgreSQL + psycopg 설치)."""
+    from app.core.config import settings
+    return (
+        settings.ASYNC_DB_ENABLED
+        and to_async_url(database_url) is not None
+        and importlib.util.find_spec("psycopg") is not None
+    )
+
+
+def pool_budget(database_url: str) -> Dict[str, Dict[str, int]]:
+    from app.core.config import settings
+    return split_pool_budget(
+        settings.DB_POOL_BUDGET, settings.DB_ASYNC_POOL_SHARE, async_engine_expected(database_url)
+    )
+
+
+def _init_async_engine():
+    global _async_engine, _async_session_factory, _init_done
+    with _init_lock:
+        if _init_done:
+            return
+        _init_done = True
+
+        from app.core.config import settings
+        if not async_engine_expected(settings.get_database_url):
+            return
+        url = to_async_url(settings.get_database_url)
+        try:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+            _async_engine = create_async_engine(
+                url,
+                connect_args={
+                    "options": "-c statement_timeout=30000",  # 개별 쿼리 30초 제한 (sync 엔진과 동일)
+                    "prepare_threshold": None,  # PgBouncer(transaction mode) - prepared statement 비활성화
+                },
+                # sync 엔진과 같은 PgBouncer 대응 풀 설정, 연결 수는 DB_POOL_BUDGET 에서 async 몫만
+                pool_pre_ping=True,
+                **pool_budget(settings.get_database_url)["async"],
+                pool_recycle=280,
+                pool_timeout=30,
+            )
+            _async_session_factory = async_sessionmaker(
+                _async_engine, autoflush=False, expire_on_commit=False
+            )
+            logger.info("Async database engine initialized (psycopg)")
+        except Exception as e:
+            # psycopg/greenlet 미설치 등 → 스레드풀 fallback
+            logger.warning(f"Async database engine unavailable, using threadpool fallback: {e}")
+            _async_engine = None
+            _async_session_factory = None
+
+
+def get_async_engine():
+    _init_async_engine()
+    return _async_engine
+
+
+async def dispose_async_engine():
+    global _async_engine, _async_session_factory, _init_done
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+    _init_done = False
+
+
+def _run_with_session(fn: Callable[[Session], T]) -> T:
+    from app.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return fn(db)
+    finally:
+        db.close()
+
+
+class AsyncDB:
+    """async 엔드포인트에서 sync 서비스 코드를 실행하는 핸들 (session=None 이면 스레드풀 fallback)."""
+
+    def __init__(self, session=None):
+        self.session = session
+
+    @property
+    def is_async(self) -> bool:
+        return self.session is not None
+
+    async def run_sync(self, fn: Callable[[Session], T]) -> T:
+        if self.session is not None:
+            return await self.session.run_sync(fn)
+        return await run_in_threadpool(_run_with_session, fn)
+
+
+async def get_async_db():
+    _init_async_engine()
+    if _async_session_factory is None:
+        yield AsyncDB()
+        return
+    async with _async_session_factory() as session:
+        yield AsyncDB(session)
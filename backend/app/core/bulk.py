@@ -0,0 +1,20 @@
+"""
+대량 INSERT / UPSERT 헬퍼
+
+PostgreSQL(Supabase)에서는 INSERT ... ON CONFLICT 를, 로컬 SQLite 에서는
+동일한 문법의 sqlite INSERT 를 사용한다. 호출부는 방언을 신경 쓰지 않는다.
+"""
+from typing import Any
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session, model: Any):
+    """현재 세션의 DB 방언에 맞는 on_conflict 지원 insert() 구문 생성."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT upsert is not supported for dialect '{dialect}'")
+    return insert(model)
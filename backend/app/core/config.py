@@ -32,6 +32,42 @@ class Settings(BaseSettings):
     # Sync Optimization
     SYNC_RAW_DAYS: int = 3       # 최근 며칠간의 원본 데이터를 매번 가져와 정합성 유지
     SYNC_BACKFILL_DAYS: int = 7  # 누락된 RECONCILED 데이터를 채워넣는 소급 기간
+    SYNC_BACKFILL_WORKERS: int = 4       # 연결당 날짜(SyncTask)를 동시에 처리할 워커 스레드 수 (sync 풀 여유의 절반으로 상한)
+    SYNC_TASK_STALE_SECONDS: int = 1800  # RUNNING 상태로 이 시간이 지나면 (프로세스 종료) 다시 점유
+
+    # Scraping Pipeline (야간 순위 수집 동시성)
+    SCRAPE_WORKERS: int = 4               # 동시에 처리할 키워드 수
+    SCRAPE_PLACE_CONCURRENCY: int = 3     # 플랫폼별 동시 요청 한도
+    SCRAPE_VIEW_CONCURRENCY: int = 3
+    SCRAPE_AD_CONCURRENCY: int = 2
+    SCRAPE_HOST_MIN_INTERVAL: float = 0.3 # 같은 호스트 요청 간 최소 간격(초)
+    NAVER_LOCAL_PAGE_CONCURRENCY: int = 5 # Local Search API 페이지 동시 요청 수
+    NAVER_ADS_CONCURRENCY: int = 8      # 검색광고 API 동시 요청 수 (연결당)
+    NAVER_ADS_RATE_PER_SEC: float = 10.0 # 고객 ID 별 초당 요청 한도 (토큰 버킷)
+    NAVER_ADS_BURST: int = 10           # 토큰 버킷 최대 burst
+    NAVER_ADS_STATS_BATCH_SIZE: int = 100 # /stats 한 번에 묶을 ids 수
+    BROWSER_POOL_MAX_CONTEXTS: int = 3 # 이벤트 루프당 동시에 열어둘 Playwright 컨텍스트 수
+    BROWSER_CONTEXT_MAX_PAGES: int = 20 # 컨텍스트 재생성 전 처리할 페이지 수
+
+    # Analytics Cache (프로세스 내 LRU → analytics_cache 테이블 2단 캐시)
+    ANALYTICS_CACHE_TTL_SECONDS: int = 6 * 3600 # analytics_cache 테이블 만료 시간
+    ANALYTICS_LRU_MAXSIZE: int = 512             # 인스턴스별 LRU 항목 수
+    ANALYTICS_LRU_TTL_SECONDS: int = 300         # 다른 인스턴스의 무효화가 반영되는 최대 지연
+
+    # PDF Report (차트 렌더링 프로세스 풀)
+    PDF_RENDER_WORKERS: int = 2 # 최대 워커 수 (할당된 CPU 수/차트 수로 다시 제한), 1 이하 = 프로세스 풀 없이 현재 프로세스에서 렌더링
+
+    # Async DB (async 엔드포인트용 psycopg3 엔진, 비활성/미설치 시 스레드풀 fallback)
+    ASYNC_DB_ENABLED: bool = True
+    DB_POOL_BUDGET: int = 10       # 인스턴스당 PgBouncer 연결 예산 (sync + async 엔진 합계)
+    DB_ASYNC_POOL_SHARE: int = 4   # async 엔진이 쓸 때 그 몫 (나머지는 sync 엔진)
+
+    # Job Queue (jobs 테이블, 인스턴스별 워커 루프)
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 2       # 인스턴스당 동시에 실행할 작업 수
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_STALE_SECONDS: int = 900          # heartbeat 가 이 시간 동안 없으면 다른 워커가 재점유
+    JOB_RETRY_BASE_SECONDS: int = 30      # 재시도 backoff 기본 간격 (30s, 60s, 120s ...)
     
     # Naver Open API (Login / Trend)
     NAVER_CLIENT_ID: Optional[str] = None
@@ -36,9 +36,11 @@ engine_args = {
 # PostgreSQL / Supabase PgBouncer (port 6543) 최적화
 # Supabase free tier PgBouncer idle timeout = 약 300초(5분).
 # pool_recycle=280 으로 안전 마진 20초 확보 → race condition 방지.
+# 연결 수: 인스턴스당 DB_POOL_BUDGET(기본 10)을 async 엔진과 나눠 쓴다
+# (async 미사용 시 sync 3 + 7, 사용 시 sync 2 + 4 / async 1 + 3)
+from app.core.async_database import pool_budget
 engine_args.update({
-    "pool_size": 3,       # 인스턴스당 기본 연결 수
-    "max_overflow": 7,    # 최대 burst 연결 (총 10)
+    **pool_budget(SQLALCHEMY_DATABASE_URL)["sync"],
     "pool_recycle": 280,  # [FIX] 4분 40초 - PgBouncer 5분 idle timeout 이전에 재생성
     "pool_timeout": 30,   # [FIX] cold start 중 연결 대기 여유 시간 (기존 10초 → 30초)
 })
@@ -0,0 +1,166 @@
+"""
+스트리밍 내보내기 포맷 (CSV / NDJSON / Parquet)
+
+행 dict 이터레이터를 받아 bytes 청크를 yield 하는 제너레이터들. StreamingResponse 본문으로 바로 쓰며,
+입력 행을 batch_size 단위로만 들고 있으므로 행 수와 무관하게 메모리가 일정하다.
+Parquet 은 pyarrow (선택 의존성) 가 있을 때만 지원 - 배치마다 row group 하나를 써서 흘려보낸다.
+"""
+import csv
+import datetime
+import io
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# (컬럼명, 타입) - 타입: 'str' | 'int' | 'float' | 'datetime' | 'date'
+ExportColumn = Tuple[str, str]
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class ExportFormatUnavailable(Exception):
+    """요청한 포맷의 의존성이 설치되어 있지 않음 (Parquet → pyarrow)."""
+
+
+def batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, max(1, size)))
+        if not batch:
+            return
+        yield batch
+
+
+def _text_value(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    if value is not None and not isinstance(value, (str, int, float, bool)):
+        return str(value)
+    return value
+
+
+def iter_csv(columns: Sequence[ExportColumn], rows: Iterable[Dict[str, Any]],
+             batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """헤더 포함 CSV. 엑셀 한글 호환을 위해 첫 청크에 UTF-8 BOM."""
+    names = [name for name, _ in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    yield buffer.getvalue().encode("utf-8-sig")
+    for batch in batched(rows, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([[_text_value(row.get(name)) for name in names] for row in batch])
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_ndjson(columns: Sequence[ExportColumn], rows: Iterable[Dict[str, Any]],
+                batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """한 줄에 JSON 객체 하나."""
+    names = [name for name, _ in columns]
+    for batch in batched(rows, batch_size):
+        yield "".join(
+            json.dumps({name: _text_value(row.get(name)) for name in names}, ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 가 쓰는 바이트를 모아 두었다가 drain() 으로 넘겨주는 출력 스트림."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(columns: Sequence[ExportColumn]):
+    import pyarrow as pa
+    types = {
+        "str": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "datetime": pa.timestamp("us"),
+        "date": pa.date32(),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _arrow_value(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "str":
+        return str(_text_value(value))
+    if kind == "datetime" and isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        # timezone-aware 값은 UTC 기준 naive 로 통일
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def iter_parquet(columns: Sequence[ExportColumn], rows: Iterable[Dict[str, Any]],
+                 batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """배치 하나 = row group 하나. 마지막 청크에 footer."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ExportFormatUnavailable("Parquet export requires pyarrow") from e
+
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        for batch in batched(rows, batch_size):
+            arrays = {
+                name: [_arrow_value(row.get(name), kind) for row in batch]
+                for name, kind in columns
+            }
+            writer.write_table(pa.Table.from_pydict(arrays, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def check_export_format(fmt: str):
+    """스트리밍 시작 전에 포맷 검증 (응답 헤더가 나간 뒤에는 오류 상태 코드를 돌려줄 수 없음)."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'")
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ExportFormatUnavailable("Parquet export requires pyarrow") from e
+
+
+def stream_export(fmt: str, columns: Sequence[ExportColumn], rows: Iterable[Dict[str, Any]],
+                  batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    check_export_format(fmt)
+    writers = {"csv": iter_csv, "ndjson": iter_ndjson, "parquet": iter_parquet}
+    return writers[fmt](columns, rows, batch_size)
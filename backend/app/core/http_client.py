@@ -0,0 +1,70 @@
+"""
+프로세스 공용 httpx.AsyncClient 레지스트리
+
+요청마다 AsyncClient 를 만들면 TLS 핸드셰이크/커넥션 생성 비용을 매번 지불한다.
+호스트별로 keep-alive 풀을 가진 클라이언트를 하나씩 두고 모든 스크래퍼/외부 API 가 공유한다.
+
+- 호스트별 클라이언트 = 호스트별 커넥션 한도 (httpx.Limits 는 클라이언트 단위)
+- h2 패키지가 설치돼 있으면 HTTP/2 사용
+- httpx 커넥션은 이벤트 루프에 묶이므로 루프별로 따로 보관한다
+  (스케줄러/BackgroundTasks 는 asyncio.run 으로 별도 루프를 돌린다)
+- FastAPI lifespan 종료 시 close_http_clients() 로 정리
+"""
+import asyncio
+import logging
+import weakref
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 15.0
+MAX_CONNECTIONS_PER_HOST = 10
+MAX_KEEPALIVE_PER_HOST = 5
+KEEPALIVE_EXPIRY = 30.0
+
+# event loop → {host: AsyncClient}
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client(host: str) -> httpx.AsyncClient:
+    """
+    host 전용 공유 AsyncClient 반환 (없으면 생성).
+    타임아웃/리다이렉트는 요청 단위로 지정한다: client.get(url, timeout=10.0, follow_redirects=True)
+    """
+    loop = asyncio.get_running_loop()
+    loop_clients = _clients.setdefault(loop, {})
+    client = loop_clients.get(host)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS_PER_HOST,
+                max_keepalive_connections=MAX_KEEPALIVE_PER_HOST,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        loop_clients[host] = client
+        logger.debug(f"[HTTP] Shared client created for {host} (http2={HTTP2_AVAILABLE})")
+    return client
+
+
+async def close_http_clients(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """현재(또는 지정한) 이벤트 루프에 속한 공유 클라이언트를 모두 닫는다."""
+    loop = loop or asyncio.get_running_loop()
+    loop_clients = _clients.pop(loop, {})
+    for host, client in loop_clients.items():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"[HTTP] Failed to close client for {host}: {e}")
+    if loop_clients:
+        logger.info(f"[HTTP] Closed {len(loop_clients)} shared HTTP client(s)")
@@ -0,0 +1,83 @@
+"""
+프로세스 내 LRU 캐시 (크기 제한 + 항목별 TTL + 클라이언트 단위 무효화)
+
+analytics_cache 테이블 앞단의 1차 캐시로 사용한다. 값은 호출자가 정한 형태 그대로 보관하며
+스레드 안전하다 (sync 엔드포인트는 스레드풀에서 실행됨).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, Optional[str]]]" = OrderedDict()
+        self._by_group: Dict[str, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(hit 여부, 값). 만료된 항목은 제거하고 미스로 처리."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry[1]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, group: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, self._clock() + ttl, group)
+            if group is not None:
+                self._by_group.setdefault(group, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_group(self, group: str, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """group(보통 client_id)에 속한 항목 제거 (predicate 가 있으면 키가 맞는 것만)."""
+        with self._lock:
+            keys = [k for k in self._by_group.get(group, ()) if predicate is None or predicate(k)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_group.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _remove(self, key: Hashable):
+        _, _, group = self._entries.pop(key)
+        if group is not None:
+            members = self._by_group.get(group)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._by_group[group]
@@ -0,0 +1,43 @@
+"""
+daily_ranks 월 파티션 유지보수 (Postgres 전용)
+
+파티션 생성은 마이그레이션 k8f9a0b1c2d3 의 ensure_daily_ranks_partitions() 함수가 담당한다.
+범위를 벗어난 행은 daily_ranks_default 로 들어가지만, 그 뒤에는 해당 월 파티션을 만들 수 없으므로
+스케줄러가 매월 앞으로 DAILY_RANK_PARTITION_MONTHS_AHEAD 개월치를 미리 만들어 둔다.
+"""
+import datetime
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DAILY_RANK_PARTITION_MONTHS_AHEAD = 3
+
+
+def ensure_daily_rank_partitions(db: Session, months_ahead: int = DAILY_RANK_PARTITION_MONTHS_AHEAD) -> int:
+    """이번 달부터 months_ahead 개월 뒤까지의 파티션 생성. 생성된 파티션 수 반환."""
+    if db.get_bind().dialect.name != "postgresql":
+        return 0
+    created = db.execute(
+        text("SELECT ensure_daily_ranks_partitions(:from_month, :months_ahead)"),
+        {"from_month": datetime.date.today().replace(day=1), "months_ahead": months_ahead},
+    ).scalar()
+    db.commit()
+    if created:
+        logger.info(f"[Partitions] daily_ranks 월 파티션 {created}개 생성")
+    return created or 0
+
+
+def run_partition_maintenance():
+    """스케줄러(BackgroundScheduler)에서 호출용."""
+    from app.core.database import SessionLocal
+    db = SessionLocal()
+    try:
+        ensure_daily_rank_partitions(db)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Partitions] daily_ranks partition maintenance failed: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,37 @@
+"""
+SQL 실행 횟수 측정 (N+1 회귀 방지용)
+
+    with count_queries(db.get_bind()) as counter:
+        repo.current_ranking(keyword_id, platform)
+    assert counter.count == 1
+
+executemany 는 1회로 센다.
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(bind) -> Iterator[QueryCounter]:
+    """bind(Engine/Connection) 에서 실행되는 SQL 문을 블록 동안 기록."""
+    engine = getattr(bind, "engine", bind)
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
@@ -0,0 +1,57 @@
+"""
+토큰 버킷 레이트 리미터 (외부 API 호출 속도 제한)
+
+- rate 개/초로 토큰이 차고 capacity 까지 burst 허용
+- reserve() 는 토큰을 미리 차감(음수 = 대기열)하고 기다릴 시간을 돌려주므로 요청 순서대로 간격이 벌어진다
+- 상태는 threading.Lock 으로 보호 → asyncio.run 으로 루프가 여러 개 생겨도 같은 버킷을 공유할 수 있다
+  (같은 API 키의 한도는 프로세스 전체에서 지켜야 함)
+"""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰 차감 후 대기해야 할 시간(초). 0 이면 즉시 진행."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def drain(self):
+        """429 등 서버 측 제한 신호를 받으면 남은 burst 를 비운다."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, 0.0)
+
+    async def acquire(self, tokens: float = 1.0):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_buckets: Dict[Tuple[str, float, float], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(key: str, rate: float, capacity: float) -> TokenBucket:
+    """key(예: 'naver_ads:<customer_id>') 별 프로세스 공용 버킷."""
+    with _buckets_lock:
+        bucket = _buckets.get((key, rate, capacity))
+        if bucket is None:
+            bucket = _buckets[(key, rate, capacity)] = TokenBucket(rate, capacity)
+        return bucket
@@ -4,8 +4,7 @@ from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_MISSED, EVENT_JOB_EXEC
 import logging
 from pytz import timezone
 
-# Import the reliable sync wrapper from scripts
-from app.scripts.sync_data import run_sync_process
+from app.core.partitions import run_partition_maintenance
 from app.core.logger import setup_logging
 
 # Initialize Logging
@@ -31,6 +30,15 @@ def job_listener(event):
     else:
         logger.info(f"Job {event.job_id} executed successfully.")
 
+def enqueue_daily_sync():
+    """
+    정기 동기화를 작업 큐에 등록 (실행은 워커가 담당).
+    모든 인스턴스의 스케줄러가 동시에 호출해도 dedupe_key 로 한 건만 남는다.
+    """
+    from app.worker.job_worker import enqueue_job
+    job_id, created = enqueue_job("sync.all", {}, dedupe_key="sync:all")
+    logger.info(f"Daily sync job {'queued' if created else 'already active'}: {job_id}")
+
 def start_scheduler():
     if not scheduler.running:
         # Add Listener
@@ -40,7 +48,7 @@ def start_scheduler():
         # max_instances=1: Prevent overlap if previous job is stuck
         # coalesce=True: If missed, run only once
         scheduler.add_job(
-            func=run_sync_process,
+            func=enqueue_daily_sync,
             trigger=CronTrigger(hour=SYNC_HOUR, minute=SYNC_MINUTE, timezone=KST),
             id='daily_marketing_sync',
             name='Daily Marketing Data Sync (Naver/Place/View)',
@@ -50,6 +58,18 @@ def start_scheduler():
             misfire_grace_time=3600 # Allow 1 hour catch-up
         )
         
+        # daily_ranks 월 파티션 사전 생성 (매월 1일, 동기화 전)
+        scheduler.add_job(
+            func=run_partition_maintenance,
+            trigger=CronTrigger(day=1, hour=1, minute=0, timezone=KST),
+            id='daily_ranks_partition_maintenance',
+            name='daily_ranks Monthly Partition Maintenance',
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=86400
+        )
+        
         scheduler.start()
         logger.info(f"Background Scheduler started. Daily Sync scheduled at {SYNC_HOUR:02d}:{SYNC_MINUTE:02d} KST.")
 
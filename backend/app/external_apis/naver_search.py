@@ -2,6 +2,7 @@ import httpx
 import logging
 from typing import List, Dict, Optional, Any
 from app.core.config import settings
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -76,31 +77,31 @@ class NaverSearchClient:
         max_retries = 3
         base_delay = 1
         
-        async with httpx.AsyncClient() as client:
-            for attempt in range(max_retries + 1):
-                try:
-                    resp = await client.get(url, headers=self.headers, params=params)
-                    resp.raise_for_status()
-                    return resp.json()
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429 and attempt < max_retries:
-                        # Rate Limit - Backoff
-                        sleep_time = (base_delay * (2 ** attempt)) + (random.randint(0, 1000) / 1000)
-                        logger.warning(f"Naver API Rate Limit (429). Retrying in {sleep_time:.2f}s... (Attempt {attempt+1}/{max_retries})")
-                        await asyncio.sleep(sleep_time)
-                        continue
-                        
-                    logger.error(f"Naver API HTTP Error: {e.response.status_code} - {e.response.text}")
-                    return {"items": [], "total": 0, "error": str(e)}
-                except (httpx.RequestError, httpx.TimeoutException) as e:
-                    if attempt < max_retries:
-                        sleep_time = base_delay * (2 ** attempt)
-                        logger.warning(f"Naver API Connection Error. Retrying in {sleep_time}s...: {e}")
-                        await asyncio.sleep(sleep_time)
-                        continue
+        client = get_http_client("openapi.naver.com")
+        for attempt in range(max_retries + 1):
+            try:
+                resp = await client.get(url, headers=self.headers, params=params)
+                resp.raise_for_status()
+                return resp.json()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429 and attempt < max_retries:
+                    # Rate Limit - Backoff
+                    sleep_time = (base_delay * (2 ** attempt)) + (random.randint(0, 1000) / 1000)
+                    logger.warning(f"Naver API Rate Limit (429). Retrying in {sleep_time:.2f}s... (Attempt {attempt+1}/{max_retries})")
+                    await asyncio.sleep(sleep_time)
+                    continue
                     
-                    logger.error(f"Naver API Connection Error (Max Retries): {e}")
-                    return {"items": [], "total": 0, "error": str(e)}
-                except Exception as e:
-                    logger.error(f"Naver API Unexpected Error: {e}")
-                    return {"items": [], "total": 0, "error": str(e)}
+                logger.error(f"Naver API HTTP Error: {e.response.status_code} - {e.response.text}")
+                return {"items": [], "total": 0, "error": str(e)}
+            except (httpx.RequestError, httpx.TimeoutException) as e:
+                if attempt < max_retries:
+                    sleep_time = base_delay * (2 ** attempt)
+                    logger.warning(f"Naver API Connection Error. Retrying in {sleep_time}s...: {e}")
+                    await asyncio.sleep(sleep_time)
+                    continue
+                
+                logger.error(f"Naver API Connection Error (Max Retries): {e}")
+                return {"items": [], "total": 0, "error": str(e)}
+            except Exception as e:
+                logger.error(f"Naver API Unexpected Error: {e}")
+                return {"items": [], "total": 0, "error": str(e)}
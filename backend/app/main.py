@@ -178,6 +178,12 @@ async def run_startup_tasks():
     except Exception as e:
         logger.error(f"Background startup: Scheduler failed to start: {e}")
 
+    try:
+        from app.worker.job_worker import start_job_worker
+        start_job_worker()
+    except Exception as e:
+        logger.error(f"Background startup: Job worker failed to start: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # CRITICAL: Start the port listener IMMEDIATELY by not awaiting heavy tasks here
@@ -188,10 +194,29 @@ async def lifespan(app: FastAPI):
     
     # Shutdown logic
     from app.core.scheduler import stop_scheduler
+    from app.core.http_client import close_http_clients
+    from app.scrapers.browser_pool import close_browser_pools
+    from app.core.async_database import dispose_async_engine
+    from app.worker.job_worker import stop_job_worker
+    from app.services.chart_render import shutdown_chart_pool
     try:
         stop_scheduler()
     except Exception as e:
         logger.error(f"Startup task failed: {e}")
+    # 하나가 실패해도 (예: Playwright 연결 끊김) 나머지 자원은 반드시 정리
+    for name, close in (
+        ("job worker", stop_job_worker),
+        ("HTTP clients", close_http_clients),
+        ("browser pools", close_browser_pools),
+        ("async DB engine", dispose_async_engine),
+        ("chart render pool", shutdown_chart_pool),
+    ):
+        try:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"Shutdown: {name} failed to close: {e}")
     if not init_task.done():
         init_task.cancel()
 
@@ -230,7 +255,7 @@ def health_check():
 # Lazy-loaded Routers to prevent top-level import crashes
 logger.info("[ROUTER] Starting endpoint imports...")
 try:
-    from app.api.endpoints import auth, scrape, analyze, dashboard, connectors, strategy, collaboration, automation, clients, users, status, reports, notifications, settlement, competitors, roi_optimization, trends, leads, naver_ads, debug
+    from app.api.endpoints import auth, scrape, analyze, dashboard, connectors, strategy, collaboration, automation, clients, users, status, reports, notifications, settlement, competitors, roi_optimization, trends, leads, naver_ads, exports, debug
     logger.info("[ROUTER] All endpoints imported successfully")
 except Exception as e:
     logger.error(f"[ROUTER] ERROR importing endpoints: {e}", exc_info=True)
@@ -281,6 +306,8 @@ app.include_router(leads.router, prefix="/api/v1/leads", tags=["Leads"])
 logger.info("[ROUTER] Registered: leads")
 app.include_router(naver_ads.router, prefix="/api/v1/naver", tags=["Naver Ads Data"])
 logger.info("[ROUTER] Registered: naver_ads")
+app.include_router(exports.router, prefix="/api/v1/exports", tags=["Data Export"])
+logger.info("[ROUTER] Registered: exports")
 logger.info("[ROUTER] All routers registered successfully!")
 
 @app.get("/")
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Date, JSON, Enum, CHAR, Text, Boolean
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Date, JSON, Enum, CHAR, Text, Boolean, Index, UniqueConstraint
 from sqlalchemy.types import TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
@@ -153,7 +153,7 @@ class AdGroup(Base):
     __tablename__ = "ad_groups"
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     campaign_id = Column(GUID, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
-    external_id = Column(String, unique=True, nullable=False) # Naver AdGroup ID (nccAdgroupId)
+    external_id = Column(String, unique=True, nullable=False) # Naver AdGroup ID (nccAdgroupId), ON CONFLICT upsert 대상
     name = Column(String, nullable=False)
     status = Column(String, default="ACTIVE")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -168,7 +168,7 @@ class AdKeyword(Base):
     __tablename__ = "ad_keywords"
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
     ad_group_id = Column(GUID, ForeignKey("ad_groups.id", ondelete="CASCADE"), nullable=False)
-    external_id = Column(String, unique=True, nullable=False) # Naver Keyword ID (nccKeywordId)
+    external_id = Column(String, unique=True, nullable=False) # Naver Keyword ID (nccKeywordId), ON CONFLICT upsert 대상
     text = Column(String, nullable=False) # The actual keyword text (e.g., '임플란트')
     bid_amt = Column(Integer, default=0) # Current bid amount
     status = Column(String, default="ACTIVE")
@@ -204,6 +204,11 @@ class AdMetricsDaily(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # 키워드 일별 지표 ON CONFLICT (keyword_id, date) upsert 대상 (광고그룹 행은 keyword_id NULL)
+        UniqueConstraint("keyword_id", "date", name="ad_metrics_daily_keyword_id_date_key"),
+    )
+
     ad_group = relationship("AdGroup", back_populates="metrics")
     keyword = relationship("AdKeyword", back_populates="metrics")
 
@@ -219,14 +224,77 @@ class MetricsDaily(Base):
     revenue = Column(Float, default=0.0)
     source = Column(String, default="API") # 'API', 'SCRAPER', 'RECONCILED'
     meta_info = Column(JSON, nullable=True) # Extra info like raw response snippet
+
+    __table_args__ = (
+        # 정합 결과는 (캠페인, 일자) 당 하나 - DataReconciliationService.reconcile_range 의 ON CONFLICT upsert 대상
+        Index(
+            'uq_metrics_daily_reconciled', 'campaign_id', 'date', unique=True,
+            postgresql_where=source == 'RECONCILED',
+            sqlite_where=source == 'RECONCILED',
+        ),
+    )
     
     campaign = relationship("Campaign", back_populates="metrics")
 
+class ReconciliationWarning(Base):
+    """API/스크래퍼 지표 편차 경고 (정합 실행마다 해당 기간 분을 다시 기록)."""
+    __tablename__ = "reconciliation_warnings"
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    campaign_id = Column(GUID, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
+    date = Column(DateTime, nullable=False)
+    metric = Column(String(50), nullable=False, default="spend")
+    api_value = Column(Float, nullable=True)
+    scraper_value = Column(Float, nullable=True)
+    variance = Column(Float, nullable=False)  # |api - scraper| / api
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_reconciliation_warnings_campaign_date', 'campaign_id', 'date'),
+    )
+
+class ClientMetricsDaily(Base):
+    """metrics_daily 일별 롤업 (client_id/platform 비정규화). MetricsRollupService 가 동기화/리컨실리에이션 후 갱신."""
+    __tablename__ = "client_metrics_daily"
+    client_id = Column(GUID, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    platform = Column(Enum(PlatformType), primary_key=True)
+    campaign_id = Column(GUID, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True)
+    source = Column(String, primary_key=True)
+    date = Column(Date, primary_key=True)
+    spend = Column(Float, default=0.0)
+    impressions = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+    conversions = Column(Integer, default=0)
+    revenue = Column(Float, default=0.0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_client_metrics_daily_client_source_date", "client_id", "source", "date"),
+    )
+
+class ClientMetricsMonthly(Base):
+    """metrics_daily 월별 롤업 (month = 해당 월 1일). 전체 기간/월 단위 집계용."""
+    __tablename__ = "client_metrics_monthly"
+    client_id = Column(GUID, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    platform = Column(Enum(PlatformType), primary_key=True)
+    campaign_id = Column(GUID, ForeignKey("campaigns.id", ondelete="CASCADE"), primary_key=True)
+    source = Column(String, primary_key=True)
+    month = Column(Date, primary_key=True)
+    spend = Column(Float, default=0.0)
+    impressions = Column(Integer, default=0)
+    clicks = Column(Integer, default=0)
+    conversions = Column(Integer, default=0)
+    revenue = Column(Float, default=0.0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_client_metrics_monthly_client_source_month", "client_id", "source", "month"),
+    )
+
 # --- Legacy Labels (Keep for now to avoid breaking existing code) ---
 class Target(Base):
     __tablename__ = "targets"
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False)
+    name = Column(String, unique=True, nullable=False)  # ON CONFLICT (name) upsert 대상
     type = Column(Enum(TargetType), nullable=False)
     urls = Column(JSON, nullable=True)
     daily_ranks = relationship("DailyRank", back_populates="target")
@@ -249,11 +317,72 @@ class DailyRank(Base):
     platform = Column(Enum(PlatformType), nullable=False)
     rank = Column(Integer, nullable=False)
     rank_change = Column(Integer, nullable=True, default=0)  # [NEW] Rank change from previous
+    snapshot_id = Column(GUID, nullable=True)  # 수집 배치 ID (같은 배치에서 저장된 행은 같은 값)
     captured_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 조회 패턴별 복합 인덱스 (Postgres 에서는 captured_at 월 단위 RANGE 파티션, 마이그레이션 k8f9a0b1c2d3 참조)
+    __table_args__ = (
+        # 최신 스냅샷 / 상위 N / SOV: keyword+platform → captured_at → rank
+        Index("ix_daily_ranks_kw_platform_captured_rank", "keyword_id", "platform", "captured_at", "rank",
+              postgresql_include=["target_id"]),
+        # 특정 타겟의 키워드별 순위 이력
+        Index("ix_daily_ranks_kw_platform_target_captured", "keyword_id", "platform", "target_id", "captured_at",
+              postgresql_include=["rank"]),
+        # 경쟁사(타겟) 기준 분석
+        Index("ix_daily_ranks_target_platform_captured", "target_id", "platform", "captured_at",
+              postgresql_include=["keyword_id", "rank"]),
+        # 클라이언트 리포트 (기간 조회)
+        Index("ix_daily_ranks_client_captured", "client_id", "captured_at"),
+    )
+
     target = relationship("Target", back_populates="daily_ranks")
     keyword = relationship("Keyword", back_populates="daily_ranks")
     client = relationship("Client", back_populates="daily_ranks")
 
+class LatestRankSnapshot(Base):
+    """Current ranking per (keyword, platform). Ingest 가 배치마다 해당 키워드/플랫폼 행을 교체한다."""
+    __tablename__ = "latest_rank_snapshot"
+    keyword_id = Column(GUID, ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True)
+    platform = Column(Enum(PlatformType), primary_key=True)
+    position = Column(Integer, primary_key=True)  # 스냅샷 내 순서 (0부터, 순위순)
+    target_id = Column(GUID, ForeignKey("targets.id", ondelete="CASCADE"), nullable=False)
+    client_id = Column(GUID, ForeignKey("clients.id", ondelete="CASCADE"), nullable=True)
+    rank = Column(Integer, nullable=False)
+    rank_change = Column(Integer, nullable=True)
+    snapshot_id = Column(GUID, nullable=False)
+    captured_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    target = relationship("Target")
+
+class RankPosition(Base):
+    """Last-known rank per (keyword, platform, target). Ingest 시 rank_change 계산용 인덱스."""
+    __tablename__ = "rank_positions"
+    keyword_id = Column(GUID, ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True)
+    platform = Column(Enum(PlatformType), primary_key=True)
+    target_id = Column(GUID, ForeignKey("targets.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False)
+    captured_at = Column(DateTime(timezone=True), server_default=func.now())  # 마지막 변동 시각
+
+class RankDelta(Base):
+    """Changed positions only (신규 진입 / 순위 변동 / 이탈). rank_change = previous - current."""
+    __tablename__ = "rank_deltas"
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    client_id = Column(GUID, ForeignKey("clients.id", ondelete="CASCADE"), nullable=True)
+    keyword_id = Column(GUID, ForeignKey("keywords.id", ondelete="CASCADE"), nullable=False)
+    target_id = Column(GUID, ForeignKey("targets.id", ondelete="CASCADE"), nullable=False)
+    platform = Column(Enum(PlatformType), nullable=False)
+    previous_rank = Column(Integer, nullable=True)  # None = 신규 진입
+    current_rank = Column(Integer, nullable=True)  # None = 순위권 이탈
+    rank_change = Column(Integer, nullable=True)
+    captured_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_rank_deltas_keyword_captured", "keyword_id", "captured_at"),
+    )
+
+    target = relationship("Target")
+    keyword = relationship("Keyword")
+
 class ContentsMetric(Base):
     __tablename__ = "contents_metrics"
     id = Column(GUID, primary_key=True, default=uuid.uuid4)
@@ -555,6 +684,11 @@ class SyncTask(Base):
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     attempts = Column(Integer, default=0)
+
+    __table_args__ = (
+        # (커넥션, 일자) 당 하나 - 백필 체크포인트. 일괄 생성은 ON CONFLICT DO NOTHING
+        UniqueConstraint("connection_id", "target_date", name="sync_tasks_connection_id_target_date_key"),
+    )
     
     connection = relationship("PlatformConnection")
     validation = relationship("SyncValidation", back_populates="task", uselist=False)
@@ -572,6 +706,49 @@ class SyncValidation(Base):
     task = relationship("SyncTask", back_populates="validation")
 
 
+# --- Durable Job Queue ---
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+
+class Job(Base):
+    """
+    Postgres 기반 작업 큐 (스크래핑/동기화/리포트 생성).
+    워커는 SELECT ... FOR UPDATE SKIP LOCKED 로 한 건씩 점유하며, 같은 dedupe_key 의
+    QUEUED/RUNNING 작업은 부분 유니크 인덱스로 인스턴스 간에도 하나만 존재한다.
+    """
+    __tablename__ = "jobs"
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)        # 'scrape.place', 'sync.all', 'report.generate' ...
+    payload = Column(JSON, nullable=False, default=dict)
+    dedupe_key = Column(String(255), nullable=True)
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    priority = Column(Integer, nullable=False, default=0)  # 클수록 먼저
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_at = Column(DateTime, nullable=False)        # UTC, 재시도 backoff 시 미래 시각
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_jobs_claim', 'status', 'priority', 'run_at'),
+        Index(
+            'uq_jobs_active_dedupe_key', 'dedupe_key', unique=True,
+            postgresql_where=status.in_(ACTIVE_JOB_STATUSES),
+            sqlite_where=status.in_(ACTIVE_JOB_STATUSES),
+        ),
+    )
+
+
 # --- AI Chat History ---
 
 class ChatSession(Base):
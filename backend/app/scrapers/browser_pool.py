@@ -0,0 +1,199 @@
+"""
+Playwright 브라우저 풀
+
+URL 마다 async_playwright() 를 시작하고 브라우저를 launch/CDP 연결하면
+요청당 수 초~수십 초가 걸리고, 동시 요청 시 브라우저 수만큼 메모리가 늘어난다.
+
+- 이벤트 루프당 브라우저 1개를 유지 (Playwright 객체는 루프에 묶임)
+- 열린 컨텍스트 수 상한(max_contexts) → 동시 요청이 몰려도 메모리 상한 유지
+- 컨텍스트는 pages_per_context 페이지를 처리하면 폐기/재생성 (UA 교체, 누수 방지)
+- 페이지를 내줄 때마다 브라우저 연결 상태를 확인하고 끊겼으면 재기동
+- 사용 중 예외가 난 컨텍스트는 재사용하지 않는다
+"""
+import asyncio
+import logging
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+LOCAL_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',  # Cloud Run 호환성
+    '--disable-gpu',
+    '--no-first-run',
+]
+
+
+class _ContextSlot:
+    def __init__(self, profile: str, context: BrowserContext, browser: Browser):
+        self.profile = profile
+        self.context = context
+        self.browser = browser
+        self.pages_served = 0
+
+
+class BrowserPool:
+    def __init__(self, max_contexts: int = 3, pages_per_context: int = 20, cdp_url: Optional[str] = None):
+        self.max_contexts = max(1, max_contexts)
+        self.pages_per_context = max(1, pages_per_context)
+        self.cdp_url = cdp_url
+        self._semaphore = asyncio.Semaphore(self.max_contexts)
+        self._lock = asyncio.Lock()
+        self._idle: Dict[str, List[_ContextSlot]] = {}
+        self._open_contexts = 0
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self.stats = {
+            "browser_launches": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "pages_served": 0,
+        }
+
+    def is_healthy(self) -> bool:
+        return bool(self._browser and self._browser.is_connected())
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._lock:
+            if self.is_healthy():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("[BrowserPool] Browser disconnected - relaunching")
+                self._idle.clear()
+                self._open_contexts = 0
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            if self.cdp_url and self.cdp_url.startswith("wss://"):
+                logger.info(f"[BrowserPool] Connecting to Bright Data Scraping Browser... (URL starts with {self.cdp_url[:15]}...)")
+                self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+            else:
+                if self.cdp_url:
+                    logger.warning(f"[BrowserPool] Invalid CDP URL format (Len: {len(self.cdp_url)}). Falling back to Local Browser.")
+                self._browser = await self._playwright.chromium.launch(headless=True, args=LOCAL_LAUNCH_ARGS)
+            self.stats["browser_launches"] += 1
+            return self._browser
+
+    async def _close_context(self, slot: _ContextSlot):
+        self._open_contexts = max(0, self._open_contexts - 1)
+        self.stats["contexts_recycled"] += 1
+        try:
+            await slot.context.close()
+        except Exception as e:
+            logger.debug(f"[BrowserPool] Context close failed: {e}")
+
+    async def _acquire_context(self, browser: Browser, profile: str, context_options: Callable[[], dict]) -> _ContextSlot:
+        idle = self._idle.get(profile) or []
+        while idle:
+            slot = idle.pop()
+            if slot.browser is browser:
+                return slot
+            await self._close_context(slot)
+
+        # 상한에 도달했으면 다른 프로필의 유휴 컨텍스트를 정리해 자리 확보
+        for other in list(self._idle.values()):
+            while other and self._open_contexts >= self.max_contexts:
+                await self._close_context(other.pop(0))
+
+        context = await browser.new_context(**context_options())
+        self._open_contexts += 1
+        self.stats["contexts_created"] += 1
+        return _ContextSlot(profile, context, browser)
+
+    @asynccontextmanager
+    async def page(self, profile: str, context_options: Callable[[], dict]):
+        """
+        풀에서 페이지 하나를 빌려준다.
+
+        Args:
+            profile: 컨텍스트 재사용 단위 (예: "mobile", "desktop")
+            context_options: 새 컨텍스트 생성 시 호출되는 browser.new_context 인자 팩토리
+        """
+        async with self._semaphore:
+            browser = await self._ensure_browser()
+            slot = await self._acquire_context(browser, profile, context_options)
+            page: Page = await slot.context.new_page()
+            reusable = True
+            try:
+                yield page
+            except BaseException:
+                reusable = False
+                raise
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    reusable = False
+                slot.pages_served += 1
+                self.stats["pages_served"] += 1
+                if reusable and slot.pages_served < self.pages_per_context and slot.browser is self._browser and self.is_healthy():
+                    self._idle.setdefault(profile, []).append(slot)
+                else:
+                    await self._close_context(slot)
+
+    def snapshot(self) -> dict:
+        return {
+            "healthy": self.is_healthy(),
+            "open_contexts": self._open_contexts,
+            "idle_contexts": sum(len(v) for v in self._idle.values()),
+            "max_contexts": self.max_contexts,
+            "pages_per_context": self.pages_per_context,
+            **self.stats,
+        }
+
+    async def close(self):
+        for slots in self._idle.values():
+            for slot in slots:
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+        self._idle.clear()
+        self._open_contexts = 0
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"[BrowserPool] Browser close failed: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+# event loop → BrowserPool
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool:
+    """현재 이벤트 루프의 공유 브라우저 풀 (없으면 생성, 브라우저는 첫 사용 시 기동)."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        from app.core.config import settings
+        cdp_url = os.getenv("BRIGHT_DATA_CDP_URL") or settings.BRIGHT_DATA_CDP_URL
+        if cdp_url:
+            # Sanitize env var (handle potential quotes from YAML)
+            cdp_url = cdp_url.strip().strip('"').strip("'")
+        pool = BrowserPool(
+            max_contexts=settings.BROWSER_POOL_MAX_CONTEXTS,
+            pages_per_context=settings.BROWSER_CONTEXT_MAX_PAGES,
+            cdp_url=cdp_url,
+        )
+        _pools[loop] = pool
+    return pool
+
+
+async def close_browser_pools(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """현재(또는 지정한) 이벤트 루프의 브라우저 풀 종료."""
+    loop = loop or asyncio.get_running_loop()
+    pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+        logger.info("[BrowserPool] Closed")
@@ -9,6 +9,7 @@ import urllib.parse
 import logging
 import asyncio
 from bs4 import BeautifulSoup
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,23 +44,21 @@ class NaverAdScraper:
 
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                ) as client:
-                    resp = await client.get(
-                        self.SEARCH_URL, params=params, headers=HEADERS
-                    )
-
-                    self.logger.info(f"[NaverAd] HTTP {resp.status_code} ('{keyword}')")
-
-                    if resp.status_code != 200:
-                        await asyncio.sleep(2)
-                        continue
-
-                    results = self._parse_ad_html(resp.text, keyword)
-                    self.logger.info(f"[NaverAd] '{keyword}' → {len(results)}건")
-                    return results
+                client = get_http_client("search.naver.com")
+                resp = await client.get(
+                    self.SEARCH_URL, params=params, headers=HEADERS,
+                    timeout=15.0, follow_redirects=True,
+                )
+
+                self.logger.info(f"[NaverAd] HTTP {resp.status_code} ('{keyword}')")
+
+                if resp.status_code != 200:
+                    await asyncio.sleep(2)
+                    continue
+
+                results = self._parse_ad_html(resp.text, keyword)
+                self.logger.info(f"[NaverAd] '{keyword}' → {len(results)}건")
+                return results
 
             except httpx.TimeoutException:
                 self.logger.warning(f"[NaverAd] 타임아웃 (시도 {attempt + 1}/3)")
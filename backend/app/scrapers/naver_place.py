@@ -13,6 +13,8 @@ import json
 import logging
 import asyncio
 import re
+from app.core.http_client import get_http_client
+from app.scrapers.paging import fetch_pages_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +38,13 @@ class NaverPlaceScraper:
     MAP_API_URL = "https://map.naver.com/p/api/search/allSearch"
     LOCAL_API_URL = "https://openapi.naver.com/v1/search/local"
 
-    def __init__(self):
+    def __init__(self, local_page_concurrency: int = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self._client_id, self._client_secret = self._load_api_credentials()
+        if local_page_concurrency is None:
+            from app.core.config import settings
+            local_page_concurrency = settings.NAVER_LOCAL_PAGE_CONCURRENCY
+        self.local_page_concurrency = local_page_concurrency
 
     def _load_api_credentials(self):
         try:
@@ -78,11 +84,11 @@ class NaverPlaceScraper:
             "X-Naver-Client-Secret": self._client_secret,
         }
 
-        all_items = []
         display = 5   # local API 최대 5개/페이지
         max_results = 25
+        client = get_http_client("openapi.naver.com")
 
-        for start in range(1, max_results + 1, display):
+        async def fetch_page(start: int):
             params = {
                 "query": keyword,
                 "display": display,
@@ -90,26 +96,27 @@ class NaverPlaceScraper:
                 "sort": "random",   # 관련도 순
             }
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    resp = await client.get(
-                        self.LOCAL_API_URL, headers=headers, params=params
-                    )
-                    if resp.status_code == 401:
-                        self.logger.error("[NaverPlace] Local API 인증 실패 (CLIENT_ID/SECRET 확인)")
-                        break
-                    if resp.status_code != 200:
-                        self.logger.warning(f"[NaverPlace] Local API HTTP {resp.status_code}")
-                        break
-                    data = resp.json()
-                    items = data.get("items", [])
-                    if not items:
-                        break
-                    all_items.extend(items)
-                    if len(items) < display:
-                        break
+                resp = await client.get(
+                    self.LOCAL_API_URL, headers=headers, params=params, timeout=10.0
+                )
             except Exception as e:
                 self.logger.error(f"[NaverPlace] Local API 요청 오류: {e}")
-                break
+                return None
+            if resp.status_code == 401:
+                self.logger.error("[NaverPlace] Local API 인증 실패 (CLIENT_ID/SECRET 확인)")
+                return None
+            if resp.status_code != 200:
+                self.logger.warning(f"[NaverPlace] Local API HTTP {resp.status_code}")
+                return None
+            return resp.json().get("items", [])
+
+        # 페이지 오프셋(1,6,11,16,21)을 동시에 요청, 순위 순서대로 병합
+        all_items = await fetch_pages_concurrently(
+            fetch_page,
+            offsets=list(range(1, max_results + 1, display)),
+            page_size=display,
+            concurrency=self.local_page_concurrency,
+        )
 
         results = []
         for i, item in enumerate(all_items):
@@ -144,46 +151,43 @@ class NaverPlaceScraper:
 
         for attempt in range(2):
             try:
-                async with httpx.AsyncClient(
-                    timeout=15.0,
-                    follow_redirects=True,
-                ) as client:
-                    resp = await client.get(url, headers=MAP_HEADERS)
-
-                    self.logger.info(f"[NaverPlace Map] HTTP {resp.status_code}")
-
-                    if resp.status_code == 403:
-                        self.logger.warning("[NaverPlace Map] 403 - 접근 차단")
-                        await asyncio.sleep(3)
-                        continue
-
-                    if resp.status_code != 200:
-                        await asyncio.sleep(2)
-                        continue
-
-                    text = resp.text.strip()
-                    if text.startswith("<"):
-                        match = re.search(r"<pre[^>]*>([\s\S]*?)</pre>", text)
-                        if match:
-                            text = match.group(1).strip()
-                        else:
-                            self.logger.warning("[NaverPlace Map] HTML 응답 - JSON 추출 불가")
-                            break
-
-                    data = json.loads(text)
-
-                    # CAPTCHA 차단 확인
-                    result_obj = data.get("result", {})
-                    if result_obj and result_obj.get("ncaptcha"):
-                        self.logger.warning(
-                            "[NaverPlace Map] CAPTCHA 차단 감지 (해외 IP). "
-                            "NAVER_CLIENT_ID/SECRET 설정 시 Local Search API로 대체됩니다."
-                        )
-                        return []
-
-                    results = self._parse_map_results(data, keyword)
-                    self.logger.info(f"[NaverPlace Map] '{keyword}' → {len(results)}건")
-                    return results
+                client = get_http_client("map.naver.com")
+                resp = await client.get(url, headers=MAP_HEADERS, timeout=15.0, follow_redirects=True)
+
+                self.logger.info(f"[NaverPlace Map] HTTP {resp.status_code}")
+
+                if resp.status_code == 403:
+                    self.logger.warning("[NaverPlace Map] 403 - 접근 차단")
+                    await asyncio.sleep(3)
+                    continue
+
+                if resp.status_code != 200:
+                    await asyncio.sleep(2)
+                    continue
+
+                text = resp.text.strip()
+                if text.startswith("<"):
+                    match = re.search(r"<pre[^>]*>([\s\S]*?)</pre>", text)
+                    if match:
+                        text = match.group(1).strip()
+                    else:
+                        self.logger.warning("[NaverPlace Map] HTML 응답 - JSON 추출 불가")
+                        break
+
+                data = json.loads(text)
+
+                # CAPTCHA 차단 확인
+                result_obj = data.get("result", {})
+                if result_obj and result_obj.get("ncaptcha"):
+                    self.logger.warning(
+                        "[NaverPlace Map] CAPTCHA 차단 감지 (해외 IP). "
+                        "NAVER_CLIENT_ID/SECRET 설정 시 Local Search API로 대체됩니다."
+                    )
+                    return []
+
+                results = self._parse_map_results(data, keyword)
+                self.logger.info(f"[NaverPlace Map] '{keyword}' → {len(results)}건")
+                return results
 
             except httpx.TimeoutException:
                 self.logger.warning(f"[NaverPlace Map] 타임아웃 (시도 {attempt + 1}/2)")
@@ -15,7 +15,8 @@ import random
 import logging
 import re
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from app.scrapers.browser_pool import get_browser_pool, BrowserPool
 from bs4 import BeautifulSoup
 import time
 
@@ -41,8 +42,8 @@ class AdvancedNaverPlaceScraper:
     MAX_RETRIES = 3
     RETRY_DELAY_MIN = 2
     RETRY_DELAY_MAX = 5
-    RANDOM_DELAY_MIN = 1
-    RANDOM_DELAY_MAX = 4
+    READY_TIMEOUT_MS = 8000
+    RESULT_SELECTOR = '[class*="place"], li[class*="item"], li[class*="result"]'
     
     # User-Agents (다양한 환경 시뮬레이션)
     USER_AGENTS = [
@@ -67,7 +68,7 @@ class AdvancedNaverPlaceScraper:
             [{rank, name, id, category, address, lat, lng}, ...]
         
         프로세스:
-            1. Browser 생성 (Stealth 모드)
+            1. 공유 브라우저 풀에서 페이지 대여
             2. 검색 페이지 방문
             3. JavaScript 렌더링 완료 대기
             4. 자연스러운 상호작용 (스크롤, 딜레이)
@@ -77,57 +78,43 @@ class AdvancedNaverPlaceScraper:
         
         self.logger.info(f"[Advanced Scrape] Starting for keyword: '{keyword}'")
         
-        async with async_playwright() as p:
-            # Playwright stealth 설정
-            browser = await self._launch_stealth_browser(p)
-            
-            try:
-                results = await self._scrape_with_retry(browser, keyword)
-                
-                if results:
-                    self.logger.info(f"[Advanced Scrape] ✅ Found {len(results)} places")
-                else:
-                    self.logger.warning(f"[Advanced Scrape] ❌ No results found")
-                
-                return results
+        try:
+            results = await self._scrape_with_retry(get_browser_pool(), keyword)
             
-            except Exception as e:
-                self.logger.error(f"[Advanced Scrape Error] {type(e).__name__}: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
-                return []
+            if results:
+                self.logger.info(f"[Advanced Scrape] ✅ Found {len(results)} places")
+            else:
+                self.logger.warning(f"[Advanced Scrape] ❌ No results found")
             
-            finally:
-                await browser.close()
-    
-    async def _launch_stealth_browser(self, p) -> Browser:
-        """Stealth 모드 브라우저 생성"""
-        
-        self.logger.debug("[Browser] Launching Stealth Chromium...")
+            return results
         
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',  # Cloud Run 호환성
-                '--disable-gpu',
-                '--disable-web-resources',
-                '--no-first-run',
-            ]
+        except Exception as e:
+            self.logger.error(f"[Advanced Scrape Error] {type(e).__name__}: {e}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+            return []
+    
+    def _context_options(self) -> dict:
+        """Stealth 컨텍스트 설정 (컨텍스트 재생성 시마다 UA 교체)"""
+        return dict(
+            user_agent=random.choice(self.USER_AGENTS),
+            viewport={'width': 1920, 'height': 1080},
+            device_scale_factor=1,
+            # Anti-detection headers
+            extra_http_headers={
+                "Referer": "https://map.naver.com/",
+                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+            },
         )
-        
-        self.logger.debug("[Browser] Stealth browser launched")
-        return browser
     
-    async def _scrape_with_retry(self, browser: Browser, keyword: str) -> List[Dict]:
+    async def _scrape_with_retry(self, pool: BrowserPool, keyword: str) -> List[Dict]:
         """자동 재시도 로직이 있는 스크래핑"""
         
         for attempt in range(self.MAX_RETRIES + 1):
             try:
                 self.logger.info(f"[Scrape] Attempt {attempt + 1}/{self.MAX_RETRIES + 1}")
                 
-                results = await self._scrape_page(browser, keyword)
+                results = await self._scrape_page(pool, keyword)
                 
                 if results:
                     return results
@@ -149,38 +136,25 @@ class AdvancedNaverPlaceScraper:
         
         return []
     
-    async def _scrape_page(self, browser: Browser, keyword: str) -> List[Dict]:
+    async def _scrape_page(self, pool: BrowserPool, keyword: str) -> List[Dict]:
         """실제 스크래핑 로직"""
         
         url = self.BASE_URL.format(keyword)
         self.logger.info(f"[Page] Navigating to {url}")
         
-        # 페이지 생성 with Stealth headers
-        page = await browser.new_page(
-            user_agent=random.choice(self.USER_AGENTS),
-            viewport={'width': 1920, 'height': 1080},
-            device_scale_factor=1,
-        )
-        
-        # Anti-detection headers
-        await page.set_extra_http_headers({
-            "Referer": "https://map.naver.com/",
-            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-        })
-        
-        # webdriver 감지 우회
-        await page.evaluate('''
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => false,
-            });
+        async with pool.page("desktop_stealth", self._context_options) as page:
+            # webdriver 감지 우회
+            await page.evaluate('''
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => false,
+                });
+                
+                // chrome 속성 숨기기
+                Object.defineProperty(navigator, 'chrome', {
+                    get: () => ({}),
+                });
+            ''')
             
-            // chrome 속성 숨기기
-            Object.defineProperty(navigator, 'chrome', {
-                get: () => ({}),
-            });
-        ''')
-        
-        try:
             # 페이지 로드 (networkidle: 모든 네트워크 요청 완료)
             self.logger.debug("[Page] Waiting for page load...")
             response = await page.goto(
@@ -196,29 +170,23 @@ class AdvancedNaverPlaceScraper:
                 self.logger.error(f"[Page] HTTP error {status}")
                 return []
             
-            # 자연스러운 상호작용 (딜레이 + 스크롤)
+            # 결과 렌더링 대기 + 지연 로딩 스크롤
             await self._simulate_human_behavior(page)
             
             # 결과 추출
-            results = await self._extract_results(page, keyword)
-            
-            return results
-        
-        finally:
-            await page.close()
+            return await self._extract_results(page, keyword)
     
     async def _simulate_human_behavior(self, page: Page):
         """
-        사용자 같은 자연스러운 동작 시뮬레이션
-        - 랜덤 딜레이
-        - 페이지 스크롤
-        - 마우스 이동
+        결과 렌더링을 이벤트 기반으로 대기한 뒤 스크롤로 지연 로딩 트리거
+        - 결과 요소 등장 대기 (고정 딜레이 대체)
+        - 페이지 스크롤 (높이 변화가 멈추면 중단)
         """
         
-        # 초기 딜레이 (페이지 완전히 렌더링될 때까지)
-        delay = random.uniform(self.RANDOM_DELAY_MIN, self.RANDOM_DELAY_MAX)
-        self.logger.debug(f"[Behavior] Waiting {delay:.1f}s for rendering...")
-        await asyncio.sleep(delay)
+        try:
+            await page.wait_for_selector(self.RESULT_SELECTOR, timeout=self.READY_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            self.logger.debug("[Behavior] Result selector not found before timeout")
         
         # 스크롤 다운 (검색 결과 로드)
         self.logger.debug("[Behavior] Scrolling page...")
@@ -226,13 +194,18 @@ class AdvancedNaverPlaceScraper:
         
         for i in range(3):
             await page.evaluate(f"window.scrollBy(0, {scroll_height // 3})")
-            await asyncio.sleep(random.uniform(0.5, 1.5))
+            try:
+                await page.wait_for_function(
+                    "h => document.documentElement.scrollHeight > h", arg=scroll_height, timeout=1000
+                )
+                scroll_height = await page.evaluate("document.documentElement.scrollHeight")
+            except PlaywrightTimeoutError:
+                pass
         
         # 상단으로 복귀
         await page.evaluate("window.scrollTo(0, 0)")
-        await asyncio.sleep(random.uniform(0.3, 0.8))
         
-        self.logger.debug("[Behavior] Finished human-like simulation")
+        self.logger.debug("[Behavior] Finished scroll pass")
     
     async def _extract_results(self, page: Page, keyword: str) -> List[Dict]:
         """
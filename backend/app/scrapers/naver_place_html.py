@@ -18,6 +18,14 @@ class NaverPlaceHtmlScraper(ScraperBase):
     
     # Naver Maps 검색 페이지
     BASE_URL = "https://map.naver.com/p/search/{}"
+
+    # Naver Maps에서 사용하는 다양한 class names (추출 순서대로, 페이지 준비 신호로도 사용)
+    PLACE_SELECTORS = [
+        'div[class*="SearchResult"]',  # React component
+        'li[class*="place"]',          # 리스트 아이템
+        'div[class*="place_item"]',    # 개별 아이템
+        '.place_name',                  # 이름
+    ]
     
     async def get_rankings(self, keyword: str) -> List[Dict]:
         """
@@ -36,7 +44,9 @@ class NaverPlaceHtmlScraper(ScraperBase):
             self.logger.info(f"[Scraping] Fetching {url}")
             
             # fetch_page_content: Playwright로 페이지 로드 + HTML wrapper 제거
-            html_content = await self.fetch_page_content(url, scroll=False, is_mobile=False)
+            html_content = await self.fetch_page_content(
+                url, scroll=False, is_mobile=False, ready_selector=", ".join(self.PLACE_SELECTORS)
+            )
             
             if not html_content:
                 self.logger.error(f"[HTML Scrape] Empty content for {keyword}")
@@ -69,13 +79,7 @@ class NaverPlaceHtmlScraper(ScraperBase):
         results = []
         
         # 전략 1: 표준 장소 아이템 찾기
-        # Naver Maps에서 사용하는 다양한 class names
-        place_selectors = [
-            'div[class*="SearchResult"]',  # React component
-            'li[class*="place"]',          # 리스트 아이템
-            'div[class*="place_item"]',    # 개별 아이템
-            '.place_name',                  # 이름
-        ]
+        place_selectors = self.PLACE_SELECTORS
         
         self.logger.debug(f"[Scraping] Searching with {len(place_selectors)} selectors")
         
@@ -13,6 +13,7 @@ import asyncio
 import re
 from bs4 import BeautifulSoup
 from html import unescape
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -119,25 +120,24 @@ class NaverViewScraper:
 
         for attempt in range(3):
             try:
-                async with httpx.AsyncClient(
+                client = get_http_client("search.naver.com")
+                resp = await client.get(
+                    self.SEARCH_URL,
+                    params=params,
+                    headers=self.HEADERS,
                     timeout=20.0,
                     follow_redirects=True,
-                ) as client:
-                    resp = await client.get(
-                        self.SEARCH_URL,
-                        params=params,
-                        headers=self.HEADERS,
-                    )
+                )
 
-                    self.logger.info(f"[NaverView HTML] HTTP {resp.status_code} ('{keyword}')")
+                self.logger.info(f"[NaverView HTML] HTTP {resp.status_code} ('{keyword}')")
 
-                    if resp.status_code != 200:
-                        await asyncio.sleep(2)
-                        continue
+                if resp.status_code != 200:
+                    await asyncio.sleep(2)
+                    continue
 
-                    results = self._parse_view_html(resp.text, keyword)
-                    self.logger.info(f"[NaverView HTML] '{keyword}' → {len(results)}건")
-                    return results
+                results = self._parse_view_html(resp.text, keyword)
+                self.logger.info(f"[NaverView HTML] '{keyword}' → {len(results)}건")
+                return results
 
             except httpx.TimeoutException:
                 self.logger.warning(f"[NaverView HTML] 타임아웃 (시도 {attempt + 1}/3)")
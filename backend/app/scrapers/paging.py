@@ -0,0 +1,67 @@
+"""
+오프셋이 정해진 페이지 API 의 동시 조회 헬퍼
+
+순차 조회(start=1,6,11,...)는 페이지 수만큼 RTT 를 직렬로 지불한다.
+알려진 오프셋을 동시에 요청하되 결과는 오프셋 순서로 병합해 순위를 보존하고,
+짧은 페이지(마지막 페이지)나 실패가 확인되면 그 뒤 페이지 요청은 즉시 취소한다.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PageFetcher = Callable[[int], Awaitable[Optional[list]]]
+
+
+async def fetch_pages_concurrently(
+    fetch_page: PageFetcher,
+    offsets: Sequence[int],
+    page_size: int,
+    concurrency: int = 5,
+) -> list:
+    """
+    Args:
+        fetch_page: async fn(offset) -> 항목 리스트, 오류/중단 시 None
+        offsets: 요청할 페이지 오프셋 (오름차순)
+        page_size: 정상 페이지의 항목 수 (이보다 짧으면 마지막 페이지)
+        concurrency: 동시 요청 한도
+
+    Returns:
+        오프셋 순서로 병합된 항목. 순차 조회와 동일하게 첫 번째 짧은/실패 페이지에서 끊는다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    cutoff = len(offsets)  # 첫 종료 페이지 인덱스 (이후 페이지는 불필요)
+    tasks: List[asyncio.Task] = []
+
+    def mark_terminal(index: int):
+        nonlocal cutoff
+        if index < cutoff:
+            cutoff = index
+            for later in tasks[index + 1:]:
+                later.cancel()
+
+    async def run(index: int, offset: int) -> Optional[list]:
+        async with semaphore:
+            if index > cutoff:
+                return None
+            try:
+                items = await fetch_page(offset)
+            except Exception as e:
+                logger.warning(f"[Paging] offset={offset} 요청 실패: {e}")
+                items = None
+        if items is None or len(items) < page_size:
+            mark_terminal(index)
+        return items
+
+    tasks.extend(asyncio.create_task(run(i, offset)) for i, offset in enumerate(offsets))
+    pages = await asyncio.gather(*tasks, return_exceptions=True)
+
+    merged = []
+    for index, page in enumerate(pages):
+        if index > cutoff or page is None or isinstance(page, BaseException):
+            break
+        merged.extend(page)
+        if len(page) < page_size:
+            break
+    return merged
@@ -0,0 +1,204 @@
+"""
+키워드 순위 스크래핑 파이프라인 (동시성 제한)
+
+    [키워드 큐] → 워커 N개 → (플랫폼별 세마포어 + 호스트별 요청 간격) → [결과 큐] → 배치 DB writer
+
+- 야간 동기화 시간은 키워드 수가 아니라 워커/세마포어 한도에 비례한다.
+- 결과 큐는 크기 제한이 있어 DB 저장이 느리면 스크래핑이 자연스럽게 감속된다.
+- 단계별 처리량 카운터는 get_last_pipeline_stats() 로 조회한다.
+
+DB/ORM 의존성 없음: 스크래퍼 함수와 writer 를 주입받는다.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ScrapeFn = Callable[[str], Awaitable[list]]
+WriterFn = Callable[[List[dict]], int]
+
+# 플랫폼 → (에러 라벨, 주 요청 호스트)
+PLATFORM_LABELS = {"place": "Place", "view": "View", "ad": "Ad"}
+PLATFORM_HOSTS = {
+    "place": "openapi.naver.com",
+    "view": "search.naver.com",
+    "ad": "search.naver.com",
+}
+
+_last_run_stats: Optional[dict] = None
+
+
+def get_last_pipeline_stats() -> Optional[dict]:
+    """마지막 파이프라인 실행의 단계별 카운터 (실행 이력 없으면 None)."""
+    return _last_run_stats
+
+
+@dataclass
+class StageCounter:
+    processed: int = 0
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    def snapshot(self, elapsed: float) -> dict:
+        return {
+            "processed": self.processed,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "processed_per_sec": round(self.processed / elapsed, 3) if elapsed > 0 else 0.0,
+            "items_per_sec": round(self.items / elapsed, 3) if elapsed > 0 else 0.0,
+        }
+
+
+class HostRateLimiter:
+    """호스트별 요청 시작 간격을 min_interval 초 이상으로 유지."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    async def acquire(self, host: str):
+        if self.min_interval <= 0:
+            return
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = self._next_slot.get(host, now)
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            self._next_slot[host] = max(slot, now) + self.min_interval
+
+
+@dataclass
+class PipelineResult:
+    items: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)
+
+
+class ScrapePipeline:
+    """
+    Args:
+        scrapers: {"place": async fn(keyword) -> list, ...}
+        writer: 동기 함수 (entries) -> 저장 행 수. 별도 스레드에서 순차 호출된다.
+        workers: 동시에 처리할 키워드 수
+        platform_limits: {"place": 3, ...} 플랫폼별 동시 요청 한도
+        host_interval: 같은 호스트에 대한 최소 요청 간격(초)
+        batch_size: writer 한 번에 넘길 (키워드×플랫폼) 항목 수
+    """
+
+    def __init__(
+        self,
+        scrapers: Dict[str, ScrapeFn],
+        writer: WriterFn,
+        workers: int = 4,
+        platform_limits: Optional[Dict[str, int]] = None,
+        host_interval: float = 0.0,
+        batch_size: int = 150,
+    ):
+        self.scrapers = scrapers
+        self.writer = writer
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        limits = platform_limits or {}
+        self._semaphores = {p: asyncio.Semaphore(max(1, limits.get(p, self.workers))) for p in scrapers}
+        self._rate_limiter = HostRateLimiter(host_interval)
+        self._counters: Dict[str, StageCounter] = {}
+        self._result = PipelineResult()
+
+    def _counter(self, stage: str) -> StageCounter:
+        return self._counters.setdefault(stage, StageCounter())
+
+    async def run(self, keywords: List[str]) -> PipelineResult:
+        global _last_run_stats
+        started = time.monotonic()
+        self._result = PipelineResult(items={p: 0 for p in self.scrapers})
+
+        keyword_queue: asyncio.Queue = asyncio.Queue()
+        for kw in keywords:
+            keyword_queue.put_nowait(kw)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * 2)
+
+        writer_task = asyncio.create_task(self._write_stage(result_queue))
+        workers = [
+            asyncio.create_task(self._worker(keyword_queue, result_queue))
+            for _ in range(min(self.workers, max(1, len(keywords))))
+        ]
+        await asyncio.gather(*workers)
+        await result_queue.put(None)
+        await writer_task
+
+        elapsed = time.monotonic() - started
+        self._result.stats = {
+            "keywords": len(keywords),
+            "workers": self.workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "stages": {name: c.snapshot(elapsed) for name, c in sorted(self._counters.items())},
+            "finished_at": time.time(),
+        }
+        _last_run_stats = self._result.stats
+        logger.info(f"[Pipeline] {len(keywords)} keywords in {elapsed:.1f}s ({self.workers} workers)")
+        return self._result
+
+    async def _worker(self, keyword_queue: asyncio.Queue, result_queue: asyncio.Queue):
+        while True:
+            try:
+                keyword = keyword_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            entries = await asyncio.gather(*(self._scrape(p, keyword) for p in self.scrapers))
+            for entry in entries:
+                if entry is not None:
+                    await result_queue.put(entry)
+            self._counter("keywords").processed += 1
+
+    async def _scrape(self, platform: str, keyword: str) -> Optional[dict]:
+        counter = self._counter(f"scrape.{platform}")
+        async with self._semaphores[platform]:
+            await self._rate_limiter.acquire(PLATFORM_HOSTS.get(platform, platform))
+            t0 = time.monotonic()
+            try:
+                results = await self.scrapers[platform](keyword) or []
+            except Exception as e:
+                counter.errors += 1
+                self._result.errors.append(f"{PLATFORM_LABELS.get(platform, platform)}({keyword}): {str(e)}")
+                logger.error(f"[Pipeline] {platform} scrape failed for '{keyword}': {e}")
+                return None
+            finally:
+                counter.busy_seconds += time.monotonic() - t0
+        counter.processed += 1
+        counter.items += len(results)
+        self._result.items[platform] += len(results)
+        return {"keyword": keyword, "platform": platform, "results": results}
+
+    async def _write_stage(self, result_queue: asyncio.Queue):
+        batch: List[dict] = []
+        while True:
+            entry = await result_queue.get()
+            if entry is not None:
+                batch.append(entry)
+            if batch and (entry is None or len(batch) >= self.batch_size):
+                await self._flush(batch)
+                batch = []
+            if entry is None:
+                return
+
+    async def _flush(self, batch: List[dict]):
+        counter = self._counter("write")
+        t0 = time.monotonic()
+        try:
+            rows = await asyncio.to_thread(self.writer, batch)
+            counter.processed += len(batch)
+            counter.items += rows or 0
+        except Exception as e:
+            counter.errors += 1
+            self._result.errors.append(f"Save({len(batch)} entries): {str(e)}")
+            logger.error(f"[Pipeline] batch write failed: {e}")
+        finally:
+            counter.busy_seconds += time.monotonic() - t0
@@ -7,11 +7,17 @@ from app.models.models import PlatformConnection, Keyword, PlatformType
 
 logger = logging.getLogger(__name__)
 
-async def sync_all_channels(client_id: str = None, days: int = None):
+class SyncRunError(Exception):
+    """커넥션 동기화 또는 전체 루틴 실패 (raise_on_error=True 일 때 완료 알림 후 발생 → 작업 큐 재시도)."""
+
+
+async def sync_all_channels(client_id: str = None, days: int = None, raise_on_error: bool = False):
     """
     Unified ASYNC entry point for multi-channel synchronization.
     If client_id is provided, only sync for that specific advertiser.
     If days is provided, sync for that many past days.
+    If raise_on_error is set, connection-level or fatal failures raise SyncRunError
+    after the completion notification (per-keyword scrape errors are only reported).
     """
     if client_id:
         logger.info(f"=== Starting Async Data Sync Routine for Client: {client_id} (Days: {days}) ===")
@@ -20,6 +26,9 @@ async def sync_all_channels(client_id: str = None, days: int = None):
     
     # We use a context manager for DB session to ensure closure
     db = SessionLocal()
+    stats = {"place": 0, "view": 0, "ad": 0}
+    error_logs = []
+    failures = []
     try:
         # 1. Platform Performance Metrics (Supabase Tracked)
         query = db.query(PlatformConnection).filter(PlatformConnection.status == "ACTIVE")
@@ -28,7 +37,7 @@ async def sync_all_channels(client_id: str = None, days: int = None):
         connections = query.all()
         
         from app.services.sync_service import SyncService
-        from app.tasks.sync_data import sync_naver_data
+        from app.tasks.sync_data import sync_naver_data, scrape_keyword_ranks
         sync_service = SyncService(db)
         
         for conn in connections:
@@ -43,6 +52,7 @@ async def sync_all_channels(client_id: str = None, days: int = None):
                     logger.info(f"Google Ads sync skipped (Pending implementation) for {conn.id}")
             except Exception as conn_error:
                 logger.error(f"!!! Error initiating sync for connection {conn.id}: {conn_error}")
+                failures.append(f"connection {conn.id}: {conn_error}")
                 continue
 
         # 2. SEO/Search Rank Scraping (DailyRank)
@@ -56,66 +66,15 @@ async def sync_all_channels(client_id: str = None, days: int = None):
             # db.commit()
             # keywords = db.query(Keyword).all()
 
-        # Import scrapers directly to bypass Celery worker dependency
-        from app.worker.tasks import run_place_scraper, run_view_scraper
-        from app.scrapers.naver_ad import NaverAdScraper
-        from app.services.analysis import AnalysisService
-        
-        service = AnalysisService(db)
-        ad_scraper = NaverAdScraper()
-
-        # Stats tracking
-        stats = {"place": 0, "view": 0, "ad": 0}
-        error_logs = []
-
-        for k in keywords:
-            logger.info(f"-> Executing SEO/Ranking scraper tasks for keyword: {k.term}")
-            
-            # Use asyncio.gather for parallel scraping within each keyword to improve speed
-            try:
-                # 1. Place & View Scraping (Async)
-                place_task = run_place_scraper(k.term)
-                view_task = run_view_scraper(k.term)
-                
-                place_results, view_results = await asyncio.gather(place_task, view_task, return_exceptions=True)
-                
-                # Handling results safely
-                if not isinstance(place_results, Exception):
-                    p_count = len(place_results)
-                    stats["place"] += p_count
-                    service.save_place_results(k.term, place_results)
-                    logger.info(f"PLACE sync completed for '{k.term}' ({p_count} items)")
-                else:
-                    error_logs.append(f"Place({k.term}): {str(place_results)}")
-                    logger.error(f"PLACE sync error for {k.term}: {place_results}")
-
-                if not isinstance(view_results, Exception):
-                    v_count = len(view_results)
-                    stats["view"] += v_count
-                    service.save_view_results(k.term, view_results)
-                    logger.info(f"VIEW sync completed for '{k.term}' ({v_count} items)")
-                else:
-                    error_logs.append(f"View({k.term}): {str(view_results)}")
-                    logger.error(f"VIEW sync error for {k.term}: {view_results}")
-
-                # 2. Ad Scraping (Async)
-                try:
-                    ad_results = await ad_scraper.get_ad_rankings(k.term)
-                    a_count = len(ad_results) if ad_results else 0
-                    stats["ad"] += a_count
-                    if ad_results:
-                        service.save_ad_results(k.term, ad_results)
-                    logger.info(f"AD rank sync completed for '{k.term}' ({a_count} items)")
-                except Exception as ad_err:
-                     error_logs.append(f"Ad({k.term}): {str(ad_err)}")
-                     logger.error(f"AD sync error for {k.term}: {ad_err}")
-
-            except Exception as e:
-                error_logs.append(f"Batch({k.term}): {str(e)}")
-                logger.error(f"Scraper batch failed for '{k.term}': {e}")
+        if keywords:
+            result = await scrape_keyword_ranks(db, keywords)
+            stats.update(result.items)
+            error_logs.extend(result.errors)
+            logger.info(f"Rank scraping pipeline stats: {result.stats}")
 
     except Exception as e:
         logger.error(f"CRITICAL: Global sync process encountered a fatal error: {e}")
+        failures.append(f"fatal: {e}")
     finally:
         db.close()
         
@@ -158,6 +117,18 @@ async def sync_all_channels(client_id: str = None, days: int = None):
             notify_db.close()
     
     logger.info("=== Async Robust Synchronization Routine Completed ===")
+    if raise_on_error and failures:
+        raise SyncRunError("; ".join(failures[:5]))
+
+async def _sync_and_close_clients(client_id: str = None, days: int = None, raise_on_error: bool = False):
+    # asyncio.run 으로 만든 루프 전용 HTTP 커넥션 풀/브라우저 풀은 루프 종료 전에 정리
+    from app.core.http_client import close_http_clients
+    from app.scrapers.browser_pool import close_browser_pools
+    try:
+        await sync_all_channels(client_id, days, raise_on_error=raise_on_error)
+    finally:
+        await close_http_clients()
+        await close_browser_pools()
 
 def run_sync_process(client_id: str = None, days: int = None):
     """
@@ -166,6 +137,6 @@ def run_sync_process(client_id: str = None, days: int = None):
     """
     try:
         logging.getLogger(__name__).info(f"Starting sync process for client {client_id}")
-        asyncio.run(sync_all_channels(client_id, days))
+        asyncio.run(_sync_and_close_clients(client_id, days))
     except Exception as e:
         logging.getLogger(__name__).error(f"Sync process wrapper failed: {e}")
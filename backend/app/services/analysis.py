@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.models.models import DailyRank, Target, Keyword, TargetType, PlatformType, MetricsDaily, Campaign, PlatformConnection, Lead, LeadActivity, LeadProfile, Report, Client
-from typing import List, Union, Optional, Any
+from app.models.models import DailyRank, Target, Keyword, TargetType, PlatformType, Campaign, ClientMetricsDaily, ClientMetricsMonthly, Lead, LeadActivity, LeadProfile, Report, Client
+from app.services.analytics_cache import cached_analytics
+from app.services.source_resolution import SourceResolver
+from typing import List, Union, Optional
 from uuid import uuid4, UUID
 import random
 import datetime
@@ -28,20 +30,6 @@ class AnalysisService:
         return self.DEFAULT_CONVERSION_VALUE
         # [MIGRATE] Transitioned from MongoDB to Supabase (Option A)
 
-    def _get_or_create_keyword(self, term: str, client_id: Optional[UUID] = None) -> Keyword:
-        query = self.db.query(Keyword).filter(Keyword.term == term)
-        if client_id:
-            query = query.filter(Keyword.client_id == client_id)
-        
-        keyword = query.first()
-        
-        if not keyword:
-            keyword = Keyword(id=uuid4(), term=term, client_id=client_id)
-            self.db.add(keyword)
-            self.db.commit()
-            self.db.refresh(keyword)
-        return keyword
-
     def get_or_create_target(self, name: str, url: str = None) -> Target:
         target = self.db.query(Target).filter(Target.name == name).first()
         if not target:
@@ -53,209 +41,95 @@ class AnalysisService:
             self.db.refresh(target)
         return target
 
-    def _save_raw_log_to_supabase(self, platform: PlatformType, keyword: str, data: Any):
-        """Saves unstructured data to Supabase JSONB table (replacing MongoDB)."""
-        try:
-            from app.models.models import RawScrapingLog
-            log_entry = RawScrapingLog(
-                id=uuid4(),
-                platform=platform,
-                keyword=keyword,
-                data=data
-            )
-            self.db.add(log_entry)
-            self.db.flush() 
-        except Exception as e:
-            self.logger.error(f"Failed to save raw log to Supabase: {e}")
+    def save_rank_results_batch(self, entries: List[dict], client_id: Optional[UUID] = None) -> int:
+        """
+        여러 키워드/플랫폼의 순위 결과를 한 번에 저장.
+        entries: [{"keyword": str, "platform": PlatformType, "results": [...]}, ...]
+        """
+        from app.services.rank_ingestion import RankIngestionService
+        return RankIngestionService(self.db).save_batch(entries, client_id)
 
     def save_place_results(self, keyword_str: str, results: List[dict], client_id: Optional[UUID] = None):
-        # Save Raw Data to Supabase (Option A Consolidation)
-        self._save_raw_log_to_supabase(PlatformType.NAVER_PLACE, keyword_str, results)
-        
-        keyword = self._get_or_create_keyword(keyword_str, client_id)
-        
-        # Optimization: Pre-fetch all targets to avoid N+1
-        target_names = [item.get("name") for item in results if item.get("name")]
-        existing_targets = {t.name: t for t in self.db.query(Target).filter(Target.name.in_(target_names)).all()}
-        
-        for item in results:
-            target_name = item.get("name")
-            if not target_name: continue
-            
-            target = existing_targets.get(target_name)
-            if not target:
-                target = Target(id=uuid4(), name=target_name, type=TargetType.OTHERS)
-                self.db.add(target)
-                self.db.flush() # Ensure ID is available
-                existing_targets[target_name] = target
-            
-            rank = DailyRank(
-                id=uuid4(),
-                client_id=client_id,
-                target_id=target.id,
-                keyword_id=keyword.id,
-                platform=PlatformType.NAVER_PLACE,
-                rank=item.get("rank"),
-            )
-            self.db.add(rank)
-        self.db.commit()
+        self.save_rank_results_batch(
+            [{"keyword": keyword_str, "platform": PlatformType.NAVER_PLACE, "results": results}], client_id
+        )
 
     def save_view_results(self, keyword_str: str, results: List[dict], client_id: Optional[UUID] = None):
-        # Save Raw Data to Supabase (Option A Consolidation)
-        self._save_raw_log_to_supabase(PlatformType.NAVER_VIEW, keyword_str, results)
-        
-        keyword = self._get_or_create_keyword(keyword_str, client_id)
-        
-        target_names = [item.get("blog_name") for item in results if item.get("blog_name")]
-        existing_targets = {t.name: t for t in self.db.query(Target).filter(Target.name.in_(target_names)).all()}
-        
-        for item in results:
-            target_name = item.get("blog_name")
-            if not target_name: continue
-            
-            target = existing_targets.get(target_name)
-            if not target:
-                target = Target(id=uuid4(), name=target_name, type=TargetType.OTHERS, urls={"default": item.get("link")} if item.get("link") else None)
-                self.db.add(target)
-                self.db.flush()
-                existing_targets[target_name] = target
-            
-            rank = DailyRank(
-                id=uuid4(),
-                client_id=client_id,
-                target_id=target.id,
-                keyword_id=keyword.id,
-                platform=PlatformType.NAVER_VIEW,
-                rank=item.get("rank"),
-            )
-            self.db.add(rank)
-        self.db.commit()
+        self.save_rank_results_batch(
+            [{"keyword": keyword_str, "platform": PlatformType.NAVER_VIEW, "results": results}], client_id
+        )
 
     def save_ad_results(self, keyword_str: str, results: List[dict], client_id: Optional[UUID] = None):
-        # Save Raw Data to Supabase (Option A Consolidation)
-        self._save_raw_log_to_supabase(PlatformType.NAVER_AD, keyword_str, results)
-        
-        keyword = self._get_or_create_keyword(keyword_str, client_id)
-        
-        target_names = [item.get("advertiser") for item in results if item.get("advertiser")]
-        existing_targets = {t.name: t for t in self.db.query(Target).filter(Target.name.in_(target_names)).all()}
-        
-        for item in results:
-            target_name = item.get("advertiser")
-            if not target_name: continue
-            
-            target = existing_targets.get(target_name)
-            if not target:
-                target = Target(id=uuid4(), name=target_name, type=TargetType.OTHERS, urls={"default": item.get("display_url")} if item.get("display_url") else None)
-                self.db.add(target)
-                self.db.flush()
-                existing_targets[target_name] = target
-            
-            rank = DailyRank(
-                id=uuid4(),
-                client_id=client_id,
-                target_id=target.id,
-                keyword_id=keyword.id,
-                platform=PlatformType.NAVER_AD,
-                rank=item.get("rank"),
-            )
-            self.db.add(rank)
-        self.db.commit()
+        self.save_rank_results_batch(
+            [{"keyword": keyword_str, "platform": PlatformType.NAVER_AD, "results": results}], client_id
+        )
 
     def calculate_sov(self, keyword_str: str, target_name: str, platform: PlatformType, top_n: int = 5) -> dict:
-        keyword = self.db.query(Keyword).filter(Keyword.term == keyword_str).first()
-        if not keyword:
-            return {"sov": 0.0, "total": 0, "hits": 0, "keyword": keyword_str}
+        return self.calculate_sov_batch([keyword_str], target_name, platform, top_n)[0]
+
+    def calculate_sov_batch(
+        self,
+        keywords: List[str],
+        target_name: str,
+        platform: PlatformType,
+        top_n: int = 5,
+        client_id: Optional[UUID] = None
+    ) -> List[dict]:
+        """
+        여러 키워드의 SOV 를 GROUP BY 쿼리 1회로 계산.
 
-        # Filter by Rank <= top_n
-        
-        # Total possible slots is usually top_n? 
-        # Or is SOV = (My Appearances in Top N) / (Total Top N Slots)?
-        # For a single keyword, there are exactly 'top_n' slots in a theoretical sense, 
-        # but realistically we just check how many times 'target' appears in the top_n results we scraped.
-        # If we assume SOV means "Share of Voice in Top N", it is usually:
-        # (Count of Target in Top N) / (Total Slots in Top N, which is top_n) * 100 ?
-        # OR (Count of Target in Top N) / (Total Items Scraped in Top N) * 100 ?
-        
-        # Let's count how many items we actually have in top_n for this keyword (denominator)
-        # In a perfect world, this is 'top_n'. But maybe we only scraped 3 items.
-        
-        total_in_range_count = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform,
-            DailyRank.rank <= top_n
-        ).count()
-        
-        # Denominator choice:
-        # Option A: top_n (Fixed slots) -> If we scraped less, SOV might be lower than expected?
-        # Option B: total_in_range_count -> Share among *captured* top N.
-        # User asked for "Exposure frequency within 1-5 rank".
-        # Let's use 'top_n' as the simpler denominator for "Share of Voice", 
-        # implying "What portion of the Top N real estate do I own?"
-        
-        # However, if naive scraping returned 0 items, SOV is 0.
-        denominator = top_n 
-        
-        if denominator == 0:
-             return {"sov": 0.0, "total": 0, "hits": 0, "keyword": keyword_str}
+        SOV = (전체 수집 이력 중 상위 top_n 안에 타겟이 노출된 횟수) / top_n * 100
+        (분모를 top_n 고정 슬롯으로 두는 "상위 N 자리 중 내 몫" 정의)
 
-        # Count hits for target in top_n
-        target = self.db.query(Target).filter(Target.name == target_name).first()
-        hits = 0
-        top_rank = None
-        
-        if target:
-            hits = self.db.query(DailyRank).filter(
-                DailyRank.keyword_id == keyword.id,
-                DailyRank.platform == platform,
-                DailyRank.target_id == target.id,
-                DailyRank.rank <= top_n
-            ).count()
-            
-        # Find actual period for this keyword/platform ranks
-        # For a single snapshot, we find the latest capture time
-        latest_capture = self.db.query(func.max(DailyRank.captured_at)).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform
-        ).scalar()
-        
-        period_str = latest_capture.strftime("%Y-%m-%d %H:%M") if latest_capture else None
+        client_id 가 있으면 해당 클라이언트의 키워드만, 없으면 term 당 키워드 레코드 1개만 집계한다
+        (여러 클라이언트가 같은 term 을 등록해도 이력을 합산하지 않음). 결과는 keywords 순서.
+        메모리 스냅샷으로 계산할 때는 app.core.algorithms.sov.compute_sov_in_memory 사용.
+        """
+        from sqlalchemy import and_, case, select
+        from app.core.algorithms.sov import build_sov_results
 
-        return {
-            "sov": (hits / denominator) * 100 if denominator > 0 else 0,
-            "total": denominator,
-            "hits": hits,
-            "keyword": keyword_str,
-            "top_rank": top_rank,
-            "period_start": period_str,
-            "period_end": period_str
-        }
+        if not keywords:
+            return []
+
+        terms = set(keywords)
+        if client_id:
+            keyword_scope = Keyword.client_id == client_id
+        else:
+            # term 당 1개 (id 순 첫 레코드) - 쿼리 수는 그대로 1회 (서브쿼리)
+            ranked = select(
+                Keyword.id,
+                func.row_number().over(partition_by=Keyword.term, order_by=Keyword.id).label("rn"),
+            ).where(Keyword.term.in_(terms)).subquery()
+            keyword_scope = Keyword.id.in_(select(ranked.c.id).where(ranked.c.rn == 1))
+
+        is_hit = and_(Target.id.isnot(None), DailyRank.rank <= top_n)
+        query = self.db.query(
+            Keyword.term,
+            func.sum(case((is_hit, 1), else_=0)).label("hits"),
+            func.min(case((is_hit, DailyRank.rank))).label("top_rank"),
+            func.max(DailyRank.captured_at).label("latest_capture"),
+        ).select_from(Keyword)\
+         .outerjoin(DailyRank, and_(DailyRank.keyword_id == Keyword.id, DailyRank.platform == platform))\
+         .outerjoin(Target, and_(Target.id == DailyRank.target_id, Target.name == target_name))\
+         .filter(Keyword.term.in_(terms), keyword_scope)
+        rows = query.group_by(Keyword.term).all()
+
+        aggregates = {r.term: (int(r.hits or 0), r.top_rank, r.latest_capture) for r in rows}
+        return build_sov_results(list(keywords), aggregates, top_n)
 
     def get_daily_ranks(self, keyword_str: str, platform: PlatformType) -> List[dict]:
-        from app.models.models import DailyRank, Keyword
+        from app.services.rank_repository import RankReadRepository
         keyword = self.db.query(Keyword).filter(Keyword.term == keyword_str).first()
         if not keyword:
             return []
             
-        # Get the latest ranks for this keyword/platform
-        latest = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform
-        ).order_by(DailyRank.captured_at.desc()).first()
-        
-        if not latest:
-            return []
-            
-        ranks = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform,
-            DailyRank.captured_at == latest.captured_at
-        ).order_by(DailyRank.rank.asc()).all()
+        # Get the latest ranks for this keyword/platform (latest_rank_snapshot 단일 조회)
+        ranks = RankReadRepository(self.db).current_ranking(keyword.id, platform)
         
         return [{
             "rank": r.rank,
-            "title": r.target.name,
-            "link": r.target.urls.get("default") if r.target.urls else None,
+            "title": r.target_name,
+            "link": r.url,
             "created_at": r.captured_at
         } for r in ranks]
 
@@ -287,24 +161,20 @@ class AnalysisService:
             return {"keyword": keyword_str, "platform": platform.value, "top_n": top_n, "competitors": []}
             
         # Get latest ranks to identify current competitors
-        ranks = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform,
-            DailyRank.rank <= top_n
-        ).order_by(DailyRank.captured_at.desc(), DailyRank.rank.asc()).limit(100).all()
+        from app.services.rank_repository import RankReadRepository
+        current_batch = RankReadRepository(self.db).current_ranking(keyword.id, platform, top_n=top_n)
 
-        if not ranks:
+        if not current_batch:
             return {"keyword": keyword_str, "platform": platform.value, "top_n": top_n, "competitors": []}
 
-        latest_time = ranks[0].captured_at
-        current_batch = [r for r in ranks if abs((r.captured_at - latest_time).total_seconds()) < 60]
+        latest_time = current_batch[0].captured_at
         
         # Aggregate by Target
         stats = {} # target_id -> {name, count, total_rank}
         for r in current_batch:
             tid = r.target_id
             if tid not in stats:
-                stats[tid] = {"name": r.target.name, "count": 0, "total_rank": 0}
+                stats[tid] = {"name": r.target_name, "count": 0, "total_rank": 0}
             stats[tid]["count"] += 1
             stats[tid]["total_rank"] += r.rank
             
@@ -335,23 +205,16 @@ class AnalysisService:
     def get_weekly_sov_summary(self, target_name: str, keywords: List[str], platform: PlatformType) -> dict:
         """
         Aggregate SOV across multiple keywords for the last 7 days.
+        클라이언트로 좁히지 않는다 - 야간 순위 수집은 term 당 한 번, id 최소 키워드에만 저장되므로
+        같은 term 을 등록한 다른 클라이언트 리포트도 그 이력을 읽어야 한다.
         """
         import datetime
         end_date = datetime.datetime.now()
         start_date = end_date - datetime.timedelta(days=7)
         
-        target = self.db.query(Target).filter(Target.name == target_name).first()
-        if not target:
-            return {"target": target_name, "avg_sov": 0.0, "keyword_details": []}
-            
-        details = []
-        total_sov = 0.0
-        
-        for k_str in keywords:
-            data = self.calculate_sov(k_str, target_name, platform, top_n=5)
-            details.append(data)
-            total_sov += data["sov"]
-            
+        # 키워드 수와 무관하게 집계 쿼리 1회 (타겟이 없으면 모든 키워드 hits=0)
+        details = self.calculate_sov_batch(keywords, target_name, platform, top_n=5)
+        total_sov = sum(d["sov"] for d in details)
         avg_sov = total_sov / len(keywords) if keywords else 0
         
         period_start_str = start_date.strftime("%Y-%m-%d")
@@ -366,12 +229,11 @@ class AnalysisService:
             "keyword_details": details
         }
 
+    @cached_analytics()
     def get_funnel_data(self, client_id: str, start_date: datetime.date = None, end_date: datetime.date = None, days: int = 30) -> dict:
         """
         Calculate funnel stages: Impressions -> Clicks -> Conversions with rates.
         """
-        from app.models.models import MetricsDaily, Campaign, PlatformConnection
-        
         # Determine date range
         if not end_date:
             end_date = datetime.date.today()
@@ -379,41 +241,22 @@ class AnalysisService:
             start_date = end_date - datetime.timedelta(days=days)
         
         # Determine best source (Fallback: RECONCILED > API > SCRAPER)
-        source_filter = 'RECONCILED'
-        recon_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'RECONCILED').limit(1).first()
-        if not recon_exists:
-            api_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'API').limit(1).first()
-            source_filter = 'API' if api_exists else 'SCRAPER'
-            self.logger.warning(f"No RECONCILED metrics found for funnel. Using {source_filter} fallback.")
-
-        # Base query with filters
-        query_base = self.db.query(MetricsDaily).join(Campaign).join(PlatformConnection).filter(
-            PlatformConnection.client_id == client_id,
-            MetricsDaily.date >= start_date,
-            MetricsDaily.date <= end_date,
-            MetricsDaily.source == source_filter
-        )
+        source_filter = SourceResolver(self.db).resolve(client_id)
 
-        # Get actual period found in DB
-        actual_period = self.db.query(
-            func.min(MetricsDaily.date),
-            func.max(MetricsDaily.date)
-        ).select_from(query_base.subquery()).first()
-        
-        # Aggregate metrics
+        # 기간 내 실제 데이터 범위 + 합계 (일별 롤업 1회 조회)
         results = self.db.query(
-            func.sum(MetricsDaily.impressions).label("impressions"),
-            func.sum(MetricsDaily.clicks).label("clicks"),
-            func.sum(MetricsDaily.conversions).label("conversions")
-        ).select_from(MetricsDaily)\
-         .join(Campaign)\
-         .join(PlatformConnection)\
-         .filter(
-            PlatformConnection.client_id == client_id,
-            MetricsDaily.date >= start_date,
-            MetricsDaily.date <= end_date,
-            MetricsDaily.source == source_filter
+            func.min(ClientMetricsDaily.date).label("period_start"),
+            func.max(ClientMetricsDaily.date).label("period_end"),
+            func.sum(ClientMetricsDaily.impressions).label("impressions"),
+            func.sum(ClientMetricsDaily.clicks).label("clicks"),
+            func.sum(ClientMetricsDaily.conversions).label("conversions")
+        ).filter(
+            ClientMetricsDaily.client_id == client_id,
+            ClientMetricsDaily.date >= start_date,
+            ClientMetricsDaily.date <= end_date,
+            ClientMetricsDaily.source == source_filter
         ).first()
+        actual_period = (results.period_start, results.period_end)
 
         impressions = int(results.impressions or 0)
         clicks = int(results.clicks or 0)
@@ -436,39 +279,49 @@ class AnalysisService:
             "period": f"{period_start_str} ~ {period_end_str}" if period_start_str else "측정 기간 데이터 없음"
         }
 
-    def get_cohort_data(self, client_id: str) -> List[dict]:
-        """Calculates real cohort retention data using Leads and LeadActivities tables."""
-        cohorts = self.db.query(
+    @cached_analytics()
+    def get_cohort_matrix(self, client_id) -> List[dict]:
+        """
+        코호트 × 월 오프셋 매트릭스 (쿼리 1회, 분석 캐시에 만료 시간과 함께 저장).
+        /analyze/cohort 와 /leads/cohort 가 같은 결과를 사용한다.
+        """
+        from sqlalchemy import Integer, cast, select
+        from app.core.algorithms.cohort import build_cohort_matrix
+
+        client_uuid = UUID(str(client_id))
+
+        def month_index(col):
+            return cast(func.substr(col, 1, 4), Integer) * 12 + cast(func.substr(col, 6, 2), Integer)
+
+        offset = (month_index(LeadActivity.activity_month) - month_index(Lead.cohort_month)).label("offset")
+        sizes = select(
             Lead.cohort_month,
             func.count(Lead.id).label("size")
-        ).filter(Lead.client_id == client_id)\
-         .group_by(Lead.cohort_month)\
-         .order_by(Lead.cohort_month.asc()).all()
-        
-        if not cohorts:
-            return []
-            
-        results = []
-        for c in cohorts:
-            activities = self.db.query(
-                LeadActivity.activity_month,
-                func.count(func.distinct(LeadActivity.lead_id)).label("active_count")
-            ).join(Lead).filter(
-                Lead.client_id == client_id,
-                Lead.cohort_month == c.cohort_month
-            ).group_by(LeadActivity.activity_month).all()
-            
-            c_y, c_m = map(int, c.cohort_month.split('-'))
-            retention = [100.0]
-            for act in sorted(activities, key=lambda x: x.activity_month):
-                a_y, a_m = map(int, act.activity_month.split('-'))
-                offset = (a_y * 12 + a_m) - (c_y * 12 + c_m)
-                if offset > 0:
-                    rate = (act.active_count / c.size * 100) if c.size > 0 else 0
-                    retention.append(round(rate, 1))
-            
-            results.append({"month": c.cohort_month, "size": c.size, "retention": retention[:6]})
-        return results
+        ).where(Lead.client_id == client_uuid).group_by(Lead.cohort_month).subquery()
+        cells = select(
+            Lead.cohort_month,
+            offset,
+            func.count(func.distinct(LeadActivity.lead_id)).label("active"),
+            func.sum(LeadActivity.conversions).label("conversions"),
+            func.sum(LeadActivity.revenue).label("revenue")
+        ).join(LeadActivity, LeadActivity.lead_id == Lead.id)\
+         .where(Lead.client_id == client_uuid)\
+         .group_by(Lead.cohort_month, offset).subquery()
+
+        rows = self.db.execute(
+            select(sizes.c.cohort_month, sizes.c.size, cells.c.offset, cells.c.active, cells.c.conversions, cells.c.revenue)
+            .outerjoin(cells, cells.c.cohort_month == sizes.c.cohort_month)
+            .order_by(sizes.c.cohort_month, cells.c.offset)
+        ).all()
+
+        return build_cohort_matrix(rows)
+
+    def get_cohort_data(self, client_id: str) -> List[dict]:
+        """Calculates real cohort retention data using Leads and LeadActivities tables."""
+        return [
+            {"month": c["month"], "size": c["size"], "retention": c["retention"]}
+            for c in self.get_cohort_matrix(client_id)
+        ]
 
     def calculate_attribution(self, client_id: str) -> List[dict]:
         """
@@ -540,13 +393,13 @@ class AnalysisService:
         w_type = widget.get("type")
         if w_type == "KPI_GROUP":
             metrics = self.db.query(
-                func.sum(MetricsDaily.spend).label("spend"),
-                func.sum(MetricsDaily.impressions).label("impressions"),
-                func.sum(MetricsDaily.clicks).label("clicks"),
-                func.sum(MetricsDaily.conversions).label("conversions")
-            ).select_from(MetricsDaily).join(Campaign).join(PlatformConnection).filter(
-                PlatformConnection.client_id == report.client_id,
-                MetricsDaily.source == 'RECONCILED'
+                func.sum(ClientMetricsMonthly.spend).label("spend"),
+                func.sum(ClientMetricsMonthly.impressions).label("impressions"),
+                func.sum(ClientMetricsMonthly.clicks).label("clicks"),
+                func.sum(ClientMetricsMonthly.conversions).label("conversions")
+            ).filter(
+                ClientMetricsMonthly.client_id == report.client_id,
+                ClientMetricsMonthly.source == 'RECONCILED'
             ).first()
             return [
                 {"label": "총 광고비", "value": int(metrics.spend or 0), "prefix": "₩"},
@@ -557,12 +410,11 @@ class AnalysisService:
         elif w_type == "SOV": return self.get_weekly_sov_summary(report.client.name, widget.get("keywords", []), PlatformType.NAVER_PLACE)
         return None
 
+    @cached_analytics()
     def get_efficiency_data(self, client_id: str, start_date: datetime.date = None, end_date: datetime.date = None, days: int = 30) -> dict:
         """
         Extract spend and conversion data per campaign/platform to analyze efficiency.
         """
-        from app.models.models import MetricsDaily, Campaign, PlatformConnection
-        
         # Determine date range
         if not end_date:
             end_date = datetime.date.today()
@@ -570,38 +422,31 @@ class AnalysisService:
             start_date = end_date - datetime.timedelta(days=days)
         
         # Determine best source (Fallback: RECONCILED > API > SCRAPER)
-        source_filter = 'RECONCILED'
-        recon_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'RECONCILED').limit(1).first()
-        if not recon_exists:
-            api_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'API').limit(1).first()
-            source_filter = 'API' if api_exists else 'SCRAPER'
-            self.logger.warning(f"No RECONCILED metrics found for efficiency. Using {source_filter} fallback.")
-
-        # Base query with filters
-        query_base = self.db.query(MetricsDaily).join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-         .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
-         .filter(
-             PlatformConnection.client_id == client_id,
-             MetricsDaily.date >= start_date,
-             MetricsDaily.date <= end_date,
-             MetricsDaily.source == source_filter
-         )
+        source_filter = SourceResolver(self.db).resolve(client_id)
+
+        # Base query with filters (일별 롤업)
+        query_base = self.db.query(ClientMetricsDaily).filter(
+            ClientMetricsDaily.client_id == client_id,
+            ClientMetricsDaily.date >= start_date,
+            ClientMetricsDaily.date <= end_date,
+            ClientMetricsDaily.source == source_filter
+        )
 
         # Get actual period found in DB
-        actual_period = self.db.query(
-            func.min(MetricsDaily.date),
-            func.max(MetricsDaily.date)
-        ).select_from(query_base.subquery()).first()
+        actual_period = query_base.with_entities(
+            func.min(ClientMetricsDaily.date),
+            func.max(ClientMetricsDaily.date)
+        ).first()
 
         # Get metrics aggregated by campaign
-        results = query_base.with_entities(
+        results = query_base.join(Campaign, Campaign.id == ClientMetricsDaily.campaign_id).with_entities(
             Campaign.name,
-            PlatformConnection.platform,
-            func.sum(MetricsDaily.spend).label("spend"),
-            func.sum(MetricsDaily.clicks).label("clicks"),
-            func.sum(MetricsDaily.conversions).label("conversions"),
-            func.sum(MetricsDaily.impressions).label("impressions")
-        ).group_by(Campaign.name, PlatformConnection.platform).all()
+            ClientMetricsDaily.platform,
+            func.sum(ClientMetricsDaily.spend).label("spend"),
+            func.sum(ClientMetricsDaily.clicks).label("clicks"),
+            func.sum(ClientMetricsDaily.conversions).label("conversions"),
+            func.sum(ClientMetricsDaily.impressions).label("impressions")
+        ).group_by(Campaign.name, ClientMetricsDaily.platform).all()
 
         items = []
         total_spend = 0
@@ -0,0 +1,214 @@
+"""
+분석 결과 2단 캐시 (프로세스 내 LRU → analytics_cache 테이블)
+
+- AnalyticsCacheStore: (client_id, cache_key) 로 계산 결과를 저장, expires_at 이 지나면 미스
+- TwoTierAnalyticsCache: LRU 미스 시 테이블, 테이블 미스 시 계산 후 두 곳에 저장
+- @cached_analytics(): 서비스 메서드 인자로 키를 만들어 위 캐시를 거치게 하는 데코레이터
+- invalidate_client_analytics(): 동기화/리컨실리에이션 완료 시 클라이언트 단위 무효화
+
+캐시된 결과는 JSON 으로 정규화되므로(date/UUID/Enum → 문자열) 미스/히트 모두 같은 형태를 반환한다.
+"""
+import datetime
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import uuid
+from typing import Any, Callable, Optional
+from sqlalchemy.orm import Session
+from app.core.lru_cache import LRUCache
+from app.models.models import AnalyticsCache
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+def _today() -> datetime.date:
+    # 서비스 메서드가 end_date=None 일 때 쓰는 date.today() 와 같은 기준
+    return datetime.date.today()
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+
+def _as_uuid(value) -> Optional[uuid.UUID]:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def make_cache_key(namespace: str, arguments: dict) -> str:
+    """'<Service.method>:<인자 해시>' (analytics_cache.cache_key 길이 제한 안쪽)."""
+    payload = json.dumps(arguments, sort_keys=True, default=_json_default)
+    return f"{namespace}:{hashlib.sha1(payload.encode()).hexdigest()[:16]}"
+
+
+class AnalyticsCacheStore:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, client_id, cache_key: str) -> Optional[Any]:
+        """만료되지 않은 캐시 데이터 (없으면 None)."""
+        row = self.db.query(AnalyticsCache.data).filter(
+            AnalyticsCache.client_id == client_id,
+            AnalyticsCache.cache_key == cache_key,
+            AnalyticsCache.expires_at > _utcnow(),
+        ).order_by(AnalyticsCache.expires_at.desc()).first()
+        return row.data if row else None
+
+    def set(self, client_id, cache_key: str, data: Any, ttl_seconds: Optional[int] = None):
+        """같은 키의 이전 항목을 교체하고 commit."""
+        if ttl_seconds is None:
+            from app.core.config import settings
+            ttl_seconds = settings.ANALYTICS_CACHE_TTL_SECONDS
+        self.db.query(AnalyticsCache).filter(
+            AnalyticsCache.client_id == client_id,
+            AnalyticsCache.cache_key == cache_key,
+        ).delete(synchronize_session=False)
+        self.db.add(AnalyticsCache(
+            id=uuid.uuid4(),
+            client_id=client_id,
+            cache_key=cache_key,
+            data=data,
+            expires_at=_utcnow() + datetime.timedelta(seconds=ttl_seconds),
+        ))
+        self.db.commit()
+
+    def invalidate(self, client_id, prefix: Optional[str] = None) -> int:
+        """클라이언트의 캐시 항목 제거 (prefix 지정 시 해당 키 계열만). commit 은 호출자 담당."""
+        query = self.db.query(AnalyticsCache).filter(AnalyticsCache.client_id == client_id)
+        if prefix:
+            query = query.filter(AnalyticsCache.cache_key.startswith(prefix))
+        return query.delete(synchronize_session=False)
+
+
+class TwoTierAnalyticsCache:
+    def __init__(self, lru: LRUCache):
+        self.lru = lru
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.db_misses = 0
+
+    def get_or_compute(self, db: Session, client_id: uuid.UUID, cache_key: str,
+                       compute: Callable[[], Any], ttl_seconds: Optional[int] = None) -> Any:
+        lru_key = (str(client_id), cache_key)
+        hit, payload = self.lru.get(lru_key)
+        if hit:
+            return json.loads(payload)
+
+        # 테이블 읽기/쓰기는 각각 짧은 별도 세션으로 (호출자 트랜잭션에 commit 을 끼워 넣지 않고,
+        # compute() 동안 캐시용 연결을 붙잡지 않음 - 미스 1건이 풀 연결 2개를 쓰지 않도록)
+        data = self._with_store(db, lambda store: store.get(client_id, cache_key))
+        with self._lock:
+            if data is not None:
+                self.db_hits += 1
+            else:
+                self.db_misses += 1
+        if data is None:
+            data = json.loads(json.dumps(compute(), default=_json_default))
+            self._with_store(db, lambda store: store.set(client_id, cache_key, data, ttl_seconds))
+
+        self.lru.set(lru_key, json.dumps(data), group=str(client_id), ttl_seconds=ttl_seconds)
+        return data
+
+    def invalidate_client(self, db: Session, client_id, prefix: Optional[str] = None) -> int:
+        """LRU 와 테이블에서 클라이언트 항목 제거 (테이블 삭제 commit 은 호출자 담당)."""
+        group = str(client_id)
+        self.lru.invalidate_group(group, None if prefix is None else lambda key: key[1].startswith(prefix))
+        return AnalyticsCacheStore(db).invalidate(client_id, prefix)
+
+    def stats(self) -> dict:
+        with self._lock:
+            db_lookups = self.db_hits + self.db_misses
+            return {
+                "lru": self.lru.stats(),
+                "db": {
+                    "hits": self.db_hits,
+                    "misses": self.db_misses,
+                    "hit_rate": round(self.db_hits / db_lookups, 3) if db_lookups else 0.0,
+                },
+            }
+
+    @staticmethod
+    def _with_store(db: Session, op: Callable[[AnalyticsCacheStore], Any]) -> Any:
+        # 캐시 테이블 장애가 분석 응답을 막지 않도록 경고만 남김. 세션은 바로 닫아 연결을 풀에 반환
+        cache_db = Session(bind=db.get_bind())
+        try:
+            return op(AnalyticsCacheStore(cache_db))
+        except Exception as e:
+            logger.warning(f"analytics_cache access failed: {e}")
+            cache_db.rollback()
+            return None
+        finally:
+            cache_db.close()
+
+
+_cache: Optional[TwoTierAnalyticsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_analytics_cache() -> TwoTierAnalyticsCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from app.core.config import settings
+                _cache = TwoTierAnalyticsCache(LRUCache(
+                    maxsize=settings.ANALYTICS_LRU_MAXSIZE,
+                    ttl_seconds=settings.ANALYTICS_LRU_TTL_SECONDS,
+                ))
+    return _cache
+
+
+def invalidate_client_analytics(db: Session, client_id, prefix: Optional[str] = None) -> int:
+    """클라이언트의 분석 캐시 무효화 (동기화/리컨실리에이션/리드 변경 후 호출, commit 은 호출자 담당)."""
+    if not client_id:
+        return 0
+    return get_analytics_cache().invalidate_client(db, _as_uuid(client_id), prefix)
+
+
+def cached_analytics(ttl_seconds: Optional[int] = None, client_arg: str = "client_id"):
+    """
+    서비스 메서드 결과를 2단 캐시로 감싼다 (self.db 필요).
+    키 = '<클래스.메서드>:<기본값 포함 인자 + 오늘 날짜 해시>', client_arg 가 없거나 UUID 가 아니면 캐시하지 않는다.
+    end_date=None / days=30 처럼 기간을 오늘 기준으로 정하는 메서드가 많아, 날짜가 바뀌면 키도 바뀐다
+    (자정 전에 저장한 항목을 TTL 동안 다음 날에 돌려주지 않음).
+    원래 함수는 wrapper.uncached 로 호출 가능.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        namespace = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+            client_id = _as_uuid(arguments.get(client_arg))
+            if client_id is None:
+                return func(self, *args, **kwargs)
+            return get_analytics_cache().get_or_compute(
+                self.db, client_id, make_cache_key(namespace, {**arguments, "_as_of": _today()}),
+                lambda: func(self, *args, **kwargs), ttl_seconds,
+            )
+
+        wrapper.uncached = func
+        wrapper.cache_namespace = namespace
+        return wrapper
+    return decorator
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.models.models import MetricsDaily, Campaign, PlatformConnection, Client
+from app.models.models import ClientMetricsMonthly, Client
+from app.services.analytics_cache import cached_analytics
 from typing import List, Dict, Any
 from uuid import UUID
 
@@ -17,11 +18,11 @@ class BenchmarkService:
 
         # Aggregate metrics for all clients in the same industry
         results = self.db.query(
-            func.sum(MetricsDaily.impressions).label("total_impressions"),
-            func.sum(MetricsDaily.clicks).label("total_clicks"),
-            func.sum(MetricsDaily.spend).label("total_spend"),
-            func.sum(MetricsDaily.conversions).label("total_conversions")
-        ).join(Campaign).join(PlatformConnection).join(Client).filter(
+            func.sum(ClientMetricsMonthly.impressions).label("total_impressions"),
+            func.sum(ClientMetricsMonthly.clicks).label("total_clicks"),
+            func.sum(ClientMetricsMonthly.spend).label("total_spend"),
+            func.sum(ClientMetricsMonthly.conversions).label("total_conversions")
+        ).join(Client, Client.id == ClientMetricsMonthly.client_id).filter(
             Client.industry == industry
         ).first()
 
@@ -49,6 +50,7 @@ class BenchmarkService:
             "industry": industry
         }
 
+    @cached_analytics()
     def compare_client_performance(self, client_id: UUID) -> Dict[str, Any]:
         """
         Compare a client's performance against their industry average.
@@ -59,12 +61,12 @@ class BenchmarkService:
 
         # 1. Get Client's own averages
         client_metrics = self.db.query(
-            func.sum(MetricsDaily.impressions).label("total_impressions"),
-            func.sum(MetricsDaily.clicks).label("total_clicks"),
-            func.sum(MetricsDaily.spend).label("total_spend"),
-            func.sum(MetricsDaily.conversions).label("total_conversions")
-        ).join(Campaign).join(PlatformConnection).filter(
-            PlatformConnection.client_id == client_id
+            func.sum(ClientMetricsMonthly.impressions).label("total_impressions"),
+            func.sum(ClientMetricsMonthly.clicks).label("total_clicks"),
+            func.sum(ClientMetricsMonthly.spend).label("total_spend"),
+            func.sum(ClientMetricsMonthly.conversions).label("total_conversions")
+        ).filter(
+            ClientMetricsMonthly.client_id == client_id
         ).first()
 
         c_imp = float(client_metrics.total_impressions or 0)
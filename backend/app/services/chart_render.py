@@ -0,0 +1,162 @@
+"""
+리포트 차트 렌더링 (matplotlib → PNG bytes)
+
+- 차트 입력(종류 + 라벨/값)을 정규화한 spec 의 content hash 로 PNG 를 캐시 → 같은 데이터 차트는 다시 그리지 않음
+- 캐시에 없는 차트가 여러 개면 프로세스 풀에서 동시에 렌더링
+  (matplotlib 렌더링은 CPU 바운드 + pyplot 전역 상태라 스레드로는 병렬화되지 않는다)
+- 풀은 spawn 컨텍스트 (스레드가 도는 서버 프로세스를 fork 하지 않음). 이 모듈은 가볍게 유지해
+  워커가 import 할 때 reportlab/DB 등을 끌어오지 않도록 한다
+- 워커 수는 PDF_RENDER_WORKERS (기본 2) 를 이 프로세스가 쓸 수 있는 CPU 수와 렌더링할 차트 수로 제한
+  (os.cpu_count() 는 Cloud Run 등 컨테이너에서 호스트 코어 수를 돌려주므로 쓰지 않는다)
+- 풀을 쓸 수 없으면 (워커 1개 이하, 풀 장애) 현재 프로세스에서 순차 렌더링
+"""
+import concurrent.futures
+import hashlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.core.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+CHART_CACHE_TTL_SECONDS = 24 * 3600
+
+_png_cache = LRUCache(maxsize=256, ttl_seconds=CHART_CACHE_TTL_SECONDS)
+_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def chart_spec(kind: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """위젯 데이터 → 렌더링에 쓰이는 값만 남긴 spec (그릴 데이터가 없으면 None)."""
+    if kind == "funnel":
+        items = data.get("stages", [])
+        labels = [s.get("name", "") for s in items]
+        values = [s.get("value", 0) for s in items]
+    elif kind == "roi":
+        items = data.get("campaigns", [])
+        labels = [c.get("name", "")[:15] for c in items]  # 이름 짧게
+        values = [c.get("roi", 0) for c in items]
+    elif kind == "trend":
+        items = data.get("data", [])
+        labels = [d.get("date", "") for d in items]
+        values = [d.get("value", 0) for d in items]
+    else:
+        raise ValueError(f"Unknown chart kind '{kind}'")
+    if not items:
+        return None
+    return {"kind": kind, "labels": labels, "values": values}
+
+
+def chart_key(spec: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def render_chart_png(spec: Dict[str, Any]) -> bytes:
+    """spec 하나를 PNG 로 (프로세스 풀 워커에서도 호출되는 최상위 함수)."""
+    import matplotlib
+    matplotlib.use('Agg')  # Non-GUI backend
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+    labels, values = spec["labels"], spec["values"]
+    if spec["kind"] == "funnel":
+        ax.barh(labels, values, color='#4F46E5')
+        ax.set_xlabel('사용자 수')
+        ax.set_title('전환 퍼널')
+    elif spec["kind"] == "roi":
+        ax.bar(labels, values, color='#10B981')
+        ax.set_ylabel('ROI (%)')
+        ax.set_title('캠페인별 ROI 비교')
+        ax.tick_params(axis='x', rotation=45)
+    else:
+        ax.plot(labels, values, marker='o', color='#4F46E5', linewidth=2)
+        ax.set_xlabel('날짜')
+        ax.set_ylabel('지표')
+        ax.set_title('추이 분석')
+        ax.tick_params(axis='x', rotation=45)
+        ax.grid(True, alpha=0.3)
+
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _worker_count(charts: Optional[int] = None) -> int:
+    from app.core.config import settings
+    workers = min(settings.PDF_RENDER_WORKERS, _available_cpus())
+    return min(workers, charts) if charts is not None else workers
+
+
+def _get_pool(charts: Optional[int] = None) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    global _pool
+    if _worker_count(charts) <= 1:
+        return None
+    # spawn 풀은 작업이 들어올 때 워커를 하나씩 띄우므로 차트 수보다 많은 프로세스는 생기지 않는다
+    workers = _worker_count()
+    with _pool_lock:
+        if _pool is None:
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def shutdown_chart_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def render_charts(specs: List[Dict[str, Any]]) -> Dict[str, bytes]:
+    """spec 목록 → {chart_key: PNG}. 캐시 미스만 렌더링 (2개 이상이면 프로세스 풀로 동시에)."""
+    result: Dict[str, bytes] = {}
+    missing: Dict[str, Dict[str, Any]] = {}
+    for spec in specs:
+        key = chart_key(spec)
+        if key in result or key in missing:
+            continue
+        hit, png = _png_cache.get(key)
+        if hit:
+            result[key] = png
+        else:
+            missing[key] = spec
+    if not missing:
+        return result
+
+    rendered: Optional[List[bytes]] = None
+    pool = _get_pool(len(missing))
+    if pool is not None:
+        try:
+            rendered = list(pool.map(render_chart_png, missing.values()))
+        except Exception as e:
+            # BrokenProcessPool 등 - 풀을 버리고 이번 요청은 현재 프로세스에서 렌더링
+            logger.warning(f"Chart process pool failed, rendering inline: {type(e).__name__}: {e}")
+            shutdown_chart_pool()
+    if rendered is None:
+        rendered = [render_chart_png(spec) for spec in missing.values()]
+
+    for key, png in zip(missing, rendered):
+        _png_cache.set(key, png)
+        result[key] = png
+    return result
+
+
+def chart_cache_stats() -> Dict[str, Any]:
+    return _png_cache.stats()
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from app.models.models import DailyRank, Target, Keyword, TargetType, PlatformType, MetricsDaily, Campaign
+from app.services.analytics_cache import cached_analytics
 from typing import List, Dict, Optional, Tuple
 from uuid import UUID
 import logging
@@ -21,6 +22,7 @@ class CompetitorIntelligenceService:
         self.db = db
         self.logger = logging.getLogger(__name__)
 
+    @cached_analytics()
     def discover_competitors(
         self,
         client_id: UUID,
@@ -251,6 +253,7 @@ class CompetitorIntelligenceService:
             "trend_direction": trend_direction
         }
 
+    @cached_analytics()
     def get_keyword_positioning_map(
         self,
         client_id: UUID,
@@ -296,37 +299,23 @@ class CompetitorIntelligenceService:
 
         competitor_ids = [UUID(c["target_id"]) for c in competitors]
 
-        # 3. 각 키워드별, 각 타겟별 최신 순위 조회
-        # 최신 snapshot 시간 찾기
-        latest_time = self.db.query(func.max(DailyRank.captured_at)).filter(
-            and_(
-                DailyRank.keyword_id.in_(keyword_ids),
-                DailyRank.platform == platform
-            )
-        ).scalar()
+        # 3. 각 키워드별, 각 타겟별 최신 순위 조회 (latest_rank_snapshot)
+        from app.services.rank_repository import RankReadRepository
+        ranks = RankReadRepository(self.db).current_ranking_for_keywords(keyword_ids, platform)
 
-        if not latest_time:
+        if not ranks:
             return {"keywords": [], "targets": []}
 
-        # 최신 데이터 조회 (±5분 이내)
-        time_window = datetime.timedelta(minutes=5)
-        ranks = self.db.query(DailyRank).filter(
-            and_(
-                DailyRank.keyword_id.in_(keyword_ids),
-                DailyRank.platform == platform,
-                DailyRank.captured_at >= latest_time - time_window,
-                DailyRank.captured_at <= latest_time + time_window
-            )
-        ).all()
+        latest_time = max((r.captured_at for r in ranks if r.captured_at), default=None)
 
-        # 데이터 구조화: {target_id: {keyword_id: rank}}
+        # 데이터 구조화: {target_id: {keyword_id: rank}} (스냅샷은 순위순이므로 첫 값이 최고 순위)
         target_rank_map: Dict[UUID, Dict[UUID, int]] = defaultdict(dict)
-        target_info_map: Dict[UUID, Target] = {}
+        target_info_map: Dict[UUID, Tuple[str, TargetType]] = {}
 
         for rank in ranks:
-            target_rank_map[rank.target_id][rank.keyword_id] = rank.rank
+            target_rank_map[rank.target_id].setdefault(rank.keyword_id, rank.rank)
             if rank.target_id not in target_info_map:
-                target_info_map[rank.target_id] = rank.target
+                target_info_map[rank.target_id] = (rank.target_name, rank.target_type)
 
         # 4. 포지셔닝 맵 데이터 생성
         targets_data = []
@@ -334,15 +323,15 @@ class CompetitorIntelligenceService:
         # 경쟁사들만 포함
         for target_id in competitor_ids:
             if target_id in target_rank_map:
-                target = target_info_map[target_id]
+                target_name, target_type = target_info_map[target_id]
                 ranks_list = [
                     target_rank_map[target_id].get(kw_id, None)
                     for kw_id in keyword_ids
                 ]
                 targets_data.append({
                     "id": str(target_id),
-                    "name": target.name,
-                    "type": target.type.value,
+                    "name": target_name,
+                    "type": target_type.value,
                     "ranks": ranks_list
                 })
 
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.models.models import DailyRank, Target, Keyword, TargetType, PlatformType
+from app.models.models import Target, Keyword, TargetType, PlatformType
+from app.services.rank_repository import RankReadRepository
 from typing import List, Optional
 import datetime
 
@@ -17,30 +18,23 @@ class CompetitorService:
         if not keyword:
             return {"keyword": keyword_str, "status": "NOT_FOUND", "competitors": []}
 
-        # Get the most recent capture time for this keyword
-        latest_rank = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform
-        ).order_by(DailyRank.captured_at.desc()).first()
+        # Current snapshot for this keyword (latest_rank_snapshot 단일 조회)
+        snapshot = RankReadRepository(self.db).current_ranking(keyword.id, platform)
 
-        if not latest_rank:
+        if not snapshot:
             return {"keyword": keyword_str, "status": "NO_DATA", "competitors": []}
 
-        ranks = self.db.query(DailyRank).filter(
-            DailyRank.keyword_id == keyword.id,
-            DailyRank.platform == platform,
-            DailyRank.captured_at == latest_rank.captured_at,
-            DailyRank.rank <= top_n
-        ).order_by(DailyRank.rank.asc()).all()
+        latest_rank = snapshot[0]
+        ranks = [r for r in snapshot if r.rank <= top_n]
 
         competitors = []
         for r in ranks:
             competitors.append({
                 "rank": r.rank,
-                "name": r.target.name,
-                "type": r.target.type.value if hasattr(r.target.type, 'value') else "OTHERS",
-                "is_threat": r.target.type == TargetType.COMPETITOR,
-                "url": r.target.urls.get("default") if r.target.urls else None
+                "name": r.target_name,
+                "type": r.target_type.value if hasattr(r.target_type, 'value') else "OTHERS",
+                "is_threat": r.target_type == TargetType.COMPETITOR,
+                "url": r.url
             })
 
         return {
@@ -2,7 +2,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.models.models import MetricsDaily, Campaign, PlatformConnection, AnalysisHistory, Client
+from app.models.models import Campaign, PlatformConnection, AnalysisHistory, Client, ClientMetricsDaily, ClientMetricsMonthly
+from app.services.source_resolution import SourceResolver
 import datetime
 
 logger = logging.getLogger(__name__)
@@ -48,25 +49,19 @@ class DashboardService:
         logger.info(f"Generating summary metrics for client_id: {client_id}")
         try:
             # Determine best source (Fallback: RECONCILED > API > SCRAPER)
-            source_filter = 'RECONCILED'
-            recon_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'RECONCILED').limit(1).first()
-            if not recon_exists:
-                api_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'API').limit(1).first()
-                source_filter = 'API' if api_exists else 'SCRAPER'
-                logger.warning(f"No RECONCILED metrics found. Using {source_filter} fallback.")
-
-            # KPI Query with Explicit Joins
+            source_filter = SourceResolver(self.db).resolve(client_id)
+
+            # KPI + 매출 (전체 기간 → 월별 롤업)
             query = self.db.query(
-                func.sum(MetricsDaily.spend).label("total_spend"),
-                func.sum(MetricsDaily.clicks).label("total_clicks"),
-                func.sum(MetricsDaily.impressions).label("total_impressions"),
-                func.sum(MetricsDaily.conversions).label("total_conversions")
-            ).filter(MetricsDaily.source == source_filter)
+                func.sum(ClientMetricsMonthly.spend).label("total_spend"),
+                func.sum(ClientMetricsMonthly.clicks).label("total_clicks"),
+                func.sum(ClientMetricsMonthly.impressions).label("total_impressions"),
+                func.sum(ClientMetricsMonthly.conversions).label("total_conversions"),
+                func.sum(ClientMetricsMonthly.revenue).label("total_revenue")
+            ).filter(ClientMetricsMonthly.source == source_filter)
             
             if client_id:
-                query = query.join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-                             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
-                             .filter(PlatformConnection.client_id == client_id)
+                query = query.filter(ClientMetricsMonthly.client_id == client_id)
             
             results = query.first()
             
@@ -78,15 +73,7 @@ class DashboardService:
             
             logger.debug(f"KPIs - Spend: {total_spend}, Conversions: {total_conversions}")
 
-            # Revenue Query with Explicit Joins
-            revenue_query = self.db.query(func.sum(MetricsDaily.revenue).label("total_revenue")).filter(MetricsDaily.source == source_filter)
-            if client_id:
-                revenue_query = revenue_query.join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-                                             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
-                                             .filter(PlatformConnection.client_id == client_id)
-            
-            revenue_res = revenue_query.first()
-            total_revenue = float(revenue_res.total_revenue or 0) if revenue_res and hasattr(revenue_res, 'total_revenue') else 0.0
+            total_revenue = float(results.total_revenue or 0) if results and hasattr(results, 'total_revenue') else 0.0
             
             if total_revenue == 0 and total_conversions > 0:
                 conversion_value = self._get_client_conversion_value(client_id)
@@ -97,15 +84,14 @@ class DashboardService:
 
             # SOV Data
             platforms_query = self.db.query(
-                PlatformConnection.platform,
-                func.sum(MetricsDaily.spend).label("spend")
-            ).join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)
+                ClientMetricsMonthly.platform,
+                func.sum(ClientMetricsMonthly.spend).label("spend")
+            )
             
             if client_id:
-                platforms_query = platforms_query.filter(PlatformConnection.client_id == client_id)
+                platforms_query = platforms_query.filter(ClientMetricsMonthly.client_id == client_id)
                 
-            platforms_results = platforms_query.group_by(PlatformConnection.platform).all()
+            platforms_results = platforms_query.group_by(ClientMetricsMonthly.platform).all()
             total_sov_spend = sum(float(r.spend or 0) for r in platforms_results)
             
             sov_data = []
@@ -150,25 +136,21 @@ class DashboardService:
         logger.info(f"Fetching top campaigns for client_id: {client_id}")
         try:
             # Determine best source
-            source_filter = 'RECONCILED'
-            recon_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'RECONCILED').limit(1).first()
-            if not recon_exists:
-                api_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'API').limit(1).first()
-                source_filter = 'API' if api_exists else 'SCRAPER'
+            source_filter = SourceResolver(self.db).resolve(client_id)
 
             query = self.db.query(
                 Campaign.name,
                 PlatformConnection.platform,
-                func.sum(MetricsDaily.spend).label("spend"),
-                func.sum(MetricsDaily.conversions).label("conversions")
+                func.sum(ClientMetricsMonthly.spend).label("spend"),
+                func.sum(ClientMetricsMonthly.conversions).label("conversions")
             ).outerjoin(PlatformConnection, Campaign.connection_id == PlatformConnection.id)\
-             .outerjoin(MetricsDaily, (MetricsDaily.campaign_id == Campaign.id) & (MetricsDaily.source == source_filter))
+             .outerjoin(ClientMetricsMonthly, (ClientMetricsMonthly.campaign_id == Campaign.id) & (ClientMetricsMonthly.source == source_filter))
             
             if client_id:
                 query = query.filter(PlatformConnection.client_id == client_id)
                 
             results = query.group_by(Campaign.id, Campaign.name, PlatformConnection.platform)\
-                           .order_by(func.sum(MetricsDaily.spend).desc())\
+                           .order_by(func.sum(ClientMetricsMonthly.spend).desc())\
                            .limit(limit).all()
             
             conversion_value = self._get_client_conversion_value(client_id)
@@ -195,25 +177,19 @@ class DashboardService:
         logger.info(f"Fetching trend data for client_id: {client_id}")
         try:
             # Trend source fallback
-            source_filter = 'RECONCILED'
-            recon_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'RECONCILED').limit(1).first()
-            if not recon_exists:
-                api_exists = self.db.query(MetricsDaily.id).filter(MetricsDaily.source == 'API').limit(1).first()
-                source_filter = 'API' if api_exists else 'SCRAPER'
+            source_filter = SourceResolver(self.db).resolve(client_id)
 
             query = self.db.query(
-                MetricsDaily.date,
-                func.sum(MetricsDaily.spend).label("spend"),
-                func.sum(MetricsDaily.clicks).label("clicks"),
-                func.sum(MetricsDaily.conversions).label("conversions")
-            ).filter(MetricsDaily.source == source_filter)
+                ClientMetricsDaily.date,
+                func.sum(ClientMetricsDaily.spend).label("spend"),
+                func.sum(ClientMetricsDaily.clicks).label("clicks"),
+                func.sum(ClientMetricsDaily.conversions).label("conversions")
+            ).filter(ClientMetricsDaily.source == source_filter)
 
             if client_id:
-                query = query.join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-                             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
-                             .filter(PlatformConnection.client_id == client_id)
+                query = query.filter(ClientMetricsDaily.client_id == client_id)
             
-            results = query.group_by(MetricsDaily.date).order_by(MetricsDaily.date).all()
+            results = query.group_by(ClientMetricsDaily.date).order_by(ClientMetricsDaily.date).all()
             
             trend = []
             for r in results:
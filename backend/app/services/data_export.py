@@ -0,0 +1,120 @@
+"""
+순위(DailyRank) / 지표(MetricsDaily) 원본 이력 내보내기
+
+행은 서버 측 커서(stream_results + yield_per)로 EXPORT_BATCH_SIZE 개씩 읽어 dict 로 흘려보내고,
+포맷 변환은 app.core.export_stream 이 담당한다. StreamingResponse 가 응답을 다 보낼 때까지
+요청 세션(get_db)이 살아 있다는 보장이 없으므로 제너레이터가 자체 SessionLocal 세션을 열고 닫는다.
+"""
+import datetime
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from app.core.export_stream import EXPORT_BATCH_SIZE, ExportColumn
+from app.models.models import (
+    Campaign, DailyRank, Keyword, MetricsDaily, PlatformConnection, PlatformType, Target,
+)
+
+logger = logging.getLogger(__name__)
+
+RANK_COLUMNS: List[ExportColumn] = [
+    ("captured_at", "datetime"),
+    ("platform", "str"),
+    ("keyword", "str"),
+    ("target", "str"),
+    ("rank", "int"),
+    ("rank_change", "int"),
+]
+
+METRIC_COLUMNS: List[ExportColumn] = [
+    ("date", "datetime"),
+    ("platform", "str"),
+    ("campaign_id", "str"),
+    ("campaign", "str"),
+    ("source", "str"),
+    ("spend", "float"),
+    ("impressions", "int"),
+    ("clicks", "int"),
+    ("conversions", "int"),
+    ("revenue", "float"),
+]
+
+
+def _day_bounds(start_date: Optional[datetime.date], end_date: Optional[datetime.date]):
+    start = datetime.datetime.combine(start_date, datetime.time.min) if start_date else None
+    end = datetime.datetime.combine(end_date, datetime.time.min) + datetime.timedelta(days=1) if end_date else None
+    return start, end
+
+
+class DataExportService:
+    def __init__(self, session_factory=None, batch_size: int = EXPORT_BATCH_SIZE):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def _stream(self, build_query) -> Iterator[Dict[str, Any]]:
+        db = self.session_factory()
+        try:
+            query = build_query(db).execution_options(stream_results=True).yield_per(self.batch_size)
+            for row in query:
+                yield row._asdict()
+        finally:
+            db.close()
+
+    def rank_rows(self, client_id: UUID, start_date: Optional[datetime.date] = None,
+                  end_date: Optional[datetime.date] = None,
+                  platform: Optional[PlatformType] = None) -> Iterator[Dict[str, Any]]:
+        start, end = _day_bounds(start_date, end_date)
+
+        def build_query(db):
+            query = db.query(
+                DailyRank.captured_at,
+                DailyRank.platform,
+                Keyword.term.label("keyword"),
+                Target.name.label("target"),
+                DailyRank.rank,
+                DailyRank.rank_change,
+            ).join(Keyword, Keyword.id == DailyRank.keyword_id)\
+             .join(Target, Target.id == DailyRank.target_id)\
+             .filter(DailyRank.client_id == client_id)
+            if platform:
+                query = query.filter(DailyRank.platform == platform)
+            if start:
+                query = query.filter(DailyRank.captured_at >= start)
+            if end:
+                query = query.filter(DailyRank.captured_at < end)
+            return query.order_by(DailyRank.captured_at, DailyRank.platform)
+
+        return self._stream(build_query)
+
+    def metric_rows(self, client_id: UUID, start_date: Optional[datetime.date] = None,
+                    end_date: Optional[datetime.date] = None,
+                    platform: Optional[PlatformType] = None) -> Iterator[Dict[str, Any]]:
+        start, end = _day_bounds(start_date, end_date)
+
+        def build_query(db):
+            query = db.query(
+                MetricsDaily.date,
+                PlatformConnection.platform,
+                MetricsDaily.campaign_id,
+                Campaign.name.label("campaign"),
+                MetricsDaily.source,
+                MetricsDaily.spend,
+                MetricsDaily.impressions,
+                MetricsDaily.clicks,
+                MetricsDaily.conversions,
+                MetricsDaily.revenue,
+            ).join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
+             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
+             .filter(PlatformConnection.client_id == client_id)
+            if platform:
+                query = query.filter(PlatformConnection.platform == platform)
+            if start:
+                query = query.filter(MetricsDaily.date >= start)
+            if end:
+                query = query.filter(MetricsDaily.date < end)
+            return query.order_by(MetricsDaily.date, MetricsDaily.campaign_id)
+
+        return self._stream(build_query)
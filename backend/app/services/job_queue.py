@@ -0,0 +1,175 @@
+"""
+Postgres 기반 작업 큐 (jobs 테이블)
+
+- enqueue(): dedupe_key 가 같은 QUEUED/RUNNING 작업이 있으면 새로 만들지 않고 기존 작업을 반환
+  (부분 유니크 인덱스 uq_jobs_active_dedupe_key 가 인스턴스 간 중복을 막는다)
+- claim(): SELECT ... FOR UPDATE SKIP LOCKED 로 실행할 작업 1건 점유 (priority 높은 순 → run_at 순)
+- complete() / fail(): 성공 처리, 실패 시 지수 backoff 로 재큐잉하거나 max_attempts 초과 시 FAILED
+- heartbeat() / requeue_stale(): 실행 중 locked_at 갱신, 갱신이 끊긴 RUNNING 작업 (인스턴스 종료 등) 은 다시 QUEUED 로
+
+모든 변경 메서드는 commit 까지 수행한다 (워커/엔드포인트 어디서 호출해도 즉시 다른 인스턴스에 보이도록).
+"""
+import datetime
+import logging
+import random
+from typing import Any, Dict, Iterable, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.algorithms.job_queue import backoff_seconds, should_retry
+from app.models.models import ACTIVE_JOB_STATUSES, Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+class JobQueue:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        dedupe_key: Optional[str] = None,
+        priority: int = 0,
+        max_attempts: int = 3,
+        delay_seconds: float = 0,
+    ) -> Tuple[Job, bool]:
+        """(job, created). created=False 면 같은 dedupe_key 의 진행 중 작업이 이미 있음."""
+        if dedupe_key:
+            existing = self.get_active(dedupe_key)
+            if existing is not None:
+                return existing, False
+
+        job = Job(
+            kind=kind,
+            payload=payload or {},
+            dedupe_key=dedupe_key,
+            status=JobStatus.QUEUED,
+            priority=priority,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_at=_utcnow() + datetime.timedelta(seconds=delay_seconds),
+        )
+        self.db.add(job)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # 다른 인스턴스가 같은 dedupe_key 로 먼저 넣음
+            self.db.rollback()
+            existing = self.get_active(dedupe_key) if dedupe_key else None
+            if existing is None:
+                raise
+            return existing, False
+        return job, True
+
+    def get(self, job_id) -> Optional[Job]:
+        return self.db.query(Job).filter(Job.id == job_id).first()
+
+    def get_active(self, dedupe_key: str) -> Optional[Job]:
+        return self.db.query(Job).filter(
+            Job.dedupe_key == dedupe_key,
+            Job.status.in_(ACTIVE_JOB_STATUSES),
+        ).first()
+
+    def claim(self, worker_id: str, kinds: Optional[Iterable[str]] = None) -> Optional[Job]:
+        """실행 가능한 작업 1건을 RUNNING 으로 점유 (없으면 None)."""
+        query = self.db.query(Job).filter(
+            Job.status == JobStatus.QUEUED,
+            Job.run_at <= _utcnow(),
+        )
+        if kinds is not None:
+            query = query.filter(Job.kind.in_(list(kinds)))
+        # 다른 워커가 잠근 행은 건너뜀 (SQLite 에서는 무시되고 아래 status 조건부 UPDATE 가 보호)
+        job_id = (
+            query.with_entities(Job.id)
+            .order_by(Job.priority.desc(), Job.run_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar()
+        )
+        if job_id is None:
+            self.db.rollback()
+            return None
+
+        claimed = self.db.query(Job).filter(
+            Job.id == job_id,
+            Job.status == JobStatus.QUEUED,
+        ).update({
+            Job.status: JobStatus.RUNNING,
+            Job.attempts: Job.attempts + 1,
+            Job.locked_by: worker_id,
+            Job.locked_at: _utcnow(),
+        }, synchronize_session=False)
+        self.db.commit()
+        if not claimed:
+            return None
+        return self.get(job_id)
+
+    def complete(self, job: Job, result: Any = None):
+        job.status = JobStatus.SUCCEEDED
+        job.result = result
+        job.last_error = None
+        job.locked_by = None
+        job.finished_at = _utcnow()
+        self.db.commit()
+
+    def fail(self, job: Job, error: str, retry: bool = True) -> bool:
+        """실패 기록. 재시도가 예약되면 True."""
+        job.last_error = error[:2000]
+        job.locked_by = None
+        if retry and should_retry(job.attempts, job.max_attempts):
+            from app.core.config import settings
+            delay = backoff_seconds(
+                job.attempts,
+                base=settings.JOB_RETRY_BASE_SECONDS,
+                jitter=0.2,
+                rand=random.random(),
+            )
+            job.status = JobStatus.QUEUED
+            job.run_at = _utcnow() + datetime.timedelta(seconds=delay)
+            self.db.commit()
+            return True
+        job.status = JobStatus.FAILED
+        job.finished_at = _utcnow()
+        self.db.commit()
+        return False
+
+    def heartbeat(self, job_id, worker_id: str) -> bool:
+        """실행 중인 작업의 locked_at 갱신 (stale 로 오인되어 재점유되지 않도록)."""
+        updated = self.db.query(Job).filter(
+            Job.id == job_id,
+            Job.status == JobStatus.RUNNING,
+            Job.locked_by == worker_id,
+        ).update({Job.locked_at: _utcnow()}, synchronize_session=False)
+        self.db.commit()
+        return bool(updated)
+
+    def requeue_stale(self, timeout_seconds: float) -> int:
+        """locked_at 이 timeout 보다 오래된 RUNNING 작업을 다시 QUEUED 로 (재시도 횟수는 유지)."""
+        count = self.db.query(Job).filter(
+            Job.status == JobStatus.RUNNING,
+            Job.locked_at < _utcnow() - datetime.timedelta(seconds=timeout_seconds),
+        ).update({
+            Job.status: JobStatus.QUEUED,
+            Job.locked_by: None,
+            Job.run_at: _utcnow(),
+        }, synchronize_session=False)
+        self.db.commit()
+        if count:
+            logger.warning(f"Requeued {count} stale job(s)")
+        return count
+
+    def list_active(self, kind_prefix: Optional[str] = None, limit: int = 100):
+        query = self.db.query(Job).filter(Job.status.in_(ACTIVE_JOB_STATUSES))
+        if kind_prefix:
+            query = query.filter(Job.kind.startswith(kind_prefix))
+        return query.order_by(Job.priority.desc(), Job.run_at).limit(limit).all()
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.db.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+        return {(status.value if hasattr(status, "value") else status): count for status, count in rows}
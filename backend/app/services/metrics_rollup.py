@@ -0,0 +1,113 @@
+"""
+클라이언트 지표 롤업 (client_metrics_daily / client_metrics_monthly)
+
+대시보드·퍼널·효율·벤치마크·계절성·ROAS·정산 조회가 매번 metrics_daily 를
+Campaign→PlatformConnection 으로 조인해 재집계하던 것을 롤업 테이블 조회로 바꾼다.
+동기화/리컨실리에이션 단계가 변경된 (캠페인, 일자) 범위만 다시 계산한다.
+"""
+import datetime
+import logging
+from typing import Iterable, List, Optional
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+from app.core.algorithms.metrics_rollup import (
+    as_date, month_start, roll_up_daily, roll_up_monthly, to_records, METRIC_FIELDS,
+)
+from app.models.models import (
+    Campaign, ClientMetricsDaily, ClientMetricsMonthly, MetricsDaily, PlatformConnection,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _next_month(month: datetime.date) -> datetime.date:
+    return (month + datetime.timedelta(days=32)).replace(day=1)
+
+
+class MetricsRollupService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh(self, campaign_ids: Iterable, dates: Optional[Iterable] = None) -> int:
+        """
+        캠페인들의 지정 일자(None 이면 전체 기간) 롤업을 다시 계산하고 commit.
+
+        일별 행은 metrics_daily 에서, 월별 행은 영향받은 월 전체를 일별 롤업에서 재집계한다.
+        Returns: 갱신된 일별 롤업 행 수
+        """
+        campaign_ids = list(set(campaign_ids))
+        if not campaign_ids:
+            return 0
+        days = sorted({as_date(d) for d in dates}) if dates is not None else None
+        if days == []:
+            return 0
+
+        # 1. 일별: metrics_daily → client_metrics_daily
+        source_query = self.db.query(
+            PlatformConnection.client_id,
+            PlatformConnection.platform,
+            MetricsDaily.campaign_id,
+            MetricsDaily.source,
+            MetricsDaily.date,
+            *(getattr(MetricsDaily, f) for f in METRIC_FIELDS),
+        ).join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
+         .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
+         .filter(MetricsDaily.campaign_id.in_(campaign_ids))
+        if days:
+            source_query = source_query.filter(
+                MetricsDaily.date >= days[0],
+                MetricsDaily.date < days[-1] + datetime.timedelta(days=1),
+            )
+            wanted = set(days)
+            rows = [r for r in source_query.all() if as_date(r.date) in wanted]
+        else:
+            rows = source_query.all()
+        daily_records = to_records(roll_up_daily(rows), "date")
+
+        stale_daily = delete(ClientMetricsDaily).where(ClientMetricsDaily.campaign_id.in_(campaign_ids))
+        if days:
+            stale_daily = stale_daily.where(ClientMetricsDaily.date.in_(days))
+        self.db.execute(stale_daily)
+        if daily_records:
+            self.db.execute(insert(ClientMetricsDaily), daily_records)
+
+        # 2. 월별: 영향받은 월의 일별 롤업 → client_metrics_monthly
+        months = sorted({month_start(d) for d in days}) if days else None
+        daily_query = self.db.query(
+            ClientMetricsDaily.client_id,
+            ClientMetricsDaily.platform,
+            ClientMetricsDaily.campaign_id,
+            ClientMetricsDaily.source,
+            ClientMetricsDaily.date,
+            *(getattr(ClientMetricsDaily, f) for f in METRIC_FIELDS),
+        ).filter(ClientMetricsDaily.campaign_id.in_(campaign_ids))
+        stale_monthly = delete(ClientMetricsMonthly).where(ClientMetricsMonthly.campaign_id.in_(campaign_ids))
+        if months:
+            daily_query = daily_query.filter(
+                ClientMetricsDaily.date >= months[0],
+                ClientMetricsDaily.date < _next_month(months[-1]),
+            )
+            stale_monthly = stale_monthly.where(ClientMetricsMonthly.month.in_(months))
+        wanted_months = set(months) if months else None
+        monthly_rows = [r for r in daily_query.all() if wanted_months is None or month_start(r.date) in wanted_months]
+        monthly_records = to_records(roll_up_monthly(monthly_rows), "month")
+
+        self.db.execute(stale_monthly)
+        if monthly_records:
+            self.db.execute(insert(ClientMetricsMonthly), monthly_records)
+
+        self.db.commit()
+        logger.info(
+            f"Metrics rollup refreshed: {len(campaign_ids)} campaigns, "
+            f"{len(daily_records)} daily / {len(monthly_records)} monthly rows"
+        )
+        return len(daily_records)
+
+    def rebuild(self, client_id=None) -> int:
+        """클라이언트(None 이면 전체)의 롤업을 전체 기간으로 재생성."""
+        query = self.db.query(Campaign.id)
+        if client_id:
+            query = query.join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
+                         .filter(PlatformConnection.client_id == client_id)
+        campaign_ids: List = [r.id for r in query.all()]
+        return self.refresh(campaign_ids)
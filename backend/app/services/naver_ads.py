@@ -3,13 +3,16 @@ import hashlib
 import hmac
 import base64
 import requests
-import json
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.core.bulk import dialect_insert
 from app.core.config import settings
 from app.models.models import PlatformConnection, Campaign, MetricsDaily, PlatformType, AdGroup, AdKeyword, AdMetricsDaily
+from app.services.naver_ads_client import NaverAdsAsyncClient, run_async
+import asyncio
 import logging
 import uuid
 
@@ -168,39 +171,35 @@ class NaverAdsService:
                 logger.error(f"Naver API AdGroup Error: {response.status_code} - {response.text}")
                 return []
             
-            ad_groups_data = response.json()
-            
-            # DB Campaign ID Lookup
-            campaign = self.db.query(Campaign).filter(Campaign.external_id == campaign_external_id).first()
-            if not campaign:
-                logger.error(f"Campaign not found for external_id: {campaign_external_id}")
-                return []
-
-            synced_groups = []
-            for group_data in ad_groups_data:
-                ad_group = self.db.query(AdGroup).filter(AdGroup.external_id == group_data["nccAdgroupId"]).first()
-                if not ad_group:
-                    ad_group = AdGroup(
-                        id=uuid.uuid4(),
-                        campaign_id=campaign.id,
-                        external_id=group_data["nccAdgroupId"],
-                        name=group_data["name"],
-                        status=group_data["userLock"] == "N" and "ACTIVE" or "PAUSED"
-                    )
-                    self.db.add(ad_group)
-                else:
-                    ad_group.name = group_data["name"]
-                    ad_group.status = group_data["userLock"] == "N" and "ACTIVE" or "PAUSED"
-                
-                synced_groups.append(ad_group)
-            
-            self.db.commit()
-            return synced_groups
+            return self._save_ad_groups(campaign_external_id, response.json())
 
         except Exception as e:
             logger.error(f"Failed to sync ad groups: {e}")
             return []
 
+    @staticmethod
+    def _status(entity_data: dict) -> str:
+        return entity_data.get("userLock") == "N" and "ACTIVE" or "PAUSED"
+
+    def _save_ad_groups(self, campaign_external_id: str, ad_groups_data: list):
+        """/ncc/adgroups 응답을 AdGroup 으로 저장 (commit 포함). 응답 순서대로 AdGroup 목록 반환."""
+        # DB Campaign ID Lookup
+        campaign = self.db.query(Campaign).filter(Campaign.external_id == campaign_external_id).first()
+        if not campaign:
+            logger.error(f"Campaign not found for external_id: {campaign_external_id}")
+            return []
+
+        rows = [{
+            "id": uuid.uuid4(),
+            "campaign_id": campaign.id,
+            "external_id": group_data["nccAdgroupId"],
+            "name": group_data["name"],
+            "status": self._status(group_data),
+        } for group_data in ad_groups_data]
+        by_external_id = self._upsert_by_external_id(AdGroup, rows, ("name", "status"))
+        self.db.commit()
+        return [by_external_id[row["external_id"]] for row in rows if row["external_id"] in by_external_id]
+
     def sync_keywords(self, ad_group_external_id: str):
         """광고그룹 하위의 키워드(AdKeyword)를 동기화합니다."""
         path = "/ncc/keywords"
@@ -213,97 +212,111 @@ class NaverAdsService:
                 logger.error(f"Naver API Keyword Error: {response.status_code} - {response.text}")
                 return []
 
-            keywords_data = response.json()
-
-            # DB AdGroup Lookup
-            ad_group = self.db.query(AdGroup).filter(AdGroup.external_id == ad_group_external_id).first()
-            if not ad_group:
-                return []
-
-            synced_keywords = []
-            for kw_data in keywords_data:
-                keyword = self.db.query(AdKeyword).filter(AdKeyword.external_id == kw_data["nccKeywordId"]).first()
-                if not keyword:
-                    keyword = AdKeyword(
-                        id=uuid.uuid4(),
-                        ad_group_id=ad_group.id,
-                        external_id=kw_data["nccKeywordId"],
-                        text=kw_data["keyword"],
-                        bid_amt=kw_data.get("bidAmt", 0),
-                        status=kw_data["userLock"] == "N" and "ACTIVE" or "PAUSED"
-                    )
-                    self.db.add(keyword)
-                else:
-                    keyword.bid_amt = kw_data.get("bidAmt", 0)
-                    keyword.status = kw_data["userLock"] == "N" and "ACTIVE" or "PAUSED"
-                
-                synced_keywords.append(keyword)
-
-            self.db.commit()
-            return synced_keywords
+            return self._save_keywords(ad_group_external_id, response.json())
 
         except Exception as e:
             logger.error(f"Failed to sync keywords: {e}")
             return []
 
-    def sync_daily_metrics(self, external_id: str, date_str: str, entity_type: str = "campaign"):
+    def _save_keywords(self, ad_group_external_id: str, keywords_data: list):
+        """/ncc/keywords 응답을 AdKeyword 로 저장 (commit 포함)."""
+        # DB AdGroup Lookup
+        ad_group = self.db.query(AdGroup).filter(AdGroup.external_id == ad_group_external_id).first()
+        if not ad_group:
+            return []
+
+        by_external_id = self._upsert_keywords([(ad_group, kw_data) for kw_data in keywords_data])
+        self.db.commit()
+        return [by_external_id[kw["nccKeywordId"]] for kw in keywords_data if kw["nccKeywordId"] in by_external_id]
+
+    def _upsert_keywords(self, keyword_data: list) -> dict:
+        """(ad_group, /ncc/keywords 항목) 목록을 한 번에 upsert → {external_id: AdKeyword}. commit 은 호출부."""
+        rows = [{
+            "id": uuid.uuid4(),
+            "ad_group_id": ad_group.id,
+            "external_id": kw_data["nccKeywordId"],
+            "text": kw_data["keyword"],
+            "bid_amt": kw_data.get("bidAmt", 0),
+            "status": self._status(kw_data),
+        } for ad_group, kw_data in keyword_data]
+        return self._upsert_by_external_id(AdKeyword, rows, ("bid_amt", "status"))
+
+    def _upsert_by_external_id(self, model, rows: list, update_fields: tuple) -> dict:
         """
-        특정 엔티티(캠페인, 광고그룹, 키워드)의 성과 데이터를 수집합니다.
-        entity_type: 'campaign', 'adgroup', 'keyword' (DB저장용 구분, API호출은 ID로 자동처리됨)
+        external_id 기준 INSERT ... ON CONFLICT DO UPDATE 한 번 + 결과 조회 한 번.
+        행마다 SELECT 후 add/수정하던 방식 대신 왕복 2회로 끝난다. 반환: {external_id: ORM 객체}.
         """
-        # Naver Ads Stats API: GET /stats
-        time_range = {"from": date_str, "to": date_str}
-        params = {
-            "ids": external_id,
-            "fields": "impCnt,clickCnt,salesAmt,convCnt,ctr,cpc,avgRnk", # Added CTR, CPC for validation
-            "timeRange": json.dumps(time_range)
-        }
-        
-        path = "/stats"
-        headers = self._get_headers("GET", path)
-        try:
-            response = self.session.get(self.base_url + path, headers=headers, params=params, timeout=10)
-            if response.status_code != 200:
-                logger.error(f"Naver API Stats Error ({entity_type}:{external_id}): {response.status_code} - {response.text}")
-                return None
-            
-            data = response.json()
-            if not data or 'data' not in data or not data['data']:
-                # logger.debug(f"No API stats data found for {external_id} on {date_str}")
-                return None
-            
-            # Extract first record
-            stats = data['data'][0]
-            return {
-                "spend": float(stats.get("salesAmt", 0)),
-                "impressions": int(stats.get("impCnt", 0)),
-                "clicks": int(stats.get("clickCnt", 0)),
-                "conversions": int(stats.get("convCnt", 0)),
-                "ctr": float(stats.get("ctr", 0)),
-                "cpc": float(stats.get("cpc", 0))
-            }
-        except requests.exceptions.Timeout:
-            logger.error(f"Naver API Timeout for stats: {external_id}")
-            return None
-        except Exception as e:
-            logger.error(f"Failed to fetch real Naver API metrics: {e}")
-            return None
+        # 같은 구문 안에서 같은 키가 두 번 나오면 ON CONFLICT 가 실패하므로 마지막 값만 남김
+        rows = list({row["external_id"]: row for row in rows}.values())
+        if not rows:
+            return {}
+        stmt = dialect_insert(self.db, model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["external_id"],
+            set_={**{field: stmt.excluded[field] for field in update_fields}, "updated_at": func.now()},
+        )
+        self.db.execute(stmt, rows)
+        saved = self.db.query(model).filter(
+            model.external_id.in_([row["external_id"] for row in rows])
+        ).populate_existing().all()
+        return {obj.external_id: obj for obj in saved}
+
+    def async_client(self) -> NaverAdsAsyncClient:
+        """같은 서명 로직을 쓰는 async 클라이언트 (실행 중인 이벤트 루프 안에서 생성)."""
+        return NaverAdsAsyncClient(self._get_headers, self.customer_id, base_url=self.base_url)
+
+    async def fetch_account_tree(self, campaign_external_ids: list, date_str: str) -> dict:
+        """
+        캠페인 → 광고그룹 → 키워드 목록을 동시에 수집하고, 캠페인/키워드 성과는 /stats 에
+        ids 를 묶어 한꺼번에 조회한다 (NAVER_ADS_STATS_BATCH_SIZE 개 단위).
+        동시 요청 수는 NAVER_ADS_CONCURRENCY, 초당 요청 수는 고객 ID 별 토큰 버킷으로 제한.
+
+        Returns:
+            {"campaigns": {campaign_external_id: [{"data": 광고그룹 응답, "keywords": [키워드 응답]}]},
+             "stats": {캠페인/키워드 external_id: 지표 dict}}
+        """
+        client = self.async_client()
+
+        async def fetch_group(group_data: dict) -> dict:
+            return {"data": group_data, "keywords": await client.list_keywords(group_data["nccAdgroupId"])}
+
+        async def fetch_campaign(external_id: str) -> list:
+            groups = await client.list_ad_groups(external_id)
+            return list(await asyncio.gather(*(fetch_group(g) for g in groups)))
+
+        trees = await asyncio.gather(*(fetch_campaign(ext_id) for ext_id in campaign_external_ids))
+        campaigns = dict(zip(campaign_external_ids, trees))
+
+        entity_ids = list(campaign_external_ids) + [
+            kw["nccKeywordId"] for groups in trees for group in groups for kw in group["keywords"]
+        ]
+        stats = await client.fetch_stats_batch(entity_ids, date_str)
+        logger.info(
+            f"[NaverAds] fetched {len(entity_ids)} entities for {len(campaign_external_ids)} campaign(s) "
+            f"on {date_str}: {client.stats()}"
+        )
+        return {"campaigns": campaigns, "stats": stats}
 
     def sync_all_campaign_metrics(self, connection_id: uuid.UUID, date_str: str):
         """
         커넥션에 연결된 모든 캠페인 -> 광고그룹 -> 키워드를 순회하며 데이터를 수집합니다.
         (Granular Sync: Campaign > AdGroup > Keyword)
+        API 호출은 fetch_account_tree 로 동시에(성과는 묶음 /stats 로) 수행하고,
+        DB 저장은 이 세션에서 캠페인 단위로 처리한다 (광고그룹/키워드/키워드 지표 각각 ON CONFLICT upsert 1회).
         """
         campaigns = self.db.query(Campaign).filter(Campaign.connection_id == connection_id).all()
+        campaigns = [cp for cp in campaigns if cp.external_id]
+        if not campaigns:
+            return 0
         results_count = 0
         target_date = datetime.strptime(date_str, "%Y-%m-%d")
+
+        fetched = run_async(lambda: self.fetch_account_tree([cp.external_id for cp in campaigns], date_str))
+        stats = fetched["stats"]
         
         for cp in campaigns:
-            if not cp.external_id:
-                continue
-            
             # 1. Sync Campaign Metrics (Legacy/Summary)
-            camp_data = self.sync_daily_metrics(cp.external_id, date_str, "campaign")
+            camp_data = stats.get(cp.external_id)
             if camp_data:
                 metrics = self.db.query(MetricsDaily).filter(
                     MetricsDaily.campaign_id == cp.id,
@@ -319,43 +332,50 @@ class NaverAdsService:
                 metrics.clicks = camp_data["clicks"]
                 metrics.conversions = camp_data["conversions"]
 
-            # 2. Sync AdGroups
-            ad_groups = self.sync_ad_groups(cp.external_id)
-            for ag in ad_groups:
-                # 3. Sync Keywords
-                keywords = self.sync_keywords(ag.external_id)
-                
-                # 4. Sync Metrics for Keywords
-                for kw in keywords:
-                    kw_data = self.sync_daily_metrics(kw.external_id, date_str, "keyword")
-                    if kw_data:
-                        ad_metrics = self.db.query(AdMetricsDaily).filter(
-                            AdMetricsDaily.keyword_id == kw.id,
-                            AdMetricsDaily.date == target_date
-                        ).first()
-                        
-                        if not ad_metrics:
-                            ad_metrics = AdMetricsDaily(
-                                id=uuid.uuid4(), 
-                                date=target_date, 
-                                ad_group_id=ag.id, 
-                                keyword_id=kw.id
-                            )
-                            self.db.add(ad_metrics)
-                        
-                        ad_metrics.impressions = kw_data["impressions"]
-                        ad_metrics.clicks = kw_data["clicks"]
-                        ad_metrics.spend = kw_data["spend"]
-                        ad_metrics.conversions = kw_data["conversions"]
-                        ad_metrics.ctr = kw_data["ctr"]
-                        ad_metrics.cpc = kw_data["cpc"]
-                        results_count += 1
+            # 2. Sync AdGroups / 3. Keywords
+            groups = fetched["campaigns"].get(cp.external_id, [])
+            ad_groups = self._save_ad_groups(cp.external_id, [g["data"] for g in groups])
+            groups_by_id = {ag.external_id: ag for ag in ad_groups}
+            # 캠페인의 키워드 전체를 upsert 한 번으로 저장
+            keywords = self._upsert_keywords([
+                (groups_by_id[group["data"]["nccAdgroupId"]], kw_data)
+                for group in groups if group["data"]["nccAdgroupId"] in groups_by_id
+                for kw_data in group["keywords"]
+            ])
+            keyword_stats = []  # (ad_group_id, keyword_id, 지표)
+            for ext_id, kw in keywords.items():
+                kw_data = stats.get(ext_id)
+                if kw_data:
+                    keyword_stats.append((kw.ad_group_id, kw.id, kw_data))
+
+            # 4. Sync Metrics for Keywords
+            results_count += self._save_keyword_metrics(keyword_stats, target_date)
                         
             # Intermediate commit per campaign to save progress
             self.db.commit()
         
         return results_count
 
+    def _save_keyword_metrics(self, keyword_stats: list, target_date: datetime) -> int:
+        """(ad_group_id, keyword_id, 지표) 목록을 AdMetricsDaily 로 저장 (keyword_id, date 기준 ON CONFLICT upsert 1회)."""
+        if not keyword_stats:
+            return 0
+        fields = ("impressions", "clicks", "spend", "conversions", "ctr", "cpc")
+        rows = {
+            keyword_id: {
+                "id": uuid.uuid4(), "date": target_date, "ad_group_id": ad_group_id, "keyword_id": keyword_id,
+                **{field: kw_data[field] for field in fields},
+            }
+            for ad_group_id, keyword_id, kw_data in keyword_stats
+        }
+        stmt = dialect_insert(self.db, AdMetricsDaily)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["keyword_id", "date"],
+            set_={field: stmt.excluded[field] for field in fields},
+        )
+        self.db.execute(stmt, list(rows.values()))
+        return len(rows)
+
     def validate_api(self) -> dict:
         """현재 설정된 키가 실제로 작동하는지 네이버 서버에 직접 물어봅니다."""
         path = "/ncc/campaigns"
@@ -0,0 +1,152 @@
+"""
+네이버 검색광고 API async 클라이언트
+
+- 서명 헤더는 NaverAdsService._get_headers (→ _generate_signature) 를 그대로 사용
+- 공유 httpx.AsyncClient (app.core.http_client) + 동시 요청 세마포어 + 고객 ID 별 토큰 버킷
+- 429/5xx 는 지수 backoff 로 재시도 (기존 requests Retry(total=3, backoff_factor=1) 와 동일한 정책)
+- 실패 시 sync 메서드와 같은 형태의 빈 값(None / [])을 돌려주고 로그만 남긴다
+
+run_async() 는 sync 호출부(동기화 태스크)에서 이 클라이언트로 만든 코루틴을 실행하는 브릿지다.
+"""
+import asyncio
+import concurrent.futures
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.rate_limit import get_token_bucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+NAVER_ADS_HOST = "api.searchad.naver.com"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+STATS_FIELDS = "impCnt,clickCnt,salesAmt,convCnt,ctr,cpc,avgRnk"
+
+
+def chunk_ids(ids: Iterable[str], size: int) -> List[List[str]]:
+    """중복 제거(순서 유지) 후 size 개씩 분할."""
+    unique = list(dict.fromkeys(i for i in ids if i))
+    size = max(1, size)
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
+def map_stats_response(data: Any) -> Dict[str, Dict[str, Any]]:
+    """여러 ids 로 요청한 /stats 응답 → {엔티티 id: 지표 dict} (data 항목의 'id' 기준)."""
+    if not data or not data.get("data"):
+        return {}
+    return {record["id"]: parse_stats_record(record) for record in data["data"] if record.get("id")}
+
+
+def parse_stats_record(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """/stats 응답 data 항목 → 내부 지표 dict."""
+    return {
+        "spend": float(stats.get("salesAmt", 0) or 0),
+        "impressions": int(stats.get("impCnt", 0) or 0),
+        "clicks": int(stats.get("clickCnt", 0) or 0),
+        "conversions": int(stats.get("convCnt", 0) or 0),
+        "ctr": float(stats.get("ctr", 0) or 0),
+        "cpc": float(stats.get("cpc", 0) or 0),
+    }
+
+
+class NaverAdsAsyncClient:
+    def __init__(self, headers_fn: Callable[[str, str], Dict[str, str]], customer_id: str,
+                 base_url: str = "https://api.searchad.naver.com", concurrency: Optional[int] = None):
+        self._headers = headers_fn
+        self.base_url = base_url
+        self.bucket = get_token_bucket(
+            f"naver_ads:{customer_id}",
+            settings.NAVER_ADS_RATE_PER_SEC,
+            settings.NAVER_ADS_BURST,
+        )
+        self._semaphore = asyncio.Semaphore(max(1, concurrency or settings.NAVER_ADS_CONCURRENCY))
+        self.requests = 0
+        self.failures = 0
+
+    async def get(self, path: str, params: Optional[dict] = None, label: str = "") -> Optional[Any]:
+        """서명된 GET. 성공 시 JSON, 실패 시 None."""
+        from app.core.http_client import get_http_client
+        client = get_http_client(NAVER_ADS_HOST)
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                await self.bucket.acquire()
+                self.requests += 1
+                try:
+                    # 타임스탬프가 서명에 들어가므로 재시도마다 헤더를 새로 만든다
+                    response = await client.get(
+                        self.base_url + path, headers=self._headers("GET", path), params=params, timeout=10.0
+                    )
+                except Exception as e:
+                    if attempt < MAX_RETRIES:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    self.failures += 1
+                    logger.error(f"Naver API request failed ({label or path}): {type(e).__name__}: {e}")
+                    return None
+
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    if response.status_code == 429:
+                        self.bucket.drain()
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                self.failures += 1
+                logger.error(f"Naver API Error ({label or path}): {response.status_code} - {response.text[:300]}")
+                return None
+        return None
+
+    async def list_ad_groups(self, campaign_external_id: str) -> List[dict]:
+        data = await self.get("/ncc/adgroups", {"nccCampaignId": campaign_external_id}, "adgroups")
+        return data if isinstance(data, list) else []
+
+    async def list_keywords(self, ad_group_external_id: str) -> List[dict]:
+        data = await self.get("/ncc/keywords", {"nccAdgroupId": ad_group_external_id}, "keywords")
+        return data if isinstance(data, list) else []
+
+    async def fetch_stats_batch(self, external_ids: List[str], date_str: str) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 엔티티(캠페인/키워드 혼합 가능)의 date_str 성과를 ids 를 묶어 조회.
+        NAVER_ADS_STATS_BATCH_SIZE 개씩 나눠 동시에 요청하고 결과를 엔티티 id 별로 합친다.
+        성과가 없는 엔티티는 결과에서 빠진다.
+        """
+        time_range = json.dumps({"from": date_str, "to": date_str})
+
+        async def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            params = {"ids": ",".join(chunk), "fields": STATS_FIELDS, "timeRange": time_range}
+            return map_stats_response(await self.get("/stats", params, f"stats:{len(chunk)} ids"))
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        chunks = chunk_ids(external_ids, settings.NAVER_ADS_STATS_BATCH_SIZE)
+        for part in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+            merged.update(part)
+        return merged
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "failures": self.failures}
+
+
+def run_async(coro_fn: Callable[[], Awaitable[T]]) -> T:
+    """
+    sync 코드에서 코루틴 실행.
+    - 현재 스레드에 실행 중인 루프가 없으면 asyncio.run
+    - 있으면(async 동기화 루틴 안에서 sync 함수로 호출된 경우) 별도 스레드의 새 루프에서 실행
+    루프 전용 공유 HTTP 클라이언트는 루프 종료 전에 정리한다.
+    """
+    async def _run():
+        from app.core.http_client import close_http_clients
+        try:
+            return await coro_fn()
+        finally:
+            await close_http_clients()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_run())
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _run()).result()
@@ -11,10 +11,31 @@ from reportlab.platypus import (
 )
 from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-import matplotlib
-matplotlib.use('Agg')  # Non-GUI backend
-import matplotlib.pyplot as plt
+import hashlib
+import json
 import logging
+from app.core.lru_cache import LRUCache
+from app.services.chart_render import chart_key, chart_spec, render_charts
+
+# 차트 위젯 타입 → chart_render 의 차트 종류
+CHART_WIDGETS = {"FUNNEL": "funnel", "ROI_COMPARISON": "roi", "TREND_CHART": "trend"}
+
+# 완성된 PDF 캐시 - 리포트 버전(report_pdf_key) 단위. 리포트가 다시 생성되면 updated_at 이 바뀌어 키가 달라진다
+_pdf_cache = LRUCache(maxsize=32, ttl_seconds=24 * 3600)
+
+
+def report_pdf_key(report, template_config: Dict, client_name: str) -> str:
+    """PDF 내용을 결정하는 값들 (리포트 버전 + 템플릿 설정 + 클라이언트 이름 + 표지의 생성일)."""
+    version = {
+        "report_id": str(report.id),
+        "updated_at": report.updated_at,
+        "generated_at": report.generated_at,
+        "template": template_config,
+        "client_name": client_name,
+        "day": datetime.now().date(),
+    }
+    return hashlib.sha256(json.dumps(version, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
 
 class PDFGeneratorService:
     """
@@ -29,6 +50,7 @@ class PDFGeneratorService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.styles = getSampleStyleSheet()
+        self._charts: Dict[str, bytes] = {}
 
         # 커스텀 스타일 정의
         self.styles.add(ParagraphStyle(
@@ -57,6 +79,22 @@ class PDFGeneratorService:
             spaceAfter=8
         ))
 
+    def generate_cached_report_pdf(self, report, template_config: Dict, client_name: str) -> bytes:
+        """
+        Report 모델 기준 PDF (다운로드/이메일 공용). 같은 리포트 버전은 캐시된 PDF 를 그대로 돌려준다.
+        """
+        key = report_pdf_key(report, template_config, client_name)
+        hit, pdf_bytes = _pdf_cache.get(key)
+        if hit:
+            return pdf_bytes
+        pdf_bytes = self.generate_report_pdf(
+            report_data=report.data or {},
+            template_config=template_config,
+            client_name=client_name
+        )
+        _pdf_cache.set(key, pdf_bytes, group=str(report.id))
+        return pdf_bytes
+
     def generate_report_pdf(
         self,
         report_data: Dict,
@@ -98,6 +136,13 @@ class PDFGeneratorService:
         # 2. 위젯별 콘텐츠 생성
         widgets = template_config.get("widgets", [])
 
+        # 차트는 story 를 만들기 전에 한 번에 렌더링 (캐시 미스만, 프로세스 풀에서 동시에)
+        specs = [
+            chart_spec(CHART_WIDGETS[widget.get("type")], report_data.get(widget.get("id"), {}))
+            for widget in widgets if widget.get("type") in CHART_WIDGETS
+        ]
+        self._charts = render_charts([spec for spec in specs if spec])
+
         for widget in widgets:
             widget_id = widget.get("id")
             widget_type = widget.get("type")
@@ -201,34 +246,18 @@ class PDFGeneratorService:
         elements.append(table)
         return elements
 
+    def _chart_image(self, kind: str, data: Dict) -> List:
+        """차트 위젯 → 미리 렌더링된 PNG 이미지 (그릴 데이터가 없으면 빈 목록)"""
+        spec = chart_spec(kind, data)
+        if spec is None:
+            return []
+        key = chart_key(spec)
+        png = self._charts.get(key) or render_charts([spec])[key]
+        return [RLImage(io.BytesIO(png), width=5*inch, height=3*inch)]
+
     def _render_funnel(self, data: Dict) -> List:
         """퍼널 차트 렌더링 (이미지로)"""
-        elements = []
-
-        stages = data.get("stages", [])
-        if not stages:
-            return elements
-
-        # Matplotlib로 차트 생성
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        labels = [s.get("name", "") for s in stages]
-        values = [s.get("value", 0) for s in stages]
-
-        ax.barh(labels, values, color='#4F46E5')
-        ax.set_xlabel('사용자 수')
-        ax.set_title('전환 퍼널')
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-
-        img = RLImage(img_buffer, width=5*inch, height=3*inch)
-        elements.append(img)
-
-        return elements
+        return self._chart_image("funnel", data)
 
     def _render_cohort(self, data: Dict) -> List:
         """코호트 테이블 렌더링"""
@@ -263,63 +292,11 @@ class PDFGeneratorService:
 
     def _render_roi_comparison(self, data: Dict) -> List:
         """ROI 비교 차트 렌더링"""
-        elements = []
-
-        campaigns = data.get("campaigns", [])
-        if not campaigns:
-            return elements
-
-        # Matplotlib로 막대 차트 생성
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        names = [c.get("name", "")[:15] for c in campaigns]  # 이름 짧게
-        roi_values = [c.get("roi", 0) for c in campaigns]
-
-        ax.bar(names, roi_values, color='#10B981')
-        ax.set_ylabel('ROI (%)')
-        ax.set_title('캠페인별 ROI 비교')
-        ax.tick_params(axis='x', rotation=45)
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-
-        img = RLImage(img_buffer, width=5*inch, height=3*inch)
-        elements.append(img)
-
-        return elements
+        return self._chart_image("roi", data)
 
     def _render_trend_chart(self, data: Dict) -> List:
         """트렌드 라인 차트 렌더링"""
-        elements = []
-
-        trend_data = data.get("data", [])
-        if not trend_data:
-            return elements
-
-        # Matplotlib로 라인 차트 생성
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        dates = [d.get("date", "") for d in trend_data]
-        values = [d.get("value", 0) for d in trend_data]
-
-        ax.plot(dates, values, marker='o', color='#4F46E5', linewidth=2)
-        ax.set_xlabel('날짜')
-        ax.set_ylabel('지표')
-        ax.set_title('추이 분석')
-        ax.tick_params(axis='x', rotation=45)
-        ax.grid(True, alpha=0.3)
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
-
-        img = RLImage(img_buffer, width=5*inch, height=3*inch)
-        elements.append(img)
-
-        return elements
+        return self._chart_image("trend", data)
 
     def _render_ai_diagnosis(self, data: Dict) -> List:
         """AI 진단 결과 렌더링"""
@@ -0,0 +1,243 @@
+"""
+순위 수집 결과 일괄 저장 (Place / View / Ad → DailyRank)
+
+여러 키워드의 스크래핑 결과를 한 번에 받아 배치 단위로 기록한다.
+- RawScrapingLog : executemany 1회
+- Keyword        : 조회 1회 + 누락분 INSERT 1회
+- Target         : INSERT ... ON CONFLICT (name) DO NOTHING 1회 + id 조회 1회
+- RankPosition   : 마지막 순위 조회 1회 → rank_change 계산 → upsert 1회 + 이탈분 DELETE 1회
+- DailyRank      : executemany 1회 (rank_change 포함)
+- RankDelta      : 바뀐 위치만 executemany 1회
+- 최신 스냅샷    : 배치 키워드/플랫폼 DELETE 1회 + INSERT 1회 (latest_rank_snapshot)
+- commit         : 배치당 1회
+"""
+import logging
+import uuid
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import insert, delete, func, tuple_
+from sqlalchemy.orm import Session
+from app.core.algorithms.rank_delta import best_positions, diff_rank_positions, rank_change
+from app.core.bulk import dialect_insert
+from app.services.rank_snapshot import RankSnapshotService
+from app.models.models import (
+    DailyRank, Keyword, Target, TargetType, PlatformType, RawScrapingLog, RankPosition, RankDelta,
+)
+
+logger = logging.getLogger(__name__)
+
+# 플랫폼별 (타겟 이름 필드, 대표 URL 필드)
+RANK_TARGET_FIELDS: Dict[PlatformType, Tuple[str, Optional[str]]] = {
+    PlatformType.NAVER_PLACE: ("name", None),
+    PlatformType.NAVER_VIEW: ("blog_name", "link"),
+    PlatformType.NAVER_AD: ("advertiser", "display_url"),
+}
+
+
+def _as_uuid(value) -> Optional[uuid.UUID]:
+    if not value:
+        return None
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+class RankIngestionService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.last_snapshot_id: Optional[uuid.UUID] = None
+
+    def save_batch(self, entries: List[dict], client_id: Optional[uuid.UUID] = None) -> int:
+        """
+        키워드 N개 × 플랫폼 결과를 한 트랜잭션으로 저장.
+
+        Args:
+            entries: [{"keyword": str, "platform": PlatformType, "results": [...], "client_id": UUID(선택)}, ...]
+            client_id: 항목에 client_id 가 없을 때 사용할 기본 광고주
+
+        Returns:
+            저장된 DailyRank 행 수 (배치의 스냅샷 ID 는 self.last_snapshot_id)
+        """
+        if not entries:
+            return 0
+
+        entries = [
+            {**e, "client_id": _as_uuid(e.get("client_id", client_id)), "results": e.get("results") or []}
+            for e in entries
+        ]
+
+        snapshot_id = uuid.uuid4()
+        try:
+            self._save_raw_logs(entries)
+            keyword_ids = self._resolve_keywords(entries)
+            target_ids = self._upsert_targets(entries)
+
+            rows = []
+            client_by_keyword = {}
+            for e in entries:
+                name_field, _ = RANK_TARGET_FIELDS[e["platform"]]
+                keyword_id = keyword_ids[(e["keyword"], e["client_id"])]
+                client_by_keyword[keyword_id] = e["client_id"]
+                for item in e["results"]:
+                    name = item.get(name_field)
+                    if not name or item.get("rank") is None:
+                        continue
+                    rows.append({
+                        "id": uuid.uuid4(),
+                        "client_id": e["client_id"],
+                        "target_id": target_ids[name],
+                        "keyword_id": keyword_id,
+                        "platform": e["platform"],
+                        "rank": item["rank"],
+                        "snapshot_id": snapshot_id,
+                    })
+
+            deltas = self._apply_rank_changes(rows)
+
+            if rows:
+                # Core INSERT: ORM bulk insert 는 default 가 있는 컬럼의 None 을 생략해 신규 진입(rank_change None)이 0 으로 저장된다
+                self.db.execute(insert(DailyRank.__table__), rows)
+                RankSnapshotService(self.db).replace(rows, snapshot_id)
+            if deltas:
+                self.db.execute(insert(RankDelta), [
+                    {
+                        "id": uuid.uuid4(),
+                        "client_id": client_by_keyword.get(d["key"][0]),
+                        "keyword_id": d["key"][0],
+                        "platform": d["key"][1],
+                        "target_id": d["key"][2],
+                        "previous_rank": d["previous_rank"],
+                        "current_rank": d["current_rank"],
+                        "rank_change": d["rank_change"],
+                    }
+                    for d in deltas
+                ])
+            self.db.commit()
+            self.last_snapshot_id = snapshot_id
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info(f"[RankIngestion] {len(entries)}개 항목 → DailyRank {len(rows)}건, 변동 {len(deltas)}건 저장")
+        self._invalidate_analytics({e["client_id"] for e in entries if e["client_id"]})
+        return len(rows)
+
+    def _invalidate_analytics(self, client_ids):
+        """순위가 바뀐 클라이언트의 경쟁사/트렌드 분석 캐시 무효화 (실패해도 저장 결과는 유지)."""
+        if not client_ids:
+            return
+        from app.services.analytics_cache import invalidate_client_analytics
+        try:
+            for cid in client_ids:
+                invalidate_client_analytics(self.db, cid)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"[RankIngestion] analytics cache invalidation failed: {e}")
+
+    def _apply_rank_changes(self, rows: List[dict]) -> List[dict]:
+        """
+        마지막 순위 인덱스(RankPosition)와 비교해 rows 에 rank_change 를 채우고
+        인덱스를 갱신한 뒤 바뀐 위치(delta) 목록을 반환.
+        """
+        if not rows:
+            return []
+
+        current = best_positions([((r["keyword_id"], r["platform"], r["target_id"]), r["rank"]) for r in rows])
+        scopes = list({(kw, platform) for kw, platform, _ in current})
+        previous = {
+            (p.keyword_id, p.platform, p.target_id): p.rank
+            for p in self.db.query(
+                RankPosition.keyword_id, RankPosition.platform, RankPosition.target_id, RankPosition.rank
+            ).filter(tuple_(RankPosition.keyword_id, RankPosition.platform).in_(scopes)).all()
+        }
+
+        for r in rows:
+            r["rank_change"] = rank_change(previous.get((r["keyword_id"], r["platform"], r["target_id"])), r["rank"])
+
+        deltas = diff_rank_positions(previous, current)
+
+        stmt = dialect_insert(self.db, RankPosition)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["keyword_id", "platform", "target_id"],
+            set_={"rank": stmt.excluded.rank, "captured_at": func.now()},
+        )
+        changed = [d["key"] for d in deltas if d["current_rank"] is not None]
+        if changed:
+            self.db.execute(stmt, [
+                {"keyword_id": kw, "platform": platform, "target_id": target_id, "rank": current[(kw, platform, target_id)]}
+                for kw, platform, target_id in changed
+            ])
+
+        dropped = [d["key"] for d in deltas if d["current_rank"] is None]
+        if dropped:
+            self.db.execute(delete(RankPosition).where(
+                tuple_(RankPosition.keyword_id, RankPosition.platform, RankPosition.target_id).in_(dropped)
+            ))
+        return deltas
+
+    def _save_raw_logs(self, entries: List[dict]):
+        """원본 결과 보존 (실패해도 순위 저장은 계속 진행)."""
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(RawScrapingLog), [
+                    {"id": uuid.uuid4(), "platform": e["platform"], "keyword": e["keyword"], "data": e["results"]}
+                    for e in entries
+                ])
+        except Exception as e:
+            logger.error(f"Failed to save raw logs to Supabase: {e}")
+
+    def _resolve_keywords(self, entries: List[dict]) -> Dict[Tuple[str, Optional[uuid.UUID]], uuid.UUID]:
+        """
+        (term, client_id) → keyword_id.
+        client_id 가 None 이면 term 만으로 id 순 첫 레코드를 사용한다
+        (calculate_sov_batch 의 "term 당 id 최소 키워드" 규칙과 같아야 저장한 순위를 SOV 가 읽는다).
+        결과가 0건인 키워드도 레코드는 항상 생성된다.
+        """
+        wanted = {(e["keyword"], e["client_id"]) for e in entries}
+        existing = self.db.query(Keyword.id, Keyword.term, Keyword.client_id).filter(
+            Keyword.term.in_({term for term, _ in wanted})
+        ).order_by(Keyword.id).all()
+
+        by_term: Dict[str, list] = {}
+        for k in existing:
+            by_term.setdefault(k.term, []).append(k)
+
+        resolved = {}
+        missing = []
+        for term, cid in wanted:
+            match = next(
+                (k for k in by_term.get(term, []) if cid is None or k.client_id == cid),
+                None,
+            )
+            if match:
+                resolved[(term, cid)] = match.id
+            else:
+                new_id = uuid.uuid4()
+                resolved[(term, cid)] = new_id
+                missing.append({"id": new_id, "term": term, "client_id": cid})
+
+        if missing:
+            self.db.execute(insert(Keyword), missing)
+        return resolved
+
+    def _upsert_targets(self, entries: List[dict]) -> Dict[str, uuid.UUID]:
+        """이름 기준 Target upsert 후 name → id 매핑 반환."""
+        candidates: Dict[str, Optional[dict]] = {}
+        for e in entries:
+            name_field, url_field = RANK_TARGET_FIELDS[e["platform"]]
+            for item in e["results"]:
+                name = item.get(name_field)
+                if not name or name in candidates:
+                    continue
+                url = item.get(url_field) if url_field else None
+                candidates[name] = {"default": url} if url else None
+
+        if not candidates:
+            return {}
+
+        stmt = dialect_insert(self.db, Target).on_conflict_do_nothing(index_elements=["name"])
+        self.db.execute(stmt, [
+            {"id": uuid.uuid4(), "name": name, "type": TargetType.OTHERS, "urls": urls}
+            for name, urls in candidates.items()
+        ])
+
+        rows = self.db.query(Target.id, Target.name).filter(Target.name.in_(list(candidates))).all()
+        return {r.name: r.id for r in rows}
@@ -0,0 +1,113 @@
+"""
+순위 조회 공용 저장소 (읽기 전용)
+
+순위/경쟁사 조회 경로가 DailyRank·LatestRankSnapshot ORM 객체를 읽고 행마다
+r.target 을 lazy-load 하던 N+1 을 없애기 위해, 필요한 컬럼만 Target 과 JOIN 해
+가벼운 RankRow 튜플로 돌려준다. 모든 메서드는 쿼리 1회.
+"""
+import datetime
+import uuid
+from typing import Iterable, List, NamedTuple, Optional
+from sqlalchemy.orm import Session
+from app.models.models import DailyRank, Keyword, LatestRankSnapshot, PlatformType, Target, TargetType
+
+
+class RankRow(NamedTuple):
+    keyword_id: uuid.UUID
+    target_id: uuid.UUID
+    target_name: str
+    target_type: Optional[TargetType]
+    url: Optional[str]
+    rank: int
+    rank_change: Optional[int]
+    captured_at: Optional[datetime.datetime]
+    keyword: Optional[str] = None
+
+
+def _to_rank_row(r, keyword: Optional[str] = None) -> RankRow:
+    return RankRow(
+        keyword_id=r.keyword_id,
+        target_id=r.target_id,
+        target_name=r.target_name,
+        target_type=r.target_type,
+        url=r.urls.get("default") if r.urls else None,
+        rank=r.rank,
+        rank_change=r.rank_change,
+        captured_at=r.captured_at,
+        keyword=keyword,
+    )
+
+
+class RankReadRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _snapshot_query(self):
+        return self.db.query(
+            LatestRankSnapshot.keyword_id,
+            LatestRankSnapshot.target_id,
+            Target.name.label("target_name"),
+            Target.type.label("target_type"),
+            Target.urls,
+            LatestRankSnapshot.rank,
+            LatestRankSnapshot.rank_change,
+            LatestRankSnapshot.captured_at,
+        ).join(Target, LatestRankSnapshot.target_id == Target.id)
+
+    def current_ranking(
+        self,
+        keyword_id: uuid.UUID,
+        platform: PlatformType,
+        top_n: Optional[int] = None,
+        since: Optional[datetime.datetime] = None,
+    ) -> List[RankRow]:
+        """키워드/플랫폼의 현재 순위 (latest_rank_snapshot, 순위 오름차순)."""
+        query = self._snapshot_query().filter(
+            LatestRankSnapshot.keyword_id == keyword_id,
+            LatestRankSnapshot.platform == platform,
+        )
+        if top_n is not None:
+            query = query.filter(LatestRankSnapshot.rank <= top_n)
+        if since is not None:
+            query = query.filter(LatestRankSnapshot.captured_at >= since)
+        return [_to_rank_row(r) for r in query.order_by(LatestRankSnapshot.position).all()]
+
+    def current_ranking_for_keywords(self, keyword_ids: Iterable[uuid.UUID], platform: PlatformType) -> List[RankRow]:
+        """여러 키워드의 현재 순위 (키워드별 순위 오름차순)."""
+        keyword_ids = list(keyword_ids)
+        if not keyword_ids:
+            return []
+        query = self._snapshot_query().filter(
+            LatestRankSnapshot.keyword_id.in_(keyword_ids),
+            LatestRankSnapshot.platform == platform,
+        ).order_by(LatestRankSnapshot.keyword_id, LatestRankSnapshot.position)
+        return [_to_rank_row(r) for r in query.all()]
+
+    def history(
+        self,
+        client_id: uuid.UUID,
+        platform: PlatformType,
+        since: datetime.datetime,
+        keyword_id: Optional[uuid.UUID] = None,
+    ) -> List[RankRow]:
+        """클라이언트의 기간 내 순위 이력 (최신순, 키워드명 포함)."""
+        query = self.db.query(
+            DailyRank.keyword_id,
+            DailyRank.target_id,
+            Target.name.label("target_name"),
+            Target.type.label("target_type"),
+            Target.urls,
+            DailyRank.rank,
+            DailyRank.rank_change,
+            DailyRank.captured_at,
+            Keyword.term,
+        ).join(Target, DailyRank.target_id == Target.id)\
+         .join(Keyword, DailyRank.keyword_id == Keyword.id)\
+         .filter(
+            DailyRank.client_id == client_id,
+            DailyRank.platform == platform,
+            DailyRank.captured_at >= since,
+        )
+        if keyword_id:
+            query = query.filter(DailyRank.keyword_id == keyword_id)
+        return [_to_rank_row(r, keyword=r.term) for r in query.order_by(DailyRank.captured_at.desc()).all()]
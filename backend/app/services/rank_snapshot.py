@@ -0,0 +1,46 @@
+"""
+최신 순위 스냅샷 (latest_rank_snapshot)
+
+"현재 순위" 조회는 daily_ranks 에서 MAX(captured_at) 을 찾은 뒤 다시 읽는 대신
+(keyword_id, platform) PK 범위 조회 한 번으로 끝낸다 (조회: RankReadRepository).
+갱신은 RankIngestionService 가 배치마다 수행.
+"""
+import uuid
+from typing import Dict, List, Tuple
+from sqlalchemy import delete, insert, tuple_
+from sqlalchemy.orm import Session
+from app.models.models import LatestRankSnapshot, PlatformType
+
+
+class RankSnapshotService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def replace(self, rows: List[dict], snapshot_id: uuid.UUID):
+        """
+        배치에 포함된 (keyword_id, platform) 의 스냅샷을 rows 로 교체 (commit 은 호출자 담당).
+        결과가 없던 키워드는 rows 에 나타나지 않으므로 이전 스냅샷이 유지된다.
+        """
+        if not rows:
+            return
+        by_scope: Dict[Tuple[uuid.UUID, PlatformType], List[dict]] = {}
+        for r in rows:
+            by_scope.setdefault((r["keyword_id"], r["platform"]), []).append(r)
+
+        self.db.execute(delete(LatestRankSnapshot).where(
+            tuple_(LatestRankSnapshot.keyword_id, LatestRankSnapshot.platform).in_(list(by_scope))
+        ))
+        self.db.execute(insert(LatestRankSnapshot), [
+            {
+                "keyword_id": keyword_id,
+                "platform": platform,
+                "position": position,
+                "target_id": r["target_id"],
+                "client_id": r.get("client_id"),
+                "rank": r["rank"],
+                "rank_change": r.get("rank_change"),
+                "snapshot_id": snapshot_id,
+            }
+            for (keyword_id, platform), scope_rows in by_scope.items()
+            for position, r in enumerate(sorted(scope_rows, key=lambda r: r["rank"]))
+        ])
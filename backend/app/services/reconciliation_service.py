@@ -1,12 +1,21 @@
 import logging
+from sqlalchemy import delete, func, insert, select, text
 from sqlalchemy.orm import Session
-from app.models.models import MetricsDaily, Campaign, PlatformType
-from datetime import datetime
-from typing import List, Optional
+from app.core.algorithms.reconciliation import METRIC_FIELDS, SOURCE_PRIORITY, reconcile_rows
+from app.core.bulk import dialect_insert
+from app.models.models import MetricsDaily, Campaign, PlatformType, ReconciliationWarning
+from datetime import datetime, timedelta
+from typing import List
 import uuid
 
 logger = logging.getLogger(__name__)
 
+
+def _day_start(value) -> datetime:
+    day = value.date() if isinstance(value, datetime) else value
+    return datetime.combine(day, datetime.min.time())
+
+
 class DataReconciliationService:
     def __init__(self, db: Session):
         self.db = db
@@ -17,73 +26,85 @@ class DataReconciliationService:
         Policy:
         - Spend/Clicks/Conversions: Trust API first (1.0 weight)
         - If API is missing, use Scraper data.
-        - If both exist, check variance. If variance > 10%, log a warning.
+        - If both exist, check variance. If variance > 10%, record a ReconciliationWarning.
         """
-        sources = self.db.query(MetricsDaily).filter(
+        if not self._reconcile([Campaign.id == campaign_id], target_date, target_date):
+            return None
+        return self.db.query(MetricsDaily).filter(
             MetricsDaily.campaign_id == campaign_id,
             MetricsDaily.date == target_date,
-            MetricsDaily.source != 'RECONCILED'
-        ).all()
-
-        if not sources:
-            return None
-
-        # Sort by source priority (API > SCRAPER)
-        api_data = next((s for s in sources if s.source == 'API'), None)
-        scraper_data = next((s for s in sources if s.source == 'SCRAPER'), None)
-
-        final_metrics = {
-            "spend": 0.0,
-            "impressions": 0,
-            "clicks": 0,
-            "conversions": 0,
-            "revenue": 0.0
-        }
+            MetricsDaily.source == 'RECONCILED'
+        ).first()
 
-        if api_data and scraper_data:
-            # Check variance for spend
-            if api_data.spend > 0:
-                variance = abs(api_data.spend - scraper_data.spend) / api_data.spend
-                if variance > 0.1:
-                    logger.warning(f"High variance ({variance:.1%}) detected for Campaign {campaign_id} on {target_date}")
+    def reconcile_range(self, connection_id: uuid.UUID, start_date: datetime, end_date: datetime) -> int:
+        """
+        커넥션의 모든 캠페인 × [start_date, end_date] 일자를 한 번에 정합.
+        소스 조회 1회(GROUP BY) + RECONCILED upsert 1회 + 경고 교체 2회로 끝난다
+        (캠페인·일자마다 reconcile_metrics 를 부르던 방식은 키당 SELECT 2회 + commit).
+        Returns: upsert 된 RECONCILED 행 수
+        """
+        return self._reconcile([Campaign.connection_id == connection_id], start_date, end_date)
 
-        # Final decision logic
-        primary = api_data or scraper_data
-        if not primary: return None
+    def _reconcile(self, campaign_filters: List, start_date: datetime, end_date: datetime) -> int:
+        start, end = _day_start(start_date), _day_start(end_date) + timedelta(days=1)
+        campaign_ids = select(Campaign.id).where(*campaign_filters)
 
-        # Populate final metrics
-        final_metrics["spend"] = primary.spend
-        final_metrics["impressions"] = primary.impressions
-        final_metrics["clicks"] = primary.clicks
-        final_metrics["conversions"] = primary.conversions
-        final_metrics["revenue"] = primary.revenue
+        # (캠페인, 일자, 소스) 별 1행. 같은 소스 중복 행은 최댓값으로 합친다 (동기화는 행을 갱신하므로 보통 1개)
+        rows = self.db.query(
+            MetricsDaily.campaign_id,
+            MetricsDaily.date,
+            MetricsDaily.source,
+            *(func.max(getattr(MetricsDaily, f)) for f in METRIC_FIELDS),
+        ).filter(
+            MetricsDaily.campaign_id.in_(campaign_ids),
+            MetricsDaily.source.in_(SOURCE_PRIORITY),
+            MetricsDaily.date >= start,
+            MetricsDaily.date < end,
+        ).group_by(MetricsDaily.campaign_id, MetricsDaily.date, MetricsDaily.source).all()
 
-        # Create or Update RECONCILED record
-        reconciled = self.db.query(MetricsDaily).filter(
-            MetricsDaily.campaign_id == campaign_id,
-            MetricsDaily.date == target_date,
-            MetricsDaily.source == 'RECONCILED'
-        ).first()
+        reconciled, warnings = reconcile_rows(rows)
 
-        if not reconciled:
-            reconciled = MetricsDaily(
-                id=uuid.uuid4(),
-                campaign_id=campaign_id,
-                date=target_date,
-                source='RECONCILED'
+        if reconciled:
+            reconciled_at = datetime.now().isoformat()
+            stmt = dialect_insert(self.db, MetricsDaily)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["campaign_id", "date"],
+                index_where=text("source = 'RECONCILED'"),
+                set_={f: stmt.excluded[f] for f in METRIC_FIELDS + ("meta_info",)},
             )
-            self.db.add(reconciled)
+            self.db.execute(stmt, [
+                {
+                    "id": uuid.uuid4(),
+                    "campaign_id": campaign_id,
+                    "date": day,
+                    "source": 'RECONCILED',
+                    **result["metrics"],
+                    "meta_info": {
+                        "reconciled_at": reconciled_at,
+                        "sources_used": result["sources_used"],
+                        "primary_source": result["primary_source"],
+                    },
+                }
+                for (campaign_id, day), result in reconciled.items()
+            ])
 
-        reconciled.spend = final_metrics["spend"]
-        reconciled.impressions = final_metrics["impressions"]
-        reconciled.clicks = final_metrics["clicks"]
-        reconciled.conversions = final_metrics["conversions"]
-        reconciled.revenue = final_metrics["revenue"]
-        reconciled.meta_info = {
-            "reconciled_at": datetime.now().isoformat(),
-            "sources_used": [s.source for s in sources],
-            "primary_source": primary.source
-        }
+        # 경고는 이번 실행 결과로 교체 (편차가 해소된 일자의 이전 경고는 사라진다)
+        self.db.execute(
+            delete(ReconciliationWarning).where(
+                ReconciliationWarning.campaign_id.in_(campaign_ids),
+                ReconciliationWarning.date >= start,
+                ReconciliationWarning.date < end,
+            ).execution_options(synchronize_session=False)
+        )
+        if warnings:
+            self.db.execute(
+                insert(ReconciliationWarning),
+                [{"id": uuid.uuid4(), **w} for w in warnings],
+            )
+            logger.warning(
+                f"High spend variance on {len(warnings)} campaign-day(s) between "
+                f"{start.date()} and {(end - timedelta(days=1)).date()} (see reconciliation_warnings)"
+            )
 
         self.db.commit()
-        return reconciled
+        return len(reconciled)
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
-from app.models.models import MetricsDaily, Campaign, PlatformConnection, Notification, Client, User
+from app.models.models import Campaign, ClientMetricsDaily, Notification, Client, User
+from app.core.algorithms.roas import campaign_totals_columns, efficiency_columns, group_campaign_days, percentile
 from typing import List, Dict, Optional, Tuple
 from uuid import UUID, uuid4
 import datetime
@@ -29,6 +30,9 @@ class ROIOptimizerService:
         self.HIGH_CPA_PERCENTILE = 75  # CPA 상위 75% (비효율)
         self.MIN_SPEND_FOR_ANALYSIS = 50000  # 최소 광고비 5만원
 
+        # (client_id, start_date) → 캠페인별 시계열 (track/detect/recommend 가 공유)
+        self._performance_cache: Dict[Tuple[str, datetime.date], Dict] = {}
+
     def _get_client_conversion_value(self, client_id: UUID) -> float:
         """클라이언트별 전환당 수익값 조회 (미설정 시 기본값 150,000원)"""
         try:
@@ -39,6 +43,34 @@ class ROIOptimizerService:
             pass
         return self.DEFAULT_CONVERSION_VALUE
 
+    def _campaign_performance(self, client_id: UUID, start_date: datetime.date) -> Dict:
+        """
+        캠페인×일자 RECONCILED 지표를 한 번 조회해 캠페인별 시계열/합계로 묶는다.
+        같은 서비스 인스턴스 안에서는 (client_id, start_date) 별로 재사용.
+        """
+        key = (str(client_id), start_date)
+        if key not in self._performance_cache:
+            rows = self.db.query(
+                ClientMetricsDaily.campaign_id,
+                Campaign.name,
+                ClientMetricsDaily.platform,
+                ClientMetricsDaily.date,
+                func.sum(ClientMetricsDaily.spend),
+                func.sum(ClientMetricsDaily.clicks),
+                func.sum(ClientMetricsDaily.conversions),
+                func.sum(ClientMetricsDaily.impressions)
+            ).join(Campaign, Campaign.id == ClientMetricsDaily.campaign_id)\
+             .filter(
+                and_(
+                    ClientMetricsDaily.client_id == client_id,
+                    ClientMetricsDaily.date >= start_date,
+                    ClientMetricsDaily.source == 'RECONCILED'
+                )
+            ).group_by(ClientMetricsDaily.campaign_id, Campaign.name, ClientMetricsDaily.platform, ClientMetricsDaily.date)\
+             .order_by(ClientMetricsDaily.campaign_id, ClientMetricsDaily.date).all()
+            self._performance_cache[key] = group_campaign_days(rows)
+        return self._performance_cache[key]
+
     def track_campaign_roas(
         self,
         client_id: UUID,
@@ -60,67 +92,35 @@ class ROIOptimizerService:
             conversion_value = self._get_client_conversion_value(client_id)
         start_date = datetime.date.today() - datetime.timedelta(days=days)
 
-        # 1. 캠페인별 전체 성과 집계
-        campaigns_performance = self.db.query(
-            Campaign.id,
-            Campaign.name,
-            PlatformConnection.platform,
-            func.sum(MetricsDaily.spend).label("total_spend"),
-            func.sum(MetricsDaily.clicks).label("total_clicks"),
-            func.sum(MetricsDaily.conversions).label("total_conversions"),
-            func.sum(MetricsDaily.impressions).label("total_impressions")
-        ).join(PlatformConnection, Campaign.connection_id == PlatformConnection.id)\
-         .join(MetricsDaily, MetricsDaily.campaign_id == Campaign.id)\
-         .filter(
-            and_(
-                PlatformConnection.client_id == client_id,
-                MetricsDaily.date >= start_date,
-                MetricsDaily.source == 'RECONCILED'
-            )
-        ).group_by(Campaign.id, Campaign.name, PlatformConnection.platform).all()
+        # 1. 캠페인×일자 집계 1회 → 캠페인별 합계 + 일별 시계열
+        performance = self._campaign_performance(client_id, start_date)
+        totals = campaign_totals_columns(performance)
+        total_metrics = efficiency_columns(
+            totals["spend"], totals["conversions"], totals["clicks"], totals["impressions"], conversion_value
+        )
 
         campaigns_data = []
-        for camp in campaigns_performance:
-            spend = float(camp.total_spend or 0)
-            conversions = int(camp.total_conversions or 0)
-            clicks = int(camp.total_clicks or 0)
-            impressions = int(camp.total_impressions or 0)
-
-            revenue = conversions * conversion_value
-            roas = (revenue / spend * 100) if spend > 0 else 0
-            cpa = (spend / conversions) if conversions > 0 else spend
-            ctr = (clicks / impressions * 100) if impressions > 0 else 0
-            cvr = (conversions / clicks * 100) if clicks > 0 else 0
-
-            # 2. 일별 트렌드 데이터
-            daily_trend = self.db.query(
-                MetricsDaily.date,
-                func.sum(MetricsDaily.spend).label("spend"),
-                func.sum(MetricsDaily.conversions).label("conversions")
-            ).filter(
-                and_(
-                    MetricsDaily.campaign_id == camp.id,
-                    MetricsDaily.date >= start_date,
-                    MetricsDaily.source == 'RECONCILED'
-                )
-            ).group_by(MetricsDaily.date)\
-             .order_by(MetricsDaily.date).all()
+        for i, camp_id in enumerate(totals["campaign_id"]):
+            series = performance[camp_id]
+            spend = float(totals["spend"][i])
+            cpa = total_metrics["cpa"][i]
 
-            trend_data = [{
-                "date": str(d.date),
-                "roas": (d.conversions * conversion_value / d.spend * 100) if d.spend > 0 else 0
-            } for d in daily_trend]
+            # 2. 일별 트렌드 데이터 (같은 조회 결과 재사용)
+            daily_roas = efficiency_columns(
+                series["spend"], series["conversions"], series["clicks"], series["impressions"], conversion_value
+            )["roas"]
+            trend_data = [{"date": str(d), "roas": r} for d, r in zip(series["dates"], daily_roas)]
 
             campaigns_data.append({
-                "campaign_id": str(camp.id),
-                "campaign_name": camp.name,
-                "platform": camp.platform.value,
+                "campaign_id": str(camp_id),
+                "campaign_name": series["name"],
+                "platform": series["platform"].value,
                 "total_spend": spend,
-                "total_conversions": conversions,
-                "roas": round(roas, 1),
-                "cpa": round(cpa, 0),
-                "ctr": round(ctr, 2),
-                "cvr": round(cvr, 2),
+                "total_conversions": int(totals["conversions"][i]),
+                "roas": round(total_metrics["roas"][i], 1),
+                "cpa": round(cpa if cpa is not None else spend, 0),
+                "ctr": round(total_metrics["ctr"][i], 2),
+                "cvr": round(total_metrics["cvr"][i], 2),
                 "trend": trend_data
             })
 
@@ -164,65 +164,45 @@ class ROIOptimizerService:
             conversion_value = self._get_client_conversion_value(client_id)
         start_date = datetime.date.today() - datetime.timedelta(days=days)
 
-        # 캠페인별 성과 집계
-        campaigns = self.db.query(
-            Campaign.id,
-            Campaign.name,
-            PlatformConnection.platform,
-            func.sum(MetricsDaily.spend).label("spend"),
-            func.sum(MetricsDaily.clicks).label("clicks"),
-            func.sum(MetricsDaily.conversions).label("conversions"),
-            func.sum(MetricsDaily.impressions).label("impressions")
-        ).join(PlatformConnection, Campaign.connection_id == PlatformConnection.id)\
-         .join(MetricsDaily, MetricsDaily.campaign_id == Campaign.id)\
-         .filter(
-            and_(
-                PlatformConnection.client_id == client_id,
-                MetricsDaily.date >= start_date,
-                MetricsDaily.source == 'RECONCILED'
-            )
-        ).group_by(Campaign.id, Campaign.name, PlatformConnection.platform)\
-         .having(func.sum(MetricsDaily.spend) >= self.MIN_SPEND_FOR_ANALYSIS)\
-         .all()
+        # 캠페인별 성과 집계 (track_campaign_roas 와 같은 조회 재사용)
+        performance = self._campaign_performance(client_id, start_date)
+        eligible = {
+            camp_id: series for camp_id, series in performance.items()
+            if series["totals"]["spend"] >= self.MIN_SPEND_FOR_ANALYSIS
+        }
+        totals = campaign_totals_columns(eligible)
+        columns = efficiency_columns(
+            totals["spend"], totals["conversions"], totals["clicks"], totals["impressions"], conversion_value
+        )
 
         # CPA 분포 계산 (75분위수)
-        cpa_list = []
+        cpa_list = [cpa if cpa is not None else 0 for cpa in columns["cpa"]]
         campaign_metrics = {}
 
-        for camp in campaigns:
-            spend = float(camp.spend or 0)
-            conversions = int(camp.conversions or 0)
-            clicks = int(camp.clicks or 0)
-            impressions = int(camp.impressions or 0)
-
-            cpa = (spend / conversions) if conversions > 0 else float('inf')
-            cpa_list.append(cpa if cpa != float('inf') else 0)
-
-            campaign_metrics[camp.id] = {
-                "name": camp.name,
-                "platform": camp.platform.value,
-                "spend": spend,
-                "conversions": conversions,
-                "clicks": clicks,
-                "impressions": impressions,
-                "cpa": cpa
+        for i, camp_id in enumerate(totals["campaign_id"]):
+            cpa = columns["cpa"][i]
+            campaign_metrics[camp_id] = {
+                "name": eligible[camp_id]["name"],
+                "platform": eligible[camp_id]["platform"].value,
+                "spend": float(totals["spend"][i]),
+                "conversions": int(totals["conversions"][i]),
+                "clicks": int(totals["clicks"][i]),
+                "impressions": int(totals["impressions"][i]),
+                "roas": columns["roas"][i],
+                "ctr": columns["ctr"][i],
+                "cpa": cpa if cpa is not None else float('inf')
             }
 
         # 비효율 광고 필터링
         inefficient_ads = []
-        cpa_threshold = statistics.quantile(cpa_list, 0.75) if len(cpa_list) >= 4 else float('inf')
+        cpa_threshold = percentile(cpa_list, self.HIGH_CPA_PERCENTILE / 100) if len(cpa_list) >= 4 else float('inf')
 
         for camp_id, metrics in campaign_metrics.items():
             spend = metrics["spend"]
-            conversions = metrics["conversions"]
-            clicks = metrics["clicks"]
-            impressions = metrics["impressions"]
+            roas = metrics["roas"]
+            ctr = metrics["ctr"]
             cpa = metrics["cpa"]
 
-            revenue = conversions * conversion_value
-            roas = (revenue / spend * 100) if spend > 0 else 0
-            ctr = (clicks / impressions * 100) if impressions > 0 else 0
-
             issues = []
             severity = "low"
 
@@ -1,8 +1,8 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.models.models import Settlement, SettlementDetail, MetricsDaily, Campaign, PlatformConnection, Client, SettlementStatus
+from app.models.models import Settlement, SettlementDetail, ClientMetricsMonthly, Campaign, Client, SettlementStatus
 from app.schemas.settlement import SettlementCreate, SettlementUpdate
-from datetime import datetime
+from datetime import date, datetime
 import uuid
 
 class SettlementService:
@@ -11,7 +11,7 @@ class SettlementService:
 
     def generate_monthly_settlement(self, client_id: str, year: int, month: int):
         """
-        Aggregate MetricsDaily for the given client and month and create a Settlement.
+        Aggregate the client_metrics_monthly rollup for the given client and month and create a Settlement.
         """
         period = f"{year}-{month:02d}"
         
@@ -24,25 +24,16 @@ class SettlementService:
         if existing:
             return existing
 
-        # Fetch aggregated metrics per platform/campaign
-        start_date = datetime(year, month, 1)
-        if month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, month + 1, 1)
-
-        # Aggregate by platform and campaign
+        # Aggregate by platform and campaign (월별 롤업의 해당 월 행)
         metrics_query = self.db.query(
-            PlatformConnection.platform,
+            ClientMetricsMonthly.platform,
             Campaign.name.label("campaign_name"),
-            func.sum(MetricsDaily.spend).label("total_spend")
-        ).join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
-         .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
+            func.sum(ClientMetricsMonthly.spend).label("total_spend")
+        ).join(Campaign, Campaign.id == ClientMetricsMonthly.campaign_id)\
          .filter(
-             PlatformConnection.client_id == client_id,
-             MetricsDaily.date >= start_date,
-             MetricsDaily.date < end_date
-         ).group_by(PlatformConnection.platform, Campaign.name).all()
+             ClientMetricsMonthly.client_id == client_id,
+             ClientMetricsMonthly.month == date(year, month, 1)
+         ).group_by(ClientMetricsMonthly.platform, Campaign.name).all()
 
         if not metrics_query:
             return None
@@ -0,0 +1,111 @@
+"""
+클라이언트별 지표 소스 결정 캐시 (RECONCILED > API > SCRAPER)
+
+대시보드/퍼널/효율 조회마다 metrics_daily 전역 EXISTS 프로브를 최대 2회 실행하던 것을
+클라이언트 단위로 한 번 계산해 메모리에 보관한다.
+- 동기화 후 refresh(client_id) 로 재계산
+- 리컨실리에이션 단계에서 invalidate(client_id) 로 무효화
+- 다른 인스턴스에서 동기화가 돌 수 있으므로 TTL 이 지나면 다시 계산한다
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PRIORITY = ("RECONCILED", "API")
+FALLBACK_SOURCE = "SCRAPER"
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def pick_source(available: Iterable[str]) -> str:
+    """존재하는 소스 중 우선순위가 가장 높은 것 (없으면 SCRAPER)."""
+    available = set(available)
+    return next((s for s in SOURCE_PRIORITY if s in available), FALLBACK_SOURCE)
+
+
+class SourceResolutionCache:
+    """client_id(None = 전체) → (source, 계산 시각). 스레드 안전."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Optional[str], Tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, client_key: Optional[str]) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(client_key)
+            if entry and self._clock() - entry[1] < self.ttl_seconds:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def set(self, client_key: Optional[str], source: str):
+        with self._lock:
+            self._entries[client_key] = (source, self._clock())
+
+    def invalidate(self, client_key: Optional[str] = None):
+        """해당 클라이언트와 전체(None) 항목 제거. client_key 가 None 이면 모두 제거."""
+        with self._lock:
+            if client_key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(client_key, None)
+                self._entries.pop(None, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "ttl_seconds": self.ttl_seconds}
+
+
+_cache = SourceResolutionCache()
+
+
+def get_source_cache() -> SourceResolutionCache:
+    return _cache
+
+
+def _client_key(client_id) -> Optional[str]:
+    return str(client_id) if client_id else None
+
+
+class SourceResolver:
+    def __init__(self, db, cache: Optional[SourceResolutionCache] = None):
+        self.db = db
+        self.cache = cache or _cache
+
+    def resolve(self, client_id=None) -> str:
+        """클라이언트의 지표 소스 (캐시 미스일 때만 DB 조회)."""
+        key = _client_key(client_id)
+        source = self.cache.get(key)
+        if source is None:
+            source = self.refresh(client_id)
+        return source
+
+    def refresh(self, client_id=None) -> str:
+        """DB 에서 다시 계산해 캐시에 저장 (RECONCILED / API 존재 여부를 한 문장으로 조회)."""
+        from sqlalchemy import exists, select
+        from app.models.models import MetricsDaily, Campaign, PlatformConnection
+
+        def has_source(source: str):
+            probe = select(MetricsDaily.id).where(MetricsDaily.source == source)
+            if client_id:
+                probe = probe.join(Campaign, Campaign.id == MetricsDaily.campaign_id)\
+                             .join(PlatformConnection, PlatformConnection.id == Campaign.connection_id)\
+                             .where(PlatformConnection.client_id == client_id)
+            return exists(probe)
+
+        row = self.db.execute(select(*(has_source(s).label(s) for s in SOURCE_PRIORITY))).first()
+        source = pick_source(s for s in SOURCE_PRIORITY if row and getattr(row, s))
+        if source != SOURCE_PRIORITY[0]:
+            logger.warning(f"No RECONCILED metrics found for client {client_id or 'ALL'}. Using {source} fallback.")
+        self.cache.set(_client_key(client_id), source)
+        return source
+
+    def invalidate(self, client_id=None):
+        self.cache.invalidate(_client_key(client_id))
@@ -1,48 +1,107 @@
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
+from app.core.bulk import dialect_insert
 from app.models.models import SyncTask, SyncTaskStatus, SyncValidation, PlatformConnection, PlatformType
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+def backfill_dates(today: datetime, days: int) -> List[datetime]:
+    """today 부터 과거로 days 일 (최신 날짜 먼저 - 백필 중단 시에도 최근 데이터가 먼저 채워진다)."""
+    return [today - timedelta(days=i) for i in range(max(days, 0))]
+
+
+def backfill_worker_count(requested: int, pending: int, pool_capacity: int) -> int:
+    """
+    백필 워커 스레드 수. 워커마다 자체 세션(연결 1개)을 쓰므로, 호출부 세션 1개를 뺀 sync 풀의
+    절반까지만 쓴다 (나머지는 API 요청/다른 작업 몫). 처리할 태스크 수보다 많이 띄우지 않는다.
+    """
+    return max(1, min(requested, pending, (pool_capacity - 1) // 2))
+
+
+def _claimable(stale_seconds: Optional[float] = None):
+    """점유 가능한 태스크 조건: PENDING, 또는 started_at 이 stale_seconds 보다 오래된 RUNNING (크래시로 멈춘 태스크)."""
+    if stale_seconds is None:
+        from app.core.config import settings
+        stale_seconds = settings.SYNC_TASK_STALE_SECONDS
+    stale_before = datetime.utcnow() - timedelta(seconds=stale_seconds)
+    return or_(
+        SyncTask.status == SyncTaskStatus.PENDING,
+        and_(SyncTask.status == SyncTaskStatus.RUNNING, SyncTask.started_at < stale_before),
+    )
+
+
 class SyncService:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_daily_tasks(self, connection_id: str, days: int = 1):
-        """Creates SyncTask entries for the last N days for a specific connection."""
-        from datetime import timedelta
+    def create_daily_tasks(self, connection_id: str, days: int = 1, stale_seconds: float = None):
+        """
+        Creates SyncTask entries for the last N days for a specific connection.
+        날짜별 SELECT 대신 INSERT ... ON CONFLICT DO NOTHING 1회 + FAILED 재설정 UPDATE 1회 + 조회 1회.
+        반환: 처리할 태스크 - 새로 만든 것, FAILED 에서 되돌린 것, 이전 실행이 남긴 PENDING,
+        크래시로 RUNNING 에 멈춘 stale 태스크 (claim_next_task 가 다시 점유하는 대상과 같다).
+        COMPLETED 날짜는 체크포인트로 보고 건너뛴다.
+        """
         now_kst = datetime.utcnow() + timedelta(hours=9)
         today = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        tasksCreated = []
-        for i in range(days):
-            target_date = today - timedelta(days=i)
-            # Check if task already exists for this date/connection to avoid duplicates
-            existing = self.db.query(SyncTask).filter(
-                SyncTask.connection_id == connection_id,
-                SyncTask.target_date == target_date
-            ).first()
-            
-            if not existing or existing.status == SyncTaskStatus.FAILED:
-                if existing:
-                    task = existing
-                    task.status = SyncTaskStatus.PENDING
-                    task.attempts = 0
-                else:
-                    task = SyncTask(
-                        id=uuid.uuid4(),
-                        connection_id=connection_id,
-                        target_date=target_date,
-                        status=SyncTaskStatus.PENDING,
-                        attempts=0
-                    )
-                    self.db.add(task)
-                tasksCreated.append(task)
-        
+        dates = backfill_dates(today, days)
+        if not dates:
+            return []
+        connection_id = uuid.UUID(str(connection_id))
+
+        stmt = dialect_insert(self.db, SyncTask).on_conflict_do_nothing(
+            index_elements=["connection_id", "target_date"]
+        )
+        self.db.execute(stmt, [
+            {"id": uuid.uuid4(), "connection_id": connection_id, "target_date": d,
+             "status": SyncTaskStatus.PENDING, "attempts": 0}
+            for d in dates
+        ])
+        in_range = (
+            SyncTask.connection_id == connection_id,
+            SyncTask.target_date.in_(dates),
+        )
+        self.db.query(SyncTask).filter(*in_range, SyncTask.status == SyncTaskStatus.FAILED).update(
+            {SyncTask.status: SyncTaskStatus.PENDING, SyncTask.attempts: 0},
+            synchronize_session=False,
+        )
         self.db.commit()
-        return tasksCreated
+        return self.db.query(SyncTask).filter(*in_range, _claimable(stale_seconds))\
+            .order_by(SyncTask.target_date.desc()).all()
+
+    def claim_next_task(self, connection_id: str, stale_seconds: float = None) -> Optional[SyncTask]:
+        """
+        커넥션의 처리할 날짜 1건을 RUNNING 으로 점유 (없으면 None). 최신 날짜부터.
+        PENDING 과, started_at 이 stale_seconds 보다 오래된 RUNNING (크래시로 멈춘 태스크) 이 대상.
+        SKIP LOCKED + status 조건부 UPDATE 라 여러 스레드/인스턴스가 동시에 불러도 같은 날짜를 두 번 잡지 않는다.
+        """
+        claimable = _claimable(stale_seconds)
+        connection_id = uuid.UUID(str(connection_id))
+        task_id = (
+            self.db.query(SyncTask.id)
+            .filter(SyncTask.connection_id == connection_id, claimable)
+            .order_by(SyncTask.target_date.desc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar()
+        )
+        if task_id is None:
+            self.db.rollback()
+            return None
+
+        claimed = self.db.query(SyncTask).filter(SyncTask.id == task_id, claimable).update({
+            SyncTask.status: SyncTaskStatus.RUNNING,
+            SyncTask.started_at: datetime.utcnow(),
+            SyncTask.attempts: func.coalesce(SyncTask.attempts, 0) + 1,
+        }, synchronize_session=False)
+        self.db.commit()
+        if not claimed:
+            return None
+        return self.db.query(SyncTask).filter(SyncTask.id == task_id).first()
 
     def mark_as_running(self, task_id: str):
         task = self.db.query(SyncTask).filter(SyncTask.id == task_id).first()
@@ -66,7 +125,13 @@ class SyncService:
         return task
 
 class VerificationService:
-    """Implements the Verification Layer to ensure data integrity after sync."""
+    """
+    Implements the Verification Layer to ensure data integrity after sync.
+    커넥션·날짜 범위 전체를 한 번에 검증: RECONCILED 지표 조회 1회 → numpy 로 기본 검사 +
+    캠페인별 이력 대비 rolling z-score / IQR (spend, CTR, CVR) → SyncValidation 일괄 저장.
+    """
+    BASIC_CHECKS = ("not_empty", "no_negative_spend", "realistic_ctr")
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -74,31 +139,102 @@ class VerificationService:
         """Performs anomaly detection and null checks on reconciled data."""
         task = self.db.query(SyncTask).filter(SyncTask.id == task_id).first()
         if not task: return None
-        
+        return self.validate_range(task.target_date, task.target_date, [task.connection_id]).get(task.id)
+
+    def validate_range(self, start_date: datetime, end_date: datetime, connection_ids: Optional[List] = None) -> dict:
+        """
+        [start_date, end_date] 의 SyncTask 들을 검증 (connection_ids=None 이면 전체 커넥션).
+        Returns: {task_id: SyncValidation}
+        """
+        import numpy as np
+        from app.core.algorithms.anomaly import HISTORY_WINDOW, build_matrices, detect_metric_anomalies, flagged_checks
+        from app.core.algorithms.metrics_rollup import as_date
         from app.models.models import MetricsDaily, Campaign
-        # Fetch metrics generated/updated for this date/connection
-        metrics = self.db.query(MetricsDaily).join(Campaign).filter(
-            Campaign.connection_id == task.connection_id,
-            MetricsDaily.date == task.target_date,
-            MetricsDaily.source == 'RECONCILED'
-        ).all()
-        
-        checks_passed = {
-            "not_empty": len(metrics) > 0,
-            "no_negative_spend": all(m.spend >= 0 for m in metrics),
-            "realistic_ctr": all((m.clicks / m.impressions < 0.5) if m.impressions > 0 else True for m in metrics)
+
+        start, end = as_date(start_date), as_date(end_date)
+        window_end = datetime.combine(end, datetime.min.time()) + timedelta(days=1)
+        task_query = self.db.query(SyncTask).filter(
+            SyncTask.target_date >= datetime.combine(start, datetime.min.time()),
+            SyncTask.target_date < window_end,
+        )
+        if connection_ids is not None:
+            task_query = task_query.filter(SyncTask.connection_id.in_(connection_ids))
+        tasks = task_query.all()
+        if not tasks:
+            return {}
+
+        # 대상 기간 + 이력 window 의 RECONCILED 지표를 한 번에
+        history_start = datetime.combine(start - timedelta(days=HISTORY_WINDOW), datetime.min.time())
+        metric_query = self.db.query(
+            Campaign.connection_id,
+            MetricsDaily.campaign_id,
+            MetricsDaily.date,
+            MetricsDaily.spend,
+            MetricsDaily.impressions,
+            MetricsDaily.clicks,
+            MetricsDaily.conversions,
+        ).join(Campaign, Campaign.id == MetricsDaily.campaign_id).filter(
+            Campaign.connection_id.in_({t.connection_id for t in tasks}),
+            MetricsDaily.source == 'RECONCILED',
+            MetricsDaily.date >= history_start,
+            MetricsDaily.date < window_end,
+        )
+        rows = metric_query.all()
+        connection_of = {r.campaign_id: r.connection_id for r in rows}
+        campaign_ids, days, m = build_matrices(
+            ((r.campaign_id, as_date(r.date), r.spend, r.impressions, r.clicks, r.conversions) for r in rows),
+            ("spend", "impressions", "clicks", "conversions"),
+        )
+        anomalies = detect_metric_anomalies(m["spend"], m["impressions"], m["clicks"], m["conversions"])
+        day_index = {d: i for i, d in enumerate(days)}
+        campaign_rows = {}
+        for i, cid in enumerate(campaign_ids):
+            campaign_rows.setdefault(connection_of[cid], []).append(i)
+
+        results = {}
+        for task in tasks:
+            col = day_index.get(as_date(task.target_date))
+            idx = np.array(campaign_rows.get(task.connection_id, []) if col is not None else [], dtype=np.intp)
+            if idx.size:
+                idx = idx[~np.isnan(m["spend"][idx, col])]  # 해당 날짜 지표가 있는 캠페인만
+            spend = m["spend"][idx, col] if idx.size else np.array([])
+            ctr = anomalies["ctr"]["value"][idx, col] if idx.size else np.array([])
+            flagged = flagged_checks(anomalies, idx, col)
+            checks_passed = {
+                "not_empty": bool(idx.size),
+                "no_negative_spend": bool(np.all(spend >= 0)),
+                "realistic_ctr": bool(np.all(np.nan_to_num(ctr) < 0.5)),
+                **{check: not hits for check, hits in flagged.items()},
+            }
+            is_valid = all(checks_passed.values())
+            if is_valid:
+                notes = f"Validated {idx.size} campaigns."
+            else:
+                failed = [c for c, ok in checks_passed.items() if not ok]
+                outliers = {
+                    check: [str(campaign_ids[r]) for r in hits] for check, hits in flagged.items() if hits
+                }
+                notes = f"Anomaly detected in metrics: {', '.join(failed)}."
+                if outliers:
+                    notes += f" Outlier campaigns: {outliers}"
+            results[task.id] = {"is_valid": 1 if is_valid else 0, "checks_passed": checks_passed, "notes": notes}
+
+        # SyncValidation 저장: 기존 행 조회 1회 + 신규 일괄 INSERT
+        existing = {
+            v.task_id: v for v in self.db.query(SyncValidation).filter(SyncValidation.task_id.in_(list(results)))
         }
-        
-        is_valid = all(checks_passed.values())
-        
-        validation = self.db.query(SyncValidation).filter(SyncValidation.task_id == task_id).first()
-        if not validation:
-            validation = SyncValidation(id=uuid.uuid4(), task_id=task_id)
-            self.db.add(validation)
-            
-        validation.is_valid = 1 if is_valid else 0
-        validation.checks_passed = checks_passed
-        validation.notes = f"Validated {len(metrics)} campaigns." if is_valid else "Anomaly detected in metrics."
-        
+        validations = {}
+        for task_id, values in results.items():
+            validation = existing.get(task_id)
+            if validation is None:
+                validation = SyncValidation(id=uuid.uuid4(), task_id=task_id)
+                self.db.add(validation)
+            for field, value in values.items():
+                setattr(validation, field, value)
+            validations[task_id] = validation
         self.db.commit()
-        return validation
+        logger.info(
+            f"Validated {len(results)} sync task(s) {start}~{end}: "
+            f"{sum(1 for v in results.values() if not v['is_valid'])} with anomalies"
+        )
+        return validations
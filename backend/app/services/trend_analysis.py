@@ -1,6 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, extract
-from app.models.models import DailyRank, Keyword, MetricsDaily, Campaign, PlatformConnection, Notification
+from app.models.models import (
+    DailyRank, Keyword, MetricsDaily, Campaign, PlatformConnection, Notification,
+    ClientMetricsDaily, ClientMetricsMonthly, RankDelta, Target, Client, PlatformType, User, UserRole,
+)
+from app.core.algorithms.rank_delta import summarize_rank_drops
+from app.services.analytics_cache import cached_analytics
 from typing import List, Dict, Optional, Tuple
 from uuid import UUID, uuid4
 import datetime
@@ -23,6 +28,7 @@ class TrendAnalysisService:
         self.db = db
         self.logger = logging.getLogger(__name__)
 
+    @cached_analytics()
     def detect_seasonality(
         self,
         client_id: UUID,
@@ -45,33 +51,27 @@ class TrendAnalysisService:
         """
         start_date = datetime.date.today() - datetime.timedelta(days=lookback_months * 30)
 
-        # 1. 월별 성과 집계
+        # 1. 월별 성과 집계 (월별 롤업, 시작일이 속한 월부터)
         monthly_performance = self.db.query(
-            extract('year', MetricsDaily.date).label('year'),
-            extract('month', MetricsDaily.date).label('month'),
-            func.sum(MetricsDaily.spend).label('spend'),
-            func.sum(MetricsDaily.clicks).label('clicks'),
-            func.sum(MetricsDaily.conversions).label('conversions'),
-            func.sum(MetricsDaily.impressions).label('impressions')
-        ).join(Campaign, MetricsDaily.campaign_id == Campaign.id)\
-         .join(PlatformConnection, Campaign.connection_id == PlatformConnection.id)\
-         .filter(
+            ClientMetricsMonthly.month,
+            func.sum(ClientMetricsMonthly.spend).label('spend'),
+            func.sum(ClientMetricsMonthly.clicks).label('clicks'),
+            func.sum(ClientMetricsMonthly.conversions).label('conversions'),
+            func.sum(ClientMetricsMonthly.impressions).label('impressions')
+        ).filter(
             and_(
-                PlatformConnection.client_id == client_id,
-                MetricsDaily.date >= start_date,
-                MetricsDaily.source == 'RECONCILED'
+                ClientMetricsMonthly.client_id == client_id,
+                ClientMetricsMonthly.month >= start_date.replace(day=1),
+                ClientMetricsMonthly.source == 'RECONCILED'
             )
-        ).group_by(
-            extract('year', MetricsDaily.date),
-            extract('month', MetricsDaily.date)
-        ).order_by('year', 'month').all()
+        ).group_by(ClientMetricsMonthly.month).order_by(ClientMetricsMonthly.month).all()
 
         monthly_data = []
         prev_spend = None
 
         for mp in monthly_performance:
-            year = int(mp.year)
-            month = int(mp.month)
+            year = mp.month.year
+            month = mp.month.month
             spend = float(mp.spend or 0)
             conversions = int(mp.conversions or 0)
             clicks = int(mp.clicks or 0)
@@ -95,19 +95,17 @@ class TrendAnalysisService:
 
         # 2. 요일별 성과 집계
         dow_performance = self.db.query(
-            extract('dow', MetricsDaily.date).label('dow'),  # 0=Sunday, 6=Saturday
-            func.sum(MetricsDaily.spend).label('spend'),
-            func.sum(MetricsDaily.clicks).label('clicks'),
-            func.sum(MetricsDaily.conversions).label('conversions')
-        ).join(Campaign, MetricsDaily.campaign_id == Campaign.id)\
-         .join(PlatformConnection, Campaign.connection_id == PlatformConnection.id)\
-         .filter(
+            extract('dow', ClientMetricsDaily.date).label('dow'),  # 0=Sunday, 6=Saturday
+            func.sum(ClientMetricsDaily.spend).label('spend'),
+            func.sum(ClientMetricsDaily.clicks).label('clicks'),
+            func.sum(ClientMetricsDaily.conversions).label('conversions')
+        ).filter(
             and_(
-                PlatformConnection.client_id == client_id,
-                MetricsDaily.date >= start_date,
-                MetricsDaily.source == 'RECONCILED'
+                ClientMetricsDaily.client_id == client_id,
+                ClientMetricsDaily.date >= start_date,
+                ClientMetricsDaily.source == 'RECONCILED'
             )
-        ).group_by(extract('dow', MetricsDaily.date)).all()
+        ).group_by(extract('dow', ClientMetricsDaily.date)).all()
 
         dow_map = ["일요일", "월요일", "화요일", "수요일", "목요일", "금요일", "토요일"]
         dow_data = []
@@ -151,6 +149,7 @@ class TrendAnalysisService:
             }
         }
 
+    @cached_analytics()
     def predict_search_trends(
         self,
         client_id: UUID,
@@ -240,6 +239,61 @@ class TrendAnalysisService:
             "predictions": predictions
         }
 
+    def get_rank_deltas(
+        self,
+        client_id: UUID,
+        since: datetime.datetime,
+        platform: Optional[PlatformType] = None,
+        keyword_id: Optional[UUID] = None
+    ) -> List[Dict]:
+        """
+        순위 변동 스트림 조회 (ingest 시 기록된 RankDelta, 바뀐 위치만)
+
+        Args:
+            client_id: 클라이언트 ID
+            since: 이 시각 이후의 변동만
+            platform: 플랫폼 필터 (선택)
+            keyword_id: 키워드 필터 (선택)
+
+        Returns:
+            시간순 변동 목록
+        """
+        query = self.db.query(
+            RankDelta.keyword_id,
+            Keyword.term,
+            RankDelta.target_id,
+            Target.name.label('target_name'),
+            RankDelta.platform,
+            RankDelta.previous_rank,
+            RankDelta.current_rank,
+            RankDelta.rank_change,
+            RankDelta.captured_at
+        ).join(Keyword, RankDelta.keyword_id == Keyword.id)\
+         .join(Target, RankDelta.target_id == Target.id)\
+         .filter(
+            Keyword.client_id == client_id,
+            RankDelta.captured_at >= since
+        )
+        if platform:
+            query = query.filter(RankDelta.platform == platform)
+        if keyword_id:
+            query = query.filter(RankDelta.keyword_id == keyword_id)
+
+        return [
+            {
+                "keyword_id": str(d.keyword_id),
+                "keyword": d.term,
+                "target_id": str(d.target_id),
+                "target_name": d.target_name,
+                "platform": d.platform.value if hasattr(d.platform, "value") else d.platform,
+                "previous_rank": d.previous_rank,
+                "current_rank": d.current_rank,
+                "rank_change": d.rank_change,
+                "captured_at": d.captured_at.isoformat() if d.captured_at else None
+            }
+            for d in query.order_by(RankDelta.captured_at).all()
+        ]
+
     def create_ranking_drop_alert(
         self,
         client_id: UUID,
@@ -248,7 +302,9 @@ class TrendAnalysisService:
         """
         순위 급락 알림
 
-        전일 대비 순위가 {rank_drop_threshold}위 이상 하락한 키워드 감지
+        최근 24시간 동안 클라이언트 자신(타겟명 = 클라이언트명)의 순위가
+        {rank_drop_threshold}위 이상 하락한 키워드 감지.
+        daily_ranks 스냅샷을 다시 읽지 않고 ingest 시 기록된 변동 스트림(RankDelta)만 사용한다.
 
         Args:
             client_id: 클라이언트 ID
@@ -257,69 +313,54 @@ class TrendAnalysisService:
         Returns:
             순위 급락 키워드 목록
         """
-        # 최근 2일간 데이터 조회
-        today = datetime.date.today()
-        yesterday = today - datetime.timedelta(days=1)
-        two_days_ago = today - datetime.timedelta(days=2)
-
-        # 어제 순위
-        yesterday_ranks = self.db.query(
-            Keyword.id,
-            Keyword.term,
-            func.min(DailyRank.rank).label('rank')
-        ).join(DailyRank, DailyRank.keyword_id == Keyword.id)\
-         .filter(
-            and_(
-                Keyword.client_id == client_id,
-                func.date(DailyRank.captured_at) == yesterday
-            )
-        ).group_by(Keyword.id, Keyword.term).all()
-
-        # 그저께 순위
-        two_days_ago_ranks = self.db.query(
-            Keyword.id,
-            func.min(DailyRank.rank).label('rank')
-        ).join(DailyRank, DailyRank.keyword_id == Keyword.id)\
-         .filter(
-            and_(
-                Keyword.client_id == client_id,
-                func.date(DailyRank.captured_at) == two_days_ago
-            )
-        ).group_by(Keyword.id).all()
+        client = self.db.query(Client.name, Client.agency_id).filter(Client.id == client_id).first()
+        if not client:
+            return []
+
+        since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)
+        deltas = [
+            {**d, "key": (d["keyword_id"], d["platform"], d["target_id"])}
+            for d in self.get_rank_deltas(client_id, since)
+            if d["target_name"] == client.name
+        ]
+        terms = {d["keyword_id"]: d["keyword"] for d in deltas}
+        recipients = None
 
-        # 그저께 순위 맵핑
-        prev_rank_map = {r.id: r.rank for r in two_days_ago_ranks}
-
-        # 순위 급락 감지
         drops = []
+        for summary in summarize_rank_drops(deltas, rank_drop_threshold):
+            keyword_id, platform, _ = summary["key"]
+            term = terms[keyword_id]
+            prev_rank = summary["previous_rank"]
+            curr_rank = summary["current_rank"]
+            drop = summary["drop"]
+
+            drops.append({
+                "keyword_id": keyword_id,
+                "keyword": term,
+                "platform": platform,
+                "previous_rank": prev_rank,
+                "current_rank": curr_rank,
+                "drop": drop
+            })
 
-        for yr in yesterday_ranks:
-            if yr.id in prev_rank_map:
-                prev_rank = prev_rank_map[yr.id]
-                curr_rank = yr.rank
-
-                # 순위 하락 계산 (숫자가 커지면 하락)
-                rank_change = curr_rank - prev_rank
-
-                if rank_change >= rank_drop_threshold:
-                    drops.append({
-                        "keyword_id": str(yr.id),
-                        "keyword": yr.term,
-                        "previous_rank": prev_rank,
-                        "current_rank": curr_rank,
-                        "drop": rank_change
-                    })
-
-                    # 알림 생성
-                    notification = Notification(
-                        id=uuid4(),
-                        client_id=client_id,
-                        type="ALERT",
-                        title=f"📉 순위 급락: {yr.term}",
-                        message=f"'{yr.term}' 키워드가 {prev_rank}위에서 {curr_rank}위로 {rank_change}위 하락했습니다.",
-                        is_read=False
-                    )
-                    self.db.add(notification)
+            # 알림 생성 (Notification 은 사용자 단위 → 클라이언트 소속 에이전시 사용자에게,
+            # 에이전시가 없는 클라이언트는 SUPER_ADMIN 에게. agency_id == NULL 비교는 IS NULL 이 되어
+            # 에이전시 없는 모든 사용자에게 보내게 되므로 분기한다)
+            if recipients is None:
+                if client.agency_id is not None:
+                    audience = User.agency_id == client.agency_id
+                else:
+                    audience = User.role == UserRole.SUPER_ADMIN
+                recipients = [u.id for u in self.db.query(User.id).filter(audience).all()]
+            for user_id in recipients:
+                self.db.add(Notification(
+                    id=uuid4(),
+                    user_id=user_id,
+                    type="ALERT",
+                    title=f"📉 순위 급락: {term}",
+                    content=f"'{term}' 키워드가 {prev_rank}위에서 {curr_rank}위로 {drop}위 하락했습니다.",
+                    is_read=0
+                ))
 
         if drops:
             self.db.commit()
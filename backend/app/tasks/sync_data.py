@@ -10,16 +10,23 @@ import asyncio
 logger = logging.getLogger(__name__)
 import uuid
 
-def sync_naver_date_metrics(db: Session, conn: PlatformConnection, target_date: datetime, task_id: str = None):
+# DailyRank 일괄 저장 단위 (키워드×플랫폼 항목 수)
+RANK_WRITE_BATCH_SIZE = 150
+
+def sync_naver_date_metrics(db: Session, conn: PlatformConnection, target_date: datetime, task_id: str = None,
+                            claimed: bool = False, refresh_campaigns: bool = None, validate: bool = True):
     """
     Syncs Naver Ads metrics for a SPECIFIC date/connection.
     Updated to support SyncTask tracking.
+    claimed=True 면 SyncService.claim_next_task 로 이미 RUNNING 처리된 태스크.
+    refresh_campaigns=None 이면 최근(1일 이내) 날짜일 때만 캠페인 목록을 갱신한다.
+    validate=False 면 검증을 호출부가 범위 단위로 한 번에 수행 (VerificationService.validate_range).
     """
     from app.services.sync_service import SyncService, VerificationService
     sync_service = SyncService(db)
     veri_service = VerificationService(db)
     
-    if task_id:
+    if task_id and not claimed:
         sync_service.mark_as_running(task_id)
 
     creds = conn.credentials
@@ -33,7 +40,9 @@ def sync_naver_date_metrics(db: Session, conn: PlatformConnection, target_date:
         if creds.get('customer_id') and (creds.get('api_key') or creds.get('access_license')):
             naver_service = NaverAdsService(db, credentials=conn.credentials)
             # Sync campaigns if it's "today" (roughly) or if we want fresh metadata
-            if (datetime.utcnow().date() - target_date.date()).days <= 1:
+            if refresh_campaigns is None:
+                refresh_campaigns = _is_recent(target_date)
+            if refresh_campaigns:
                 naver_service.sync_campaigns(conn.client_id)
             
             sync_count = naver_service.sync_all_campaign_metrics(conn.id, date_str)
@@ -57,12 +66,19 @@ def sync_naver_date_metrics(db: Session, conn: PlatformConnection, target_date:
         # 3. Reconciliation for this specific date
         if campaign_ids_to_reconcile:
             from app.services.reconciliation_service import DataReconciliationService
-            recon_service = DataReconciliationService(db)
-            for cid in campaign_ids_to_reconcile:
-                recon_service.reconcile_metrics(cid, target_date)
+            # 커넥션 전체 캠페인을 한 번에 정합 (캠페인별 reconcile_metrics 반복 대신)
+            DataReconciliationService(db).reconcile_range(conn.id, target_date, target_date)
+            from app.services.metrics_rollup import MetricsRollupService
+            MetricsRollupService(db).refresh(campaign_ids_to_reconcile, [target_date])
+            # RECONCILED 행이 새로 생겼을 수 있으므로 소스 결정 캐시 무효화
+            from app.services.source_resolution import SourceResolver
+            SourceResolver(db).invalidate(conn.client_id)
+            from app.services.analytics_cache import invalidate_client_analytics
+            invalidate_client_analytics(db, conn.client_id)
+            db.commit()
             
         # 4. Verification Check
-        if task_id:
+        if task_id and validate:
             veri_service.validate_sync_results(task_id)
 
     except Exception as e:
@@ -74,6 +90,36 @@ def sync_naver_date_metrics(db: Session, conn: PlatformConnection, target_date:
     
     return not bool(error_msg)
 
+def _is_recent(target_date: datetime) -> bool:
+    return (datetime.utcnow().date() - target_date.date()).days <= 1
+
+def _sync_naver_backfill_worker(connection_id, worker_index: int) -> int:
+    """
+    백필 워커 (스레드): 자체 세션으로 커넥션의 날짜 태스크를 하나씩 점유해 처리, 남은 게 없으면 종료.
+    태스크 상태가 (커넥션, 일자) 체크포인트 - COMPLETED 는 다시 처리하지 않고,
+    크래시로 RUNNING 에 멈춘 날짜는 SYNC_TASK_STALE_SECONDS 후 다시 점유된다.
+    """
+    from app.core.database import SessionLocal
+    from app.services.sync_service import SyncService
+    db = SessionLocal()
+    processed = 0
+    try:
+        conn = db.query(PlatformConnection).filter(PlatformConnection.id == connection_id).first()
+        sync_service = SyncService(db)
+        while conn is not None:
+            task = sync_service.claim_next_task(connection_id)
+            if task is None:
+                break
+            logger.info(f"[Backfill w{worker_index}] Processing Task {task.id} for date {task.target_date}")
+            sync_naver_date_metrics(
+                db, conn, task.target_date, task_id=str(task.id),
+                claimed=True, refresh_campaigns=False, validate=False,
+            )
+            processed += 1
+    finally:
+        db.close()
+    return processed
+
 def sync_naver_data(db: Session, connection_id: str, days: int = None):
     # 1. Fetch connection
     conn = db.query(PlatformConnection).filter(PlatformConnection.id == connection_id).first()
@@ -84,24 +130,99 @@ def sync_naver_data(db: Session, connection_id: str, days: int = None):
     from app.core.config import settings
     sync_days = days or settings.SYNC_RAW_DAYS
     
-    # Timezone: Naver is KST
-    from datetime import timedelta
-    now_kst = datetime.utcnow() + timedelta(hours=9)
-    today = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    # Using the new SyncService to create tracked tasks
+    # Using the new SyncService to create tracked tasks (일괄 생성, 이미 COMPLETED 인 날짜는 제외)
     from app.services.sync_service import SyncService
     sync_service = SyncService(db)
     tasks = sync_service.create_daily_tasks(connection_id, days=sync_days)
     
     logger.info(f"Created/Fetched {len(tasks)} sync tasks for connection {connection_id}")
-    
-    for task in tasks:
-        logger.info(f"Processing Task {task.id} for date {task.target_date}")
-        sync_naver_date_metrics(db, conn, task.target_date, task_id=str(task.id))
+
+    # 날짜별 태스크를 워커 스레드들이 나눠 점유 (다른 인스턴스의 같은 커넥션 백필과도 SKIP LOCKED 로 분담)
+    # 워커마다 세션을 하나씩 잡으므로 sync 풀 크기로 상한 (pool_timeout 대기/고갈 방지)
+    from app.core.async_database import pool_budget
+    from app.core.database import SQLALCHEMY_DATABASE_URL
+    from app.services.sync_service import backfill_worker_count
+    sync_pool = pool_budget(SQLALCHEMY_DATABASE_URL)["sync"]
+    workers = backfill_worker_count(
+        settings.SYNC_BACKFILL_WORKERS, len(tasks), sync_pool["pool_size"] + sync_pool["max_overflow"]
+    )
+    if tasks:
+        # 캠페인 목록은 워커들이 날짜마다 동시에 갱신하지 않도록 여기서 한 번만 (Campaign 중복 생성 방지)
+        creds = conn.credentials or {}
+        if any(_is_recent(t.target_date) for t in tasks) and creds.get('customer_id') \
+                and (creds.get('api_key') or creds.get('access_license')):
+            try:
+                NaverAdsService(db, credentials=creds).sync_campaigns(conn.client_id)
+            except Exception as e:
+                logger.error(f"Campaign sync failed for {conn.id}: {e}")
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="naver-backfill") as executor:
+            processed = sum(executor.map(_sync_naver_backfill_worker, [conn.id] * workers, range(workers)))
+        logger.info(f"Backfill processed {processed} date(s) for connection {connection_id} with {workers} worker(s)")
+
+        # 검증은 백필 범위 전체를 한 번에 (태스크마다 조회하지 않음)
+        from app.services.sync_service import VerificationService
+        try:
+            dates = [t.target_date for t in tasks]
+            VerificationService(db).validate_range(min(dates), max(dates), [conn.id])
+        except Exception as e:
+            logger.error(f"Sync validation failed for {conn.id}: {e}")
+
+    # 동기화 직후 한 번 계산해 두고 대시보드 조회는 메모리에서 응답
+    from app.services.source_resolution import SourceResolver
+    try:
+        SourceResolver(db).refresh(conn.client_id)
+    except Exception as e:
+        logger.warning(f"Source resolution refresh failed for client {conn.client_id}: {e}")
 
     return
 
+RANK_PLATFORMS = {
+    "place": PlatformType.NAVER_PLACE,
+    "view": PlatformType.NAVER_VIEW,
+    "ad": PlatformType.NAVER_AD,
+}
+
+async def scrape_keyword_ranks(db: Session, keywords: list):
+    """
+    Runs Place/View/Ad rank scraping for all keywords through the bounded
+    ScrapePipeline and writes DailyRank rows in batches.
+    Returns the PipelineResult (per-platform item counts, errors, stage stats).
+    """
+    from app.core.config import settings
+    from app.scrapers.pipeline import ScrapePipeline
+    from app.scrapers.naver_place import NaverPlaceScraper
+    from app.scrapers.naver_view import NaverViewScraper
+    from app.scrapers.naver_ad import NaverAdScraper
+    from app.services.analysis import AnalysisService
+
+    service = AnalysisService(db)
+
+    def write_batch(entries):
+        return service.save_rank_results_batch([
+            {**e, "platform": RANK_PLATFORMS[e["platform"]]} for e in entries
+        ])
+
+    pipeline = ScrapePipeline(
+        scrapers={
+            "place": NaverPlaceScraper().get_rankings,
+            "view": NaverViewScraper().get_rankings,
+            "ad": NaverAdScraper().get_ad_rankings,
+        },
+        writer=write_batch,
+        workers=settings.SCRAPE_WORKERS,
+        platform_limits={
+            "place": settings.SCRAPE_PLACE_CONCURRENCY,
+            "view": settings.SCRAPE_VIEW_CONCURRENCY,
+            "ad": settings.SCRAPE_AD_CONCURRENCY,
+        },
+        host_interval=settings.SCRAPE_HOST_MIN_INTERVAL,
+        batch_size=RANK_WRITE_BATCH_SIZE,
+    )
+    # 같은 term 이 여러 광고주에 등록돼 있어도 한 번만 수집
+    terms = list(dict.fromkeys(k.term for k in keywords))
+    return await pipeline.run(terms)
+
 async def sync_all_channels(db: Session, client_id: str = None, days: int = None):
     """
     Unified ASYNC entry point for multi-channel synchronization.
@@ -142,55 +263,8 @@ async def sync_all_channels(db: Session, client_id: str = None, days: int = None
         if not keywords:
             logger.info("No keywords found. Skipping scraping.")
         else:
-            # Import scrapers directly to bypass Celery worker dependency
-            from app.worker.tasks import run_place_scraper, run_view_scraper
-            from app.scrapers.naver_ad import NaverAdScraper
-            from app.services.analysis import AnalysisService
-            
-            service = AnalysisService(db)
-            ad_scraper = NaverAdScraper()
-
-            # Stats tracking
-            stats = {"place": 0, "view": 0, "ad": 0}
-            error_logs = []
-
-            for k in keywords:
-                logger.info(f"-> Executing SEO/Ranking scraper tasks for keyword: {k.term}")
-                
-                try:
-                    # 1. Place & View Scraping (Async)
-                    place_task = run_place_scraper(k.term)
-                    view_task = run_view_scraper(k.term)
-                    
-                    place_results, view_results = await asyncio.gather(place_task, view_task, return_exceptions=True)
-                    
-                    if not isinstance(place_results, Exception):
-                        p_count = len(place_results)
-                        stats["place"] += p_count
-                        service.save_place_results(k.term, place_results)
-                    else:
-                        error_logs.append(f"Place({k.term}): {str(place_results)}")
-
-                    if not isinstance(view_results, Exception):
-                        v_count = len(view_results)
-                        stats["view"] += v_count
-                        service.save_view_results(k.term, view_results)
-                    else:
-                        error_logs.append(f"View({k.term}): {str(view_results)}")
-
-                    # 2. Ad Scraping (Async)
-                    try:
-                        ad_results = await ad_scraper.get_ad_rankings(k.term)
-                        a_count = len(ad_results) if ad_results else 0
-                        stats["ad"] += a_count
-                        if ad_results:
-                            service.save_ad_results(k.term, ad_results)
-                    except Exception as ad_err:
-                         error_logs.append(f"Ad({k.term}): {str(ad_err)}")
-
-                except Exception as e:
-                    error_logs.append(f"Batch({k.term}): {str(e)}")
-                    logger.error(f"Scraper batch failed for '{k.term}': {e}")
+            result = await scrape_keyword_ranks(db, keywords)
+            stats, error_logs = result.items, result.errors
 
             # Notify Completion
             try:
@@ -228,8 +302,17 @@ def run_sync_process(db: Session, client_id: str = None, days: int = None):
     """
     Synchronous wrapper to run the async sync process.
     """
+    async def _run():
+        from app.core.http_client import close_http_clients
+        from app.scrapers.browser_pool import close_browser_pools
+        try:
+            await sync_all_channels(db, client_id, days)
+        finally:
+            await close_http_clients()
+            await close_browser_pools()
+
     try:
-        asyncio.run(sync_all_channels(db, client_id, days))
+        asyncio.run(_run())
     except Exception as e:
         logger.error(f"Sync process wrapper failed: {e}")
 
@@ -0,0 +1,264 @@
+"""
+작업 큐 워커 (jobs 테이블 소비)
+
+각 인스턴스의 이벤트 루프에서 JOB_WORKER_CONCURRENCY 개의 루프가 JobQueue.claim() 으로
+작업을 하나씩 점유해 실행한다. SKIP LOCKED 점유이므로 인스턴스를 늘리면 처리량도 늘어난다.
+
+- async 핸들러는 이벤트 루프에서 await, sync 핸들러(동기화/리포트)는 asyncio.to_thread 로 실행
+- 큐 접근(점유/완료/실패/heartbeat)은 매번 짧은 SessionLocal 세션을 스레드에서 사용
+- 핸들러 예외 → JobQueue.fail() 이 backoff 재시도 또는 FAILED 처리 (PermanentJobError 는 재시도 없음)
+"""
+import asyncio
+import inspect
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("worker")
+
+JOB_HANDLERS: Dict[str, Callable[[dict], Any]] = {}
+
+
+class PermanentJobError(Exception):
+    """재시도해도 소용없는 실패 (잘못된 payload, 대상 없음 등)."""
+
+
+def job_handler(kind: str):
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+# ────────────────────────────────────────────────────────────
+# 핸들러
+# ────────────────────────────────────────────────────────────
+
+@job_handler("scrape.place")
+async def _scrape_place(payload: dict):
+    from app.worker.tasks import scrape_place_task
+    return {"count": len(await scrape_place_task(payload["keyword"], payload.get("client_id"), raise_on_error=True))}
+
+
+@job_handler("scrape.view")
+async def _scrape_view(payload: dict):
+    from app.worker.tasks import scrape_view_task
+    return {"count": len(await scrape_view_task(payload["keyword"], payload.get("client_id"), raise_on_error=True))}
+
+
+@job_handler("scrape.ad")
+async def _scrape_ad(payload: dict):
+    from app.worker.tasks import scrape_ad_task
+    return {"count": len(await scrape_ad_task(payload["keyword"], payload.get("client_id"), raise_on_error=True))}
+
+
+@job_handler("sync.all")
+def _sync_all(payload: dict):
+    # 전체/광고주 단위 동기화 - 별도 루프(asyncio.run)에서 실행. run_sync_process 는 예외를 삼키므로
+    # 실패가 JobQueue.fail 의 재시도로 이어지도록 raise_on_error 경로를 직접 호출한다
+    from app.scripts.sync_data import _sync_and_close_clients
+    asyncio.run(_sync_and_close_clients(payload.get("client_id"), payload.get("days"), raise_on_error=True))
+
+
+@job_handler("sync.connection")
+def _sync_connection(payload: dict):
+    from app.core.database import SessionLocal
+    from app.tasks.sync_data import sync_naver_data
+    db = SessionLocal()
+    try:
+        sync_naver_data(db, payload["connection_id"], days=payload.get("days"))
+    finally:
+        db.close()
+
+
+@job_handler("report.generate")
+def _generate_report(payload: dict):
+    from app.core.database import SessionLocal
+    from app.services.report_builder import ReportBuilderService
+    db = SessionLocal()
+    try:
+        ReportBuilderService(db).generate_report_data(uuid.UUID(payload["report_id"]))
+    except ValueError as e:
+        # 리포트가 삭제됨
+        raise PermanentJobError(str(e))
+    finally:
+        db.close()
+
+
+# ────────────────────────────────────────────────────────────
+# 큐 접근 (스레드에서 실행되는 짧은 세션)
+# ────────────────────────────────────────────────────────────
+
+def _claim(worker_id: str, kinds: List[str]) -> Optional[dict]:
+    from app.core.database import SessionLocal
+    from app.services.job_queue import JobQueue
+    db = SessionLocal()
+    try:
+        job = JobQueue(db).claim(worker_id, kinds)
+        if job is None:
+            return None
+        return {"id": job.id, "kind": job.kind, "payload": job.payload or {}, "attempts": job.attempts}
+    finally:
+        db.close()
+
+
+def _finish(job_id, result: Any = None, error: Optional[BaseException] = None):
+    from app.core.database import SessionLocal
+    from app.services.job_queue import JobQueue
+    db = SessionLocal()
+    try:
+        queue = JobQueue(db)
+        job = queue.get(job_id)
+        if job is None:
+            return
+        if error is None:
+            queue.complete(job, result if isinstance(result, (dict, list)) else None)
+        else:
+            retried = queue.fail(job, f"{type(error).__name__}: {error}", retry=not isinstance(error, PermanentJobError))
+            logger.warning(f"[Job] {job.kind} {job_id} failed (attempt {job.attempts}, retry={retried}): {error}")
+    finally:
+        db.close()
+
+
+def _heartbeat(job_id, worker_id: str):
+    from app.core.database import SessionLocal
+    from app.services.job_queue import JobQueue
+    db = SessionLocal()
+    try:
+        JobQueue(db).heartbeat(job_id, worker_id)
+    finally:
+        db.close()
+
+
+def _requeue_stale(timeout_seconds: float) -> int:
+    from app.core.database import SessionLocal
+    from app.services.job_queue import JobQueue
+    db = SessionLocal()
+    try:
+        return JobQueue(db).requeue_stale(timeout_seconds)
+    finally:
+        db.close()
+
+
+# ────────────────────────────────────────────────────────────
+# 워커 루프
+# ────────────────────────────────────────────────────────────
+
+class JobWorker:
+    def __init__(self, concurrency: int = 2, poll_interval: float = 2.0, stale_seconds: float = 900.0,
+                 kinds: Optional[List[str]] = None):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_seconds = stale_seconds
+        self.kinds = kinds or list(JOB_HANDLERS)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._loop(i)) for i in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._reaper()))
+        logger.info(f"[Job] worker {self.worker_id} started (concurrency={self.concurrency})")
+
+    async def stop(self, timeout: float = 10.0):
+        self._stopping.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            # 실행 중이던 작업은 stale 타임아웃 후 다른 인스턴스가 다시 점유
+            task.cancel()
+        self._tasks = []
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _loop(self, index: int):
+        while not self._stopping.is_set():
+            try:
+                job = await asyncio.to_thread(_claim, self.worker_id, self.kinds)
+            except Exception as e:
+                logger.error(f"[Job] claim failed: {e}")
+                await self._sleep(self.poll_interval * 5)
+                continue
+            if job is None:
+                await self._sleep(self.poll_interval)
+                continue
+            await self.execute(job)
+
+    async def execute(self, job: dict):
+        handler = JOB_HANDLERS.get(job["kind"])
+        result, error = None, None
+        heartbeat = asyncio.create_task(self._heartbeat(job["id"]))
+        try:
+            if handler is None:
+                raise PermanentJobError(f"No handler for job kind '{job['kind']}'")
+            logger.info(f"[Job] running {job['kind']} {job['id']} (attempt {job['attempts']})")
+            if inspect.iscoroutinefunction(handler):
+                result = await handler(job["payload"])
+            else:
+                result = await asyncio.to_thread(handler, job["payload"])
+        except Exception as e:
+            error = e
+        finally:
+            heartbeat.cancel()
+        try:
+            await asyncio.to_thread(_finish, job["id"], result, error)
+        except Exception as e:
+            logger.error(f"[Job] failed to record result for {job['id']}: {e}")
+
+    async def _heartbeat(self, job_id):
+        while True:
+            await asyncio.sleep(max(self.stale_seconds / 3, 1.0))
+            try:
+                await asyncio.to_thread(_heartbeat, job_id, self.worker_id)
+            except Exception as e:
+                logger.warning(f"[Job] heartbeat failed for {job_id}: {e}")
+
+    async def _reaper(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.to_thread(_requeue_stale, self.stale_seconds)
+            except Exception as e:
+                logger.error(f"[Job] stale requeue failed: {e}")
+            await self._sleep(max(self.stale_seconds / 4, self.poll_interval))
+
+
+_worker: Optional[JobWorker] = None
+
+
+def start_job_worker():
+    global _worker
+    from app.core.config import settings
+    if not settings.JOB_WORKER_ENABLED or _worker is not None:
+        return
+    _worker = JobWorker(
+        concurrency=settings.JOB_WORKER_CONCURRENCY,
+        poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+        stale_seconds=settings.JOB_STALE_SECONDS,
+    )
+    _worker.start()
+
+
+async def stop_job_worker():
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
+
+
+def enqueue_job(kind: str, payload: Optional[dict] = None, dedupe_key: Optional[str] = None, priority: int = 0):
+    """스케줄러 등 요청 세션이 없는 곳에서 작업 등록."""
+    from app.core.database import SessionLocal
+    from app.services.job_queue import JobQueue
+    db = SessionLocal()
+    try:
+        job, created = JobQueue(db).enqueue(kind, payload, dedupe_key=dedupe_key, priority=priority)
+        return str(job.id), created
+    finally:
+        db.close()
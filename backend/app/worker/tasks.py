@@ -1,7 +1,7 @@
 """
 Scraping Tasks - 완전 async 버전
 
-asyncio.run() 완전 제거 → FastAPI BackgroundTasks와 호환.
+asyncio.run() 완전 제거 → 작업 큐 워커(app/worker/job_worker.py)의 이벤트 루프에서 직접 await.
 Playwright 의존성 없음 - httpx 기반 스크래퍼 직접 사용.
 """
 import logging
@@ -10,13 +10,17 @@ from uuid import UUID, uuid4
 logger = logging.getLogger("worker")
 
 
+class ScrapeTaskError(Exception):
+    """스크래핑 또는 결과 저장 실패 (raise_on_error=True 일 때만 발생 → 작업 큐가 backoff 재시도)."""
+
+
 # ────────────────────────────────────────────────────────────
 # 공통 DB 저장 + 알림 처리
 # ────────────────────────────────────────────────────────────
 
 def _save_and_notify(keyword: str, results: list, client_uuid, platform_label: str,
                      save_fn, error_msg: str = None):
-    """스크래핑 결과 DB 저장 + 관리자 알림 (동기 함수, SessionLocal 사용)."""
+    """스크래핑 결과 DB 저장 + 관리자 알림 (동기 함수, SessionLocal 사용). 저장 성공 여부 반환."""
     from app.core.database import SessionLocal
     from app.models.models import Notification, User, UserRole
 
@@ -50,13 +54,22 @@ def _save_and_notify(keyword: str, results: list, client_uuid, platform_label: s
             ))
         db.commit()
         logger.info(f"[{platform_label}] '{keyword}' 저장 완료 ({count}건)")
+        return True
     except Exception as e:
         logger.error(f"[{platform_label}] DB 저장 실패: {e}")
         db.rollback()
+        return False
     finally:
         db.close()
 
 
+def _raise_if_failed(keyword: str, platform_label: str, error_msg: str, saved: bool):
+    if error_msg:
+        raise ScrapeTaskError(f"[{platform_label}] '{keyword}' 스크래핑 실패: {error_msg}")
+    if not saved:
+        raise ScrapeTaskError(f"[{platform_label}] '{keyword}' 결과 저장 실패")
+
+
 # ────────────────────────────────────────────────────────────
 # Place 저장 함수 (동기)
 # ────────────────────────────────────────────────────────────
@@ -80,10 +93,10 @@ def _save_ad(db, keyword, results, client_uuid):
 
 
 # ────────────────────────────────────────────────────────────
-# async Task 함수들 (FastAPI BackgroundTasks에서 직접 await)
+# async Task 함수들 (job_worker 의 scrape.* 핸들러에서 직접 await)
 # ────────────────────────────────────────────────────────────
 
-async def scrape_place_task(keyword: str, client_id: str = None):
+async def scrape_place_task(keyword: str, client_id: str = None, raise_on_error: bool = False):
     """네이버 플레이스 스크래핑 - httpx 직접 호출, asyncio.run() 없음."""
     from app.scrapers.naver_place import NaverPlaceScraper
 
@@ -105,11 +118,13 @@ async def scrape_place_task(keyword: str, client_id: str = None):
         except Exception:
             pass
 
-    _save_and_notify(keyword, results, client_uuid, "플레이스", _save_place, error_msg)
+    saved = _save_and_notify(keyword, results, client_uuid, "플레이스", _save_place, error_msg)
+    if raise_on_error:
+        _raise_if_failed(keyword, "플레이스", error_msg, saved)
     return results
 
 
-async def scrape_view_task(keyword: str, client_id: str = None):
+async def scrape_view_task(keyword: str, client_id: str = None, raise_on_error: bool = False):
     """네이버 VIEW 스크래핑 - httpx HTML 파싱, asyncio.run() 없음."""
     from app.scrapers.naver_view import NaverViewScraper
 
@@ -131,11 +146,13 @@ async def scrape_view_task(keyword: str, client_id: str = None):
         except Exception:
             pass
 
-    _save_and_notify(keyword, results, client_uuid, "VIEW", _save_view, error_msg)
+    saved = _save_and_notify(keyword, results, client_uuid, "VIEW", _save_view, error_msg)
+    if raise_on_error:
+        _raise_if_failed(keyword, "VIEW", error_msg, saved)
     return results
 
 
-async def scrape_ad_task(keyword: str, client_id: str = None):
+async def scrape_ad_task(keyword: str, client_id: str = None, raise_on_error: bool = False):
     """네이버 광고 순위 스크래핑 - httpx, asyncio.run() 없음."""
     from app.scrapers.naver_ad import NaverAdScraper
 
@@ -157,7 +174,9 @@ async def scrape_ad_task(keyword: str, client_id: str = None):
         except Exception:
             pass
 
-    _save_and_notify(keyword, results, client_uuid, "광고", _save_ad, error_msg)
+    saved = _save_and_notify(keyword, results, client_uuid, "광고", _save_ad, error_msg)
+    if raise_on_error:
+        _raise_if_failed(keyword, "광고", error_msg, saved)
     return results
 
 
@@ -168,19 +187,27 @@ async def scrape_ad_task(keyword: str, client_id: str = None):
 def run_place_scraper_sync(keyword: str, client_id: str = None):
     """스케줄러(BackgroundScheduler)에서 호출용 - 별도 이벤트 루프에서 실행."""
     import asyncio
+    from app.core.http_client import close_http_clients
+    from app.scrapers.browser_pool import close_browser_pools
     loop = asyncio.new_event_loop()
     try:
         return loop.run_until_complete(scrape_place_task(keyword, client_id))
     finally:
+        loop.run_until_complete(close_http_clients(loop))
+        loop.run_until_complete(close_browser_pools(loop))
         loop.close()
 
 
 def run_view_scraper_sync(keyword: str, client_id: str = None):
     import asyncio
+    from app.core.http_client import close_http_clients
+    from app.scrapers.browser_pool import close_browser_pools
     loop = asyncio.new_event_loop()
     try:
         return loop.run_until_complete(scrape_view_task(keyword, client_id))
     finally:
+        loop.run_until_complete(close_http_clients(loop))
+        loop.run_until_complete(close_browser_pools(loop))
         loop.close()
 
 
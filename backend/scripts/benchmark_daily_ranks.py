@@ -0,0 +1,191 @@
+"""
+daily_ranks 조회 패턴 벤치마크 (인덱스/월 파티션 적용 전후 비교)
+
+별도 스키마(bench_daily_ranks)에 합성 데이터를 만들어 측정하므로 운영 테이블은 건드리지 않는다.
+- before  : 현재 구조와 같은 PK 만 있는 단일 테이블
+- indexed : 단일 테이블 + 마이그레이션 k8f9a0b1c2d3 의 복합 인덱스 (파티션 효과와 인덱스 효과를 분리)
+- after   : captured_at 월 RANGE 파티션 + 같은 복합 인덱스
+
+Usage:
+    BENCHMARK_DATABASE_URL=postgresql://... python scripts/benchmark_daily_ranks.py --rows 10000000
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+SCHEMA = "bench_daily_ranks"
+PLATFORMS = ["NAVER_PLACE", "NAVER_VIEW", "NAVER_AD"]
+RANKS_PER_SNAPSHOT = 30
+TARGET_POOL = 5000
+CLIENT_POOL = 50
+
+# 마이그레이션과 같은 인덱스 정의 (테이블명만 치환)
+INDEXES = [
+    "CREATE INDEX ON {t} (keyword_id, platform, captured_at, rank) INCLUDE (target_id)",
+    "CREATE INDEX ON {t} (keyword_id, platform, target_id, captured_at) INCLUDE (rank)",
+    "CREATE INDEX ON {t} (target_id, platform, captured_at) INCLUDE (keyword_id, rank)",
+    "CREATE INDEX ON {t} (client_id, captured_at)",
+]
+
+# analysis / competitor / scrape 엔드포인트의 대표 조회 형태
+QUERIES = {
+    "latest_capture (get_daily_ranks)": """
+        SELECT MAX(captured_at) FROM {t}
+        WHERE keyword_id = :kw AND platform = 'NAVER_PLACE'
+    """,
+    "latest_snapshot_top_n (competitor_landscape)": """
+        SELECT target_id, rank FROM {t}
+        WHERE keyword_id = :kw AND platform = 'NAVER_PLACE' AND rank <= 10
+          AND captured_at = (SELECT MAX(captured_at) FROM {t} WHERE keyword_id = :kw AND platform = 'NAVER_PLACE')
+    """,
+    "sov_top_n_range (calculate_sov)": """
+        SELECT COUNT(*) FILTER (WHERE target_id = :target), COUNT(*) FROM {t}
+        WHERE keyword_id = :kw AND platform = 'NAVER_PLACE' AND rank <= 10
+          AND captured_at >= :since
+    """,
+    "target_history (rank trend)": """
+        SELECT captured_at, rank FROM {t}
+        WHERE keyword_id = :kw AND platform = 'NAVER_PLACE' AND target_id = :target
+          AND captured_at >= :since ORDER BY captured_at
+    """,
+    "target_keywords (competitor_intelligence)": """
+        SELECT keyword_id, AVG(rank) FROM {t}
+        WHERE target_id = :target AND platform = 'NAVER_PLACE' AND captured_at >= :since
+        GROUP BY keyword_id
+    """,
+    "client_week (report_builder)": """
+        SELECT COUNT(*), AVG(rank) FROM {t}
+        WHERE client_id = :client AND captured_at >= :since
+    """,
+}
+
+
+def _populate_sql(table: str, keywords: int, days: int) -> str:
+    # 하루 1회 스냅샷 × 키워드 × 플랫폼 × 상위 30위
+    return f"""
+        INSERT INTO {table} (id, client_id, target_id, keyword_id, platform, rank, rank_change, captured_at)
+        SELECT
+            gen_random_uuid(),
+            md5('client' || (k % {CLIENT_POOL}))::uuid,
+            md5('target' || ((k * 7 + r * 13 + d) % {TARGET_POOL}))::uuid,
+            md5('keyword' || k)::uuid,
+            p.platform,
+            r,
+            0,
+            date_trunc('day', now()) - make_interval(days => d) + interval '2 hours'
+        FROM generate_series(0, {days - 1}) d
+        CROSS JOIN generate_series(1, {keywords}) k
+        CROSS JOIN unnest(ARRAY{PLATFORMS}) AS p(platform)
+        CROSS JOIN generate_series(1, {RANKS_PER_SNAPSHOT}) r
+    """
+
+
+def _create_tables(conn, keywords: int, days: int):
+    columns = """
+        id uuid NOT NULL,
+        client_id uuid,
+        target_id uuid NOT NULL,
+        keyword_id uuid NOT NULL,
+        platform text NOT NULL,
+        rank integer NOT NULL,
+        rank_change integer DEFAULT 0,
+        captured_at timestamptz NOT NULL DEFAULT now()
+    """
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    print(f"[before] populating {SCHEMA}.ranks_plain ...")
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.ranks_plain ({columns}, PRIMARY KEY (id))"))
+    conn.execute(text(_populate_sql(f"{SCHEMA}.ranks_plain", keywords, days)))
+    conn.execute(text(f"ANALYZE {SCHEMA}.ranks_plain"))
+
+    print(f"[indexed] building {SCHEMA}.ranks_indexed ...")
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.ranks_indexed ({columns}, PRIMARY KEY (id))"))
+    conn.execute(text(f"INSERT INTO {SCHEMA}.ranks_indexed SELECT * FROM {SCHEMA}.ranks_plain"))
+    for ddl in INDEXES:
+        conn.execute(text(ddl.format(t=f"{SCHEMA}.ranks_indexed")))
+    conn.execute(text(f"ANALYZE {SCHEMA}.ranks_indexed"))
+
+    print(f"[after] building {SCHEMA}.ranks_partitioned ...")
+    conn.execute(text(
+        f"CREATE TABLE {SCHEMA}.ranks_partitioned ({columns}, PRIMARY KEY (id, captured_at)) "
+        f"PARTITION BY RANGE (captured_at)"
+    ))
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.ranks_partitioned_default PARTITION OF {SCHEMA}.ranks_partitioned DEFAULT"))
+    months = math.ceil(days / 28) + 1
+    for i in range(months + 1):
+        conn.execute(text(f"""
+            DO $$
+            DECLARE m date := (date_trunc('month', now()) - make_interval(months => {i}))::date;
+            BEGIN
+                EXECUTE format('CREATE TABLE {SCHEMA}.%I PARTITION OF {SCHEMA}.ranks_partitioned FOR VALUES FROM (%L) TO (%L)',
+                               'ranks_' || to_char(m, 'YYYY_MM'), m, (m + interval '1 month')::date);
+            END $$;
+        """))
+    for ddl in INDEXES:
+        conn.execute(text(ddl.format(t=f"{SCHEMA}.ranks_partitioned")))
+    conn.execute(text(f"INSERT INTO {SCHEMA}.ranks_partitioned SELECT * FROM {SCHEMA}.ranks_plain"))
+    conn.execute(text(f"ANALYZE {SCHEMA}.ranks_partitioned"))
+
+
+def _time_query(conn, sql: str, params: dict, repeat: int) -> float:
+    """EXPLAIN ANALYZE 실행 시간(ms)의 중앙값."""
+    timings = []
+    for _ in range(repeat):
+        plan = conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params).scalar()
+        timings.append(plan[0]["Execution Time"])
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.getenv("BENCHMARK_DATABASE_URL"), help="벤치마크용 Postgres URL")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--keywords", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="측정 후 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    if not args.url:
+        parser.error("--url 또는 BENCHMARK_DATABASE_URL 이 필요합니다 (운영 DB 사용 금지)")
+
+    days = max(1, math.ceil(args.rows / (args.keywords * len(PLATFORMS) * RANKS_PER_SNAPSHOT)))
+    engine = create_engine(args.url.replace("postgres://", "postgresql://", 1))
+
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.execute(text("SET statement_timeout = 0"))
+        t0 = time.monotonic()
+        _create_tables(conn, args.keywords, days)
+        total = conn.execute(text(f"SELECT COUNT(*) FROM {SCHEMA}.ranks_plain")).scalar()
+        print(f"Loaded {total:,} rows ({days} days × {args.keywords} keywords) in {time.monotonic() - t0:.0f}s\n")
+
+        params = {
+            "kw": conn.execute(text("SELECT md5('keyword' || 42)::uuid")).scalar(),
+            "target": conn.execute(text(f"SELECT target_id FROM {SCHEMA}.ranks_plain WHERE keyword_id = md5('keyword' || 42)::uuid LIMIT 1")).scalar(),
+            "client": conn.execute(text("SELECT md5('client' || 7)::uuid")).scalar(),
+            "since": conn.execute(text("SELECT now() - interval '7 days'")).scalar(),
+        }
+
+        print(f"{'query':<48}{'before (ms)':>14}{'indexed (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+        print("-" * 100)
+        for name, sql in QUERIES.items():
+            before = _time_query(conn, sql.format(t=f"{SCHEMA}.ranks_plain"), params, args.repeat)
+            indexed = _time_query(conn, sql.format(t=f"{SCHEMA}.ranks_indexed"), params, args.repeat)
+            after = _time_query(conn, sql.format(t=f"{SCHEMA}.ranks_partitioned"), params, args.repeat)
+            speedup = before / after if after > 0 else float("inf")
+            print(f"{name:<48}{before:>14.2f}{indexed:>14.2f}{after:>14.2f}{speedup:>9.1f}x")
+
+        if not args.keep:
+            conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+공용 테스트 fixture
+- engine / session_factory / db: 테스트마다 새로 만드는 SQLite in-memory DB (모든 모델 테이블 생성)
+  StaticPool 이라 여러 세션/스레드가 같은 메모리 DB 를 본다
+"""
+import pytest
+
+
+@pytest.fixture
+def engine():
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from app.core.database import Base
+    import app.models.models  # noqa: F401 - 테이블 등록
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    from sqlalchemy.orm import sessionmaker
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
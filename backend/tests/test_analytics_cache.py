@@ -0,0 +1,139 @@
+"""
+분석 결과 2단 캐시 테스트 (SQLite in-memory)
+- @cached_analytics 키 생성 (기본값/날짜 포함) / LRU 미스 후 테이블 히트 / prefix 무효화 / 캐시 테이블 장애 무시
+- 미스 시 캐시 세션이 계산 전에 연결을 반환하는지
+"""
+import datetime
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.lru_cache import LRUCache
+from app.models.models import AnalyticsCache
+from app.services import analytics_cache
+from app.services.analytics_cache import TwoTierAnalyticsCache, cached_analytics
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TwoTierAnalyticsCache(LRUCache(maxsize=32, ttl_seconds=300))
+    monkeypatch.setattr(analytics_cache, "_cache", cache)
+    return cache
+
+
+class ReportService:
+    def __init__(self, db):
+        self.db = db
+        self.calls = []
+
+    @cached_analytics()
+    def summary(self, client_id, days: int = 30):
+        self.calls.append(("summary", days))
+        return {"days": days, "as_of": datetime.date(2026, 1, 1)}
+
+    @cached_analytics()
+    def funnel(self, client_id):
+        self.calls.append(("funnel",))
+        return {"stages": [1, 2, 3]}
+
+
+def test_key_includes_defaults(db, cache):
+    service = ReportService(db)
+    client_id = uuid.uuid4()
+    first = service.summary(client_id)
+    assert service.summary(client_id, 30) == first
+    assert service.summary(client_id=str(client_id), days=30) == first
+    service.summary(client_id, days=7)
+    assert service.calls == [("summary", 30), ("summary", 7)]
+    # 결과는 JSON 정규화된 형태 (미스/히트 동일)
+    assert first == {"days": 30, "as_of": "2026-01-01"}
+
+
+def test_non_uuid_client_is_not_cached(db, cache):
+    service = ReportService(db)
+    service.funnel("not-a-uuid")
+    service.funnel("not-a-uuid")
+    assert len(service.calls) == 2
+    assert db.query(AnalyticsCache).count() == 0
+
+
+def test_table_hit_after_lru_miss(db, cache):
+    client_id = uuid.uuid4()
+    ReportService(db).summary(client_id)
+    cache.lru.clear()  # 다른 인스턴스 / 재시작 상황
+
+    service = ReportService(db)
+    assert service.summary(client_id) == {"days": 30, "as_of": "2026-01-01"}
+    assert service.calls == []
+    assert cache.stats()["db"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_prefix_invalidation_clears_both_tiers(db, cache):
+    client_id, other_client = uuid.uuid4(), uuid.uuid4()
+    service = ReportService(db)
+    service.summary(client_id)
+    service.funnel(client_id)
+    service.funnel(other_client)
+
+    removed = analytics_cache.invalidate_client_analytics(db, str(client_id), prefix=ReportService.summary.cache_namespace)
+    db.commit()
+    assert removed == 1
+
+    service.calls.clear()
+    service.summary(client_id)
+    service.funnel(client_id)
+    service.funnel(other_client)
+    assert service.calls == [("summary", 30)]
+
+
+def test_cache_table_failure_falls_back_to_compute(engine, db, cache):
+    AnalyticsCache.__table__.drop(engine)
+    service = ReportService(db)
+    client_id = uuid.uuid4()
+    assert service.funnel(client_id) == {"stages": [1, 2, 3]}
+    assert service.funnel(client_id) == {"stages": [1, 2, 3]}  # LRU 에서
+    assert service.calls == [("funnel",)]
+    assert cache.stats()["db"]["misses"] == 1
+
+
+def test_key_changes_at_day_boundary(db, cache, monkeypatch):
+    service = ReportService(db)
+    client_id = uuid.uuid4()
+    monkeypatch.setattr(analytics_cache, "_today", lambda: datetime.date(2026, 10, 16))
+    service.summary(client_id)
+    service.summary(client_id)
+    # 자정이 지나면 end_date=None 기본 기간이 달라지므로 TTL 안이라도 다시 계산
+    monkeypatch.setattr(analytics_cache, "_today", lambda: datetime.date(2026, 10, 17))
+    service.summary(client_id)
+    assert service.calls == [("summary", 30), ("summary", 30)]
+
+
+def test_cache_session_released_before_compute(tmp_path, cache):
+    from sqlalchemy import text
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    checked_out = []
+
+    class PoolProbe:
+        def __init__(self, db):
+            self.db = db
+
+        @cached_analytics()
+        def heavy(self, client_id):
+            self.db.execute(text("SELECT 1"))
+            checked_out.append(engine.pool.checkedout())
+            return {"ok": True}
+
+    PoolProbe(db).heavy(uuid.uuid4())
+    # 계산 중에는 호출자 세션의 연결 1개만 (캐시 조회 세션은 이미 반환)
+    assert checked_out == [1]
+    db.close()
+    assert engine.pool.checkedout() == 0
+    engine.dispose()
@@ -0,0 +1,87 @@
+"""
+지표 이상치 탐지 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import datetime
+
+import numpy as np
+
+from app.core.algorithms.anomaly import (
+    build_matrices, detect_metric_anomalies, flagged_checks, rolling_outliers, safe_ratio, trailing_windows,
+)
+
+D0 = datetime.date(2026, 9, 1)
+
+
+def _steady(days=30, value=100.0, jitter=5.0):
+    return np.array([value + (jitter if i % 2 else -jitter) for i in range(days)])
+
+
+class TestTrailingWindows:
+    def test_excludes_current_day(self):
+        windows = trailing_windows(np.array([[1.0, 2.0, 3.0, 4.0]]), 2)
+        assert windows.shape == (1, 4, 2)
+        assert np.isnan(windows[0, 0]).all()
+        assert windows[0, 3].tolist() == [2.0, 3.0]
+
+
+class TestRollingOutliers:
+    def test_spike_flagged_by_both_checks(self):
+        series = _steady()
+        series[-1] = 500.0
+        result = rolling_outliers(series[None, :])
+        assert result["zscore"][0, -1] and result["iqr"][0, -1]
+        assert not result["zscore"][0, :-1].any()
+        assert not result["iqr"][0, :-1].any()
+
+    def test_short_history_not_judged(self):
+        series = np.array([[100.0, 100.0, 105.0, 1000.0]])
+        result = rolling_outliers(series, min_history=7)
+        assert not result["zscore"].any() and not result["iqr"].any()
+        assert np.isnan(result["z"]).all()
+
+    def test_missing_days_are_ignored(self):
+        series = _steady()
+        series[5:10] = np.nan
+        result = rolling_outliers(series[None, :])
+        assert not result["zscore"].any()
+
+    def test_campaigns_use_their_own_history(self):
+        small, large = _steady(value=10.0, jitter=1.0), _steady(value=10000.0, jitter=100.0)
+        result = rolling_outliers(np.vstack([small, large]))
+        assert not result["zscore"].any() and not result["iqr"].any()
+
+
+class TestMetricAnomalies:
+    def test_ctr_and_cvr_ratios(self):
+        ratio = safe_ratio(np.array([5.0, 1.0, np.nan]), np.array([100.0, 0.0, 10.0]))
+        assert ratio[0] == 0.05 and np.isnan(ratio[1]) and np.isnan(ratio[2])
+
+    def test_ctr_drop_flagged(self):
+        days = 30
+        impressions = np.full((1, days), 1000.0)
+        clicks = np.array([[50.0 + (i % 3) for i in range(days)]])
+        clicks[0, -1] = 0.0
+        anomalies = detect_metric_anomalies(_steady(days)[None, :], impressions, clicks, clicks / 10)
+        flagged = flagged_checks(anomalies, np.array([0]), days - 1)
+        assert flagged["ctr_zscore"] == [0]
+        assert flagged["spend_zscore"] == []
+        assert set(flagged) == {f"{m}_{c}" for m in ("spend", "ctr", "cvr") for c in ("zscore", "iqr")}
+
+    def test_flagged_checks_without_data(self):
+        anomalies = detect_metric_anomalies(*(np.empty((0, 0)),) * 4)
+        assert all(v == [] for v in flagged_checks(anomalies, np.array([], dtype=np.intp), None).values())
+
+
+class TestBuildMatrices:
+    def test_dense_date_grid(self):
+        rows = [
+            ("cp1", D0, 10.0, 100),
+            ("cp1", D0 + datetime.timedelta(days=2), 30.0, 300),
+            ("cp2", D0 + datetime.timedelta(days=1), None, 200),
+        ]
+        campaign_ids, days, m = build_matrices(rows, ("spend", "impressions"))
+        assert campaign_ids == ["cp1", "cp2"]
+        assert days == [D0 + datetime.timedelta(days=i) for i in range(3)]
+        assert m["spend"][0].tolist()[0] == 10.0 and np.isnan(m["spend"][0, 1])
+        assert m["spend"][1, 1] == 0.0
@@ -0,0 +1,78 @@
+"""
+비동기 DB 레이어 테스트
+- URL 변환 / 연결 예산 분배 (순수 로직)
+- AsyncDB.run_sync 가 실제 AsyncSession (aiosqlite) 위에서 sync 서비스 코드를 실행하는지
+"""
+import asyncio
+
+import pytest
+
+from app.core.async_database import AsyncDB, split_pool_budget, to_async_url
+
+
+class TestToAsyncUrl:
+    def test_postgres_schemes_use_psycopg(self):
+        assert to_async_url("postgres://u:p@h:6543/db") == "postgresql+psycopg://u:p@h:6543/db"
+        assert to_async_url("postgresql://u:p@h/db?sslmode=require") == "postgresql+psycopg://u:p@h/db?sslmode=require"
+        assert to_async_url("postgresql+psycopg2://u@h/db") == "postgresql+psycopg://u@h/db"
+
+    def test_non_postgres_falls_back(self):
+        assert to_async_url("sqlite:///./test.db") is None
+
+
+class TestSplitPoolBudget:
+    def test_async_share_comes_out_of_the_same_budget(self):
+        budget = split_pool_budget(10, 4, async_enabled=True)
+        assert budget == {"sync": {"pool_size": 2, "max_overflow": 4}, "async": {"pool_size": 1, "max_overflow": 3}}
+        assert sum(p["pool_size"] + p["max_overflow"] for p in budget.values()) == 10
+
+    def test_sync_keeps_whole_budget_without_async(self):
+        budget = split_pool_budget(10, 4, async_enabled=False)
+        assert budget["sync"] == {"pool_size": 3, "max_overflow": 7}
+        assert budget["async"] == {"pool_size": 0, "max_overflow": 0}
+
+    def test_sync_always_keeps_a_connection(self):
+        budget = split_pool_budget(3, 8, async_enabled=True)
+        assert budget["sync"]["pool_size"] == 1
+        assert sum(p["pool_size"] + p["max_overflow"] for p in budget.values()) == 3
+
+
+def test_run_sync_through_async_session():
+    """AsyncSession.run_sync 경로로 sync 서비스 코드 실행 (aiosqlite)."""
+    pytest.importorskip("aiosqlite")
+    import uuid
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from app.core.database import Base
+    from app.models.models import Keyword, LatestRankSnapshot, PlatformType, Target, TargetType
+    from app.services.analysis import AnalysisService
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with factory() as session:
+            keyword = Keyword(id=uuid.uuid4(), term="임플란트")
+            targets = [Target(id=uuid.uuid4(), name=f"치과{i}", type=TargetType.OTHERS) for i in range(3)]
+            session.add_all([keyword] + targets)
+            await session.flush()
+            session.add_all([
+                LatestRankSnapshot(keyword_id=keyword.id, platform=PlatformType.NAVER_PLACE, position=i,
+                                   target_id=t.id, rank=i + 1, snapshot_id=uuid.uuid4())
+                for i, t in enumerate(targets)
+            ])
+            await session.commit()
+
+        async with factory() as session:
+            db = AsyncDB(session)
+            assert db.is_async
+            ranks = await db.run_sync(
+                lambda sync_db: AnalysisService(sync_db).get_daily_ranks("임플란트", PlatformType.NAVER_PLACE)
+            )
+        await engine.dispose()
+        return ranks
+
+    ranks = asyncio.run(main())
+    assert [(r["rank"], r["title"]) for r in ranks] == [(1, "치과0"), (2, "치과1"), (3, "치과2")]
@@ -0,0 +1,147 @@
+"""
+Playwright 브라우저 풀 단위 테스트 (가짜 브라우저 - 실제 Playwright 실행 없음)
+- 컨텍스트 상한 / pages_per_context 재생성 / 연결 끊김 시 재기동
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from app.scrapers import browser_pool
+from app.scrapers.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+        self.browser.open_contexts -= 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.open_contexts = 0
+        self.max_open_contexts = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        self.open_contexts += 1
+        self.max_open_contexts = max(self.max_open_contexts, self.open_contexts)
+        return FakeContext(self, options)
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **kwargs):
+        self.browsers.append(FakeBrowser())
+        return self.browsers[-1]
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: fake)
+    return fake
+
+
+def _options():
+    return {"user_agent": "test"}
+
+
+def test_concurrent_pages_respect_context_cap(fake_playwright):
+    pool = BrowserPool(max_contexts=2, pages_per_context=100)
+
+    async def use(profile):
+        async with pool.page(profile, _options):
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(use("mobile" if i % 2 else "desktop") for i in range(10)))
+        await pool.close()
+
+    asyncio.run(main())
+    browser = fake_playwright.browsers[0]
+    assert len(fake_playwright.browsers) == 1
+    assert browser.max_open_contexts <= 2
+    assert pool.stats["pages_served"] == 10
+
+
+def test_context_recycled_after_pages_per_context(fake_playwright):
+    pool = BrowserPool(max_contexts=1, pages_per_context=3)
+    contexts = []
+
+    async def main():
+        for _ in range(7):
+            async with pool.page("mobile", _options) as page:
+                contexts.append(page.context)
+        await pool.close()
+
+    asyncio.run(main())
+    # 3 페이지마다 새 컨텍스트 (7 페이지 → 3개), 다 쓴 컨텍스트는 닫힌다
+    assert [contexts.index(c) for c in contexts] == [0, 0, 0, 3, 3, 3, 6]
+    assert pool.stats["contexts_created"] == 3
+    assert contexts[0].closed and contexts[3].closed
+
+
+def test_failed_page_context_is_not_reused(fake_playwright):
+    pool = BrowserPool(max_contexts=1, pages_per_context=10)
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            async with pool.page("mobile", _options):
+                raise RuntimeError("scrape failed")
+        async with pool.page("mobile", _options):
+            pass
+
+    asyncio.run(main())
+    assert pool.stats["contexts_created"] == 2
+
+
+def test_relaunch_when_browser_disconnected(fake_playwright):
+    pool = BrowserPool(max_contexts=2, pages_per_context=10)
+
+    async def main():
+        async with pool.page("mobile", _options):
+            pass
+        fake_playwright.browsers[0].connected = False  # 원격 브라우저 연결 끊김
+        async with pool.page("mobile", _options):
+            pass
+        return pool.snapshot()
+
+    snapshot = asyncio.run(main())
+    assert len(fake_playwright.browsers) == 2
+    assert pool.stats["browser_launches"] == 2
+    # 끊긴 브라우저의 유휴 컨텍스트는 버리고 새 브라우저에서 컨텍스트를 만든다
+    assert pool.stats["contexts_created"] == 2
+    assert snapshot["healthy"] and snapshot["open_contexts"] == 1
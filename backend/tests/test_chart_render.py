@@ -0,0 +1,50 @@
+"""
+리포트 차트 렌더링 단위 테스트
+- spec 정규화 / content hash / PNG 캐시 (프로세스 풀 없이 현재 프로세스에서 렌더링) / 워커 수 상한
+"""
+from unittest.mock import patch
+
+from app.services import chart_render
+from app.services.chart_render import chart_key, chart_spec, render_charts
+
+
+def test_chart_spec_keeps_only_rendered_values():
+    spec = chart_spec("roi", {"campaigns": [{"name": "임플란트 검색광고 캠페인 A", "roi": 120.5, "spend": 1000}]})
+    assert spec == {"kind": "roi", "labels": ["임플란트 검색광고 캠페인 A"[:15]], "values": [120.5]}
+    assert chart_spec("funnel", {"stages": []}) is None
+    assert chart_spec("trend", {}) is None
+
+
+def test_chart_key_depends_on_content_only():
+    a = chart_spec("trend", {"data": [{"date": "2026-01-01", "value": 3}], "title": "무시됨"})
+    b = chart_spec("trend", {"data": [{"value": 3, "date": "2026-01-01"}]})
+    c = chart_spec("trend", {"data": [{"date": "2026-01-01", "value": 4}]})
+    assert chart_key(a) == chart_key(b)
+    assert chart_key(a) != chart_key(c)
+    assert chart_key(a) != chart_key({**a, "kind": "funnel"})
+
+
+def test_render_charts_caches_png_by_content_hash():
+    spec = chart_spec("funnel", {"stages": [{"name": "노출", "value": 1000}, {"name": "클릭", "value": 50}]})
+    with patch.object(chart_render, "_png_cache", chart_render.LRUCache(maxsize=8)), \
+         patch.object(chart_render, "_get_pool", return_value=None), \
+         patch.object(chart_render, "render_chart_png", wraps=chart_render.render_chart_png) as render:
+        first = render_charts([spec, dict(spec)])
+        second = render_charts([spec])
+    assert render.call_count == 1  # 중복 spec 과 두 번째 호출은 캐시에서
+    png = first[chart_key(spec)]
+    assert png.startswith(b"\x89PNG")
+    assert second == first
+
+
+def test_worker_count_capped_by_cpus_and_charts():
+    from app.core.config import settings
+    with patch.object(settings, "PDF_RENDER_WORKERS", 4), \
+         patch.object(chart_render, "_available_cpus", return_value=3):
+        assert chart_render._worker_count() == 3
+        assert chart_render._worker_count(charts=2) == 2
+        assert chart_render._get_pool(charts=1) is None
+    with patch.object(settings, "PDF_RENDER_WORKERS", 2), \
+         patch.object(chart_render, "_available_cpus", return_value=1):
+        assert chart_render._worker_count(charts=5) == 1  # CPU 1개 할당 → 풀 없이 렌더링
+        assert chart_render._get_pool(charts=5) is None
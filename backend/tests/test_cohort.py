@@ -0,0 +1,39 @@
+"""
+코호트 리텐션 매트릭스 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+from app.core.algorithms.cohort import build_cohort_matrix, month_offset
+
+
+class TestMonthOffset:
+    def test_across_year_boundary(self):
+        assert month_offset("2025-11", "2026-02") == 3
+        assert month_offset("2026-01", "2026-01") == 0
+
+
+class TestBuildCohortMatrix:
+    ROWS = [
+        # cohort_month, size, offset, active, conversions, revenue
+        ("2026-01", 10, 0, 10, 2, 100.0),
+        ("2026-01", 10, 1, 5, 1, 50.0),
+        ("2026-01", 10, 3, 2, 0, 0.0),  # 2개월 차 활동 없음
+        ("2026-02", 4, None, None, None, None),  # 활동 기록 없는 코호트
+    ]
+
+    def test_retention_fills_gaps(self):
+        jan = build_cohort_matrix(self.ROWS)[0]
+        assert jan["retention"] == [100.0, 50.0, 0.0, 20.0]
+        assert jan["active"][:4] == [10, 5, 0, 2]
+        assert (jan["conversions"], jan["revenue"]) == (3, 150.0)
+
+    def test_cohort_without_activity(self):
+        feb = build_cohort_matrix(self.ROWS)[1]
+        assert feb["month"] == "2026-02"
+        assert feb["retention"] == [100.0]
+        assert feb["conversions"] == 0
+
+    def test_offsets_beyond_window_are_ignored(self):
+        rows = [("2026-01", 4, 0, 4, 0, 0), ("2026-01", 4, 9, 1, 1, 10.0)]
+        cohort = build_cohort_matrix(rows, max_offset=5)[0]
+        assert cohort["retention"] == [100.0]
+        assert cohort["conversions"] == 1
@@ -0,0 +1,68 @@
+"""
+스트리밍 내보내기 포맷 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import csv
+import datetime
+import io
+import json
+
+import pytest
+
+from app.core.export_stream import check_export_format, iter_csv, iter_ndjson, iter_parquet, stream_export
+from app.models.models import PlatformType
+
+COLUMNS = [("captured_at", "datetime"), ("platform", "str"), ("keyword", "str"), ("rank", "int")]
+
+
+def _rows(n):
+    base = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    for i in range(n):
+        yield {"captured_at": base + datetime.timedelta(hours=i), "platform": PlatformType.NAVER_PLACE,
+               "keyword": f"임플란트 {i}", "rank": i % 10 + 1}
+
+
+def test_csv_streams_in_batches_with_bom_header():
+    chunks = list(iter_csv(COLUMNS, _rows(25), batch_size=10))
+    assert len(chunks) == 4  # 헤더 + 3 배치
+    assert chunks[0].startswith(b"\xef\xbb\xbf")
+    parsed = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8-sig"))))
+    assert parsed[0] == ["captured_at", "platform", "keyword", "rank"]
+    assert parsed[1] == ["2026-01-01T00:00:00+00:00", "NAVER_PLACE", "임플란트 0", "1"]
+    assert len(parsed) == 26
+
+
+def test_ndjson_one_object_per_line():
+    lines = b"".join(iter_ndjson(COLUMNS, _rows(3), batch_size=2)).decode("utf-8").splitlines()
+    assert [json.loads(line)["rank"] for line in lines] == [1, 2, 3]
+    assert json.loads(lines[0])["platform"] == "NAVER_PLACE"
+
+
+def test_rows_are_consumed_lazily():
+    consumed = []
+
+    def tracking():
+        for row in _rows(100):
+            consumed.append(row)
+            yield row
+
+    stream = iter_ndjson(COLUMNS, tracking(), batch_size=10)
+    next(stream)
+    assert len(consumed) == 10
+
+
+def test_parquet_round_trip():
+    pq = pytest.importorskip("pyarrow.parquet")
+    chunks = list(iter_parquet(COLUMNS, _rows(25), batch_size=10))
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+    assert table.num_rows == 25
+    assert pq.ParquetFile(io.BytesIO(b"".join(chunks))).metadata.num_row_groups == 3
+    assert table.column("rank").to_pylist()[:3] == [1, 2, 3]
+    assert table.column("platform").to_pylist()[0] == "NAVER_PLACE"
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        check_export_format("xlsx")
+    with pytest.raises(ValueError):
+        stream_export("xml", COLUMNS, [])
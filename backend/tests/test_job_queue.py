@@ -0,0 +1,168 @@
+"""
+작업 큐 테스트
+- 재시도 backoff 순수 로직
+- JobQueue (SQLite in-memory): dedupe / 점유 / 실패 재큐잉 → FAILED / stale 재큐잉
+- 워커: 스크래핑 실패가 핸들러 예외 → 재시도로 이어지는지
+"""
+import asyncio
+import datetime
+
+from app.core.algorithms.job_queue import backoff_seconds, should_retry
+
+
+class TestBackoff:
+    def test_exponential_until_cap(self):
+        assert [backoff_seconds(n, base=30, cap=200) for n in (1, 2, 3, 4)] == [30, 60, 120, 200]
+
+    def test_jitter_only_extends_delay(self):
+        assert backoff_seconds(2, base=30, jitter=0.2, rand=0.0) == 60
+        assert backoff_seconds(2, base=30, jitter=0.2, rand=1.0) == 72
+
+    def test_should_retry(self):
+        assert should_retry(2, 3)
+        assert not should_retry(3, 3)
+
+
+# ────────────────────────────────────────────────────────────
+# JobQueue (SQLite)
+# ────────────────────────────────────────────────────────────
+
+def _past(seconds: float) -> datetime.datetime:
+    return datetime.datetime.utcnow() - datetime.timedelta(seconds=seconds)
+
+
+class TestJobQueue:
+    def test_enqueue_dedupes_active_jobs(self, db):
+        from app.models.models import Job
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        first, created = queue.enqueue("scrape.place", {"keyword": "임플란트"}, dedupe_key="place:임플란트")
+        assert created
+        again, created = queue.enqueue("scrape.place", {"keyword": "임플란트"}, dedupe_key="place:임플란트")
+        assert not created and again.id == first.id
+
+        # 끝난 작업은 dedupe 대상이 아님
+        queue.complete(first)
+        _, created = queue.enqueue("scrape.place", {"keyword": "임플란트"}, dedupe_key="place:임플란트")
+        assert created
+        assert db.query(Job).count() == 2
+
+    def test_enqueue_integrity_error_returns_existing(self, db, monkeypatch):
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        existing, _ = queue.enqueue("sync.all", dedupe_key="sync:all")
+
+        # 다른 인스턴스가 get_active 확인 직후 먼저 넣은 상황 → 유니크 인덱스 위반 후 기존 작업 반환
+        real_get_active = queue.get_active
+        calls = []
+
+        def racing_get_active(key):
+            calls.append(key)
+            return None if len(calls) == 1 else real_get_active(key)
+
+        monkeypatch.setattr(queue, "get_active", racing_get_active)
+        job, created = queue.enqueue("sync.all", dedupe_key="sync:all")
+        assert not created and job.id == existing.id
+        assert len(calls) == 2
+
+    def test_claim_orders_by_priority_then_run_at(self, db):
+        from app.models.models import JobStatus
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        low, _ = queue.enqueue("scrape.view", {"n": 1})
+        high, _ = queue.enqueue("scrape.view", {"n": 2}, priority=5)
+        queue.enqueue("scrape.view", {"n": 3}, delay_seconds=3600)  # 아직 실행 시각 전
+        queue.enqueue("report.generate", {"n": 4}, priority=10)     # 다른 kind
+
+        claimed = [queue.claim("w1", kinds=["scrape.view"]) for _ in range(3)]
+        assert [job.id if job else None for job in claimed] == [high.id, low.id, None]
+        assert claimed[0].status == JobStatus.RUNNING
+        assert claimed[0].attempts == 1 and claimed[0].locked_by == "w1"
+
+    def test_fail_requeues_with_backoff_then_marks_failed(self, db):
+        from app.models.models import JobStatus
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        job, _ = queue.enqueue("sync.all", max_attempts=2)
+
+        job = queue.claim("w1")
+        assert queue.fail(job, "boom") is True
+        assert job.status == JobStatus.QUEUED and job.locked_by is None
+        assert job.run_at > datetime.datetime.utcnow()  # backoff 동안 점유 불가
+        assert queue.claim("w1") is None
+
+        job.run_at = _past(1)
+        db.commit()
+        job = queue.claim("w1")
+        assert job.attempts == 2
+        assert queue.fail(job, "boom again") is False
+        assert job.status == JobStatus.FAILED and job.last_error == "boom again"
+        assert job.finished_at is not None
+
+    def test_fail_without_retry_is_final(self, db):
+        from app.models.models import JobStatus
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        queue.enqueue("report.generate")
+        job = queue.claim("w1")
+        assert queue.fail(job, "report deleted", retry=False) is False
+        assert job.status == JobStatus.FAILED and job.attempts == 1
+
+    def test_requeue_stale_running_jobs(self, db):
+        from app.models.models import JobStatus
+        from app.services.job_queue import JobQueue
+
+        queue = JobQueue(db)
+        queue.enqueue("sync.all", {"n": 1})
+        queue.enqueue("sync.all", {"n": 2})
+        stale, fresh = queue.claim("dead-worker"), queue.claim("w2")
+        stale.locked_at = _past(3600)
+        db.commit()
+
+        assert queue.heartbeat(fresh.id, "w2") is True
+        assert queue.heartbeat(stale.id, "w2") is False  # 다른 워커의 작업은 갱신하지 않음
+        assert queue.requeue_stale(900) == 1
+        db.refresh(stale)
+        db.refresh(fresh)
+        assert stale.status == JobStatus.QUEUED and stale.locked_by is None
+        assert stale.attempts == 1  # 재시도 횟수 유지
+        assert fresh.status == JobStatus.RUNNING
+
+        reclaimed = queue.claim("w3")
+        assert reclaimed.id == stale.id and reclaimed.attempts == 2
+
+
+# ────────────────────────────────────────────────────────────
+# 워커 → 재시도
+# ────────────────────────────────────────────────────────────
+
+def test_scrape_failure_is_retried_by_worker(session_factory, monkeypatch):
+    from app.core import database
+    from app.models.models import Job, JobStatus
+    from app.scrapers.naver_place import NaverPlaceScraper
+    from app.services.job_queue import JobQueue
+    from app.worker.job_worker import JobWorker, _claim
+
+    async def failing_rankings(self, keyword):
+        raise RuntimeError("blocked by captcha")
+
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    monkeypatch.setattr(NaverPlaceScraper, "get_rankings", failing_rankings)
+
+    db = session_factory()
+    job_id = JobQueue(db).enqueue("scrape.place", {"keyword": "임플란트"})[0].id
+    db.close()
+
+    worker = JobWorker(kinds=["scrape.place"])
+    asyncio.run(worker.execute(_claim(worker.worker_id, worker.kinds)))
+
+    db = session_factory()
+    job = db.query(Job).filter(Job.id == job_id).one()
+    assert job.status == JobStatus.QUEUED and job.attempts == 1
+    assert job.last_error.startswith("ScrapeTaskError") and "blocked by captcha" in job.last_error
+    db.close()
@@ -0,0 +1,50 @@
+"""
+프로세스 내 LRU 캐시 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+from app.core.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_entry_ttl_capped_by_cache_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1, ttl_seconds=3600)
+        clock.now = 11
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate_group(self):
+        cache = LRUCache()
+        cache.set(("c1", "funnel"), 1, group="c1")
+        cache.set(("c1", "cohort"), 2, group="c1")
+        cache.set(("c2", "funnel"), 3, group="c2")
+        assert cache.invalidate_group("c1", lambda key: key[1] == "cohort") == 1
+        assert cache.get(("c1", "funnel")) == (True, 1)
+        assert cache.invalidate_group("c1") == 1
+        assert cache.get(("c2", "funnel")) == (True, 3)
+
+    def test_hit_rate(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        assert cache.stats()["hit_rate"] == 0.5
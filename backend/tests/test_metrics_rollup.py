@@ -0,0 +1,45 @@
+"""
+지표 롤업 집계 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import datetime
+
+from app.core.algorithms.metrics_rollup import roll_up_daily, roll_up_monthly, to_records
+
+D1 = datetime.datetime(2026, 9, 30)
+D2 = datetime.datetime(2026, 10, 1)
+D3 = datetime.datetime(2026, 10, 15, 13, 0)
+
+ROWS = [
+    # client, platform, campaign, source, date, spend, impressions, clicks, conversions, revenue
+    ("c1", "NAVER_AD", "cp1", "API", D1, 100.0, 10, 2, 1, 0.0),
+    ("c1", "NAVER_AD", "cp1", "API", D2, 200.0, 20, 4, 0, None),
+    ("c1", "NAVER_AD", "cp1", "API", D3, 300.0, 30, 6, 2, 50.0),
+    ("c1", "NAVER_AD", "cp1", "RECONCILED", D3, 300.0, 30, 6, 2, 50.0),
+]
+
+
+class TestRollUp:
+    def test_daily_keys_are_dates(self):
+        totals = roll_up_daily(ROWS)
+        assert ("c1", "NAVER_AD", "cp1", "API", datetime.date(2026, 10, 15)) in totals
+        assert len(totals) == 4
+
+    def test_daily_sums_duplicate_rows(self):
+        totals = roll_up_daily(ROWS + [ROWS[0]])
+        assert totals[("c1", "NAVER_AD", "cp1", "API", datetime.date(2026, 9, 30))]["spend"] == 200.0
+
+    def test_monthly_buckets_by_first_day(self):
+        totals = roll_up_monthly(ROWS)
+        october = totals[("c1", "NAVER_AD", "cp1", "API", datetime.date(2026, 10, 1))]
+        assert october == {"spend": 500.0, "impressions": 50, "clicks": 10, "conversions": 2, "revenue": 50.0}
+        assert ("c1", "NAVER_AD", "cp1", "API", datetime.date(2026, 9, 1)) in totals
+        assert ("c1", "NAVER_AD", "cp1", "RECONCILED", datetime.date(2026, 10, 1)) in totals
+
+    def test_records_use_period_field(self):
+        records = to_records(roll_up_monthly(ROWS[:1]), "month")
+        assert records == [{
+            "client_id": "c1", "platform": "NAVER_AD", "campaign_id": "cp1", "source": "API",
+            "month": datetime.date(2026, 9, 1),
+            "spend": 100.0, "impressions": 10, "clicks": 2, "conversions": 1, "revenue": 0.0,
+        }]
@@ -0,0 +1,26 @@
+"""
+네이버 검색광고 /stats 묶음 조회 단위 테스트
+- 네트워크 없이 분할/응답 매핑 로직만 테스트
+"""
+from app.services.naver_ads_client import chunk_ids, map_stats_response
+
+
+class TestChunkIds:
+    def test_dedupes_and_splits(self):
+        assert chunk_ids(["a", "b", "a", None, "c", "d", "e"], 2) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+class TestMapStatsResponse:
+    def test_fans_out_by_id(self):
+        data = {"data": [
+            {"id": "kw-1", "impCnt": 10, "clickCnt": 2, "salesAmt": "1500", "convCnt": 1},
+            {"id": "kw-2", "impCnt": 0, "clickCnt": 0, "salesAmt": 0, "convCnt": 0, "ctr": None},
+        ]}
+        stats = map_stats_response(data)
+        assert stats["kw-1"]["spend"] == 1500.0
+        assert stats["kw-2"]["ctr"] == 0.0
+        assert set(stats) == {"kw-1", "kw-2"}
+
+    def test_empty_response(self):
+        assert map_stats_response(None) == {}
+        assert map_stats_response({"data": []}) == {}
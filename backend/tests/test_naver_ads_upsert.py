@@ -0,0 +1,118 @@
+"""
+네이버 검색광고 광고그룹/키워드/키워드 지표 upsert 테스트 (SQLite in-memory, 네트워크 없음)
+- 재동기화 시 external_id / (keyword_id, date) 기준으로 같은 행을 갱신하고 중복 행을 만들지 않는지 확인
+"""
+import datetime
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.models.models import AdGroup, AdKeyword, AdMetricsDaily, Campaign, MetricsDaily
+from app.services.naver_ads import NaverAdsService
+from app.services.naver_ads_client import parse_stats_record
+
+
+@pytest.fixture
+def campaign(db):
+    campaign = Campaign(id=uuid.uuid4(), connection_id=uuid.uuid4(), external_id="cmp-1", name="임플란트 캠페인")
+    db.add(campaign)
+    db.commit()
+    return campaign
+
+
+def _group(external_id, name, locked="N"):
+    return {"nccAdgroupId": external_id, "name": name, "userLock": locked}
+
+
+def _keyword(external_id, text, bid, locked="N"):
+    return {"nccKeywordId": external_id, "keyword": text, "bidAmt": bid, "userLock": locked}
+
+
+def _stats(impressions, clicks, spend):
+    return parse_stats_record({"impCnt": impressions, "clickCnt": clicks, "salesAmt": spend, "convCnt": 1,
+                               "ctr": 1.5, "cpc": 300})
+
+
+def test_ad_groups_update_in_place(db, campaign):
+    service = NaverAdsService(db)
+    first = service._save_ad_groups("cmp-1", [_group("grp-1", "강남"), _group("grp-2", "서초")])
+    ids = {g.external_id: g.id for g in first}
+
+    second = service._save_ad_groups("cmp-1", [_group("grp-1", "강남역", locked="Y"), _group("grp-3", "송파")])
+    assert [g.external_id for g in second] == ["grp-1", "grp-3"]
+    assert second[0].id == ids["grp-1"]
+    assert (second[0].name, second[0].status) == ("강남역", "PAUSED")
+
+    groups = {g.external_id: (g.id, g.name) for g in db.query(AdGroup).all()}
+    assert groups == {
+        "grp-1": (ids["grp-1"], "강남역"), "grp-2": (ids["grp-2"], "서초"), "grp-3": (second[1].id, "송파"),
+    }
+
+
+def test_keywords_update_in_place(db, campaign):
+    service = NaverAdsService(db)
+    service._save_ad_groups("cmp-1", [_group("grp-1", "강남")])
+    first = service._save_keywords("grp-1", [_keyword("kw-1", "임플란트", 500), _keyword("kw-2", "치아교정", 700)])
+
+    # 같은 응답 안의 중복 id 는 마지막 값만 반영
+    second = service._save_keywords("grp-1", [
+        _keyword("kw-1", "임플란트", 600), _keyword("kw-1", "임플란트", 800, locked="Y"),
+    ])
+    assert [kw.id for kw in second] == [first[0].id, first[0].id]
+    assert (second[0].bid_amt, second[0].status) == (800, "PAUSED")
+
+    assert db.query(AdKeyword).count() == 2
+    assert db.query(AdKeyword.bid_amt).filter(AdKeyword.external_id == "kw-2").scalar() == 700
+
+
+def test_keyword_metrics_upsert_by_keyword_and_date(db, campaign):
+    service = NaverAdsService(db)
+    group = service._save_ad_groups("cmp-1", [_group("grp-1", "강남")])[0]
+    kw1, kw2 = service._save_keywords("grp-1", [_keyword("kw-1", "임플란트", 500), _keyword("kw-2", "치아교정", 700)])
+    day = datetime.datetime(2026, 10, 1)
+
+    assert service._save_keyword_metrics([
+        (group.id, kw1.id, _stats(100, 5, 1500)), (group.id, kw2.id, _stats(50, 2, 600)),
+    ], day) == 2
+    db.commit()
+
+    # 같은 날짜 재동기화 (값 보정) + 다음 날짜
+    assert service._save_keyword_metrics([(group.id, kw1.id, _stats(120, 6, 1800))], day) == 1
+    assert service._save_keyword_metrics([(group.id, kw1.id, _stats(80, 3, 900))], day + datetime.timedelta(days=1)) == 1
+    db.commit()
+
+    rows = db.query(AdMetricsDaily.keyword_id, AdMetricsDaily.date, AdMetricsDaily.impressions, AdMetricsDaily.spend)\
+        .order_by(AdMetricsDaily.date, AdMetricsDaily.impressions).all()
+    assert [(r.keyword_id, r.date, r.impressions, r.spend) for r in rows] == [
+        (kw2.id, day, 50, 600.0),
+        (kw1.id, day, 120, 1800.0),
+        (kw1.id, day + datetime.timedelta(days=1), 80, 900.0),
+    ]
+    assert service._save_keyword_metrics([], day) == 0
+
+
+def test_resync_campaign_tree_does_not_duplicate(db, campaign, monkeypatch):
+    service = NaverAdsService(db)
+    responses = [
+        {"campaigns": {"cmp-1": [{"data": _group("grp-1", "강남"),
+                                  "keywords": [_keyword("kw-1", "임플란트", 500), _keyword("kw-2", "치아교정", 700)]}]},
+         "stats": {"cmp-1": _stats(150, 7, 2100), "kw-1": _stats(100, 5, 1500), "kw-2": _stats(50, 2, 600)}},
+        {"campaigns": {"cmp-1": [{"data": _group("grp-1", "강남역"),
+                                  "keywords": [_keyword("kw-1", "임플란트", 900), _keyword("kw-2", "치아교정", 700)]}]},
+         "stats": {"cmp-1": _stats(170, 8, 2400), "kw-1": _stats(120, 6, 1800), "kw-2": _stats(50, 2, 600)}},
+    ]
+
+    async def fake_tree(campaign_external_ids, date_str):
+        return responses.pop(0)
+
+    monkeypatch.setattr(service, "fetch_account_tree", fake_tree)
+    assert service.sync_all_campaign_metrics(campaign.connection_id, "2026-10-01") == 2
+    assert service.sync_all_campaign_metrics(campaign.connection_id, "2026-10-01") == 2
+
+    assert db.query(AdGroup.name).all() == [("강남역",)]
+    assert db.query(AdKeyword).count() == 2
+    assert db.query(AdKeyword.bid_amt).filter(AdKeyword.external_id == "kw-1").scalar() == 900
+    assert sorted(db.query(AdMetricsDaily.impressions).all()) == [(50,), (120,)]
+    assert db.query(MetricsDaily.impressions).filter(MetricsDaily.campaign_id == campaign.id).all() == [(170,)]
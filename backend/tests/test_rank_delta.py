@@ -0,0 +1,87 @@
+"""
+순위 변동(delta) 계산 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+from app.core.algorithms.rank_delta import (
+    best_positions,
+    diff_rank_positions,
+    rank_change,
+    summarize_rank_drops,
+)
+
+
+class TestRankChange:
+    def test_rise_is_positive(self):
+        assert rank_change(5, 2) == 3
+
+    def test_fall_is_negative(self):
+        assert rank_change(2, 7) == -5
+
+    def test_new_entry_or_dropout(self):
+        assert rank_change(None, 3) is None
+        assert rank_change(3, None) is None
+
+
+class TestBestPositions:
+    def test_keeps_highest_rank_per_target(self):
+        result = best_positions([(("kw", "P", "a"), 4), (("kw", "P", "a"), 2), (("kw", "P", "b"), 3)])
+        assert result == {("kw", "P", "a"): 2, ("kw", "P", "b"): 3}
+
+
+class TestDiffRankPositions:
+    def test_only_changed_positions_are_emitted(self):
+        previous = {("kw", "P", "a"): 1, ("kw", "P", "b"): 2}
+        current = {("kw", "P", "a"): 1, ("kw", "P", "b"): 4}
+        deltas = diff_rank_positions(previous, current)
+        assert deltas == [
+            {"key": ("kw", "P", "b"), "previous_rank": 2, "current_rank": 4, "rank_change": -2},
+        ]
+
+    def test_new_entry_and_dropout(self):
+        previous = {("kw", "P", "a"): 1}
+        current = {("kw", "P", "c"): 1}
+        deltas = {d["key"]: d for d in diff_rank_positions(previous, current)}
+        assert deltas[("kw", "P", "c")]["previous_rank"] is None
+        assert deltas[("kw", "P", "a")]["current_rank"] is None
+
+    def test_dropout_limited_to_observed_scopes(self):
+        # 이번 배치에 결과가 없는 키워드/플랫폼은 이탈로 보지 않는다
+        previous = {("kw", "P", "a"): 1, ("other", "P", "a"): 1, ("kw", "V", "a"): 1}
+        current = {("kw", "P", "a"): 1}
+        assert diff_rank_positions(previous, current) == []
+
+    def test_first_ingest_emits_all(self):
+        current = {("kw", "P", "a"): 1, ("kw", "P", "b"): 2}
+        assert len(diff_rank_positions({}, current)) == 2
+
+
+class TestSummarizeRankDrops:
+    def test_net_change_over_window(self):
+        deltas = [
+            {"key": "x", "previous_rank": 2, "current_rank": 5},
+            {"key": "x", "previous_rank": 5, "current_rank": 9},
+        ]
+        assert summarize_rank_drops(deltas, threshold=5) == [
+            {"key": "x", "previous_rank": 2, "current_rank": 9, "drop": 7},
+        ]
+
+    def test_recovered_position_is_not_a_drop(self):
+        deltas = [
+            {"key": "x", "previous_rank": 2, "current_rank": 9},
+            {"key": "x", "previous_rank": 9, "current_rank": 3},
+        ]
+        assert summarize_rank_drops(deltas, threshold=5) == []
+
+    def test_new_entries_and_dropouts_ignored(self):
+        deltas = [
+            {"key": "x", "previous_rank": None, "current_rank": 9},
+            {"key": "y", "previous_rank": 1, "current_rank": None},
+        ]
+        assert summarize_rank_drops(deltas, threshold=1) == []
+
+    def test_sorted_by_drop(self):
+        deltas = [
+            {"key": "a", "previous_rank": 1, "current_rank": 6},
+            {"key": "b", "previous_rank": 1, "current_rank": 10},
+        ]
+        assert [d["key"] for d in summarize_rank_drops(deltas, threshold=5)] == ["b", "a"]
@@ -0,0 +1,89 @@
+"""
+순위 일괄 저장 (RankIngestionService.save_batch) 테스트 (SQLite in-memory)
+- 두 배치를 연속 저장해 rank_change / RankDelta / 최신 스냅샷 / 마지막 순위 인덱스를 확인
+"""
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.models.models import (
+    DailyRank, Keyword, LatestRankSnapshot, PlatformType, RankDelta, RankPosition, RawScrapingLog, Target,
+)
+from app.services.rank_ingestion import RankIngestionService
+
+
+def _place(*names):
+    return [{"name": name, "rank": i + 1} for i, name in enumerate(names)]
+
+
+def _ranks_by_target(db, snapshot_id):
+    rows = db.query(Target.name, DailyRank.rank, DailyRank.rank_change)\
+        .join(Target, Target.id == DailyRank.target_id)\
+        .filter(DailyRank.snapshot_id == snapshot_id).all()
+    return {r.name: (r.rank, r.rank_change) for r in rows}
+
+
+def test_save_batch_tracks_rank_changes_across_batches(db):
+    service = RankIngestionService(db)
+    view = [{"blog_name": "치과블로그", "link": "https://blog/1", "rank": 1}]
+
+    saved = service.save_batch([
+        {"keyword": "임플란트", "platform": PlatformType.NAVER_PLACE, "results": _place("A치과", "B치과", "C치과")},
+        {"keyword": "치아교정", "platform": PlatformType.NAVER_VIEW, "results": view},
+    ])
+    first_snapshot = service.last_snapshot_id
+    assert saved == 4
+    assert _ranks_by_target(db, first_snapshot) == {
+        "A치과": (1, None), "B치과": (2, None), "C치과": (3, None), "치과블로그": (1, None),
+    }
+    assert db.query(RankDelta).count() == 4  # 모두 신규 진입
+
+    # 두 번째 배치: A/B 순위 교체, C 이탈, D 신규. 치아교정은 빈 결과 (스크래핑 실패) → 기존 순위 유지
+    saved = service.save_batch([
+        {"keyword": "임플란트", "platform": PlatformType.NAVER_PLACE, "results": _place("B치과", "A치과", "D치과")},
+        {"keyword": "치아교정", "platform": PlatformType.NAVER_VIEW, "results": []},
+    ])
+    second_snapshot = service.last_snapshot_id
+    assert saved == 3
+    assert _ranks_by_target(db, second_snapshot) == {"B치과": (1, 1), "A치과": (2, -1), "D치과": (3, None)}
+
+    deltas = db.query(Target.name, RankDelta.previous_rank, RankDelta.current_rank, RankDelta.rank_change)\
+        .join(Target, Target.id == RankDelta.target_id).all()
+    assert len(deltas) == 8
+    assert ("C치과", 3, None, None) in deltas
+    assert ("B치과", 2, 1, 1) in deltas and ("A치과", 1, 2, -1) in deltas
+
+    positions = {name: rank for name, rank in
+                 db.query(Target.name, RankPosition.rank).join(Target, Target.id == RankPosition.target_id).all()}
+    assert positions == {"B치과": 1, "A치과": 2, "D치과": 3, "치과블로그": 1}
+
+    snapshot = db.query(Keyword.term, Target.name, LatestRankSnapshot.position, LatestRankSnapshot.rank_change,
+                        LatestRankSnapshot.snapshot_id)\
+        .join(Keyword, Keyword.id == LatestRankSnapshot.keyword_id)\
+        .join(Target, Target.id == LatestRankSnapshot.target_id)\
+        .order_by(Keyword.term, LatestRankSnapshot.position).all()
+    assert [(s.term, s.name, s.position, s.rank_change) for s in snapshot] == [
+        ("임플란트", "B치과", 0, 1), ("임플란트", "A치과", 1, -1), ("임플란트", "D치과", 2, None),
+        ("치아교정", "치과블로그", 0, None),
+    ]
+    assert {s.term: s.snapshot_id for s in snapshot} == {"임플란트": second_snapshot, "치아교정": first_snapshot}
+
+    # 키워드/타겟은 재사용 (중복 생성 없음), 원본 로그는 항목마다 1건
+    assert db.query(Keyword).count() == 2
+    assert db.query(Target).count() == 5
+    assert db.query(RawScrapingLog).count() == 4
+
+
+def test_unscoped_batch_writes_to_lowest_id_keyword(db):
+    # 두 클라이언트가 같은 term 을 등록 - 조회 순서와 무관하게 id 가 가장 작은 키워드에 저장
+    ids = sorted([uuid.uuid4(), uuid.uuid4()])
+    db.add_all([Keyword(id=ids[1], term="임플란트", client_id=uuid.uuid4()),
+                Keyword(id=ids[0], term="임플란트", client_id=uuid.uuid4())])
+    db.commit()
+
+    RankIngestionService(db).save_batch([
+        {"keyword": "임플란트", "platform": PlatformType.NAVER_PLACE, "results": _place("A치과")},
+    ])
+    assert {r.keyword_id for r in db.query(DailyRank.keyword_id).all()} == {ids[0]}
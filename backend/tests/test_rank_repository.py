@@ -0,0 +1,128 @@
+"""
+순위 조회 경로 쿼리 수 회귀 테스트 (SQLite in-memory)
+- 행 수와 무관하게 쿼리 수가 고정인지 확인 (lazy-load N+1 방지)
+"""
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from app.core.query_counter import count_queries
+from app.models.models import Keyword, LatestRankSnapshot, PlatformType, Target, TargetType, DailyRank
+from app.services.rank_repository import RankReadRepository, RankRow
+
+ROWS = 15
+
+
+@pytest.fixture
+def seeded(db):
+    client_id = None
+    keywords = [Keyword(id=uuid.uuid4(), term=term, client_id=client_id) for term in ("임플란트", "치아교정")]
+    targets = [Target(id=uuid.uuid4(), name=f"치과{i}", type=TargetType.OTHERS, urls={"default": f"https://t/{i}"})
+               for i in range(ROWS)]
+    db.add_all(keywords + targets)
+    db.flush()
+    snapshot_id = uuid.uuid4()
+    for kw in keywords:
+        for i, t in enumerate(targets):
+            db.add(LatestRankSnapshot(keyword_id=kw.id, platform=PlatformType.NAVER_PLACE, position=i,
+                                      target_id=t.id, rank=i + 1, rank_change=0, snapshot_id=snapshot_id))
+            db.add(DailyRank(id=uuid.uuid4(), keyword_id=kw.id, target_id=t.id, platform=PlatformType.NAVER_PLACE,
+                             rank=i + 1, snapshot_id=snapshot_id))
+    keyword_ids = [kw.id for kw in keywords]
+    db.commit()
+    db.expunge_all()
+    return keyword_ids
+
+
+def test_current_ranking_single_query(db, seeded):
+    keyword_ids = seeded
+    with count_queries(db.get_bind()) as counter:
+        rows = RankReadRepository(db).current_ranking(keyword_ids[0], PlatformType.NAVER_PLACE)
+        names = [r.target_name for r in rows]
+    assert counter.count == 1
+    assert len(rows) == ROWS and isinstance(rows[0], RankRow)
+    assert names[0] == "치과0" and rows[0].url == "https://t/0"
+
+
+def test_current_ranking_top_n(db, seeded):
+    keyword_ids = seeded
+    rows = RankReadRepository(db).current_ranking(keyword_ids[0], PlatformType.NAVER_PLACE, top_n=5)
+    assert [r.rank for r in rows] == [1, 2, 3, 4, 5]
+
+
+def test_current_ranking_for_keywords_single_query(db, seeded):
+    keyword_ids = seeded
+    with count_queries(db.get_bind()) as counter:
+        rows = RankReadRepository(db).current_ranking_for_keywords(keyword_ids, PlatformType.NAVER_PLACE)
+    assert counter.count == 1
+    assert len(rows) == ROWS * len(keyword_ids)
+
+
+def test_get_daily_ranks_no_lazy_loads(db, seeded):
+    from app.services.analysis import AnalysisService
+    with count_queries(db.get_bind()) as counter:
+        ranks = AnalysisService(db).get_daily_ranks("임플란트", PlatformType.NAVER_PLACE)
+        [r["title"] for r in ranks]
+    # 키워드 조회 1 + 스냅샷 조회 1
+    assert counter.count == 2
+    assert len(ranks) == ROWS
+
+
+def test_competitor_landscape_no_lazy_loads(db, seeded):
+    from app.services.competitor_service import CompetitorService
+    with count_queries(db.get_bind()) as counter:
+        result = CompetitorService(db).get_competitor_landscape("임플란트", PlatformType.NAVER_PLACE, top_n=10)
+    assert counter.count == 2
+    assert result["total_slots"] == 10
+
+
+def test_sov_batch_single_query(db, seeded):
+    from app.services.analysis import AnalysisService
+    with count_queries(db.get_bind()) as counter:
+        results = AnalysisService(db).calculate_sov_batch(
+            ["임플란트", "치아교정", "없는키워드"], "치과0", PlatformType.NAVER_PLACE, top_n=5
+        )
+    assert counter.count == 1
+    assert [r["hits"] for r in results] == [1, 1, 0]
+
+
+def test_sov_batch_does_not_sum_across_clients(db):
+    from app.services.analysis import AnalysisService
+    client_a, client_b = uuid.uuid4(), uuid.uuid4()
+    target = Target(id=uuid.uuid4(), name="우리치과", type=TargetType.OTHERS)
+    keywords = [Keyword(id=uuid.uuid4(), term="임플란트", client_id=cid) for cid in (client_a, client_b)]
+    db.add_all([target] + keywords)
+    db.flush()
+    # 두 클라이언트가 같은 term 을 각자 수집 (A: 2회 노출, B: 1회 노출)
+    for kw, hits in zip(keywords, (2, 1)):
+        for _ in range(hits):
+            db.add(DailyRank(id=uuid.uuid4(), keyword_id=kw.id, target_id=target.id,
+                             platform=PlatformType.NAVER_PLACE, rank=1, snapshot_id=uuid.uuid4()))
+    db.commit()
+
+    service = AnalysisService(db)
+    unscoped = service.calculate_sov_batch(["임플란트"], "우리치과", PlatformType.NAVER_PLACE)[0]
+    first_keyword = min(keywords, key=lambda k: k.id)
+    assert unscoped["hits"] == (2 if first_keyword.client_id == client_a else 1)
+    scoped = service.calculate_sov_batch(["임플란트"], "우리치과", PlatformType.NAVER_PLACE, client_id=client_b)[0]
+    assert scoped["hits"] == 1
+
+
+def test_weekly_sov_reads_nightly_ranks_for_every_client_sharing_a_term(db):
+    from app.services.analysis import AnalysisService
+    from app.services.rank_ingestion import RankIngestionService
+    # 두 클라이언트가 같은 term 을 등록, 야간 수집은 클라이언트 없이 term 당 한 번 저장
+    for client_id in (uuid.uuid4(), uuid.uuid4()):
+        db.add(Keyword(id=uuid.uuid4(), term="임플란트", client_id=client_id))
+    db.commit()
+    RankIngestionService(db).save_batch([{
+        "keyword": "임플란트", "platform": PlatformType.NAVER_PLACE,
+        "results": [{"name": "우리치과", "rank": 1}, {"name": "옆치과", "rank": 2}],
+    }])
+
+    summary = AnalysisService(db).get_weekly_sov_summary("우리치과", ["임플란트"], PlatformType.NAVER_PLACE)
+    # 리포트 위젯은 클라이언트와 무관하게 같은 이력을 읽는다 (다른 클라이언트 리포트가 0% 가 되지 않음)
+    assert summary["keyword_details"][0]["hits"] == 1
+    assert summary["avg_sov"] == 20.0
@@ -0,0 +1,35 @@
+"""
+토큰 버킷 레이트 리미터 단위 테스트
+- 네트워크/이벤트 루프 없이 순수 로직만 테스트
+"""
+from app.core.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_spaced_reservations(self):
+        bucket = TokenBucket(rate=10, capacity=2, clock=FakeClock())
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == 0.1
+        assert round(waits[3], 3) == 0.2
+
+    def test_refill_caps_at_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 100
+        assert [bucket.reserve() for _ in range(3)][:2] == [0.0, 0.0]
+
+    def test_drain_removes_burst(self):
+        bucket = TokenBucket(rate=10, capacity=5, clock=FakeClock())
+        bucket.drain()
+        assert bucket.reserve() == 0.1
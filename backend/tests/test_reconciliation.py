@@ -0,0 +1,61 @@
+"""
+지표 정합 결정 로직 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import datetime
+
+from app.core.algorithms.reconciliation import reconcile_rows, spend_variance
+
+D1 = datetime.datetime(2026, 10, 1)
+D2 = datetime.datetime(2026, 10, 2)
+
+
+class TestReconcileRows:
+    def test_api_wins_over_scraper(self):
+        reconciled, _ = reconcile_rows([
+            ("cp1", D1, "SCRAPER", 95.0, 9, 1, 0, 0.0),
+            ("cp1", D1, "API", 100.0, 10, 2, 1, None),
+        ])
+        result = reconciled[("cp1", D1)]
+        assert result["primary_source"] == "API"
+        assert result["metrics"] == {"spend": 100.0, "impressions": 10, "clicks": 2, "conversions": 1, "revenue": 0}
+        assert result["sources_used"] == ["API", "SCRAPER"]
+
+    def test_scraper_used_when_api_missing(self):
+        reconciled, warnings = reconcile_rows([("cp1", D2, "SCRAPER", 50.0, 5, 1, 0, 0.0)])
+        assert reconciled[("cp1", D2)]["primary_source"] == "SCRAPER"
+        assert warnings == []
+
+    def test_unknown_source_only_is_skipped(self):
+        reconciled, _ = reconcile_rows([("cp1", D1, "MANUAL", 50.0, 5, 1, 0, 0.0)])
+        assert reconciled == {}
+
+    def test_keys_are_per_campaign_and_date(self):
+        reconciled, _ = reconcile_rows([
+            ("cp1", D1, "API", 1.0, 1, 0, 0, 0.0),
+            ("cp1", D2, "API", 2.0, 1, 0, 0, 0.0),
+            ("cp2", D1, "API", 3.0, 1, 0, 0, 0.0),
+        ])
+        assert set(reconciled) == {("cp1", D1), ("cp1", D2), ("cp2", D1)}
+
+
+class TestVarianceWarnings:
+    def test_warns_above_threshold(self):
+        _, warnings = reconcile_rows([
+            ("cp1", D1, "API", 100.0, 10, 2, 1, 0.0),
+            ("cp1", D1, "SCRAPER", 80.0, 10, 2, 1, 0.0),
+        ])
+        assert len(warnings) == 1
+        assert warnings[0]["metric"] == "spend"
+        assert abs(warnings[0]["variance"] - 0.2) < 1e-9
+
+    def test_no_warning_within_threshold(self):
+        _, warnings = reconcile_rows([
+            ("cp1", D1, "API", 100.0, 10, 2, 1, 0.0),
+            ("cp1", D1, "SCRAPER", 95.0, 10, 2, 1, 0.0),
+        ])
+        assert warnings == []
+
+    def test_zero_api_spend_has_no_variance(self):
+        assert spend_variance(0, 10.0) is None
+        assert spend_variance(None, 10.0) is None
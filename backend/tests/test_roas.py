@@ -0,0 +1,52 @@
+"""
+캠페인 ROAS 계산 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import datetime
+import math
+
+import pytest
+from app.core.algorithms.roas import (
+    campaign_totals_columns, efficiency_columns, group_campaign_days, percentile,
+)
+
+D1 = datetime.date(2026, 10, 1)
+D2 = datetime.date(2026, 10, 2)
+
+ROWS = [
+    ("cp1", "임플란트", "NAVER_AD", D1, 100000.0, 50, 2, 1000),
+    ("cp1", "임플란트", "NAVER_AD", D2, 50000.0, 10, 0, 500),
+    ("cp2", "교정", "NAVER_AD", D1, 0.0, 0, 0, None),
+]
+
+
+class TestGroupCampaignDays:
+    def test_series_and_totals(self):
+        campaigns = group_campaign_days(ROWS)
+        assert campaigns["cp1"]["dates"] == [D1, D2]
+        assert campaigns["cp1"]["spend"] == [100000.0, 50000.0]
+        assert campaigns["cp1"]["totals"] == {"spend": 150000.0, "clicks": 60, "conversions": 2, "impressions": 1500}
+        assert campaigns["cp2"]["impressions"] == [0]
+
+    def test_totals_columns_keep_campaign_order(self):
+        columns = campaign_totals_columns(group_campaign_days(ROWS))
+        assert columns["campaign_id"] == ["cp1", "cp2"]
+        assert columns["spend"] == [150000.0, 0.0]
+
+
+class TestEfficiencyColumns:
+    def test_metrics(self):
+        cols = efficiency_columns([150000.0, 0.0], [2, 0], [60, 0], [1500, 0], conversion_value=150000.0)
+        assert cols["roas"] == [pytest.approx(200.0), 0]
+        assert cols["cpa"] == [75000.0, None]
+        assert cols["ctr"] == [pytest.approx(4.0), 0]
+        assert cols["cvr"] == [pytest.approx(2 / 60 * 100), 0]
+
+
+class TestPercentile:
+    def test_linear_interpolation(self):
+        assert percentile([1, 2, 3, 4], 0.75) == pytest.approx(3.25)
+        assert percentile([5], 0.75) == 5
+
+    def test_empty(self):
+        assert math.isinf(percentile([], 0.5))
@@ -0,0 +1,67 @@
+"""
+페이지 동시 조회 헬퍼 단위 테스트
+"""
+import asyncio
+from app.scrapers.paging import fetch_pages_concurrently
+
+OFFSETS = [1, 6, 11, 16, 21]
+
+
+def _page(offset, size=5):
+    return [f"item{offset + i}" for i in range(size)]
+
+
+class TestFetchPagesConcurrently:
+    def test_full_pages_merged_in_rank_order(self):
+        async def fetch(offset):
+            # 뒤 페이지가 먼저 끝나도 병합 순서는 오프셋 순
+            await asyncio.sleep(0.001 * (30 - offset))
+            return _page(offset)
+
+        items = asyncio.run(fetch_pages_concurrently(fetch, OFFSETS, page_size=5))
+        assert items == [f"item{i}" for i in range(1, 26)]
+
+    def test_short_page_truncates_and_cancels_later_pages(self):
+        finished = []
+
+        async def fetch(offset):
+            if offset == 6:
+                return _page(offset, size=2)
+            await asyncio.sleep(0.05)
+            finished.append(offset)
+            return _page(offset)
+
+        items = asyncio.run(fetch_pages_concurrently(fetch, OFFSETS, page_size=5))
+        assert items == _page(1) + _page(6, size=2)
+        assert 11 not in finished and 16 not in finished and 21 not in finished
+
+    def test_failed_page_stops_merge_like_sequential(self):
+        async def fetch(offset):
+            if offset == 11:
+                return None
+            return _page(offset)
+
+        items = asyncio.run(fetch_pages_concurrently(fetch, OFFSETS, page_size=5))
+        assert items == _page(1) + _page(6)
+
+    def test_exception_is_treated_as_failed_page(self):
+        async def fetch(offset):
+            if offset == 1:
+                raise RuntimeError("timeout")
+            return _page(offset)
+
+        items = asyncio.run(fetch_pages_concurrently(fetch, OFFSETS, page_size=5))
+        assert items == []
+
+    def test_concurrency_limit(self):
+        state = {"active": 0, "peak": 0}
+
+        async def fetch(offset):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return _page(offset)
+
+        asyncio.run(fetch_pages_concurrently(fetch, OFFSETS, page_size=5, concurrency=2))
+        assert state["peak"] == 2
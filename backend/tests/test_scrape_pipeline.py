@@ -0,0 +1,97 @@
+"""
+순위 수집 파이프라인 단위 테스트
+- 스크래퍼/writer 를 주입하므로 DB·네트워크 의존성 없음
+"""
+import asyncio
+from app.scrapers.pipeline import ScrapePipeline, HostRateLimiter, get_last_pipeline_stats
+
+
+def _make_scraper(delay=0.01, fail_on=None, tracker=None):
+    async def scrape(keyword):
+        if tracker is not None:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delay)
+            if fail_on and keyword in fail_on:
+                raise RuntimeError("blocked")
+            return [{"rank": 1, "name": keyword}, {"rank": 2, "name": f"{keyword}-2"}]
+        finally:
+            if tracker is not None:
+                tracker["active"] -= 1
+    return scrape
+
+
+class TestScrapePipeline:
+    def test_all_keywords_written_in_batches(self):
+        batches = []
+
+        def writer(entries):
+            batches.append(list(entries))
+            return sum(len(e["results"]) for e in entries)
+
+        pipeline = ScrapePipeline(
+            scrapers={"place": _make_scraper(), "view": _make_scraper()},
+            writer=writer,
+            workers=3,
+            batch_size=4,
+        )
+        result = asyncio.run(pipeline.run([f"kw{i}" for i in range(5)]))
+
+        written = [e for b in batches for e in b]
+        assert len(written) == 10  # 5 keywords × 2 platforms
+        assert all(len(b) <= 4 for b in batches)
+        assert result.items == {"place": 10, "view": 10}
+        assert result.stats["stages"]["write"]["items"] == 20
+        assert get_last_pipeline_stats() is result.stats
+
+    def test_platform_semaphore_bounds_concurrency(self):
+        tracker = {"active": 0, "peak": 0}
+        pipeline = ScrapePipeline(
+            scrapers={"place": _make_scraper(tracker=tracker)},
+            writer=lambda entries: 0,
+            workers=8,
+            platform_limits={"place": 2},
+        )
+        asyncio.run(pipeline.run([f"kw{i}" for i in range(10)]))
+        assert tracker["peak"] <= 2
+
+    def test_scrape_errors_are_collected_not_raised(self):
+        pipeline = ScrapePipeline(
+            scrapers={"ad": _make_scraper(fail_on={"bad"})},
+            writer=lambda entries: len(entries),
+            workers=2,
+        )
+        result = asyncio.run(pipeline.run(["good", "bad"]))
+        assert result.errors == ["Ad(bad): blocked"]
+        assert result.stats["stages"]["scrape.ad"]["errors"] == 1
+        assert result.stats["stages"]["scrape.ad"]["processed"] == 1
+
+    def test_writer_failure_is_reported(self):
+        def writer(entries):
+            raise RuntimeError("db down")
+
+        pipeline = ScrapePipeline(scrapers={"view": _make_scraper()}, writer=writer)
+        result = asyncio.run(pipeline.run(["kw"]))
+        assert result.errors == ["Save(1 entries): db down"]
+
+
+class TestHostRateLimiter:
+    def test_min_interval_between_requests(self):
+        limiter = HostRateLimiter(min_interval=0.05)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            times = []
+            for _ in range(3):
+                await limiter.acquire("search.naver.com")
+                times.append(loop.time())
+            return times
+
+        times = asyncio.run(run())
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert all(g >= 0.045 for g in gaps)
+
+    def test_zero_interval_does_not_wait(self):
+        limiter = HostRateLimiter(min_interval=0)
+        asyncio.run(limiter.acquire("a"))
@@ -0,0 +1,47 @@
+"""
+지표 소스 결정 캐시 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+from app.services.source_resolution import SourceResolutionCache, pick_source
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPickSource:
+    def test_priority(self):
+        assert pick_source(["API", "RECONCILED"]) == "RECONCILED"
+        assert pick_source(["SCRAPER", "API"]) == "API"
+        assert pick_source([]) == "SCRAPER"
+
+
+class TestSourceResolutionCache:
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = SourceResolutionCache(ttl_seconds=60, clock=clock)
+        cache.set("c1", "API")
+        assert cache.get("c1") == "API"
+        clock.now = 61
+        assert cache.get("c1") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_invalidate_client_drops_global_entry(self):
+        cache = SourceResolutionCache()
+        cache.set("c1", "API")
+        cache.set("c2", "API")
+        cache.set(None, "API")
+        cache.invalidate("c1")
+        assert cache.get("c1") is None
+        assert cache.get(None) is None
+        assert cache.get("c2") == "API"
+
+    def test_invalidate_all(self):
+        cache = SourceResolutionCache()
+        cache.set("c1", "RECONCILED")
+        cache.invalidate()
+        assert cache.snapshot()["entries"] == 0
@@ -0,0 +1,57 @@
+"""
+SOV 계산 단위 테스트
+- DB 의존성 없는 순수 로직만 테스트
+"""
+import datetime
+
+import pytest
+from app.core.algorithms.sov import build_sov_results, compute_sov_in_memory
+
+T0 = datetime.datetime(2026, 10, 1, 9, 0)
+T1 = datetime.datetime(2026, 10, 2, 9, 0)
+
+
+class TestBuildSovResults:
+    def test_missing_keyword_is_empty(self):
+        assert build_sov_results(["임플란트"], {}, top_n=5) == [
+            {"sov": 0.0, "total": 0, "hits": 0, "keyword": "임플란트"}
+        ]
+
+    def test_keeps_request_order(self):
+        aggregates = {"b": (1, 3, T0), "a": (2, 1, T1)}
+        assert [r["keyword"] for r in build_sov_results(["a", "b", "c"], aggregates, top_n=5)] == ["a", "b", "c"]
+
+    def test_sov_uses_fixed_slots(self):
+        result = build_sov_results(["a"], {"a": (2, 1, T0)}, top_n=5)[0]
+        assert result["sov"] == pytest.approx(40.0)
+        assert result["total"] == 5
+        assert result["top_rank"] == 1
+        assert result["period_start"] == result["period_end"] == "2026-10-01 09:00"
+
+    def test_keyword_without_ranks(self):
+        result = build_sov_results(["a"], {"a": (0, None, None)}, top_n=5)[0]
+        assert result["sov"] == 0.0
+        assert result["total"] == 5
+        assert result["period_start"] is None
+
+
+class TestComputeSovInMemory:
+    ROWS = [
+        ("a", "우리치과", 2, T0),
+        ("a", "경쟁치과", 1, T0),
+        ("a", "우리치과", 7, T1),  # top_n 밖
+        ("b", "경쟁치과", 1, T1),
+        ("c", "우리치과", 1, T1),  # 요청 외 키워드
+    ]
+
+    def test_matches_sql_shape(self):
+        results = compute_sov_in_memory(self.ROWS, ["a", "b", "z"], "우리치과", top_n=5)
+        a, b, z = results
+        assert (a["hits"], a["top_rank"], a["period_end"]) == (1, 2, "2026-10-02 09:00")
+        assert a["sov"] == pytest.approx(20.0)
+        assert (b["hits"], b["top_rank"]) == (0, None)
+        assert z == {"sov": 0.0, "total": 0, "hits": 0, "keyword": "z"}
+
+    def test_unknown_target(self):
+        results = compute_sov_in_memory(self.ROWS, ["a"], "없는치과", top_n=5)
+        assert results[0]["hits"] == 0
@@ -0,0 +1,114 @@
+"""
+백필 테스트
+- 날짜 계산 / 워커 수 상한 (순수 로직)
+- SyncService.create_daily_tasks / claim_next_task (SQLite in-memory): 일괄 생성, FAILED 재설정,
+  COMPLETED 건너뜀, stale RUNNING 재점유 (크래시 후 재개)
+"""
+import datetime
+import uuid
+
+from app.services.sync_service import backfill_dates, backfill_worker_count
+
+TODAY = datetime.datetime(2026, 10, 17)
+
+
+def test_newest_date_first():
+    dates = backfill_dates(TODAY, 3)
+    assert dates == [TODAY, TODAY - datetime.timedelta(days=1), TODAY - datetime.timedelta(days=2)]
+
+
+def test_long_backfill_has_unique_days():
+    dates = backfill_dates(TODAY, 180)
+    assert len(set(dates)) == 180
+    assert dates[-1] == TODAY - datetime.timedelta(days=179)
+
+
+def test_non_positive_days():
+    assert backfill_dates(TODAY, 0) == []
+    assert backfill_dates(TODAY, -1) == []
+
+
+def test_worker_count_capped_by_pool_and_tasks():
+    assert backfill_worker_count(4, 30, pool_capacity=10) == 4
+    assert backfill_worker_count(4, 30, pool_capacity=6) == 2   # async 엔진과 예산을 나눈 sync 풀
+    assert backfill_worker_count(4, 2, pool_capacity=10) == 2
+    assert backfill_worker_count(4, 0, pool_capacity=2) == 1
+
+
+# ────────────────────────────────────────────────────────────
+# SyncService (SQLite)
+# ────────────────────────────────────────────────────────────
+
+def _statuses(db, connection_id):
+    from app.models.models import SyncTask
+    rows = db.query(SyncTask.status, SyncTask.attempts)\
+        .filter(SyncTask.connection_id == connection_id).order_by(SyncTask.target_date.desc()).all()
+    return [(r.status.value, r.attempts) for r in rows]
+
+
+def test_create_daily_tasks_resets_failed_and_skips_completed(db):
+    from app.models.models import SyncTask, SyncTaskStatus
+    from app.services.sync_service import SyncService
+
+    service = SyncService(db)
+    connection_id = uuid.uuid4()
+    tasks = service.create_daily_tasks(connection_id, days=5)
+    assert len(tasks) == 5
+    assert [t.target_date for t in tasks] == sorted((t.target_date for t in tasks), reverse=True)
+
+    done, failed, running = tasks[0], tasks[1], tasks[2]
+    done.status = SyncTaskStatus.COMPLETED
+    failed.status, failed.attempts = SyncTaskStatus.FAILED, 3
+    running.status, running.started_at = SyncTaskStatus.RUNNING, datetime.datetime.utcnow()  # 다른 워커가 처리 중
+    db.commit()
+
+    # 재실행: 새로 만든 날짜 없음 (ON CONFLICT DO NOTHING), FAILED 는 PENDING 으로, COMPLETED/진행 중은 제외
+    again = service.create_daily_tasks(connection_id, days=5)
+    assert [t.id for t in again] == [failed.id, tasks[3].id, tasks[4].id]
+    assert db.query(SyncTask).count() == 5
+    assert _statuses(db, connection_id) == [
+        ("COMPLETED", 0), ("PENDING", 0), ("RUNNING", 0), ("PENDING", 0), ("PENDING", 0),
+    ]
+
+    # 기간을 늘리면 없는 날짜만 추가
+    assert len(service.create_daily_tasks(connection_id, days=7)) == 5
+    assert db.query(SyncTask).count() == 7
+    assert service.create_daily_tasks(connection_id, days=0) == []
+
+
+def test_stale_running_task_is_returned_and_reclaimed(db):
+    from app.models.models import SyncTaskStatus
+    from app.services.sync_service import SyncService
+
+    service = SyncService(db)
+    connection_id = uuid.uuid4()
+    tasks = service.create_daily_tasks(connection_id, days=2)
+    crashed = service.claim_next_task(connection_id, stale_seconds=600)
+    assert crashed.id == tasks[0].id and crashed.status == SyncTaskStatus.RUNNING and crashed.attempts == 1
+    second = service.claim_next_task(connection_id, stale_seconds=600)
+    assert second.id == tasks[1].id
+    second.status = SyncTaskStatus.COMPLETED
+    db.commit()
+    assert service.claim_next_task(connection_id, stale_seconds=600) is None
+
+    # 프로세스가 죽어 RUNNING 에 남은 날짜: stale 이 되기 전에는 반환/점유하지 않는다
+    assert service.create_daily_tasks(connection_id, days=2, stale_seconds=600) == []
+    crashed.started_at = datetime.datetime.utcnow() - datetime.timedelta(hours=1)
+    db.commit()
+
+    # 재실행 시 stale RUNNING 도 처리 대상으로 반환 → 워커가 돌고 다시 점유
+    resumed = service.create_daily_tasks(connection_id, days=2, stale_seconds=600)
+    assert [t.id for t in resumed] == [crashed.id]
+    reclaimed = service.claim_next_task(connection_id, stale_seconds=600)
+    assert reclaimed.id == crashed.id and reclaimed.attempts == 2
+    assert service.claim_next_task(connection_id, stale_seconds=600) is None
+
+
+def test_claim_is_scoped_to_connection(db):
+    from app.services.sync_service import SyncService
+
+    service = SyncService(db)
+    mine, other = uuid.uuid4(), uuid.uuid4()
+    service.create_daily_tasks(other, days=1)
+    assert service.claim_next_task(mine) is None
+    assert service.claim_next_task(other).connection_id == other